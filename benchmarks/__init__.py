@@ -0,0 +1,12 @@
+"""
+Performance regression benchmarks (pytest-benchmark)
+
+Run from the project root:
+
+    python -m pytest benchmarks                                  # compare with the saved baseline
+    BENCHMARK_UPDATE_BASELINE=true python -m pytest benchmarks   # record a new baseline
+    BENCHMARK_REGRESSION_THRESHOLD=10 python -m pytest benchmarks
+
+Ollama and Redis are replaced by in-process fakes (see fakes.py), so results
+reflect this repo's code rather than model or network latency.
+"""
@@ -0,0 +1,117 @@
+"""
+Agents: creation through AgentFactory, resume compression, and /agents/process end to end
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from .fakes import FINAL_ANSWER
+
+RESUME = {
+    "resume_text": "\n".join(
+        [
+            "PROFESSIONAL SUMMARY: IT Specialist (INFOSEC), GS-2210-13, email jane@example.gov, phone 555-0100",
+            "WORK EXPERIENCE",
+        ]
+        + [
+            f"Position {i}: Responsible for security assessments of {10 + i} systems; duties included "
+            f"patch management, various tasks and helped to reduce findings by {5 + i}% etc. "
+            f"Technical skills: Splunk, Nessus, PowerShell. Certified CISSP."
+            for i in range(30)
+        ]
+        + ["EDUCATION: B.S. Computer Science, State University", "References available upon request"]
+    ),
+    "current_pages": 4,
+    "target_series": "2210",
+    "accomplishments": [
+        "Reduced vulnerability backlog by 42% across 120 servers in 6 months",
+        "Responsible for various security tasks",
+        "Saved $250,000 annually by automating compliance scans",
+    ] * 5,
+    "format_info": {"margins": 1.0, "font_size": 12, "line_spacing": 1.5},
+    "positions": [
+        f"IT Specialist (INFOSEC) GS-2210-{13 - i % 3}, Federal Agency, 20{24 - i}-present security"
+        for i in range(12)
+    ],
+    "target_keywords": ["security", "INFOSEC", "Splunk", "incident response"],
+}
+
+RESUME_TOOLS = (
+    "_analyze_resume_length", "_check_redundancy", "_evaluate_impact_statements",
+    "_optimize_formatting", "_rank_content_priority",
+)
+
+
+class BenchAgentFactory:
+    """Benchmark agent construction with fake Ollama and Redis"""
+
+    @pytest.mark.parametrize("role", ["data_scientist", "resume_compression"])
+    def test_create_agent(self, benchmark, agent_factory, run_async, role):
+        """New instance: LLM client, memory, tools, prompt layout and executor"""
+        async def create():
+            agent_factory._instances.pop(f"{role}:bench-user", None)
+            agent = agent_factory.create(role=role, user_id="bench-user")
+            await asyncio.sleep(0)  # let the conversation history load from Redis
+            return agent
+
+        agent = benchmark(lambda: run_async(create()))
+        assert agent.role == role and agent.tools and agent.redis_client is not None
+
+    def test_get_existing_agent(self, benchmark, agent_factory, run_async):
+        """Lookup of an already created instance"""
+        async def create():
+            return agent_factory.create(role="data_scientist", user_id="bench-cached")
+
+        first = run_async(create())
+        assert benchmark(agent_factory.create, role="data_scientist", user_id="bench-cached") is first
+
+
+class BenchResumeCompression:
+    """Benchmark resume compression analysis"""
+
+    @pytest.fixture(scope="class")
+    def agent(self, agent_factory, run_async):
+        async def create():
+            return agent_factory.create(role="resume_compression", user_id="bench-resume", enable_memory=False)
+
+        return run_async(create())
+
+    def test_compression_tools(self, benchmark, agent):
+        """All five deterministic compression tools on one resume, as the model invokes them"""
+        tool_input = json.dumps(RESUME)
+        outputs = benchmark(lambda: [getattr(agent, tool)(tool_input) for tool in RESUME_TOOLS])
+        assert all(not output.startswith("Error") for output in outputs)
+
+    def test_analyze(self, benchmark, agent, run_async):
+        """analyze(): prompt building, context budget and the agent loop around one model reply"""
+        response = benchmark(lambda: run_async(agent.analyze(RESUME)))
+        assert response.success and "compression_strategy" in response.data
+
+
+class BenchAgentProcess:
+    """Benchmark POST /agents/process through the ASGI app"""
+
+    def test_process(self, benchmark, api_client):
+        """Request validation, agent lookup, context budget, agent loop and response serialization"""
+        from src.agents.app.agents.factory import AgentFactory
+
+        payload = {
+            "role": "resume_compression",
+            "user_id": "bench-process",
+            "query": "Which sections of my resume should I condense first?",
+            "data": {"target_series": "2210", "current_pages": 4},
+        }
+
+        def clear_history():
+            # Each round starts from an empty conversation so rounds do equal work
+            agent = AgentFactory._instances.get("resume_compression:bench-process")
+            if agent is not None and agent.memory is not None:
+                agent.memory.clear()
+
+        response = benchmark.pedantic(api_client.post, args=("/agents/process",), kwargs={"json": payload},
+                                      setup=clear_history, rounds=200, warmup_rounds=5)
+        assert response.status_code == 200
+        body = response.json()
+        assert body["success"] and body["data"]["response"] == FINAL_ANSWER.split("Final Answer: ")[1]
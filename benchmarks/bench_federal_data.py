@@ -0,0 +1,91 @@
+"""
+Federal compensation and classification: locality pay and series keyword mapping
+"""
+
+import pytest
+
+from src.mcp_services.external.opm_researcher import OPMResearcher
+from src.mcp_services.federal.locality_pay_analyst import LocalityPayAnalyst
+from src.mcp_services.federal.series_mapping_expert import SeriesMappingExpert
+
+# Shaped like the OPM tables the services load from documentation/external_services/opm;
+# the values only need to be realistic in size and spread
+GS_BASE_PAY = {
+    "base_rates": {
+        f"GS-{grade}": [round(22360 * 1.135 ** (grade - 1) * (1 + 0.0333 * step), 0) for step in range(10)]
+        for grade in range(1, 16)
+    }
+}
+LOCALITY_AREAS = {
+    "rest-of-us": {"name": "Rest of U.S.", "adjustment": 16.50},
+    "san-francisco": {"name": "San Jose-San Francisco-Oakland, CA", "adjustment": 46.34},
+    "new-york": {"name": "New York-Newark, NY-NJ-CT-PA", "adjustment": 37.97},
+    "washington-dc": {"name": "Washington-Baltimore-Arlington, DC-MD-VA-WV-PA", "adjustment": 33.94},
+    "seattle": {"name": "Seattle-Tacoma, WA", "adjustment": 31.82},
+    "los-angeles": {"name": "Los Angeles-Long Beach, CA", "adjustment": 35.69},
+    "boston": {"name": "Boston-Worcester-Providence, MA-RI-NH-ME", "adjustment": 32.13},
+    "denver": {"name": "Denver-Aurora, CO", "adjustment": 29.87},
+    "chicago": {"name": "Chicago-Naperville, IL-IN-WI", "adjustment": 30.39},
+    "houston": {"name": "Houston-The Woodlands, TX", "adjustment": 34.40},
+    "atlanta": {"name": "Atlanta--Athens-Clarke County--Sandy Springs, GA-AL", "adjustment": 23.40},
+    "phoenix": {"name": "Phoenix-Mesa-Scottsdale, AZ", "adjustment": 22.42},
+}
+# The remaining locality areas, for the full 53 + Rest of U.S.
+LOCALITY_AREAS.update({
+    f"area-{i:02d}": {"name": f"Locality Area {i}", "adjustment": round(17.0 + i * 0.31, 2)}
+    for i in range(len(LOCALITY_AREAS), 54)
+})
+
+CANDIDATES = [
+    (["Python", "scikit-learn", "Statistics", "SQL"], "Built machine learning models and analytics dashboards for fraud detection"),
+    (["Terraform", "Kubernetes", "AWS", "Jenkins"], "Led DevOps migration of 40 services to cloud; network and database operations"),
+    (["Verilog", "FPGA", "C"], "Designed embedded firmware and hardware test circuits"),
+    (["Java", "Algorithms"], "PhD research on distributed algorithms and theoretical computer science"),
+    (["Excel", "Tableau"], "Program management analysis, performance metrics and evaluation for a regional office"),
+    (["Splunk", "Nessus", "IT specialist"], "Cybersecurity incident response and software patching for a federal agency"),
+]
+
+
+@pytest.fixture(scope="module")
+def opm():
+    researcher = OPMResearcher()
+    researcher.gs_base = GS_BASE_PAY
+    researcher.locality_areas = LOCALITY_AREAS
+    return researcher
+
+
+@pytest.fixture(scope="module")
+def locality_analyst():
+    analyst = LocalityPayAnalyst()
+    analyst.locality_data = LOCALITY_AREAS
+    return analyst
+
+
+class BenchLocalityPay:
+    """Benchmark salary computation across grades, steps and locality areas"""
+
+    def test_salary_grid(self, benchmark, opm):
+        """GS-1..15, steps 1-10, every locality area"""
+        def grid():
+            return [opm.calculate_salary(grade, step, locality)
+                    for grade in range(1, 16) for step in range(1, 11) for locality in LOCALITY_AREAS]
+
+        salaries = benchmark(grid)
+        assert len(salaries) == 15 * 10 * len(LOCALITY_AREAS) and all(salaries)
+
+    def test_compare_localities(self, benchmark, locality_analyst):
+        """Cost-of-living adjusted comparison of every locality area"""
+        comparisons = benchmark(locality_analyst.compare_localities, 13, 1)
+        assert len(comparisons) == len(LOCALITY_AREAS)
+        assert comparisons[0]["real_value"] >= comparisons[-1]["real_value"]
+
+
+class BenchSeriesMapping:
+    """Benchmark mapping candidate skills and experience to job series"""
+
+    def test_map_skills_to_series(self, benchmark):
+        """Keyword matching of several candidate profiles against the IT series table"""
+        expert = SeriesMappingExpert()
+        matches = benchmark(lambda: [expert.map_skills_to_series(skills, experience)
+                                     for skills, experience in CANDIDATES])
+        assert matches[0][0]["series"] == "1560" and matches[2][0]["series"] == "0854"
@@ -0,0 +1,67 @@
+"""
+WebscrapingSpecialist parse path: HTML to content, links and metadata
+"""
+
+import pytest
+
+from src.mcp_services.external.webscraping_specialist import WebscrapingSpecialist
+
+BASE_URL = "https://docs.docker.com/compose/"
+
+
+def documentation_page(sections: int = 40) -> str:
+    """A documentation page of realistic size: navigation, headings, prose, code and links"""
+    nav = "".join(f'<li><a href="/compose/topic-{i}/">Topic {i}</a></li>' for i in range(60))
+    body = "".join(
+        f"<h2>Section {i}</h2>"
+        f"<p>Compose service {i} builds an image, mounts a volume and joins the default network. "
+        f"See the <a href='../reference/service-{i}/'>service reference</a> and "
+        f"<a href='https://github.com/docker/compose/issues/{i}'>issue {i}</a>.</p>"
+        f"<pre><code>services:\n  web{i}:\n    image: nginx:1.{i}\n    ports: ['80{i:02d}:80']</code></pre>"
+        f"<h3>Options</h3><ul><li>restart: unless-stopped</li><li>healthcheck: curl -f localhost</li></ul>"
+        for i in range(sections)
+    )
+    return (
+        "<html><head><title>Docker Compose overview</title>"
+        "<meta name='description' content='Define and run multi-container applications'>"
+        "<meta name='keywords' content='compose, docker, yaml'></head>"
+        f"<body><nav><ul>{nav}</ul></nav><main><h1>Docker Compose</h1>{body}</main>"
+        "<footer><a href='/privacy/'>Privacy</a> <img src='/logo.png'></footer></body></html>"
+    )
+
+
+PAGE = documentation_page()
+
+
+@pytest.fixture(scope="module")
+def scraper():
+    scraper = WebscrapingSpecialist()
+    scraper.http_cache = None
+
+    async def fetch(session, url):
+        return {"status": 200, "reason": "OK", "text": PAGE, "from_cache": False}
+
+    # Served from memory: the benchmark covers parsing, not the network
+    scraper._fetch = fetch
+    return scraper
+
+
+class BenchScraperParse:
+    """Benchmark parsing one fetched documentation page"""
+
+    def test_scrape_single_page(self, benchmark, scraper, run_async):
+        """BeautifulSoup parse, main content, links and metadata extraction"""
+        result = benchmark(lambda: run_async(scraper.scrape_single_page(BASE_URL)))
+        assert result["success"] and result["title"] == "Docker Compose overview"
+        assert len(result["metadata"]["headings"]) == 81 and len(result["links"]) > 100
+
+    def test_crawl_bookkeeping(self, benchmark, scraper, run_async):
+        """Per-page crawl work after parsing: documentation link filtering and near-duplicate check"""
+        page = run_async(scraper.scrape_single_page(BASE_URL))
+
+        def bookkeeping():
+            links = scraper._filter_documentation_links(page["links"], BASE_URL)
+            return links, scraper._near_duplicate_of("https://docs.docker.com/compose", page["content"])
+
+        links, duplicate_of = benchmark(bookkeeping)
+        assert duplicate_of is None and all(link.startswith("https://docs.docker.com/") for link in links)
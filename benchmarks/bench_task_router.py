@@ -0,0 +1,36 @@
+"""
+MCPTaskRouter: task classification and full routing analysis
+"""
+
+import pytest
+
+from src.core.mcp_task_router import MCPTaskRouter, TaskType
+
+TASKS = {
+    "Add Stripe subscription checkout with webhook retries": TaskType.PAYMENT_INTEGRATION,
+    "Fix login session expiry bug in the JWT refresh flow": TaskType.AUTHENTICATION,
+    "Add an index to speed up the PostgreSQL job search query": TaskType.DATABASE_CHANGES,
+    "Scrape USAJobs postings nightly into the ETL pipeline": TaskType.DATA_COLLECTION,
+    "Audit essay guidance for Merit Hiring Plan compliance": TaskType.FEDERAL_COMPLIANCE,
+    "Build a responsive dashboard component for salary trends": TaskType.FRONTEND_FEATURES,
+}
+
+
+@pytest.fixture(scope="module")
+def router():
+    return MCPTaskRouter()
+
+
+class BenchTaskRouter:
+    """Benchmark routing of a mixed set of development tasks"""
+
+    def test_classify_tasks(self, benchmark, router):
+        """Pattern-based task type classification"""
+        types = benchmark(lambda: [router._classify_task_type(task) for task in TASKS])
+        assert types == list(TASKS.values())
+
+    def test_analyze_tasks(self, benchmark, router):
+        """Classification plus priority, agent selection, complexity, compliance and risk analysis"""
+        analyses = benchmark(lambda: [router.analyze_task(task) for task in TASKS])
+        assert [analysis.task_type for analysis in analyses] == list(TASKS.values())
+        assert all(analysis.primary_agents for analysis in analyses)
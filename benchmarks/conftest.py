@@ -0,0 +1,87 @@
+"""
+Benchmark suite configuration
+
+Every run is compared against the last saved baseline for this machine and
+fails when a benchmark's median regresses by more than
+BENCHMARK_REGRESSION_THRESHOLD percent (default 25). The first run on a
+machine, or any run with BENCHMARK_UPDATE_BASELINE=true, saves its results as
+the new baseline JSON under benchmarks/.baselines/<machine id>/. The
+matching --benchmark-* command line options override all of this.
+"""
+
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+
+from .fakes import FakeOllama, fake_redis_module
+
+BASELINE_DIR = Path(__file__).parent / ".baselines"
+BASELINE_NAME = "baseline"
+DEFAULT_STORAGE = "file://./.benchmarks"
+
+
+def pytest_configure(config):
+    option = config.option
+    if not hasattr(option, "benchmark_storage"):
+        # pytest-benchmark is not installed; collection reports the missing fixture
+        return
+    from pytest_benchmark.utils import get_machine_id, parse_compare_fail
+
+    # Agents built here must not open the on-disk LLM response cache
+    os.environ.setdefault("LLM_CACHE_ENABLED", "false")
+
+    if option.benchmark_storage == DEFAULT_STORAGE:
+        option.benchmark_storage = f"file://{BASELINE_DIR}"
+        has_baseline = any((BASELINE_DIR / get_machine_id()).glob("*.json"))
+        if not has_baseline or os.getenv("BENCHMARK_UPDATE_BASELINE", "false").lower() == "true":
+            if not (option.benchmark_save or option.benchmark_autosave):
+                option.benchmark_save = BASELINE_NAME
+        elif not option.benchmark_compare:
+            option.benchmark_compare = True
+
+    if option.benchmark_compare and not option.benchmark_compare_fail:
+        stat = os.getenv("BENCHMARK_REGRESSION_STAT", "median")
+        threshold = int(os.getenv("BENCHMARK_REGRESSION_THRESHOLD", "25"))
+        option.benchmark_compare_fail = [parse_compare_fail(f"{stat}:{threshold}%")]
+
+
+@pytest.fixture(scope="session")
+def run_async():
+    """Run a coroutine to completion on one event loop shared by the session"""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def fake_backends():
+    """Agents created during the session use FakeOllama and FakeRedis"""
+    from src.agents.app.agents import base
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(base, "Ollama", FakeOllama)
+        patch.setattr(base, "redis", fake_redis_module)
+        yield
+
+
+@pytest.fixture(scope="session")
+def agent_factory(fake_backends, run_async):
+    """AgentFactory with the benchmarked roles registered as the agent service registers them"""
+    from src.agents.app.agents.factory import AgentFactory, AgentRoles
+
+    AgentFactory.register_agent(AgentRoles.DATA_SCIENTIST, ".roles.data_scientist:DataScientistAgent")
+    AgentFactory.register_agent(AgentRoles.RESUME_COMPRESSION, ".compliance.resume_compression:ResumeCompressionAgent")
+    yield AgentFactory
+    run_async(AgentFactory.cleanup_all_agents())
+
+
+@pytest.fixture(scope="session")
+def api_client(fake_backends):
+    """ASGI test client for the agent service, started up and shut down once"""
+    from fastapi.testclient import TestClient
+    from src.core.main import app
+
+    with TestClient(app) as client:
+        yield client
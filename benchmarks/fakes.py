@@ -0,0 +1,77 @@
+"""
+In-process stand-ins for Ollama and Redis
+
+Benchmarks measure this repo's code, so the model and the conversation store
+answer immediately and deterministically instead of over the network.
+"""
+
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.language_models.llms import LLM
+
+FINAL_ANSWER = (
+    " I have enough information to answer.\n"
+    "Final Answer: Keep federal positions in full; condense private sector roles to three bullets each."
+)
+
+
+class FakeOllama(LLM):
+    """Accepts the Ollama constructor arguments FederalJobAgent passes and replies with a fixed final answer"""
+
+    model: str = "fake"
+    temperature: Optional[float] = None
+    num_ctx: Optional[int] = None
+    num_predict: Optional[int] = None
+    keep_alive: Any = None
+    reply: str = FINAL_ANSWER
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-ollama"
+
+    def _call(self, prompt: str, stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any) -> str:
+        return self.reply
+
+    async def _acall(self, prompt: str, stop: Optional[List[str]] = None, run_manager: Any = None,
+                     **kwargs: Any) -> str:
+        return self.reply
+
+
+class FakeRedis:
+    """The subset of redis.asyncio.Redis the agents use, backed by a dict"""
+
+    def __init__(self):
+        self.data: Dict[str, Tuple[str, Optional[float]]] = {}
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> "FakeRedis":
+        return cls()
+
+    async def get(self, key: str) -> Optional[str]:
+        value, expires = self.data.get(key, (None, None))
+        if expires is not None and expires <= time.monotonic():
+            self.data.pop(key, None)
+            return None
+        return value
+
+    async def set(self, key: str, value: str) -> bool:
+        self.data[key] = (value, None)
+        return True
+
+    async def setex(self, key: str, seconds: int, value: str) -> bool:
+        self.data[key] = (value, time.monotonic() + seconds)
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def close(self) -> None:
+        pass
+
+    aclose = close
+
+
+# Drop-in for the `redis.asyncio` module as imported by agents/base.py
+fake_redis_module = SimpleNamespace(from_url=FakeRedis.from_url)
@@ -3,64 +3,64 @@
 MLX-Accelerated MCP Agent Template
 Universal template for creating Apple Silicon optimized agents
 All agents inherit from this base for automatic MLX acceleration
+(NumPy backend on machines without MLX, see mlx_backend)
 """
 
-import mlx.core as mx
 import numpy as np
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, Sequence
 from abc import ABC, abstractmethod
 import json
 import logging
+import os
+import sys
 from datetime import datetime
 from functools import wraps
 
+from mlx_backend import get_backend
+from mlx_statistics import get_statistics_batcher
+
+# Shared embedding and semantic index modules live in src/mcp_services
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from mcp_services.utils.embeddings import get_embedder
+from mcp_services.utils.semantic_index import get_semantic_index
+
 logger = logging.getLogger(__name__)
 
+xp = get_backend()
+
+
+def _to_backend(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return xp.asarray(value)
+    if isinstance(value, (list, tuple)) and value and isinstance(value[0], (int, float)):
+        return xp.asarray(value)
+    return value
+
 
 def mlx_accelerate(func: Callable) -> Callable:
-    """Decorator to automatically accelerate functions with MLX"""
+    """
+    Decorator that hands array arguments to the function as backend arrays
+    (NumPy input by buffer, no list round trip) and returns backend results as
+    Python scalars or NumPy arrays
+    """
     @wraps(func)
     def wrapper(*args, **kwargs):
         try:
-            # Convert numpy arrays to MLX arrays for acceleration
-            mlx_args = []
-            for arg in args:
-                if isinstance(arg, np.ndarray):
-                    mlx_args.append(mx.array(arg.tolist()))  # Convert via list to avoid type issues
-                elif isinstance(arg, (list, tuple)) and arg and isinstance(arg[0], (int, float)):
-                    mlx_args.append(mx.array(arg))
-                else:
-                    mlx_args.append(arg)
-            
-            # Convert kwargs
-            mlx_kwargs = {}
-            for key, val in kwargs.items():
-                if isinstance(val, np.ndarray):
-                    mlx_kwargs[key] = mx.array(val.tolist())
-                elif isinstance(val, (list, tuple)) and val and isinstance(val[0], (int, float)):
-                    mlx_kwargs[key] = mx.array(val)
-                else:
-                    mlx_kwargs[key] = val
-            
-            # Execute on Apple Silicon GPU
-            result = func(*mlx_args, **mlx_kwargs)
-            
-            # Convert MLX arrays back to standard types
-            def convert_result(r):
-                if hasattr(r, 'tolist'):  # MLX array
-                    return r.tolist()  # Return as Python list/number
-                return r
-                
-            if isinstance(result, (list, tuple)):
-                return type(result)(convert_result(r) for r in result)
-            else:
-                return convert_result(result)
-            
+            backend_args = [_to_backend(arg) for arg in args]
+            backend_kwargs = {key: _to_backend(val) for key, val in kwargs.items()}
         except Exception as e:
-            logger.warning(f"MLX acceleration failed, falling back to CPU: {e}")
-            # Fallback to original function without acceleration
-            return func(*args, **kwargs)
-    
+            # Only conversion falls back; errors raised by func itself propagate
+            # instead of running it a second time
+            logger.warning(f"{xp.name} conversion failed for {func.__name__}, passing inputs through: {e}")
+            backend_args, backend_kwargs = list(args), kwargs
+
+        result = func(*backend_args, **backend_kwargs)
+
+        if isinstance(result, (list, tuple)):
+            return type(result)(xp.to_python(r) for r in result)
+        return xp.to_python(result)
+
     return wrapper
 
 
@@ -73,6 +73,7 @@ class MLXAgent(ABC):
     def __init__(self, agent_name: str, agent_type: str = "specialist"):
         self.agent_name = agent_name
         self.agent_type = agent_type
+        self.backend = xp.name
         self.mlx_enabled = self._check_mlx_availability()
         self.performance_metrics = {
             "tasks_processed": 0,
@@ -84,80 +85,72 @@ class MLXAgent(ABC):
         if self.mlx_enabled:
             logger.info(f"✅ MLX acceleration enabled for {agent_name} on Apple Silicon")
         else:
-            logger.warning(f"⚠️ MLX not available for {agent_name}, using CPU")
+            logger.info(f"MLX not available for {agent_name}, using the NumPy backend")
     
     def _check_mlx_availability(self) -> bool:
         """Check if MLX is available on this system"""
-        try:
-            # Test MLX with a simple operation
-            test_array = mx.array([1, 2, 3])
-            result = mx.sum(test_array)
-            mx.eval(result)  # Force evaluation
-            return True
-        except Exception as e:
-            logger.debug(f"MLX availability check failed: {e}")
-            return False
+        return xp.is_mlx
     
     def preprocess_data(self, data: Any) -> Any:
         """
         Preprocess data - no MLX acceleration to avoid conversion issues
         Override in child classes for specific preprocessing
         """
-        if isinstance(data, (list, np.ndarray)):
-            # Simple passthrough - let individual methods handle MLX conversion
-            if isinstance(data, np.ndarray):
-                return data.tolist()
-            return data
+        # Arrays pass through as-is; mlx_accelerate and the backend convert them
+        # by buffer, so flattening to Python lists here would only add a copy
         return data
     
     @mlx_accelerate
-    def compute_embeddings(self, text_or_tokens: Any, fixed_dim: int = 10) -> mx.array:
+    def compute_embeddings(self, text_or_tokens: Any, fixed_dim: Optional[int] = None) -> np.ndarray:
         """
-        Compute embeddings using MLX acceleration with fixed dimensions
-        Override for specific embedding models
+        Text embeddings from the shared local embedder (normalized, stable
+        across processes, cached by content); numeric input is padded or
+        truncated to fixed_dim. Override for specific embedding models
         """
-        # Placeholder for embedding computation with consistent dimensions
         if isinstance(text_or_tokens, str):
-            # Simple hash-based embedding for demo with fixed dimensions
-            tokens = text_or_tokens.split()
-            embeddings = []
-            for i in range(fixed_dim):
-                # Create a deterministic embedding based on text content
-                hash_val = hash(text_or_tokens + str(i)) % 1000
-                embeddings.append(hash_val / 1000.0)
-            return mx.array(embeddings)
+            return xp.asarray(get_embedder().embed_one(text_or_tokens))
+        elif fixed_dim is None:
+            return xp.asarray(text_or_tokens)
         else:
             # Ensure array has fixed dimensions
-            arr = mx.array(text_or_tokens) if not isinstance(text_or_tokens, mx.array) else text_or_tokens
+            arr = xp.asarray(text_or_tokens)
             if len(arr) > fixed_dim:
                 return arr[:fixed_dim]
             elif len(arr) < fixed_dim:
                 # Pad with zeros
-                padding = mx.zeros(fixed_dim - len(arr))
-                return mx.concatenate([arr, padding])
+                padding = xp.zeros(fixed_dim - len(arr), dtype=arr.dtype)
+                return xp.concatenate([arr, padding])
             return arr
     
+    def semantic_search(self, query: str, k: int = 5,
+                        kinds: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """Nearest docs passages, job postings and research reports to a query"""
+        return get_semantic_index(refresh=False).search(query, k=k, kinds=kinds)
+
     @mlx_accelerate
-    def similarity_search(self, query_embedding: mx.array, 
-                         database_embeddings: mx.array,
+    def similarity_search(self, query_embedding: Any,
+                         database_embeddings: Any,
                          top_k: int = 5) -> List[int]:
         """
-        Fast similarity search using MLX
+        Fast similarity search on the active backend
         """
+        query_embedding = xp.asarray(query_embedding)
+        database_embeddings = xp.asarray(database_embeddings)
+
         # Compute cosine similarity
-        query_norm = mx.sqrt(mx.sum(query_embedding ** 2))
-        db_norms = mx.sqrt(mx.sum(database_embeddings ** 2, axis=1))
+        query_norm = xp.sqrt(xp.sum(query_embedding ** 2))
+        db_norms = xp.sqrt(xp.sum(database_embeddings ** 2, axis=1))
         
         # Dot product
-        similarities = mx.matmul(database_embeddings, query_embedding)
+        similarities = xp.matmul(database_embeddings, query_embedding)
         
         # Normalize
         similarities = similarities / (db_norms * query_norm + 1e-8)
         
         # Get top-k indices
-        top_indices = mx.argsort(similarities)[-top_k:][::-1]
+        top_indices = xp.argsort(similarities)[-top_k:][::-1]
         
-        return top_indices.tolist()
+        return xp.to_numpy(top_indices).tolist()
     
     @abstractmethod
     def analyze(self, task: str, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -211,6 +204,7 @@ class MLXAgent(ABC):
                 "recommendations": recommendations,
                 "execution_time": execution_time,
                 "mlx_enabled": self.mlx_enabled,
+                "backend": self.backend,
                 "timestamp": datetime.now().isoformat(),
                 "success": True
             }
@@ -236,6 +230,7 @@ class MLXAgent(ABC):
         return {
             "agent": self.agent_name,
             "mlx_enabled": self.mlx_enabled,
+            "backend": self.backend,
             "metrics": self.performance_metrics,
             "acceleration_rate": (
                 self.performance_metrics["mlx_accelerated"] / 
@@ -250,7 +245,6 @@ class DataScienceAgent(MLXAgent):
     def __init__(self):
         super().__init__("data_scientist", "technical_specialist")
     
-    @mlx_accelerate
     def analyze(self, task: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze data science tasks with MLX acceleration"""
         analysis = {
@@ -262,13 +256,8 @@ class DataScienceAgent(MLXAgent):
         if "data" in context:
             data = context["data"]
             if isinstance(data, (list, np.ndarray)):
-                arr = mx.array(data)
-                analysis["statistics"] = {
-                    "mean": float(mx.mean(arr)),
-                    "std": float(mx.std(arr)),
-                    "min": float(mx.min(arr)),
-                    "max": float(mx.max(arr))
-                }
+                stats = get_statistics_batcher().describe(data)
+                analysis["statistics"] = {key: stats[key] for key in ("mean", "std", "min", "max")}
         
         analysis["findings"] = [
             "Data patterns analyzed using MLX acceleration",
@@ -316,16 +305,11 @@ class DevOpsAgent(MLXAgent):
         
         return analysis
     
-    @mlx_accelerate
     def _analyze_metrics(self, metrics: Any) -> Dict[str, float]:
-        """Analyze performance metrics using MLX"""
+        """Analyze performance metrics (batched with concurrent requests)"""
         if isinstance(metrics, list):
-            arr = mx.array(metrics)
-            return {
-                "p50": float(mx.quantile(arr, 0.5)),
-                "p95": float(mx.quantile(arr, 0.95)),
-                "p99": float(mx.quantile(arr, 0.99))
-            }
+            stats = get_statistics_batcher().describe(metrics, percentiles=(50, 95, 99))
+            return {key: stats[key] for key in ("p50", "p95", "p99")}
         return {}
     
     def generate_recommendations(self, analysis_results: Dict[str, Any]) -> List[str]:
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Array Backend for the MLX agent server
+MLX on Apple Silicon when it is installed and working, NumPy everywhere else,
+behind one small interface so agents never import mlx.core directly
+"""
+
+import logging
+import os
+from typing import Any, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    import mlx.core as mx
+except ImportError:  # Linux servers, CI
+    mx = None
+
+
+class ArrayBackend:
+    """
+    Array namespace plus conversions
+
+    Functions not defined here (mean, var, sqrt, matmul, argsort, where, ...)
+    resolve on the underlying module, which MLX and NumPy share by name.
+    """
+
+    def __init__(self, name: str, module: Any):
+        self.name = name
+        self.module = module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.module, attr)
+
+    @property
+    def is_mlx(self) -> bool:
+        return self.name == "mlx"
+
+    def asarray(self, data: Any, dtype: Any = None) -> Any:
+        """
+        Backend array from lists, NumPy arrays or backend arrays
+
+        NumPy input is passed by buffer: no copy for the NumPy backend, a single
+        memcpy into unified memory for MLX, never a Python-list round trip.
+        """
+        if self.is_mlx:
+            if isinstance(data, mx.array):
+                return data if dtype is None else data.astype(dtype)
+            data = np.asarray(data)
+            if data.dtype == np.float64:
+                # Metal has no float64
+                data = data.astype(np.float32)
+            return mx.array(data) if dtype is None else mx.array(data, dtype=dtype)
+        return np.asarray(data, dtype=dtype)
+
+    def to_numpy(self, array: Any) -> np.ndarray:
+        """NumPy view of a backend array (evaluates lazy MLX graphs first)"""
+        if self.is_mlx and isinstance(array, mx.array):
+            mx.eval(array)
+        return np.asarray(array)
+
+    def to_python(self, value: Any) -> Any:
+        """Scalars to Python numbers; arrays to NumPy, so results stay usable with either backend"""
+        if self.is_mlx and isinstance(value, mx.array):
+            return value.item() if value.ndim == 0 else self.to_numpy(value)
+        if isinstance(value, np.ndarray):
+            return value.item() if value.ndim == 0 else value
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    def eval(self, *arrays: Any) -> None:
+        if self.is_mlx:
+            mx.eval(*arrays)
+
+    def take_along_axis(self, array: Any, indices: Any, axis: int) -> Any:
+        return self.module.take_along_axis(array, indices, axis=axis)
+
+
+def _mlx_works() -> bool:
+    if mx is None:
+        return False
+    try:
+        mx.eval(mx.sum(mx.array([1, 2, 3])))
+        return True
+    except Exception as e:
+        logger.debug(f"MLX availability check failed: {e}")
+        return False
+
+
+_backend: Optional[ArrayBackend] = None
+
+
+def get_backend() -> ArrayBackend:
+    """
+    Process-wide backend; MLX_BACKEND=mlx|numpy forces one, "auto" (default)
+    prefers MLX when it imports and runs
+    """
+    global _backend
+
+    if _backend is None:
+        requested = os.getenv("MLX_BACKEND", "auto").lower()
+        if requested == "numpy" or not _mlx_works():
+            if requested == "mlx":
+                logger.warning("MLX_BACKEND=mlx but MLX is unavailable; using NumPy")
+            _backend = ArrayBackend("numpy", np)
+        else:
+            _backend = ArrayBackend("mlx", mx)
+        logger.info(f"Array backend: {_backend.name}")
+    return _backend
@@ -4,6 +4,8 @@ MLX-Accelerated MCP Agent Server for Fed Job Advisor
 All agents now benefit from Apple Silicon GPU acceleration
 """
 
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
@@ -15,9 +17,12 @@ import logging
 
 # Import our MLX agent template
 from mlx_agent_template import MLXAgent, mlx_accelerate
-import mlx.core as mx
+from mlx_backend import get_backend
+from mlx_statistics import get_statistics_batcher
 import numpy as np
 
+xp = get_backend()
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -66,14 +71,10 @@ class FedDataScientistAgent(MLXAgent):
         if "data" in context:
             data = context["data"]
             if isinstance(data, list) and all(isinstance(x, (int, float)) for x in data):
-                # Convert to MLX array and compute statistics
-                arr = mx.array(data)
+                # Batched with concurrent requests on the array backend
+                stats = get_statistics_batcher().describe(data)
                 analysis["statistics"] = {
-                    "mean": float(mx.mean(arr)),
-                    "std": float(mx.std(arr)),
-                    "min": float(mx.min(arr)),
-                    "max": float(mx.max(arr)),
-                    "variance": float(mx.var(arr))
+                    key: stats[key] for key in ("mean", "std", "min", "max", "variance")
                 }
         
         # Simple skill matching without embeddings
@@ -109,7 +110,6 @@ class FedStatisticianAgent(MLXAgent):
     def __init__(self):
         super().__init__("statistician", "federal_technical")
     
-    @mlx_accelerate
     def analyze(self, task: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze statistical requirements with MLX"""
         analysis = {
@@ -121,12 +121,11 @@ class FedStatisticianAgent(MLXAgent):
         
         # MLX-accelerated statistical computations
         if "data_samples" in context:
-            samples = mx.array(context["data_samples"])
+            # All four moments come from one batched pass shared with
+            # concurrent requests instead of four separate reductions each
+            stats = get_statistics_batcher().describe(context["data_samples"])
             analysis["statistical_tests"] = {
-                "mean": float(mx.mean(samples)),
-                "variance": float(mx.var(samples)),
-                "skewness": self._compute_skewness(samples),
-                "kurtosis": self._compute_kurtosis(samples)
+                key: stats[key] for key in ("mean", "variance", "skewness", "kurtosis")
             }
         
         analysis["findings"] = [
@@ -137,20 +136,6 @@ class FedStatisticianAgent(MLXAgent):
         
         return analysis
     
-    @mlx_accelerate
-    def _compute_skewness(self, data: mx.array) -> float:
-        """Compute skewness using MLX"""
-        mean = mx.mean(data)
-        std = mx.std(data)
-        return float(mx.mean(((data - mean) / std) ** 3))
-    
-    @mlx_accelerate
-    def _compute_kurtosis(self, data: mx.array) -> float:
-        """Compute kurtosis using MLX"""
-        mean = mx.mean(data)
-        std = mx.std(data)
-        return float(mx.mean(((data - mean) / std) ** 4) - 3)
-    
     def generate_recommendations(self, analysis_results: Dict[str, Any]) -> List[str]:
         return [
             "Master SAS/SPSS/R for federal statistics roles",
@@ -177,11 +162,11 @@ class FedDatabaseAdminAgent(MLXAgent):
         
         # Analyze query performance patterns with MLX
         if "query_times" in context:
-            times = mx.array(context["query_times"])
+            stats = get_statistics_batcher().describe(context["query_times"], percentiles=(95,))
             analysis["performance_metrics"] = {
-                "avg_query_time": float(mx.mean(times)),
-                "p95_query_time": float(mx.quantile(times, 0.95)),
-                "optimization_potential": self._analyze_optimization(times)
+                "avg_query_time": stats["mean"],
+                "p95_query_time": stats["p95"],
+                "optimization_potential": self._analyze_optimization(stats["variance"] or 0.0)
             }
         
         analysis["findings"] = [
@@ -192,10 +177,8 @@ class FedDatabaseAdminAgent(MLXAgent):
         
         return analysis
     
-    @mlx_accelerate
-    def _analyze_optimization(self, times: mx.array) -> str:
-        """Analyze optimization potential using MLX"""
-        variance = mx.var(times)
+    def _analyze_optimization(self, variance: float) -> str:
+        """Analyze optimization potential from query time variance"""
         if variance > 100:
             return "High optimization potential"
         elif variance > 10:
@@ -213,6 +196,9 @@ class FedDatabaseAdminAgent(MLXAgent):
 
 class FedDevOpsAgent(MLXAgent):
     """DevOps Engineer Agent (2210) with MLX acceleration"""
+
+    # Minutes for successful deployment; reliability = % of deployments under it
+    SUCCESS_THRESHOLD = 5.0
     
     def __init__(self):
         super().__init__("devops_engineer", "federal_technical")
@@ -228,10 +214,12 @@ class FedDevOpsAgent(MLXAgent):
         
         # Analyze deployment metrics with MLX
         if "deployment_metrics" in context:
-            metrics = mx.array(context["deployment_metrics"])
+            stats = get_statistics_batcher().describe(
+                context["deployment_metrics"], threshold=self.SUCCESS_THRESHOLD
+            )
             analysis["ci_cd_performance"] = {
-                "avg_deployment_time": float(mx.mean(metrics)),
-                "deployment_reliability": self._calculate_reliability(metrics)
+                "avg_deployment_time": stats["mean"],
+                "deployment_reliability": stats["reliability"]
             }
         
         analysis["findings"] = [
@@ -242,13 +230,6 @@ class FedDevOpsAgent(MLXAgent):
         
         return analysis
     
-    @mlx_accelerate
-    def _calculate_reliability(self, metrics: mx.array) -> float:
-        """Calculate deployment reliability score"""
-        success_threshold = 5.0  # Minutes for successful deployment
-        successes = mx.sum(metrics < success_threshold)
-        return float(successes / len(metrics) * 100)
-    
     def generate_recommendations(self, analysis_results: Dict[str, Any]) -> List[str]:
         return [
             "Master Kubernetes and Docker for federal cloud",
@@ -283,9 +264,9 @@ class FedComplianceAgent(MLXAgent):
             keyword_embeddings = self.compute_embeddings(" ".join(star_keywords))
             
             # Manual cosine similarity computation
-            dot_product = mx.sum(embeddings * keyword_embeddings)
-            embedding_norm = mx.sqrt(mx.sum(embeddings ** 2))
-            keyword_norm = mx.sqrt(mx.sum(keyword_embeddings ** 2))
+            dot_product = xp.sum(embeddings * keyword_embeddings)
+            embedding_norm = xp.sqrt(xp.sum(embeddings ** 2))
+            keyword_norm = xp.sqrt(xp.sum(keyword_embeddings ** 2))
             similarity = dot_product / (embedding_norm * keyword_norm + 1e-8)
             analysis["star_compliance_score"] = float(similarity)
             
@@ -419,18 +400,13 @@ def get_agent(agent_name: str) -> MLXAgent:
 @app.get("/")
 async def root():
     """Root endpoint with MLX status"""
-    mlx_available = False
-    try:
-        test = mx.array([1, 2, 3])
-        mx.eval(test)
-        mlx_available = True
-    except:
-        pass
+    mlx_available = xp.is_mlx
     
     return {
         "message": "MLX-Accelerated Fed Job Advisor MCP Agent System",
         "agents": len(AGENTS),
         "mlx_enabled": mlx_available,
+        "backend": xp.name,
         "hardware": "Apple Silicon Optimized" if mlx_available else "CPU Mode"
     }
 
@@ -440,16 +416,16 @@ async def health():
     """Health check with MLX status"""
     mlx_status = "healthy"
     try:
-        # Test MLX operation
-        test_array = mx.array([1.0, 2.0, 3.0])
-        result = mx.mean(test_array)
-        mx.eval(result)
+        # Test a backend operation
+        result = xp.mean(xp.asarray([1.0, 2.0, 3.0]))
+        xp.eval(result)
     except Exception as e:
         mlx_status = f"degraded: {e}"
     
     return {
         "status": "healthy",
         "agents_available": len(AGENTS),
+        "backend": xp.name,
         "mlx_status": mlx_status
     }
 
@@ -475,8 +451,9 @@ async def analyze_with_agent(agent_name: str, request: AnalysisRequest):
         # Get the agent
         agent = get_agent(agent_name)
         
-        # Execute task with MLX acceleration
-        result = agent.execute_task(request.task, request.context)
+        # Execute off the event loop so concurrent requests reach the
+        # statistics batcher together instead of one at a time
+        result = await asyncio.to_thread(agent.execute_task, request.task, request.context)
         
         # Generate documentation file path
         doc_file = f"/Users/jasonewillis/Developer/jwRepos/JLWAI/fedJobAdvisor/_Management/_PM/_Tasks/{agent_name.upper()}_MLX_RESEARCH.md"
@@ -532,8 +509,10 @@ async def get_performance_metrics():
         "overall": {
             "total_tasks": total_tasks,
             "mlx_accelerated": total_accelerated,
-            "acceleration_rate": (total_accelerated / max(total_tasks, 1)) * 100
-        }
+            "acceleration_rate": (total_accelerated / max(total_tasks, 1)) * 100,
+            "backend": xp.name
+        },
+        "statistics_batching": get_statistics_batcher().stats()
     }
 
 
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Batched Descriptive Statistics for the MLX agent server
+Moments, percentiles and threshold reliability for many samples in one
+vectorized pass on the active array backend, with a micro-batcher that
+coalesces concurrent agent requests into those passes
+"""
+
+import math
+import os
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from mlx_backend import ArrayBackend, get_backend
+
+DEFAULT_PERCENTILES = (50.0, 95.0, 99.0)
+
+
+def _padded(samples: Sequence[Any]) -> Any:
+    """(values, mask, lengths) with ragged samples left-aligned in a zero-padded matrix"""
+    arrays = [np.asarray(s, dtype=np.float64).ravel() for s in samples]
+    lengths = np.array([len(a) for a in arrays], dtype=np.int64)
+    width = max(int(lengths.max()) if len(lengths) else 0, 1)
+    mask = np.arange(width) < lengths[:, None]
+    values = np.zeros((len(arrays), width), dtype=np.float64)
+    # Row-major True positions of the mask line up with the concatenated samples
+    values[mask] = np.concatenate(arrays) if arrays else []
+    return values, mask, lengths
+
+
+def _finite(value: float) -> Optional[float]:
+    return value if math.isfinite(value) else None
+
+
+def describe_batch(samples: Sequence[Any], percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+                   thresholds: Optional[Sequence[Optional[float]]] = None,
+                   backend: Optional[ArrayBackend] = None) -> List[Dict[str, Optional[float]]]:
+    """
+    Statistics for each sample: count, mean, variance, std, min, max, skewness,
+    excess kurtosis, requested percentiles (linear interpolation, as numpy) and,
+    where a threshold is given, reliability = % of values below it
+
+    Population moments match the per-sample formulas the agents used before;
+    undefined values (empty samples, zero variance) are None.
+    """
+    if not len(samples):
+        return []
+    xp = backend or get_backend()
+    values, mask, lengths = _padded(samples)
+    # Empty and constant samples divide by zero; they are reported as None
+    with np.errstate(divide="ignore", invalid="ignore"):
+        columns = _describe_columns(xp, values, mask, lengths, percentiles, thresholds)
+
+    results = []
+    for row, count in enumerate(lengths.tolist()):
+        result: Dict[str, Optional[float]] = {"count": count}
+        for name, column in columns.items():
+            if name == "reliability" and thresholds[row] is None:
+                continue
+            result[name] = _finite(column[row]) if count else None
+        results.append(result)
+    return results
+
+
+def _describe_columns(xp: ArrayBackend, values: np.ndarray, mask: np.ndarray, lengths: np.ndarray,
+                      percentiles: Sequence[float], thresholds: Optional[Sequence[Optional[float]]]
+                      ) -> Dict[str, List[float]]:
+    x = xp.asarray(values)
+    m = xp.asarray(mask.astype(values.dtype))
+    n = xp.asarray(lengths.astype(values.dtype))
+
+    mean = xp.sum(x * m, axis=1) / n
+    deviation = (x - mean[:, None]) * m
+    squared = deviation * deviation
+    m2 = xp.sum(squared, axis=1) / n
+    m3 = xp.sum(squared * deviation, axis=1) / n
+    m4 = xp.sum(squared * squared, axis=1) / n
+    std = xp.sqrt(m2)
+
+    # Padding sorts to the end, so a row's first n entries are its sorted values
+    ordered = xp.sort(xp.where(m > 0, x, math.inf), axis=1)
+    stats = {
+        "mean": mean,
+        "variance": m2,
+        "std": std,
+        "min": ordered[:, 0],
+        "max": xp.max(xp.where(m > 0, x, -math.inf), axis=1),
+        "skewness": m3 / (std * std * std),
+        "kurtosis": m4 / (m2 * m2) - 3,
+    }
+
+    last = np.maximum(lengths - 1, 0)
+    for q in percentiles:
+        position = q / 100.0 * last
+        low = np.floor(position).astype(np.int64)
+        high = np.minimum(low + 1, last)
+        fraction = xp.asarray((position - low).astype(values.dtype))
+        low_values = xp.take_along_axis(ordered, xp.asarray(low[:, None]), axis=1)[:, 0]
+        high_values = xp.take_along_axis(ordered, xp.asarray(high[:, None]), axis=1)[:, 0]
+        stats[f"p{q:g}"] = low_values + (high_values - low_values) * fraction
+
+    if thresholds is not None:
+        limits = np.array([math.nan if t is None else t for t in thresholds], dtype=values.dtype)
+        below = xp.sum((x < xp.asarray(limits)[:, None]) * m, axis=1)
+        stats["reliability"] = below / n * 100
+
+    xp.eval(*stats.values())
+    return {name: xp.to_numpy(column).tolist() for name, column in stats.items()}
+
+
+class _Pending:
+    __slots__ = ("values", "percentiles", "threshold", "result", "error", "done")
+
+    def __init__(self, values: Any, percentiles: Sequence[float], threshold: Optional[float]):
+        self.values = values
+        self.percentiles = percentiles
+        self.threshold = threshold
+        self.result: Optional[Dict[str, Optional[float]]] = None
+        self.error: Optional[BaseException] = None
+        self.done = threading.Event()
+
+
+class StatisticsBatcher:
+    """
+    Coalesces describe() calls from concurrent request threads
+
+    The first caller of a batch waits up to `window_ms` for others (or until
+    `max_batch` are queued), computes the whole batch with one describe_batch
+    call and hands each caller its row. A zero window computes every call
+    immediately.
+    """
+
+    def __init__(self, window_ms: Optional[float] = None, max_batch: int = 256,
+                 backend: Optional[ArrayBackend] = None):
+        if window_ms is None:
+            window_ms = float(os.getenv("MLX_STATS_BATCH_WINDOW_MS", "2"))
+        self.window = window_ms / 1000.0
+        self.max_batch = max_batch
+        self.backend = backend
+        self._cond = threading.Condition()
+        self._pending: List[_Pending] = []
+        self.batches = 0
+        self.requests = 0
+
+    def describe(self, values: Any, percentiles: Sequence[float] = (),
+                 threshold: Optional[float] = None) -> Dict[str, Optional[float]]:
+        request = _Pending(values, tuple(percentiles), threshold)
+        if self.window <= 0:
+            self._run([request])
+        else:
+            with self._cond:
+                self._pending.append(request)
+                leader = len(self._pending) == 1
+                if len(self._pending) >= self.max_batch:
+                    self._cond.notify_all()
+            if leader:
+                with self._cond:
+                    self._cond.wait_for(lambda: len(self._pending) >= self.max_batch, timeout=self.window)
+                    batch, self._pending = self._pending, []
+                self._run(batch)
+            else:
+                request.done.wait()
+
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def _run(self, batch: List[_Pending]) -> None:
+        try:
+            percentiles = sorted({q for request in batch for q in request.percentiles})
+            thresholds = [request.threshold for request in batch]
+            rows = describe_batch(
+                [request.values for request in batch], percentiles,
+                thresholds if any(t is not None for t in thresholds) else None, self.backend
+            )
+            for request, row in zip(batch, rows):
+                # Each caller sees only the percentiles it asked for
+                extra = {f"p{q:g}" for q in percentiles} - {f"p{q:g}" for q in request.percentiles}
+                request.result = {k: v for k, v in row.items() if k not in extra}
+        except Exception as e:
+            for request in batch:
+                request.error = e
+        finally:
+            with self._cond:
+                self.batches += 1
+                self.requests += len(batch)
+            for request in batch:
+                request.done.set()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "average_batch": round(self.requests / self.batches, 2) if self.batches else 0.0,
+            "window_ms": self.window * 1000,
+        }
+
+
+_batcher: Optional[StatisticsBatcher] = None
+_batcher_lock = threading.Lock()
+
+
+def get_statistics_batcher() -> StatisticsBatcher:
+    """Process-wide batcher shared by the agents of the MLX server"""
+    global _batcher
+
+    with _batcher_lock:
+        if _batcher is None:
+            _batcher = StatisticsBatcher()
+    return _batcher
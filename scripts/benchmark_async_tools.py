@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Async Tool Execution Benchmark
+Runs concurrent analytics-agent requests that each need two I/O-bound tool
+calls (simulated with a fixed latency) against the Ollama stand-in, comparing
+the previous execution (sync executor in asyncio.to_thread, sync tools, one
+tool per step) with ainvoke, coroutine tools and both calls in one step.
+Reports request latency, wall time, LLM calls and worker threads used.
+"""
+
+import argparse
+import asyncio
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from benchmark_prompt_prefix import OllamaStandIn
+from langchain.agents import AgentExecutor, create_react_agent
+from langchain.tools import Tool
+
+from agents.app.agents.async_tools import async_tool
+from agents.app.agents.automation.analytics_intelligence import AnalyticsIntelligenceAgent
+from agents.app.agents.base import AgentConfig
+
+TOOLS = ["salary_analyzer", "location_analyzer"]
+JOBS = '{"job_data": [{"grade": "GS-13", "location": "Denver, CO", "salary_min": 112000}]}'
+
+
+def respond(parallel: bool):
+    """Stand-in model: request both tools (together or one per step), then answer"""
+    def reply(prompt: str) -> str:
+        done = prompt.rsplit("Question:", 1)[-1].count("Observation:")
+        if done >= len(TOOLS):
+            return "Thought: I now know the final answer\nFinal Answer: Denver pays locality above base."
+        pending = TOOLS[done:] if parallel else TOOLS[done:done + 1]
+        return "Thought: gather data\n" + "\n".join(f"Action: {name}\nAction Input: {JOBS}" for name in pending)
+    return reply
+
+
+def with_latency(tool: Tool, latency: float, asynchronous: bool) -> Tool:
+    """The same tool behind a simulated remote call"""
+    def call(query: str) -> str:
+        time.sleep(latency)
+        return tool.func(query)
+
+    async def acall(query: str) -> str:
+        await asyncio.sleep(latency)
+        return tool.func(query)
+    return Tool(name=tool.name, description=tool.description, func=call, coroutine=acall if asynchronous else None)
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Default executor that records how many threads the event loop asked for"""
+
+    def __init__(self):
+        super().__init__(max_workers=64)
+        self.submitted = 0
+
+    def submit(self, fn, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+async def run_mode(server: OllamaStandIn, mode: str, requests: int, latency: float):
+    executor = CountingExecutor()
+    asyncio.get_running_loop().set_default_executor(executor)
+    agents = []
+    for i in range(requests):
+        agent = AnalyticsIntelligenceAgent(AgentConfig(role="analytics_intelligence", user_id=f"bench-{mode}-{i}",
+                                                       context_budget=False, enable_memory=False, timeout=120))
+        agent.llm.base_url = server.url
+        tools = {tool.name: tool for tool in agent._load_tools()}
+        if mode == "to_thread":
+            agent.tools = [with_latency(tools[name], latency, asynchronous=False) for name in TOOLS]
+            agent.agent = AgentExecutor(agent=create_react_agent(agent.llm, agent.tools, agent.prompt),
+                                        tools=agent.tools, max_iterations=3, handle_parsing_errors=True)
+        else:
+            agent.tools = [async_tool(with_latency(tools[name], latency, asynchronous=True)) for name in TOOLS]
+            agent.agent = agent._create_agent()
+        agents.append(agent)
+
+    peak_threads = threading.active_count()
+    latencies = []
+
+    async def one(agent):
+        nonlocal peak_threads
+        started = time.perf_counter()
+        if mode == "to_thread":
+            # The previous FederalJobAgent.process: blocking invoke in a worker thread
+            await asyncio.to_thread(agent.agent.invoke, {"input": "Where does GS-13 pay best?", "context": "{}"})
+        else:
+            await agent.process("Where does GS-13 pay best?", {})
+        latencies.append(time.perf_counter() - started)
+        peak_threads = max(peak_threads, threading.active_count())
+
+    executor.submitted = 0
+    started = time.perf_counter()
+    await asyncio.gather(*(one(agent) for agent in agents))
+    return time.perf_counter() - started, latencies, executor.submitted, peak_threads
+
+
+def main(requests: int, latency: float, prompt_ms: float) -> None:
+    print("=" * 60)
+    print(f"🧵 Async tools: {requests} concurrent requests, 2 tools x {latency * 1000:.0f} ms each")
+    print("=" * 60)
+
+    for mode in ("to_thread", "async"):
+        server = OllamaStandIn(load_ms=0, prompt_ms=prompt_ms, eval_ms=0.1, default_keep_alive=3600,
+                               respond=respond(parallel=mode == "async"))
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            wall, latencies, submitted, peak = asyncio.run(run_mode(server, mode, requests, latency))
+        finally:
+            server.shutdown()
+        latencies.sort()
+        print(f"{mode:>10}: wall {wall * 1000:.0f} ms, request p50 {latencies[len(latencies) // 2] * 1000:.0f} ms, "
+              f"max {latencies[-1] * 1000:.0f} ms, LLM calls {len(server.requests)}")
+        print(f"{'':>10}  executor jobs {submitted} ({submitted / requests:.1f}/request), peak threads {peak}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark async tool execution against an Ollama stand-in")
+    parser.add_argument("--requests", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.25, help="simulated tool I/O latency in seconds")
+    parser.add_argument("--prompt-ms", type=float, default=0.05, help="stand-in prompt eval time per token")
+    args = parser.parse_args()
+    main(args.requests, args.latency, args.prompt_ms)
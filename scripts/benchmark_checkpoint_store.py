@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Checkpoint Storage Benchmark
+Writes a synthetic time-travel run (workflows of growing message lists, agent
+outputs and a large static job/resume context) two ways: the previous layout,
+full state JSON per checkpoint with a commit per insert, and the checkpoint
+store (content-addressed snapshot chunks, JSON-patch deltas, batched
+transactions). Reports database size, insert throughput and replay time,
+and checks that replayed states and diffs between checkpoints are exact.
+"""
+
+import argparse
+import json
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import jsonpatch
+
+from agents.app.agents.checkpoint_store import CheckpointStore, normalize
+
+METADATA_SQL = "INSERT INTO checkpoint_metadata VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+METADATA_TABLE = """
+    CREATE TABLE checkpoint_metadata (
+        checkpoint_id TEXT PRIMARY KEY, thread_id TEXT NOT NULL, timestamp TEXT NOT NULL,
+        event_type TEXT NOT NULL, workflow_type TEXT, phase TEXT, state_hash TEXT,
+        performance_metrics TEXT, debug_notes TEXT, parent_checkpoint TEXT
+    )
+"""
+AGENTS = ["resume_analyst", "compliance_officer", "salary_analyst", "cover_letter_writer"]
+PHASES = ["intake", "analysis", "drafting", "review", "complete"]
+
+
+def synthetic_run(steps: int, steps_per_workflow: int, seed: int):
+    """(thread_id, checkpoint_id, state) for each step of workflows run one after another"""
+    rng = random.Random(seed)
+    job_context = {
+        "announcement": "".join(rng.choice("abcdefghij ") for _ in range(12000)),
+        "qualifications": [f"Specialized experience {i}" for i in range(80)],
+    }
+    for start in range(0, steps, steps_per_workflow):
+        thread_id = f"workflow_{start // steps_per_workflow}"
+        resume = "".join(rng.choice("klmnopqrst ") for _ in range(6000))
+        state = {"job_context": job_context, "resume": resume, "messages": [], "agent_outputs": {},
+                 "phase": PHASES[0], "progress": 0.0, "errors": []}
+        for step in range(min(steps_per_workflow, steps - start)):
+            state = dict(state, messages=state["messages"] + [{
+                "role": rng.choice(["user", "agent"]),
+                "content": " ".join(rng.choice(["GS-13", "series", "2210", "experience", "KSA"]) for _ in range(12)),
+            }])
+            agent = rng.choice(AGENTS)
+            state["agent_outputs"] = dict(state["agent_outputs"], **{agent: {"score": round(rng.random(), 4),
+                                                                             "step": step}})
+            state["phase"] = PHASES[min(len(PHASES) - 1, step * len(PHASES) // steps_per_workflow)]
+            state["progress"] = round(step / steps_per_workflow, 3)
+            if rng.random() < 0.05:
+                state["errors"] = state["errors"] + [f"{agent} timed out"]
+            yield thread_id, f"{thread_id}_{step}", state
+
+
+def metadata_row(thread_id: str, checkpoint_id: str, state: dict, state_hash: str, parent):
+    return (checkpoint_id, thread_id, datetime.utcnow().isoformat(), "phase_complete", "user_facing",
+            state["phase"], state_hash, "{}", "", parent)
+
+
+def db_size(path: Path, conn: sqlite3.Connection) -> int:
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")  # no-op outside WAL mode
+    return path.stat().st_size
+
+
+def run_full_json(path: Path, run):
+    """Previous layout: whole state as JSON per checkpoint, one commit per insert (default journal)"""
+    conn = sqlite3.connect(str(path))
+    conn.execute(METADATA_TABLE)
+    conn.execute("CREATE TABLE checkpoint_state (checkpoint_id TEXT PRIMARY KEY, state TEXT NOT NULL)")
+    started = time.perf_counter()
+    for thread_id, checkpoint_id, state in run:
+        encoded = json.dumps(state, sort_keys=True, default=str)
+        conn.execute("INSERT INTO checkpoint_state VALUES (?, ?)", (checkpoint_id, encoded))
+        conn.execute(METADATA_SQL, metadata_row(thread_id, checkpoint_id, state, "", None))
+        conn.commit()
+    elapsed = time.perf_counter() - started
+
+    def replay(checkpoint_id):
+        row = conn.execute("SELECT state FROM checkpoint_state WHERE checkpoint_id = ?", (checkpoint_id,)).fetchone()
+        return json.loads(row[0])
+    return elapsed, db_size(path, conn), replay
+
+
+def run_store(path: Path, run, batch_size: int, snapshot_interval: int):
+    conn = sqlite3.connect(str(path))
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(METADATA_TABLE)
+    store = CheckpointStore(conn, batch_size=batch_size, snapshot_interval=snapshot_interval)
+    heads = {}
+    started = time.perf_counter()
+    for thread_id, checkpoint_id, state in run:
+        state_hash = store.put(checkpoint_id, state, base_id=heads.get(thread_id))
+        store.defer(METADATA_SQL, metadata_row(thread_id, checkpoint_id, state, state_hash, None))
+        heads[thread_id] = checkpoint_id
+    store.flush()
+    elapsed = time.perf_counter() - started
+    # Replay from disk, not from states cached while writing
+    reader = CheckpointStore(conn, cache_size=8)
+    return elapsed, db_size(path, conn), reader.get, store
+
+
+def main(steps: int, steps_per_workflow: int, batch_size: int, snapshot_interval: int, samples: int, seed: int):
+    print("=" * 60)
+    print(f"🗄️  Time-travel checkpoints: {steps} steps, {steps_per_workflow} per workflow")
+    print("=" * 60)
+
+    expected = {checkpoint_id: normalize(state)
+                for _, checkpoint_id, state in synthetic_run(steps, steps_per_workflow, seed)}
+    rng = random.Random(seed)
+    sample = rng.sample(sorted(expected), min(samples, len(expected)))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        full = run_full_json(Path(tmp) / "full.sqlite", synthetic_run(steps, steps_per_workflow, seed))
+        delta = run_store(Path(tmp) / "delta.sqlite", synthetic_run(steps, steps_per_workflow, seed),
+                          batch_size, snapshot_interval)
+
+        for label, (elapsed, size, replay, *_) in (("full JSON, commit per insert", full),
+                                                   ("chunks + deltas, batched", delta)):
+            started = time.perf_counter()
+            exact = all(replay(checkpoint_id) == expected[checkpoint_id] for checkpoint_id in sample)
+            replay_ms = (time.perf_counter() - started) * 1000 / len(sample)
+            print(f"{label:<30} {size / 1024 / 1024:8.2f} MiB  {steps / elapsed:8.0f} inserts/s  "
+                  f"replay {replay_ms:6.2f} ms  exact {exact}")
+
+        store = delta[3]
+        pairs = [tuple(rng.sample(sample, 2)) for _ in range(50)]
+        reader = CheckpointStore(store.conn, cache_size=8)
+        diffs_exact = all(jsonpatch.apply_patch(expected[a], reader.diff(a, b)) == expected[b] for a, b in pairs)
+        print(f"\nsize ratio {full[1] / delta[1]:.1f}x smaller, throughput {full[0] / delta[0]:.1f}x")
+        print(f"store: {store.stats}")
+        print(f"tables: {store.size()}")
+        print(f"diff between {len(pairs)} random checkpoint pairs exact: {diffs_exact}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark delta-encoded checkpoint storage")
+    parser.add_argument("--steps", type=int, default=10000)
+    parser.add_argument("--steps-per-workflow", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--snapshot-interval", type=int, default=50)
+    parser.add_argument("--samples", type=int, default=200, help="checkpoints replayed and verified")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+    main(args.steps, args.steps_per_workflow, args.batch_size, args.snapshot_interval, args.samples, args.seed)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Context Budget Benchmark
+Runs 20-turn analytics-agent sessions (market data passed as context, a tool
+call with a full JSON analysis per turn, long answers accumulating in memory)
+against the Ollama stand-in from benchmark_prompt_prefix.py, with and without
+the context budget, and reports prompt tokens per turn, truncations, evaluated
+tokens, latency and budget utilization
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from benchmark_prompt_prefix import OllamaStandIn
+
+from agents.app.agents.automation.analytics_intelligence import AnalyticsIntelligenceAgent
+from agents.app.agents.base import AgentConfig
+from agents.app.agents.context_budget import TOKEN_PATTERN
+
+AGENCIES = ["VA", "DoD", "DHS", "IRS", "SSA", "Census Bureau", "NASA", "HHS", "DOE", "EPA", "GSA", "OPM"]
+SERIES = ["0343", "1560", "2210", "1530", "0301", "0110", "1550"]
+
+
+def market_data(jobs: int, rng: random.Random) -> Dict[str, Any]:
+    return {"jobs": [
+        {"title": f"{rng.choice(['Data', 'IT', 'Program', 'Management'])} "
+                  f"{rng.choice(['Scientist', 'Specialist', 'Analyst'])}",
+         "series": rng.choice(SERIES), "grade": f"GS-{rng.randint(9, 15)}", "agency": rng.choice(AGENCIES),
+         "location": rng.choice(["Washington, DC", "Remote", "Denver, CO", "Austin, TX"]),
+         "salary_min": rng.randint(60, 140) * 1000, "summary": "Supports mission analytics " * rng.randint(3, 12)}
+        for _ in range(jobs)
+    ]}
+
+
+def respond_with_tool_then_answer(jobs: List[Dict[str, Any]], answer_words: int):
+    """Stand-in model: call trend_analyzer on the job data, then give a long final answer"""
+    action_input = json.dumps({"job_data": jobs, "time_period": "last_12_months"})
+    answer = " ".join(["Federal hiring for this series peaks in the first fiscal quarter."] * (answer_words // 10))
+
+    def respond(prompt: str) -> str:
+        scratchpad = prompt.rsplit("Question:", 1)[-1]
+        if "Observation:" in scratchpad:
+            return f"Thought: I now know the final answer\nFinal Answer: {answer}"
+        return f"Thought: Check posting trends first\nAction: trend_analyzer\nAction Input: {action_input}"
+    return respond
+
+
+async def run_session(server: OllamaStandIn, budgeted: bool, turns: int, context: Dict[str, Any]) -> Dict[str, Any]:
+    agent = AnalyticsIntelligenceAgent(AgentConfig(role="analytics_intelligence", user_id=f"bench-{budgeted}",
+                                                   context_budget=budgeted, timeout=120))
+    agent.llm.base_url = server.url
+    agent.redis_client = None
+
+    latencies, utilization = [], []
+    for turn in range(turns):
+        started = time.perf_counter()
+        response = await agent.process(f"Turn {turn + 1}: where is hiring growing for series 2210?", context)
+        latencies.append(time.perf_counter() - started)
+        report = (response.metadata or {}).get("context_budget")
+        if report:
+            utilization.append(report["utilization"])
+    return {"latencies": latencies, "utilization": utilization}
+
+
+def main(turns: int, jobs: int, answer_words: int, prompt_ms: float) -> None:
+    print("=" * 60)
+    print(f"📏 Context budget: {turns}-turn sessions, {jobs} postings of market data, "
+          f"~{answer_words}-word answers, num_ctx 4096 / num_predict 2000")
+    print("=" * 60)
+
+    rng = random.Random(3)
+    data = market_data(jobs, rng)
+    for budgeted in (False, True):
+        server = OllamaStandIn(load_ms=0, prompt_ms=prompt_ms, eval_ms=0.2, default_keep_alive=3600,
+                               respond=respond_with_tool_then_answer(data["jobs"][:25], answer_words),
+                               tokenize=TOKEN_PATTERN.findall)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            result = asyncio.run(run_session(server, budgeted, turns, {"market_data": data, "target_series": "2210"}))
+        finally:
+            server.shutdown()
+
+        records = server.requests
+        per_turn = [max(r["prompt_tokens"] for r in records[i:i + 2]) for i in range(0, len(records), 2)]
+        latencies = result["latencies"]
+        label = "budgeted" if budgeted else "unbounded"
+        print(f"{label:>10}: prompt tokens/call mean {sum(r['prompt_tokens'] for r in records) / len(records):,.0f}, "
+              f"turn 1 {per_turn[0]:,} -> turn {len(per_turn)} {per_turn[-1]:,}, "
+              f"over num_ctx {sum(r['truncated'] for r in records)}/{len(records)} calls")
+        print(f"{'':>10}  evaluated {sum(r['evaluated'] for r in records):,} tokens, "
+              f"turn latency mean {sum(latencies) / len(latencies) * 1000:.0f} ms, "
+              f"last 5 turns {sum(latencies[-5:]) / 5 * 1000:.0f} ms")
+        if result["utilization"]:
+            print(f"{'':>10}  budget utilization mean {sum(result['utilization']) / len(result['utilization']):.0%}, "
+                  f"max {max(result['utilization']):.0%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark context budgeting over long agent sessions")
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--jobs", type=int, default=200, help="job postings in the market data context")
+    parser.add_argument("--answer-words", type=int, default=120)
+    parser.add_argument("--prompt-ms", type=float, default=0.3, help="stand-in prompt eval time per token")
+    args = parser.parse_args()
+    main(args.turns, args.jobs, args.answer_words, args.prompt_ms)
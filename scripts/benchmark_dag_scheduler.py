@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+DAG Scheduler Benchmark
+Runs virtual-team plans with stub agents (each subtask sleeps for its
+estimated time) and compares makespans: the orchestrator's previous sequential
+execution, level-by-level gathering, and the DAG scheduler with FIFO and
+critical-path ordering of ready tasks under the same concurrency limit.
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from agents.app.agents.dag_scheduler import DAGScheduler, topological_order
+
+# VirtualTeamOrchestrator._parse_analysis sample plan (estimated minutes)
+SAMPLE_PLAN = {"subtask_1": [], "subtask_2": ["subtask_1"], "subtask_3": ["subtask_1"]}
+SAMPLE_MINUTES = {"subtask_1": 30, "subtask_2": 45, "subtask_3": 20}
+
+
+def layered_plan(tasks: int, rng: random.Random):
+    """Random plan: tasks in layers, each depending on 1-3 tasks of earlier layers"""
+    dependencies: Dict[str, List[str]] = {}
+    minutes: Dict[str, float] = {}
+    earlier: List[str] = []
+    layer: List[str] = []
+    for i in range(tasks):
+        task_id = f"t{i:02d}"
+        if earlier and rng.random() < 0.85:
+            dependencies[task_id] = rng.sample(earlier, min(len(earlier), rng.randint(1, 3)))
+        else:
+            dependencies[task_id] = []
+        minutes[task_id] = rng.choice([5, 10, 15, 30, 60])
+        layer.append(task_id)
+        if len(layer) >= rng.randint(2, 6):
+            earlier.extend(layer)
+            layer = []
+    return dependencies, minutes
+
+
+def stub(seconds: float):
+    async def run():
+        await asyncio.sleep(seconds)
+        return "ok"
+    return run
+
+
+async def sequential(dependencies, seconds) -> float:
+    started = time.perf_counter()
+    for task_id in topological_order(dependencies):
+        await stub(seconds[task_id])()
+    return time.perf_counter() - started
+
+
+async def level_parallel(dependencies, seconds, max_concurrency: int) -> float:
+    """Gather one dependency level at a time (a level waits for the whole previous level)"""
+    level: Dict[str, int] = {}
+    for task_id in topological_order(dependencies):
+        level[task_id] = 1 + max((level[dep] for dep in dependencies[task_id]), default=-1)
+    slots = asyncio.Semaphore(max_concurrency)
+
+    async def bounded(task_id):
+        async with slots:
+            await stub(seconds[task_id])()
+
+    started = time.perf_counter()
+    for depth in range(max(level.values()) + 1):
+        await asyncio.gather(*(bounded(task_id) for task_id, d in level.items() if d == depth))
+    return time.perf_counter() - started
+
+
+async def dag(dependencies, seconds, minutes, max_concurrency: int, critical_path_first: bool):
+    scheduler = DAGScheduler(max_concurrency=max_concurrency, critical_path_first=critical_path_first)
+    return await scheduler.run({task_id: stub(seconds[task_id]) for task_id in dependencies}, dependencies, minutes)
+
+
+def compare(name: str, dependencies, minutes, scale: float, max_concurrency: int) -> None:
+    seconds = {task_id: value * scale for task_id, value in minutes.items()}
+    baseline = asyncio.run(sequential(dependencies, seconds))
+    levels = asyncio.run(level_parallel(dependencies, seconds, max_concurrency))
+    fifo = asyncio.run(dag(dependencies, seconds, minutes, max_concurrency, critical_path_first=False))
+    ranked = asyncio.run(dag(dependencies, seconds, minutes, max_concurrency, critical_path_first=True))
+
+    print(f"\n{name}: {len(dependencies)} subtasks, max concurrency {max_concurrency}")
+    print(f"  {'sequential':<22} {baseline * 1000:8.0f} ms")
+    for label, makespan in (("level-by-level", levels), ("DAG, FIFO ready queue", fifo.makespan),
+                            ("DAG, critical path", ranked.makespan)):
+        print(f"  {label:<22} {makespan * 1000:8.0f} ms  ({baseline / makespan:.2f}x)")
+    if len(dependencies) <= 5:
+        for task_id, task in ranked.tasks.items():
+            print(f"    {task_id}: {task.started * 1000:6.0f} -> {task.finished * 1000:6.0f} ms")
+
+
+def main(tasks: int, max_concurrency: int, scale: float, seed: int) -> None:
+    print("=" * 60)
+    print(f"🕸️  DAG scheduling of virtual-team plans, stub agents at {scale * 1000:.0f} ms per estimated minute")
+    print("=" * 60)
+
+    compare("Sample plan", SAMPLE_PLAN, SAMPLE_MINUTES, scale, max_concurrency)
+    dependencies, minutes = layered_plan(tasks, random.Random(seed))
+    compare("Layered plan", dependencies, minutes, scale, max_concurrency)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark DAG scheduling of dependent subtasks")
+    parser.add_argument("--tasks", type=int, default=40)
+    parser.add_argument("--max-concurrency", type=int, default=4)
+    parser.add_argument("--scale", type=float, default=0.002, help="stub seconds per estimated minute")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    main(args.tasks, args.max_concurrency, args.scale, args.seed)
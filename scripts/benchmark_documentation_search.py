@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Documentation Search Benchmark
+Measures cold/warm index build over docs/ + docs_unified/, query latency
+percentiles, and prompt size of ranked snippets versus whole documentation files
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from mcp_services.utils.documentation_store import DocumentationStore
+from mcp_services.utils.documentation_search import DocumentationSearchIndex, DEFAULT_DOCS_ROOTS, REPO_ROOT
+
+QUERIES = [
+    ("Fields=Full pagination", "usajobs"),
+    ("ResultsPerPage rate limit", "usajobs"),
+    ("docker compose healthcheck depends_on", None),
+    ('"rate limit"', None),
+    ("stripe webhook signature verification", None),
+    ("sentry performance monitoring sample rate", None),
+    ("slack bot token scopes", None),
+    ("GS-13 data scientist series 1560", None),
+    ("postgres connection pooling", None),
+    ("agent orchestration workflow", None),
+]
+
+
+def percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def main(rounds: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        store = DocumentationStore(Path(tmp) / "documentation.sqlite")
+
+        print("=" * 60)
+        print("🔍 Documentation search benchmark")
+        print("=" * 60)
+
+        start = time.perf_counter()
+        index = DocumentationSearchIndex(roots=DEFAULT_DOCS_ROOTS, store=store)
+        cold = index.refresh()
+        cold_s = time.perf_counter() - start
+        print(f"Cold build:  {cold_s:.2f}s ({cold['documents']} docs, {cold['passages']} passages, "
+              f"{cold['terms']} terms)")
+
+        # Fresh index over an already-populated store (process restart)
+        start = time.perf_counter()
+        DocumentationSearchIndex(roots=DEFAULT_DOCS_ROOTS, store=store).refresh()
+        print(f"Restart:     {time.perf_counter() - start:.2f}s (store warm, index rebuilt)")
+
+        warm = index.refresh()
+        print(f"No-op sync:  {warm['seconds']:.3f}s ({warm['indexed']} re-indexed)")
+
+        latencies = []
+        for _ in range(rounds):
+            for query, service in QUERIES:
+                start = time.perf_counter()
+                index.search(query, limit=5, service=service)
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        print(f"Query:       p50 {statistics.median(latencies):.2f} ms | "
+              f"p99 {percentile(latencies, 99):.2f} ms | max {max(latencies):.2f} ms "
+              f"({len(latencies)} queries)")
+
+        # Prompt size: distinct whole files behind the top results vs the snippets themselves
+        whole_chars = snippet_chars = 0
+        for query, service in QUERIES:
+            results = index.search(query, limit=3, service=service)
+            files = {r["path"] for r in results}
+            whole_chars += sum(os.path.getsize(REPO_ROOT / f) for f in files)
+            snippet_chars += len(index.relevant_context(query, service=service, limit=3))
+
+        print(f"Prompt size: whole files {whole_chars:,} chars vs snippets {snippet_chars:,} chars "
+              f"({whole_chars / max(snippet_chars, 1):.0f}x smaller)")
+        store.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark BM25 documentation search")
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+    main(args.rounds)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Documentation Store Benchmark
+Constructs 30 service specialists and reports construction time and resident
+memory for the shared DocumentationStore versus the legacy per-instance
+pickle blob (complete_docs.cache) loading
+"""
+
+import argparse
+import json
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+SERVICES = 30
+
+
+def rss_kb() -> int:
+    status = Path("/proc/self/status")
+    if status.exists():
+        for line in status.read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def generate_docs(root: Path) -> None:
+    """~300 KB of manifest/reference/example files per service"""
+    for i in range(SERVICES):
+        service = root / f"service_{i}"
+        for sub in ("official", "best_practices", "troubleshooting", "examples"):
+            (service / sub).mkdir(parents=True, exist_ok=True)
+        (service / "manifest.json").write_text(json.dumps({"service": f"service_{i}", "critical_concepts": ["auth"]}))
+        reference = {f"endpoint_{n}": {"description": "x" * 400, "params": list(range(20))} for n in range(300)}
+        (service / "official" / "api_reference.json").write_text(json.dumps(reference))
+        (service / "best_practices" / "patterns.json").write_text(json.dumps({"always": ["y" * 200] * 100}))
+        (service / "troubleshooting" / "common_issues.json").write_text(json.dumps({"issue": ["z" * 200] * 100}))
+        for n in range(20):
+            (service / "examples" / f"example_{n}.py").write_text("print('example')\n" * 200)
+
+
+def make_specialist_class():
+    from mcp_services.base_specialist import ServiceSpecialistBase
+
+    class BenchSpecialist(ServiceSpecialistBase):
+        def _initialize_knowledge_base(self) -> Dict[str, Any]:
+            # Typical specialists only need the manifest at construction
+            return {"critical": self.documentation["manifest"].get("critical_concepts", [])}
+
+        def _get_default_manifest(self): return {}
+        def _get_embedded_api_reference(self): return {}
+        def _get_embedded_best_practices(self): return {}
+        def _get_embedded_troubleshooting(self): return {}
+        def _get_embedded_examples(self): return {}
+
+    return BenchSpecialist
+
+
+def legacy_load(docs_path: Path, cache_file: Path) -> Dict[str, Any]:
+    """Previous behaviour: read every section, pickle the blob, unpickle per instance"""
+    if cache_file.exists():
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+
+    def read_json(path: Path):
+        return json.loads(path.read_text()) if path.exists() else {}
+
+    docs = {
+        "manifest": read_json(docs_path / "manifest.json"),
+        "api_reference": read_json(docs_path / "official" / "api_reference.json"),
+        "best_practices": read_json(docs_path / "best_practices" / "patterns.json"),
+        "troubleshooting": read_json(docs_path / "troubleshooting" / "common_issues.json"),
+        "examples": {p.stem: p.read_text() for p in (docs_path / "examples").glob("*")},
+    }
+    with open(cache_file, 'wb') as f:
+        pickle.dump(docs, f)
+    return docs
+
+
+def run_mode(mode: str, docs_root: Path, work: Path) -> Dict[str, float]:
+    """Construct SERVICES specialists twice (cold caches, then warm) and measure the warm pass"""
+    os.environ["DOCUMENTATION_STORE_PATH"] = str(work / "documentation.sqlite")
+    BenchSpecialist = make_specialist_class()
+
+    def build_all():
+        instances = []
+        for i in range(SERVICES):
+            docs_path = docs_root / f"service_{i}"
+            if mode == "legacy":
+                instances.append(legacy_load(docs_path, work / f"service_{i}.cache"))
+            else:
+                instances.append(BenchSpecialist(f"service_{i}", docs_path=docs_path))
+        return instances
+
+    build_all()  # populate pickle blobs / store rows
+    baseline = rss_kb()
+    start = time.perf_counter()
+    instances = build_all()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "construct_ms_per_specialist": round(elapsed * 1000 / SERVICES, 3),
+        "rss_delta_mb": round((rss_kb() - baseline) / 1024, 1),
+        "instances": len(instances),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark specialist documentation loading")
+    parser.add_argument("--mode", choices=["legacy", "store"])
+    parser.add_argument("--docs-root")
+    parser.add_argument("--work")
+    args = parser.parse_args()
+
+    if args.mode:
+        # Child process: one mode per interpreter so RSS numbers are independent
+        import contextlib, io
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = run_mode(args.mode, Path(args.docs_root), Path(args.work))
+        print(json.dumps(result))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        docs_root = Path(tmp) / "docs"
+        generate_docs(docs_root)
+
+        print("=" * 60)
+        print(f"📚 Documentation loading for {SERVICES} specialists")
+        print("=" * 60)
+
+        for mode in ("legacy", "store"):
+            work = Path(tmp) / mode
+            work.mkdir()
+            output = subprocess.run(
+                [sys.executable, __file__, "--mode", mode, "--docs-root", str(docs_root), "--work", str(work)],
+                capture_output=True, text=True, check=True
+            )
+            result = json.loads(output.stdout.strip().splitlines()[-1])
+            print(f"{mode:>6}: {result['construct_ms_per_specialist']} ms/specialist, "
+                  f"+{result['rss_delta_mb']} MB RSS for {result['instances']} instances")
+
+
+if __name__ == "__main__":
+    main()
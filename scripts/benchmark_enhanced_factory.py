@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Enhanced Agent Factory Cold-Start Benchmark
+Starts the factory against the Ollama stand-in the previous way (one LLM object
+per role, every agent built in the constructor, a new HTTP connection per call)
+and the lazy way (agents built on first use, one LLM per model/settings, one
+pooled HTTP client), then serves the first tasks for a few roles. Reports
+startup time, time to the first answer, Python heap held by the factory
+(tracemalloc), LLM objects and agents resident.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from benchmark_prompt_prefix import OllamaStandIn
+
+from agents.app.agents.enhanced_factory import EnhancedAgentFactory
+from agents.app.agents.ollama_client import SharedClientOllama
+
+ANSWER = "Thought: I now know the final answer\nFinal Answer: Done."
+
+
+class EagerFactory(EnhancedAgentFactory):
+    """The previous factory: an LLM object per role and every agent built up front"""
+
+    def __init__(self):
+        super().__init__()
+        for role, model_name in self.config["models"].items():
+            settings = self.config["agent_settings"]
+            self.models[role] = SharedClientOllama(
+                model=model_name, base_url=os.environ["OLLAMA_BASE_URL"], temperature=settings["temperature"],
+                num_ctx=8192, num_gpu=1, repeat_penalty=1.1, timeout=settings["timeout"]
+            )
+        self.warm_up()
+
+    def _get_model(self, role: str) -> SharedClientOllama:
+        return self.models[role]
+
+    def build_report(self):
+        return {**super().build_report(), "llm_objects": len(self.models)}
+
+
+async def serve(factory: EnhancedAgentFactory, roles: List[str], started: float) -> float:
+    first = None
+    for result in asyncio.as_completed([factory.execute_task(role, "Summarize open work") for role in roles]):
+        await result
+        first = first or time.perf_counter() - started
+    await factory.http_client.aclose()
+    return first
+
+
+def run(mode: str, roles: List[str]):
+    tracemalloc.start()
+    started = time.perf_counter()
+    factory = EagerFactory() if mode == "eager" else EnhancedAgentFactory()
+    startup = time.perf_counter() - started
+    first_answer = asyncio.run(serve(factory, roles, started))
+    resident, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return startup, first_answer, resident, factory.build_report()
+
+
+def main(roles: List[str], load_ms: float) -> None:
+    print("=" * 60)
+    print(f"🏭 Agent factory cold start: first tasks for {', '.join(roles)}")
+    print("=" * 60)
+
+    server = OllamaStandIn(load_ms=load_ms, prompt_ms=0.01, eval_ms=0.1, default_keep_alive=3600,
+                           respond=lambda prompt: ANSWER)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ["OLLAMA_BASE_URL"] = server.url
+
+    try:
+        for mode in ("eager", "lazy"):
+            startup, first_answer, resident, report = run(mode, roles)
+            print(f"{mode:>6}: startup {startup * 1000:7.1f} ms, first answer {first_answer * 1000:7.1f} ms, "
+                  f"heap {resident / 1024:8.0f} KiB")
+            print(f"{'':>6}  agents {len(report['loaded'])}/{len(report['available'])}, "
+                  f"LLM objects {report['llm_objects']}, HTTP {report['http_client']}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark EnhancedAgentFactory cold start and memory")
+    parser.add_argument("--roles", nargs="+", default=["backend_engineer", "database_admin", "email_handler"])
+    parser.add_argument("--load-ms", type=float, default=0, help="stand-in model load time")
+    args = parser.parse_args()
+    main(args.roles, args.load_ms)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Job Matching Benchmark
+Builds a BM25 job match index over synthetic postings (100k by default), then
+measures incremental ingest, single-resume top-k latency, batch scoring
+throughput and save/load time
+"""
+
+import argparse
+import itertools
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from agents.app.agents.job_matching import JobMatchIndex
+
+DOMAIN_TERMS = [
+    "python", "sql", "oracle", "kubernetes", "docker", "terraform", "ansible", "cisco", "firewall",
+    "statistics", "regression", "survey", "sampling", "machine", "learning", "tableau", "spark",
+    "cybersecurity", "nist", "fedramp", "incident", "itil", "helpdesk", "linux", "windows",
+    "active", "directory", "vmware", "backup", "recovery", "aws", "azure", "jenkins", "gitlab",
+    "budget", "acquisition", "contract", "policy", "analysis", "program", "management", "grants",
+]
+
+
+def make_vocabulary(size: int, rng: random.Random) -> list:
+    syllables = ["ad", "min", "is", "tra", "tion", "sys", "tem", "an", "al", "y", "sis", "pro",
+                 "gram", "sup", "port", "ser", "vice", "op", "er", "ate", "net", "work", "dev"]
+    words = set(DOMAIN_TERMS)
+    while len(words) < size:
+        words.add("".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))))
+    return list(words)
+
+
+def make_text(vocabulary: list, cum_weights: list, words: int, rng: random.Random) -> str:
+    return " ".join(rng.choices(vocabulary, cum_weights=cum_weights, k=words))
+
+
+def make_jobs(count: int, start: int, vocabulary: list, weights: list, rng: random.Random) -> list:
+    return [{
+        "job_id": f"job-{start + i}",
+        "title": make_text(DOMAIN_TERMS, None, 3, rng),
+        "summary": make_text(vocabulary, weights, 60, rng),
+        "duties": [make_text(vocabulary, weights, 40, rng) for _ in range(3)],
+        "qualifications": make_text(vocabulary, weights, 80, rng) + " " + make_text(DOMAIN_TERMS, None, 10, rng),
+    } for i in range(count)]
+
+
+def main(postings: int, resumes: int, k: int) -> None:
+    rng = random.Random(11)
+    vocabulary = make_vocabulary(20000, rng)
+    # Zipf-like term frequencies
+    weights = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(len(vocabulary))))
+
+    print("=" * 60)
+    print(f"🔎 Job matching: {postings} postings, {resumes} resumes, top-{k}")
+    print("=" * 60)
+
+    index = JobMatchIndex()
+    ingest = 0.0
+    batch = 5000
+    for start in range(0, postings, batch):
+        jobs = make_jobs(min(batch, postings - start), start, vocabulary, weights, rng)
+        t0 = time.perf_counter()
+        index.add_jobs(jobs)
+        ingest += time.perf_counter() - t0
+    t0 = time.perf_counter()
+    index.compact()
+    compact = time.perf_counter() - t0
+    stats = index.stats()
+    print(f"Ingest: {ingest:.2f}s ({postings / ingest:,.0f} postings/s, "
+          f"{stats['terms']:,} terms, {stats['nonzeros']:,} nonzeros); final compact {compact:.2f}s")
+
+    queries = [
+        make_text(DOMAIN_TERMS, None, 25, rng) + " " + make_text(vocabulary, weights, 120, rng)
+        for _ in range(resumes)
+    ]
+
+    for explain in (False, True):
+        timings = []
+        for query in queries:
+            t0 = time.perf_counter()
+            index.match(query, k=k, explain=explain)
+            timings.append((time.perf_counter() - t0) * 1000)
+        timings.sort()
+        label = "match+explain" if explain else "match"
+        print(f"{label:>14}: p50 {statistics.median(timings):.1f} ms, "
+              f"p95 {timings[int(len(timings) * 0.95) - 1]:.1f} ms per resume")
+
+    t0 = time.perf_counter()
+    index.match_many(queries, k=k)
+    elapsed = time.perf_counter() - t0
+    print(f"{'match_many':>14}: {elapsed * 1000 / resumes:.1f} ms per resume ({resumes} resumes in {elapsed:.2f}s)")
+
+    jobs = make_jobs(1000, postings, vocabulary, weights, rng)
+    t0 = time.perf_counter()
+    index.add_jobs(jobs)
+    added = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    index.match(queries[0], k=k)
+    print(f"Incremental: +1000 postings in {added * 1000:.0f} ms, next match {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "job_match_index.npz"
+        t0 = time.perf_counter()
+        index.save(path)
+        saved = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        JobMatchIndex.load(path)
+        print(f"Persist: save {saved:.2f}s, load {time.perf_counter() - t0:.2f}s "
+              f"({path.stat().st_size / 1e6:.0f} MB)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark BM25 candidate-to-job matching")
+    parser.add_argument("--postings", type=int, default=100000)
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+    main(args.postings, args.resumes, args.k)
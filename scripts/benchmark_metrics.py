@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Metrics Overhead Benchmark
+Measures per-observation cost of the log-linear histogram against
+prometheus_client's fixed-bucket histogram, single-threaded and across worker
+threads, plus /metrics render time
+"""
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+from prometheus_client import CollectorRegistry, Histogram as PrometheusHistogram, generate_latest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from agents.app.agents.metrics import Histogram
+
+LABELS = ("route", "method", "status")
+
+
+def run(histogram, threads: int, observations: int) -> float:
+    """Nanoseconds per observation (wall clock across all threads)"""
+    per_thread = observations // threads
+
+    def worker():
+        for i in range(per_thread):
+            histogram.labels(route="/agents/analyze", method="POST", status="200").observe(0.001 * (i % 500))
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker_thread in workers:
+        worker_thread.start()
+    for worker_thread in workers:
+        worker_thread.join()
+    return (time.perf_counter() - start) / (per_thread * threads) * 1e9
+
+
+def main(observations: int) -> None:
+    print("=" * 60)
+    print(f"📈 Histogram observation cost ({observations:,} observations)")
+    print("=" * 60)
+
+    for threads in (1, 4, 8):
+        log_linear_ns = run(Histogram("latency_seconds", "bench", LABELS), threads, observations)
+        prometheus_ns = run(PrometheusHistogram("latency_seconds", "bench", LABELS, registry=None),
+                            threads, observations)
+        print(f"{threads} thread(s): log-linear {log_linear_ns:6.0f} ns/obs | "
+              f"prometheus_client {prometheus_ns:6.0f} ns/obs")
+
+    # Exposition cost with a realistic number of series
+    registry = CollectorRegistry()
+    histogram = Histogram("http_request_duration_seconds", "bench", LABELS, registry=registry)
+    for route in range(30):
+        for status in ("200", "400", "500"):
+            histogram.labels(route=f"/route/{route}", method="POST", status=status).observe(0.05)
+
+    start = time.perf_counter()
+    text = generate_latest(registry).decode()
+    print(f"/metrics render: {(time.perf_counter() - start) * 1000:.1f} ms for 90 series "
+          f"({len(text.splitlines())} lines)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark metrics recording overhead")
+    parser.add_argument("--observations", type=int, default=400_000)
+    args = parser.parse_args()
+    main(args.observations)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+MLX Backend Benchmark
+Compares the old list round-trip conversion in mlx_accelerate with buffer
+conversion on the active array backend, and per-request statistics against
+batched describe_batch passes and the threaded StatisticsBatcher
+"""
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from mlx_backend import get_backend
+from mlx_statistics import StatisticsBatcher, describe_batch
+
+xp = get_backend()
+
+
+def per_request_stats(sample: np.ndarray) -> dict:
+    """The agents' previous pattern: one reduction per statistic, per request"""
+    arr = xp.asarray(sample.tolist())
+    mean = xp.mean(arr)
+    std = xp.std(arr)
+    return {
+        "mean": float(mean),
+        "variance": float(xp.var(arr)),
+        "skewness": float(xp.mean(((arr - mean) / std) ** 3)),
+        "kurtosis": float(xp.mean(((arr - mean) / std) ** 4) - 3),
+        "p95": float(np.percentile(xp.to_numpy(arr), 95)),
+        "reliability": float(xp.sum(arr < 5.0) / len(sample) * 100),
+    }
+
+
+def timed(func, repeat: int) -> float:
+    func()
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - t0) / repeat
+
+
+def main(size: int, requests: int, repeat: int) -> None:
+    rng = np.random.default_rng(3)
+
+    print("=" * 60)
+    print(f"⚡ Array backend: {xp.name} ({size} values, {requests} requests per batch)")
+    print("=" * 60)
+
+    array = rng.standard_normal(size)
+    round_trip = timed(lambda: xp.to_numpy(xp.asarray(array.tolist()) * 2).tolist(), repeat)
+    buffered = timed(lambda: xp.to_python(xp.asarray(array) * 2), repeat)
+    print(f"{'list round trip':>18}: {round_trip * 1000:.3f} ms")
+    print(f"{'buffer':>18}: {buffered * 1000:.3f} ms ({round_trip / buffered:.0f}x)")
+
+    samples = [rng.gamma(2.0, 2.0, rng.integers(size // 2, size + 1)) for _ in range(requests)]
+    thresholds = [5.0] * requests
+    separate = timed(lambda: [per_request_stats(s) for s in samples], repeat)
+    batched = timed(lambda: describe_batch(samples, (95,), thresholds), repeat)
+    print(f"{'per-request stats':>18}: {separate * 1000 / requests:.3f} ms per request")
+    print(f"{'describe_batch':>18}: {batched * 1000 / requests:.3f} ms per request ({separate / batched:.1f}x)")
+
+    batcher = StatisticsBatcher(window_ms=2)
+
+    def concurrent() -> None:
+        threads = [threading.Thread(target=batcher.describe, args=(s, (95,), 5.0)) for s in samples]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    threaded = timed(concurrent, repeat)
+    print(f"{'batcher (threads)':>18}: {threaded * 1000 / requests:.3f} ms per request, "
+          f"average batch {batcher.stats()['average_batch']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the MLX/NumPy array backend and batched statistics")
+    parser.add_argument("--size", type=int, default=10000, help="values per sample")
+    parser.add_argument("--requests", type=int, default=64)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    main(args.size, args.requests, args.repeat)
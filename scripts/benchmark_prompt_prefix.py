@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Prompt Prefix Reuse Benchmark
+Runs multi-turn role-agent sessions against a local Ollama stand-in that
+models the server's prompt cache (one KV slot per loaded model, reused for the
+longest common token prefix, dropped when the model unloads after keep_alive)
+and reports evaluated prompt tokens and time-to-first-token for the legacy
+prompt layout versus the stable-prefix layout with keep_alive
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from langchain.agents import AgentExecutor, create_react_agent
+from langchain.memory import ConversationBufferMemory
+from langchain.prompts import PromptTemplate
+
+from agents.app.agents.base import AgentConfig
+from agents.app.agents.roles.data_scientist import DataScientistAgent
+from agents.app.agents.roles.database_admin import DatabaseAdminAgent
+from agents.app.agents.roles.devops_engineer import DevOpsEngineerAgent
+
+# Whitespace runs count as tokens, as they do for BPE vocabularies
+TOKEN = re.compile(r"\w+|[^\w\s]|\s+")
+ANSWER = "Thought: I now know the final answer\nFinal Answer: Map each requirement to a specific project you led."
+
+ROLES = [DatabaseAdminAgent, DataScientistAgent, DevOpsEngineerAgent]
+QUESTIONS = [
+    "Which of my skills matter most for a GS-13 position?",
+    "What gaps should I close before applying?",
+    "How should I describe my cloud migration work?",
+    "Does my certification count toward specialized experience?",
+    "Which agencies hire for this series most often?",
+    "How do I show supervisory experience without a title?",
+]
+
+
+def parse_keep_alive(value: Any, default: float) -> float:
+    """Ollama keep_alive: seconds or a duration like '30m'; negative keeps the model forever"""
+    if value is None:
+        return default
+    if isinstance(value, (int, float)):
+        return float("inf") if value < 0 else float(value)
+    number, unit = re.fullmatch(r"(-?[\d.]+)([smh]?)", str(value)).groups()
+    seconds = float(number) * {"": 1, "s": 1, "m": 60, "h": 3600}[unit]
+    return float("inf") if seconds < 0 else seconds
+
+
+class OllamaStandIn(ThreadingHTTPServer):
+    """
+    /api/generate with load, prompt-eval and eval costs and a per-model KV
+    prefix cache; prompts longer than num_ctx are truncated like Ollama does
+    (the first num_keep tokens plus the most recent ones)
+    """
+
+    def __init__(self, load_ms: float, prompt_ms: float, eval_ms: float, default_keep_alive: float,
+                 respond: Optional[Callable[[str], str]] = None,
+                 tokenize: Callable[[str], List[str]] = TOKEN.findall):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.load_ms, self.prompt_ms, self.eval_ms = load_ms, prompt_ms, eval_ms
+        self.default_keep_alive = default_keep_alive
+        self.respond = respond or (lambda prompt: ANSWER)
+        self.tokenize = tokenize
+        self.lock = threading.Lock()
+        self.loaded: Dict[str, Dict[str, Any]] = {}  # model -> {"tokens", "expires"}
+        self.requests: List[Dict[str, Any]] = []
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        server: OllamaStandIn = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        started = time.perf_counter()
+        options = body.get("options") or {}
+        answer = server.respond(body["prompt"])
+        prompt_tokens = server.tokenize(body["prompt"])
+        answer_tokens = server.tokenize(answer)
+        sent = len(prompt_tokens)
+        num_ctx, num_keep = options.get("num_ctx") or 2048, options.get("num_keep") or 4
+        if sent > num_ctx:
+            prompt_tokens = prompt_tokens[:num_keep] + prompt_tokens[sent - (num_ctx - num_keep):]
+
+        with server.lock:
+            now = time.monotonic()
+            slot = server.loaded.get(body["model"])
+            load = slot is None or slot["expires"] < now
+            cached = [] if load else slot["tokens"]
+            reused = 0
+            for a, b in zip(cached, prompt_tokens):
+                if a != b:
+                    break
+                reused += 1
+            evaluated = len(prompt_tokens) - reused
+            time.sleep((server.load_ms * load + server.prompt_ms * evaluated) / 1000)
+            first_token = time.perf_counter() - started
+            time.sleep(server.eval_ms * len(answer_tokens) / 1000)
+            keep_alive = parse_keep_alive(body.get("keep_alive"), server.default_keep_alive)
+            server.loaded[body["model"]] = {"tokens": prompt_tokens + answer_tokens,
+                                            "expires": time.monotonic() + keep_alive}
+            server.requests.append({"prompt_tokens": sent, "evaluated": evaluated, "truncated": sent > num_ctx,
+                                    "loaded": load, "ttft": first_token, "num_keep": options.get("num_keep")})
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        for chunk in (
+            {"model": body["model"], "response": answer, "done": False},
+            {"model": body["model"], "response": "", "done": True, "prompt_eval_count": evaluated,
+             "prompt_eval_duration": int(server.prompt_ms * evaluated * 1e6), "eval_count": len(answer_tokens)},
+        ):
+            self.wfile.write((json.dumps(chunk) + "\n").encode())
+
+
+def legacy_executor(agent, keep_alive: bool) -> AgentExecutor:
+    """The previous layout: role template as written, message-list history, no num_keep"""
+    if not keep_alive:
+        agent.llm.keep_alive = None
+    memory = ConversationBufferMemory(memory_key="chat_history", input_key="input", return_messages=True)
+    prompt = PromptTemplate(
+        template=agent._get_prompt_template(),
+        input_variables=["input", "agent_scratchpad"],
+        partial_variables={
+            "tools": "\n".join([f"{tool.name}: {tool.description}" for tool in agent.tools]),
+            "tool_names": ", ".join([tool.name for tool in agent.tools])
+        }
+    )
+    return AgentExecutor(agent=create_react_agent(llm=agent.llm, tools=agent.tools, prompt=prompt),
+                         tools=agent.tools, memory=memory, max_iterations=3, handle_parsing_errors=True)
+
+
+async def run_sessions(server: OllamaStandIn, layout: str, turns: int, gap: float) -> List[float]:
+    latencies = []
+    for role_class in ROLES:
+        agent = role_class(AgentConfig(role=role_class.__name__, user_id=f"bench-{layout}", model="gptFREE"))
+        agent.llm.base_url = server.url
+        agent.redis_client = None
+        legacy = layout.startswith("legacy")
+        if legacy:
+            agent.agent = legacy_executor(agent, keep_alive=layout.endswith("keep_alive"))
+
+        for turn in range(turns):
+            context = {"target_grade": f"GS-{12 + turn % 3}", "skills": ["Python", "SQL", "Oracle"],
+                       "experience": f"{5 + turn} years of federal contracting", "series": "2210"}
+            if legacy:
+                # Callers build context dicts in varying key order
+                context = dict(reversed(list(context.items()))) if turn % 2 else context
+                await asyncio.sleep(gap)
+                started = time.perf_counter()
+                await asyncio.to_thread(agent.agent.invoke, {"input": QUESTIONS[turn % len(QUESTIONS)],
+                                                             "context": json.dumps(context)})
+            else:
+                await asyncio.sleep(gap)
+                started = time.perf_counter()
+                await agent.process(QUESTIONS[turn % len(QUESTIONS)], context)
+            latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def report(layout: str, records: List[Dict[str, Any]], latencies: List[float]) -> None:
+    prompt = sum(r["prompt_tokens"] for r in records)
+    evaluated = sum(r["evaluated"] for r in records)
+    ttft = sorted(r["ttft"] for r in records)
+    loads = sum(r["loaded"] for r in records)
+    print(f"{layout:>18}: {len(records)} calls, prompt tokens {prompt:,}, evaluated {evaluated:,} "
+          f"({evaluated / max(prompt, 1):.0%}), model loads {loads}")
+    print(f"{'':>18}  TTFT mean {sum(ttft) / len(ttft) * 1000:.0f} ms, p50 {ttft[len(ttft) // 2] * 1000:.0f} ms, "
+          f"request mean {sum(latencies) / len(latencies) * 1000:.0f} ms")
+
+
+def main(turns: int, gap: float, load_ms: float, prompt_ms: float, eval_ms: float, default_keep_alive: float) -> None:
+    print("=" * 60)
+    print(f"🔁 Prompt prefix reuse: {len(ROLES)} roles x {turns} turns, {gap}s between requests, "
+          f"server keep_alive default {default_keep_alive}s")
+    print("=" * 60)
+
+    for layout in ("legacy", "legacy+keep_alive", "stable"):
+        server = OllamaStandIn(load_ms, prompt_ms, eval_ms, default_keep_alive)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            latencies = asyncio.run(run_sessions(server, layout, turns, gap))
+        finally:
+            server.shutdown()
+        report(layout, server.requests, latencies)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark prompt-prefix KV reuse against an Ollama stand-in")
+    parser.add_argument("--turns", type=int, default=6, help="turns per role session")
+    parser.add_argument("--gap", type=float, default=0.3, help="seconds between requests")
+    parser.add_argument("--load-ms", type=float, default=400, help="model load time")
+    parser.add_argument("--prompt-ms", type=float, default=0.5, help="prompt eval time per token")
+    parser.add_argument("--eval-ms", type=float, default=2.0, help="generation time per token")
+    parser.add_argument("--default-keep-alive", type=float, default=0.2,
+                        help="server keep_alive when the request sets none (stands in for Ollama's 5m "
+                             "default against traffic that arrives less often)")
+    args = parser.parse_args()
+    main(args.turns, args.gap, args.load_ms, args.prompt_ms, args.eval_ms, args.default_keep_alive)
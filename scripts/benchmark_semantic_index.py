@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Semantic Index Benchmark
+Measures local embedding throughput (LSA fit, batch embed, cache hits) and the
+IVF vector index at scale (1M vectors by default): build time, memory-mapped
+load time, and recall@10 / queries per second against exact search for a
+range of nprobe settings
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from mcp_services.utils.embeddings import HashingEmbedder
+from mcp_services.utils.vector_index import VectorIndex
+
+
+def make_corpus(documents: int, rng: random.Random) -> list:
+    """Documents drawn from topic vocabularies plus background words"""
+    background = [f"term{i}" for i in range(20000)]
+    topics = [rng.sample(background, 80) for _ in range(200)]
+    return [" ".join(rng.choices(topics[i % len(topics)], k=120) + rng.choices(background, k=40))
+            for i in range(documents)]
+
+
+def make_vectors(count: int, centres: np.ndarray, rng: np.random.Generator, spread: float,
+                 block: int = 100000) -> np.ndarray:
+    """Normalized points around topic centres (overlapping, like embeddings of a topical corpus)"""
+    vectors = np.empty((count, centres.shape[1]), dtype=np.float32)
+    for start in range(0, count, block):
+        size = min(block, count - start)
+        noise = rng.standard_normal((size, centres.shape[1]), dtype=np.float32) * spread
+        chunk = centres[rng.integers(0, len(centres), size)] + noise
+        vectors[start:start + size] = chunk / np.linalg.norm(chunk, axis=1, keepdims=True)
+    return vectors
+
+
+def benchmark_embeddings(documents: int) -> None:
+    corpus = make_corpus(documents, random.Random(5))
+    embedder = HashingEmbedder()
+
+    t0 = time.perf_counter()
+    embedder.fit(corpus)
+    fitted = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    embedder.embed(corpus)
+    embedded = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    embedder.embed(corpus)
+    cached = time.perf_counter() - t0
+
+    print(f"Embeddings: fit {fitted:.1f}s on {documents} docs, "
+          f"{documents / embedded:,.0f} docs/s, cached {documents / cached:,.0f} docs/s")
+
+
+def main(count: int, dim: int, queries: int, k: int, documents: int, spread: float) -> None:
+    print("=" * 60)
+    print(f"🧭 Semantic index: {count:,} x {dim}-d vectors (spread {spread}), {queries} queries, top-{k}")
+    print("=" * 60)
+
+    benchmark_embeddings(documents)
+
+    rng = np.random.default_rng(7)
+    centres = rng.standard_normal((max(100, count // 500), dim)).astype(np.float32)
+    vectors = make_vectors(count, centres, rng, spread)
+    held_out = make_vectors(queries, centres, np.random.default_rng(8), spread)
+
+    index = VectorIndex(dim)
+    t0 = time.perf_counter()
+    index.add(np.arange(count), vectors)
+    built = time.perf_counter() - t0
+    print(f"Build: {built:.1f}s ({index.stats()['nlist']} lists, largest {index.stats()['largest_list']})")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        t0 = time.perf_counter()
+        index.save(tmp)
+        saved = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        index = VectorIndex.load(tmp)
+        print(f"Persist: save {saved:.1f}s, mmap load {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+        t0 = time.perf_counter()
+        truth = [set(ids.tolist()) for ids, _ in index.search(held_out, k=k, exact=True)]
+        exact = time.perf_counter() - t0
+        print(f"{'exact':>12}: recall 1.000, {queries / exact:8.1f} q/s")
+
+        for nprobe in (4, 8, 16, 32, 64):
+            t0 = time.perf_counter()
+            results = index.search(held_out, k=k, nprobe=nprobe)
+            elapsed = time.perf_counter() - t0
+            recall = np.mean([len(set(ids.tolist()) & expected) / k for (ids, _), expected in zip(results, truth)])
+            print(f"{'nprobe=' + str(nprobe):>12}: recall {recall:.3f}, {queries / elapsed:8.1f} q/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark local embeddings and the IVF vector index")
+    parser.add_argument("--vectors", type=int, default=1000000)
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--documents", type=int, default=5000, help="corpus size for the embedding benchmark")
+    parser.add_argument("--spread", type=float, default=1.5,
+                        help="noise around topic centres; higher is closer to uniform data, where any ANN index degrades")
+    args = parser.parse_args()
+    main(args.vectors, args.dim, args.queries, args.k, args.documents, args.spread)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Agent Server Startup Benchmark
+Measures time-to-first-healthy-response and RSS of the FastAPI agent service
+with lazy agent registration versus eager (all agents imported at startup)
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+MODES = {
+    # Previous behaviour: every agent module imported before serving traffic
+    "eager": {"AGENT_WARMUP_ROLES": "all", "AGENT_WARMUP_BLOCKING": "true"},
+    "lazy": {"AGENT_WARMUP_ROLES": "", "AGENT_WARMUP_BLOCKING": "false"},
+}
+
+
+def rss_kb(pid: int) -> int:
+    """Resident set size of a process in KB (Linux /proc, falls back to ps)"""
+    status = Path(f"/proc/{pid}/status")
+    if status.exists():
+        for line in status.read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    output = subprocess.run(["ps", "-o", "rss=", "-p", str(pid)], capture_output=True, text=True)
+    return int(output.stdout.strip() or 0)
+
+
+def measure(mode: str, port: int, timeout: float) -> dict:
+    env = {**os.environ, **MODES[mode], "API_RELOAD": "false"}
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.core.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=PROJECT_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}") as client:
+            while True:
+                if server.poll() is not None:
+                    raise RuntimeError(f"server exited: {server.stderr.read().decode()[-2000:]}")
+                if time.perf_counter() - started > timeout:
+                    raise TimeoutError(f"{mode}: no healthy response within {timeout}s")
+                try:
+                    if client.get("/health").status_code == 200:
+                        break
+                except httpx.TransportError:
+                    time.sleep(0.02)
+
+            ttfh = time.perf_counter() - started
+            startup_rss = rss_kb(server.pid)
+
+            # Import report shows how much agent loading happened before first healthy response
+            report = client.get("/debug/imports").json()
+            return {
+                "mode": mode,
+                "time_to_first_healthy_s": round(ttfh, 3),
+                "rss_mb_at_healthy": round(startup_rss / 1024, 1),
+                "agents_loaded": len(report["loaded"]),
+                "agent_import_ms": report["total_import_ms"],
+            }
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark agent server cold start")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🚀 Agent server startup: eager vs lazy agent registration")
+    print("=" * 60)
+
+    for mode in ("eager", "lazy"):
+        runs = [measure(mode, args.port, args.timeout) for _ in range(args.runs)]
+        best = min(runs, key=lambda run: run["time_to_first_healthy_s"])
+        print(f"{mode:>5}: healthy in {best['time_to_first_healthy_s']}s, "
+              f"RSS {best['rss_mb_at_healthy']} MB, "
+              f"{best['agents_loaded']} agents imported ({best['agent_import_ms']} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+WebAuthn Verifier Benchmark
+Measures ES256/RS256 assertion verifications per second per core for the
+generated WebAuthnVerifier, with and without the parsed public-key cache
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import cbor2
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec, rsa, padding
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from mcp_services.auth.webauthn_authentication_specialist import WebAuthnSpecialist
+
+RP_ID = "fedjobadvisor.com"
+ORIGIN = "https://fedjobadvisor.com"
+
+
+def b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode().rstrip('=')
+
+
+def load_verifier_class():
+    """Materialize the verifier from the specialist's generated server code"""
+    namespace = {}
+    exec(WebAuthnSpecialist().create_server_verification_code(), namespace)
+    return namespace["WebAuthnVerifier"]
+
+
+def make_credential(alg: str, index: int):
+    """Create a credential plus one valid assertion for it"""
+    if alg == "ES256":
+        private_key = ec.generate_private_key(ec.SECP256R1())
+        numbers = private_key.public_key().public_numbers()
+        cose_key = {1: 2, 3: -7, -1: 1, -2: numbers.x.to_bytes(32, 'big'), -3: numbers.y.to_bytes(32, 'big')}
+        sign = lambda data: private_key.sign(data, ec.ECDSA(hashes.SHA256()))
+    else:
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        numbers = private_key.public_key().public_numbers()
+        cose_key = {1: 3, 3: -257, -1: numbers.n.to_bytes(256, 'big'), -2: numbers.e.to_bytes(3, 'big')}
+        sign = lambda data: private_key.sign(data, padding.PKCS1v15(), hashes.SHA256())
+
+    challenge = os.urandom(32)
+    client_data_json = json.dumps({"type": "webauthn.get", "challenge": b64(challenge), "origin": ORIGIN}).encode()
+    auth_data = hashlib.sha256(RP_ID.encode()).digest() + bytes([0x05]) + (index + 1).to_bytes(4, 'big')
+    signature = sign(auth_data + hashlib.sha256(client_data_json).digest())
+
+    credential_id = b64(os.urandom(16))
+    assertion = {
+        "rawId": credential_id,
+        "response": {
+            "clientDataJSON": b64(client_data_json),
+            "authenticatorData": b64(auth_data),
+            "signature": b64(signature)
+        }
+    }
+    stored = {"credential_id": credential_id, "public_key": b64(cbor2.dumps(cose_key)), "signature_counter": 0}
+    return assertion, challenge, stored
+
+
+def bench_sequential(verifier_factory, requests, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        verifier = verifier_factory()
+        for assertion, challenge, stored in requests:
+            assert verifier.verify_authentication(assertion, challenge, stored)["verified"]
+    return rounds * len(requests) / (time.perf_counter() - start)
+
+
+async def bench_batch(verifier, requests, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        results = await verifier.verify_authentication_batch(requests)
+        assert all(result["verified"] for result in results)
+    return rounds * len(requests) / (time.perf_counter() - start)
+
+
+def main(credentials: int, rounds: int) -> None:
+    WebAuthnVerifier = load_verifier_class()
+    cores = os.cpu_count() or 1
+
+    print("=" * 60)
+    print(f"🔐 WebAuthn verification benchmark ({credentials} credentials x {rounds} rounds, {cores} cores)")
+    print("=" * 60)
+
+    for alg in ("ES256", "RS256"):
+        requests = [make_credential(alg, i) for i in range(credentials)]
+
+        uncached = bench_sequential(lambda: WebAuthnVerifier(RP_ID, ORIGIN, key_cache_size=0), requests, rounds)
+        shared = WebAuthnVerifier(RP_ID, ORIGIN)
+        cached = bench_sequential(lambda: shared, requests, rounds)
+        batch = asyncio.run(bench_batch(shared, requests, rounds))
+        shared.close()
+
+        print(f"{alg}: uncached {uncached:8.0f}/s | cached {cached:8.0f}/s | "
+              f"batch {batch:8.0f}/s ({batch / cores:.0f}/s per core)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark WebAuthn assertion verification")
+    parser.add_argument("--credentials", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    main(args.credentials, args.rounds)
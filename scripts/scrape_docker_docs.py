@@ -166,6 +166,10 @@ class DockerDocumentationScraper:
             if result['success']:
                 total_pages = result['total_pages']
                 print(f"✅ Successfully scraped {total_pages} pages from {section_name}")
+                dedup = result['deduplication']
+                if dedup['near_duplicates']:
+                    print(f"🔁 Skipped {dedup['near_duplicates']} near-duplicate pages "
+                          f"({dedup['duplicate_ratio']:.0%}, {dedup['skipped_bytes'] / 1024:.0f} KiB)")
                 
                 # Create directory for this section
                 section_dir = self.output_dir / category / section_name
@@ -202,6 +206,8 @@ class DockerDocumentationScraper:
                     "scraped_date": datetime.now().isoformat(),
                     "source_url": section_config['url'],
                     "total_pages": total_pages,
+                    "deduplication": result['deduplication'],
+                    "duplicates": result['duplicates'],
                     "saved_files": saved_files,
                     "scraping_config": section_config
                 }
@@ -265,6 +271,7 @@ class DockerDocumentationScraper:
                 "total_pages_scraped": self.total_scraped
             },
             "results_by_category": self.section_results,
+            "http_cache": self.scraper.record_cache_run("docker_docs"),
             "output_directory": str(self.output_dir)
         }
         
@@ -276,6 +283,9 @@ class DockerDocumentationScraper:
         print("\n" + "=" * 70)
         print("🎉 Docker Documentation Scraping Complete!")
         print(f"📊 Total pages scraped: {self.total_scraped}")
+        cache = summary["http_cache"]
+        print(f"🗃️  HTTP cache: {cache['hits']} not modified, {cache['misses']} changed/new, "
+              f"{cache['bytes_saved'] / 1024:.0f} KiB not re-downloaded (hit ratio {cache['hit_ratio']:.0%})")
         print(f"⏱️  Total time: {duration}")
         print(f"📁 Output directory: {self.output_dir}")
         print(f"📋 Summary saved to: {summary_path}")
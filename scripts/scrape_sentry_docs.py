@@ -201,6 +201,10 @@ class SentryDocumentationScraper:
             if result['success']:
                 total_pages = result['total_pages']
                 print(f"✅ Successfully scraped {total_pages} pages from {section_name}")
+                dedup = result['deduplication']
+                if dedup['near_duplicates']:
+                    print(f"🔁 Skipped {dedup['near_duplicates']} near-duplicate pages "
+                          f"({dedup['duplicate_ratio']:.0%}, {dedup['skipped_bytes'] / 1024:.0f} KiB)")
                 
                 # Create directory for this section
                 section_dir = self.output_dir / category / section_name
@@ -237,6 +241,8 @@ class SentryDocumentationScraper:
                     "scraped_date": datetime.now().isoformat(),
                     "source_url": section_config['url'],
                     "total_pages": total_pages,
+                    "deduplication": result['deduplication'],
+                    "duplicates": result['duplicates'],
                     "saved_files": saved_files,
                     "scraping_config": section_config,
                     "platform": "sentry",
@@ -305,6 +311,7 @@ class SentryDocumentationScraper:
                 "platform": "sentry"
             },
             "results_by_category": self.section_results,
+            "http_cache": self.scraper.record_cache_run("sentry_docs"),
             "output_directory": str(self.output_dir),
             "features_covered": [
                 "Python/FastAPI Integration",
@@ -324,6 +331,9 @@ class SentryDocumentationScraper:
         print("\n" + "=" * 70)
         print("🎉 Sentry Documentation Scraping Complete!")
         print(f"📊 Total pages scraped: {self.total_scraped}")
+        cache = summary["http_cache"]
+        print(f"🗃️  HTTP cache: {cache['hits']} not modified, {cache['misses']} changed/new, "
+              f"{cache['bytes_saved'] / 1024:.0f} KiB not re-downloaded (hit ratio {cache['hit_ratio']:.0%})")
         print(f"⏱️  Total time: {duration}")
         print(f"📁 Output directory: {self.output_dir}")
         print(f"📋 Summary saved to: {summary_path}")
@@ -273,6 +273,10 @@ class SlackDocumentationScraper:
             if result['success']:
                 total_pages = result['total_pages']
                 print(f"✅ Successfully scraped {total_pages} pages from {section_name}")
+                dedup = result['deduplication']
+                if dedup['near_duplicates']:
+                    print(f"🔁 Skipped {dedup['near_duplicates']} near-duplicate pages "
+                          f"({dedup['duplicate_ratio']:.0%}, {dedup['skipped_bytes'] / 1024:.0f} KiB)")
                 
                 # Create directory for this section
                 section_dir = self.output_dir / category / section_name
@@ -309,6 +313,8 @@ class SlackDocumentationScraper:
                     "scraped_date": datetime.now().isoformat(),
                     "source_url": section_config['url'],
                     "total_pages": total_pages,
+                    "deduplication": result['deduplication'],
+                    "duplicates": result['duplicates'],
                     "saved_files": saved_files,
                     "scraping_config": section_config,
                     "tier": "FREE",
@@ -377,6 +383,7 @@ class SlackDocumentationScraper:
                 "excluded": "Enterprise Grid, Paid Plans, Premium Features"
             },
             "results_by_category": self.section_results,
+            "http_cache": self.scraper.record_cache_run("slack_docs"),
             "output_directory": str(self.output_dir),
             "free_features_covered": [
                 "Incoming Webhooks",
@@ -397,6 +404,9 @@ class SlackDocumentationScraper:
         print("\n" + "=" * 70)
         print("🎉 Slack Documentation Scraping Complete!")
         print(f"📊 Total pages scraped: {self.total_scraped}")
+        cache = summary["http_cache"]
+        print(f"🗃️  HTTP cache: {cache['hits']} not modified, {cache['misses']} changed/new, "
+              f"{cache['bytes_saved'] / 1024:.0f} KiB not re-downloaded (hit ratio {cache['hit_ratio']:.0%})")
         print(f"⏱️  Total time: {duration}")
         print(f"📁 Output directory: {self.output_dir}")
         print(f"📋 Summary saved to: {summary_path}")
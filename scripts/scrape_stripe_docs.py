@@ -263,6 +263,10 @@ class StripeDocumentationScraper:
             if result['success']:
                 total_pages = result['total_pages']
                 print(f"✅ Successfully scraped {total_pages} pages from {section_name}")
+                dedup = result['deduplication']
+                if dedup['near_duplicates']:
+                    print(f"🔁 Skipped {dedup['near_duplicates']} near-duplicate pages "
+                          f"({dedup['duplicate_ratio']:.0%}, {dedup['skipped_bytes'] / 1024:.0f} KiB)")
                 
                 # Create directory for this section
                 section_dir = self.output_dir / category / section_name
@@ -299,6 +303,8 @@ class StripeDocumentationScraper:
                     "scraped_date": datetime.now().isoformat(),
                     "source_url": section_config['url'],
                     "total_pages": total_pages,
+                    "deduplication": result['deduplication'],
+                    "duplicates": result['duplicates'],
                     "saved_files": saved_files,
                     "scraping_config": section_config,
                     "platform": "stripe",
@@ -369,6 +375,7 @@ class StripeDocumentationScraper:
                 "pricing_model": "subscription_based"
             },
             "results_by_category": self.section_results,
+            "http_cache": self.scraper.record_cache_run("stripe_docs"),
             "output_directory": str(self.output_dir),
             "fed_job_advisor_features": [
                 "Local Tier Subscription ($29/month)",
@@ -390,6 +397,9 @@ class StripeDocumentationScraper:
         print("\n" + "=" * 70)
         print("🎉 Stripe Documentation Scraping Complete!")
         print(f"📊 Total pages scraped: {self.total_scraped}")
+        cache = summary["http_cache"]
+        print(f"🗃️  HTTP cache: {cache['hits']} not modified, {cache['misses']} changed/new, "
+              f"{cache['bytes_saved'] / 1024:.0f} KiB not re-downloaded (hit ratio {cache['hit_ratio']:.0%})")
         print(f"⏱️  Total time: {duration}")
         print(f"📁 Output directory: {self.output_dir}")
         print(f"📋 Summary saved to: {summary_path}")
@@ -0,0 +1,148 @@
+"""
+Async Tool Execution for Agent ReAct Loops
+
+Role tools are wrapped with a coroutine so AgentExecutor.ainvoke runs them on
+the event loop: native coroutines and in-process tools run inline, tools that
+block on I/O are offloaded to a worker thread. Coroutine and offloaded calls
+are bounded by a per-tool timeout; an inline sync call holds the loop until it
+returns, so the timeout cannot interrupt it. The output parser accepts several
+Action/Action Input pairs in one model turn; AgentExecutor dispatches them
+together with asyncio.gather.
+"""
+
+import asyncio
+import re
+import time
+from typing import Any, Callable, List, Sequence, Union
+
+from langchain.agents.format_scratchpad import format_log_to_str
+from langchain.agents.output_parsers import ReActSingleInputOutputParser
+from langchain.agents.output_parsers.react_single_input import (
+    FINAL_ANSWER_ACTION, FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE
+)
+from langchain.prompts import PromptTemplate
+from langchain.tools import Tool
+from langchain_core.agents import AgentAction, AgentFinish
+from langchain_core.exceptions import OutputParserException
+from langchain_core.outputs import Generation
+from langchain_core.runnables import Runnable, RunnableLambda, RunnablePassthrough
+
+from .metrics import TOOL_LATENCY
+
+DEFAULT_TOOL_TIMEOUT = 10.0
+
+# Added to the role prompt so the model knows it may batch independent calls
+PARALLEL_TOOLS_HINT = (
+    "Independent tool calls can run together: write one Action/Action Input pair "
+    "per tool, one after another, before stopping for the Observation."
+)
+
+# Action/Action Input pairs; each input runs until the next Action or Thought line
+ACTION_PAIR = re.compile(
+    r"Action\s*\d*\s*:[\s]*(.*?)[\s]*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*?)"
+    r"(?=\n\s*(?:Action\s*\d*\s*:|Thought\s*:)|\Z)",
+    re.DOTALL
+)
+
+
+class ParallelReActOutputParser(ReActSingleInputOutputParser):
+    """ReAct parser that returns a list of actions when one turn requests several tools"""
+
+    max_actions: int = 4
+
+    def parse(self, text: str) -> Union[AgentAction, List[AgentAction], AgentFinish]:
+        pairs = list(ACTION_PAIR.finditer(text))
+        if len(pairs) < 2 or self.max_actions < 2:
+            return super().parse(text)
+
+        if FINAL_ANSWER_ACTION in text:
+            raise OutputParserException(f"{FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE}: {text}")
+
+        actions: List[AgentAction] = []
+        seen = set()
+        for i, pair in enumerate(pairs[:self.max_actions]):
+            tool, tool_input = pair.group(1).strip(), pair.group(2).strip().strip(" ").strip('"')
+            if (tool, tool_input) in seen:
+                continue
+            seen.add((tool, tool_input))
+            # The first action carries the thought; each log renders its own pair in the scratchpad
+            log = text[:pair.end()] if i == 0 else pair.group(0).strip()
+            actions.append(AgentAction(tool, tool_input, log))
+        return actions
+
+    async def aparse_result(self, result: List[Generation], *, partial: bool = False) -> Any:
+        # Regex parsing is cheap; the base class would hop to an executor thread
+        return self.parse_result(result, partial=partial)
+
+    @property
+    def _type(self) -> str:
+        return "react-parallel-input"
+
+
+def _scratchpad(inputs: dict) -> str:
+    return format_log_to_str(inputs["intermediate_steps"])
+
+
+async def _ascratchpad(inputs: dict) -> str:
+    return _scratchpad(inputs)
+
+
+def create_async_react_agent(llm: Runnable, tools: Sequence[Tool], prompt: PromptTemplate,
+                             output_parser: ParallelReActOutputParser) -> Runnable:
+    """
+    create_react_agent with every step runnable on the event loop (the stock
+    agent formats the scratchpad in a sync lambda, which ainvoke runs in a thread)
+    """
+    prompt = prompt.partial(
+        tools="\n".join(f"{tool.name}: {tool.description}" for tool in tools),
+        tool_names=", ".join(tool.name for tool in tools)
+    )
+    scratchpad = RunnableLambda(_scratchpad, afunc=_ascratchpad)
+    return (
+        RunnablePassthrough.assign(agent_scratchpad=scratchpad)
+        | prompt
+        | llm.bind(stop=["\nObservation"])
+        | output_parser
+    )
+
+
+def async_tool(tool: Tool, timeout: float = DEFAULT_TOOL_TIMEOUT, agent: str = "", offload: bool = False) -> Tool:
+    """
+    Copy of `tool` with a coroutine bounded by `timeout` seconds
+
+    An existing coroutine is used as is; otherwise the sync function runs
+    inline (in-process computation) or, with `offload`, in a worker thread.
+    The timeout applies to coroutines and offloaded calls: a timed-out call
+    returns an observation the model can act on, and cancelling the request
+    cancels the call (an offloaded thread finishes in the background). An
+    inline sync function never yields to the loop, so it always runs to
+    completion - offload any sync tool that can be slow.
+    """
+    func: Callable[..., Any] = tool.func
+    if tool.coroutine is not None:
+        run = tool.coroutine
+    elif offload:
+        async def run(*args: Any, **kwargs: Any) -> Any:
+            return await asyncio.to_thread(func, *args, **kwargs)
+    else:
+        async def run(*args: Any, **kwargs: Any) -> Any:
+            return func(*args, **kwargs)
+
+    async def coroutine(*args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await asyncio.wait_for(run(*args, **kwargs), timeout)
+            outcome = "success"
+            return result
+        except asyncio.TimeoutError:
+            outcome = "timeout"
+            return f"Tool {tool.name} timed out after {timeout:g}s; continue without its result."
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        finally:
+            TOOL_LATENCY.labels(agent=agent, tool=tool.name, outcome=outcome).observe(time.perf_counter() - started)
+
+    return Tool(name=tool.name, description=tool.description, func=func, coroutine=coroutine,
+                return_direct=tool.return_direct)
@@ -4,22 +4,78 @@ Provides foundation for all specialized agents
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, AsyncGenerator
+from typing import Dict, Any, FrozenSet, List, Optional, AsyncGenerator, Union
 import asyncio
+from contextvars import ContextVar
 from datetime import datetime
+import inspect
 import json
+import os
+import re
 
 from langchain_community.llms import Ollama
-from langchain.agents import AgentExecutor, create_react_agent
-from langchain.memory import ConversationBufferMemory
+from langchain.agents import AgentExecutor
 from langchain.prompts import PromptTemplate
 from langchain.tools import Tool
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import get_buffer_string
 import redis.asyncio as redis
 from pydantic import BaseModel, Field
 import structlog
+import time
+
+from .async_tools import (
+    DEFAULT_TOOL_TIMEOUT, PARALLEL_TOOLS_HINT, ParallelReActOutputParser, async_tool, create_async_react_agent
+)
+from .context_budget import BudgetedConversationMemory, ContextBudget
+from .llm_cache import attach_llm_cache
+from .metrics import (
+    AGENT_LATENCY, AGENT_QUEUE_DEPTH, LLM_CALLS, LLM_LATENCY, LLM_TOKENS, PROMPT_TOKENS, PROMPT_TRIMMED_TOKENS,
+    quantile_from_counts
+)
 
 logger = structlog.get_logger()
 
+# Token budget of the process() call running in the current task. Kept per
+# task rather than on the agent, so concurrent calls sharing one instance
+# (e.g. /agents/batch) do not overwrite each other's limits and counts.
+_CALL_BUDGET: ContextVar[Optional[Dict[str, Any]]] = ContextVar("agent_call_budget", default=None)
+
+# Prompt layout: a byte-identical prefix per role (instructions and tool
+# descriptions) followed by the per-call parts, most stable first, so Ollama
+# reuses the KV cache of the prefix (and of earlier turns) across calls
+VARIABLE_LINE = re.compile(r"^\s*(?:[A-Za-z ]+:\s*)?\{(?:chat_history|input|context|agent_scratchpad)\}\s*$")
+SECTION_LABEL = re.compile(r"^\s*[A-Za-z ]+:\s*$")
+CONVERSATION_SECTION = "Current conversation:\n{chat_history}\n\n"
+REQUEST_SECTION = "Context: {context}\n\nQuestion: {input}\nThought:{agent_scratchpad}"
+
+# Rough prompt-token estimate used to size num_keep (Ollama keeps that many
+# leading tokens when it shifts a full context window)
+CHARS_PER_TOKEN = 4
+
+
+def stable_prompt_layout(template: str, with_history: bool = True) -> str:
+    """
+    Rewrite a role template as static prefix + variable suffix
+
+    Lines carrying {chat_history}, {input}, {context} or {agent_scratchpad}
+    (and a label line directly above them) are removed wherever the role put
+    them, the remaining instructions are dedented, and the variable sections
+    are appended in a fixed order: conversation, context, question, scratchpad.
+    """
+    kept: List[str] = []
+    for line in template.splitlines():
+        if VARIABLE_LINE.match(line):
+            while kept and not kept[-1].strip():
+                kept.pop()
+            if kept and SECTION_LABEL.match(kept[-1]):
+                kept.pop()
+            continue
+        kept.append(line)
+
+    prefix = re.sub(r"\n{3,}", "\n\n", inspect.cleandoc("\n".join(kept)))
+    return prefix + "\n\n" + (CONVERSATION_SECTION if with_history else "") + REQUEST_SECTION
+
 
 class AgentConfig(BaseModel):
     """Configuration for agent instances"""
@@ -28,8 +84,17 @@ class AgentConfig(BaseModel):
     model: str = Field(default="gptFREE", description="Ollama model to use")
     temperature: float = Field(default=0.3, description="Model temperature")
     max_tokens: int = Field(default=2000, description="Maximum response tokens")
+    num_ctx: int = Field(default=4096, description="Model context window in tokens")
+    context_budget: bool = Field(default=True, description="Fit memory, context and tool output to num_ctx")
     timeout: int = Field(default=30, description="Response timeout in seconds")
+    tool_timeout: float = Field(default=DEFAULT_TOOL_TIMEOUT, description="Per-tool-call timeout in seconds (coroutine and offloaded tools)")
+    parallel_tools: bool = Field(default=True, description="Run independent tool calls of one step concurrently")
+    verbose: bool = Field(default=False, description="Print ReAct steps to stdout (a sync callback per step)")
     enable_memory: bool = Field(default=True, description="Enable conversation memory")
+    keep_alive: Union[int, str] = Field(
+        default=os.getenv("OLLAMA_KEEP_ALIVE", "30m"),
+        description="How long Ollama keeps the model and its prompt cache loaded between requests"
+    )
     
 
 class AgentResponse(BaseModel):
@@ -41,12 +106,54 @@ class AgentResponse(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 
+class LLMMetricsCallback(BaseCallbackHandler):
+    """Records LLM call counts, latency and Ollama-reported token counts per agent"""
+    
+    # Counter updates only: run on the event loop instead of an executor thread
+    run_inline = True
+    
+    def __init__(self, agent: "FederalJobAgent"):
+        self.agent = agent
+        self._started: Dict[Any, float] = {}
+    
+    def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], *, run_id=None, **kwargs) -> None:
+        self._started[run_id] = time.perf_counter()
+    
+    def on_llm_end(self, response, *, run_id=None, **kwargs) -> None:
+        labels = {"agent": self.agent.role, "model": self.agent.config.model}
+        started = self._started.pop(run_id, None)
+        if started is not None:
+            LLM_LATENCY.labels(**labels).observe(time.perf_counter() - started)
+        LLM_CALLS.labels(outcome="success", **labels).inc()
+        
+        # Ollama reports prompt_eval_count / eval_count on the final generation chunk
+        for generations in response.generations:
+            for generation in generations:
+                info = generation.generation_info or {}
+                prompt_tokens = info.get("prompt_eval_count") or 0
+                completion_tokens = info.get("eval_count") or 0
+                if prompt_tokens:
+                    LLM_TOKENS.labels(kind="prompt", **labels).inc(prompt_tokens)
+                if completion_tokens:
+                    LLM_TOKENS.labels(kind="completion", **labels).inc(completion_tokens)
+                self.agent.metrics["total_tokens"] += prompt_tokens + completion_tokens
+    
+    def on_llm_error(self, error: BaseException, *, run_id=None, **kwargs) -> None:
+        self._started.pop(run_id, None)
+        LLM_CALLS.labels(agent=self.agent.role, model=self.agent.config.model, outcome="error").inc()
+
+
 class FederalJobAgent(ABC):
     """
     Base class for all federal job advisory agents
     Provides common functionality and enforces agent patterns
     """
     
+    # Tools whose sync function blocks on I/O; they run in a worker thread,
+    # all other sync tools run inline on the event loop, where tool_timeout
+    # cannot interrupt them (list any sync tool that can be slow here)
+    blocking_tools: FrozenSet[str] = frozenset()
+    
     def __init__(self, config: AgentConfig):
         self.config = config
         self.role = config.role
@@ -56,9 +163,16 @@ class FederalJobAgent(ABC):
         self.llm = Ollama(
             model=config.model,
             temperature=config.temperature,
-            num_ctx=4096,
-            num_predict=config.max_tokens
+            num_ctx=config.num_ctx,
+            num_predict=config.max_tokens,
+            keep_alive=config.keep_alive,
+            callbacks=[LLMMetricsCallback(self)]
         )
+        # Temperature-0 configs answer repeated prompts from the response cache (the 0.3 default is not cached)
+        attach_llm_cache(self.llm)
+        
+        # Token budget for the prompt (num_ctx less the reply's num_predict)
+        self.context_budget = ContextBudget(config.num_ctx, config.max_tokens) if config.context_budget else None
         
         # Initialize memory if enabled
         self.memory = None
@@ -66,8 +180,11 @@ class FederalJobAgent(ABC):
         if config.enable_memory:
             self._initialize_memory()
         
-        # Load role-specific tools
-        self.tools = self._load_tools()
+        # Load role-specific tools, each with a timeout-bounded coroutine
+        self.tools = [
+            async_tool(tool, config.tool_timeout, agent=self.role, offload=tool.name in self.blocking_tools)
+            for tool in self._load_tools()
+        ]
         
         # Create agent executor
         self.agent = self._create_agent()
@@ -93,9 +210,10 @@ class FederalJobAgent(ABC):
             )
             
             # Create conversation memory
-            self.memory = ConversationBufferMemory(
+            self.memory = BudgetedConversationMemory(
                 memory_key="chat_history",
-                return_messages=True
+                input_key="input",
+                return_messages=False  # append-only text transcript keeps earlier turns a cacheable prefix
             )
             
             # Load existing conversation if available
@@ -103,9 +221,10 @@ class FederalJobAgent(ABC):
             
         except Exception as e:
             logger.warning(f"Failed to initialize memory: {e}")
-            self.memory = ConversationBufferMemory(
+            self.memory = BudgetedConversationMemory(
                 memory_key="chat_history",
-                return_messages=True
+                input_key="input",
+                return_messages=False  # append-only text transcript keeps earlier turns a cacheable prefix
             )
     
     async def _load_conversation_history(self):
@@ -155,24 +274,36 @@ class FederalJobAgent(ABC):
     def _create_agent(self) -> AgentExecutor:
         """Create the agent executor with tools and memory"""
         
-        # Create the prompt template with tool information
-        template = self._get_prompt_template()
+        # Static role prefix first, per-call sections after it (see stable_prompt_layout)
+        template = stable_prompt_layout(self._get_prompt_template(), with_history=self.memory is not None)
+        first_section = CONVERSATION_SECTION if self.memory is not None else REQUEST_SECTION
+        if self.config.parallel_tools and self.tools:
+            template = template.replace(first_section, f"{PARALLEL_TOOLS_HINT}\n\n{first_section}", 1)
+        input_variables = ["input", "context", "agent_scratchpad"]
+        if self.memory is not None:
+            input_variables.append("chat_history")
         
-        # Create prompt with partial variables for tools
+        tool_variables = {
+            "tools": "\n".join([f"{tool.name}: {tool.description}" for tool in self.tools]),
+            "tool_names": ", ".join([tool.name for tool in self.tools])
+        }
         prompt = PromptTemplate(
             template=template,
-            input_variables=["input", "agent_scratchpad"],
-            partial_variables={
-                "tools": "\n".join([f"{tool.name}: {tool.description}" for tool in self.tools]),
-                "tool_names": ", ".join([tool.name for tool in self.tools])
-            }
+            input_variables=input_variables,
+            partial_variables=tool_variables
         )
+        self.prompt = prompt
+        # The rendered static prefix, identical for every call of this role
+        self.prompt_prefix = template[:template.index(first_section)].format(**tool_variables)
+        self._prefix_tokens = self.context_budget.count(self.prompt_prefix) if self.context_budget else 0
         
-        # Create the ReAct agent
-        agent = create_react_agent(
-            llm=self.llm,
+        # Create the ReAct agent; num_keep pins the role prefix in Ollama's context
+        # window so a long conversation shifting the window does not evict it
+        agent = create_async_react_agent(
+            llm=self.llm.bind(num_keep=len(self.prompt_prefix) // CHARS_PER_TOKEN),
             tools=self.tools,
-            prompt=prompt
+            prompt=prompt,
+            output_parser=ParallelReActOutputParser(max_actions=4 if self.config.parallel_tools else 1)
         )
         
         # Create the executor
@@ -180,9 +311,10 @@ class FederalJobAgent(ABC):
             agent=agent,
             tools=self.tools,
             memory=self.memory,
-            verbose=True,
+            verbose=self.config.verbose,
             max_iterations=3,
-            handle_parsing_errors=True
+            handle_parsing_errors=True,
+            trim_intermediate_steps=self._trim_scratchpad if self.context_budget else -1
         )
         
         return executor
@@ -216,18 +348,26 @@ class FederalJobAgent(ABC):
         Process a user query with the agent
         """
         start_time = datetime.utcnow()
+        started = time.perf_counter()
+        outcome = "error"
         self.metrics["requests"] += 1
+        AGENT_QUEUE_DEPTH.labels(agent=self.role).inc()
+        budget_token = _CALL_BUDGET.set({})
         
         try:
-            # Prepare input
+            # Prepare input (sorted keys: the same context renders to the same bytes every call)
+            if self.context_budget:
+                context_text = self._plan_context_budget(query, context)
+            else:
+                context_text = json.dumps(context, sort_keys=True, default=str) if context else "{}"
             agent_input = {
                 "input": query,
-                "context": json.dumps(context) if context else "{}"
+                "context": context_text
             }
             
-            # Run the agent
+            # Run the agent on the event loop; a timeout cancels in-flight LLM and tool calls
             result = await asyncio.wait_for(
-                asyncio.to_thread(self.agent.invoke, agent_input),
+                self.agent.ainvoke(agent_input),
                 timeout=self.config.timeout
             )
             
@@ -235,6 +375,7 @@ class FederalJobAgent(ABC):
             await self._save_conversation_history()
             
             # Update metrics
+            outcome = "success"
             self.metrics["successes"] += 1
             response_time = (datetime.utcnow() - start_time).total_seconds()
             self._update_avg_response_time(response_time)
@@ -246,11 +387,13 @@ class FederalJobAgent(ABC):
                 metadata={
                     "agent": self.role,
                     "response_time": response_time,
-                    "model": self.config.model
+                    "model": self.config.model,
+                    "context_budget": self._budget_report() if self.context_budget else None
                 }
             )
             
         except asyncio.TimeoutError:
+            outcome = "timeout"
             self.metrics["failures"] += 1
             return AgentResponse(
                 success=False,
@@ -266,6 +409,78 @@ class FederalJobAgent(ABC):
                 message=f"Agent processing failed: {str(e)}",
                 metadata={"agent": self.role, "error": str(e)}
             )
+        
+        finally:
+            _CALL_BUDGET.reset(budget_token)
+            AGENT_QUEUE_DEPTH.labels(agent=self.role).dec()
+            AGENT_LATENCY.labels(agent=self.role, outcome=outcome).observe(time.perf_counter() - started)
+    
+    def _plan_context_budget(self, query: str, context: Optional[Dict]) -> str:
+        """Split the context window for this call; returns the context JSON fitted to its share"""
+        budget = self.context_budget
+        count = budget.count
+        full_context = json.dumps(context, sort_keys=True, default=str) if context else "{}"
+        demands = {"context": count(full_context)}
+        if self.memory is not None:
+            demands["memory"] = count(get_buffer_string(self.memory.chat_memory.messages))
+        
+        system, question = self._prefix_tokens, count(query)
+        limits = budget.plan(system, question, demands)
+        context_text, context_trimmed = budget.fit_json(context or {}, limits["context"])
+        if self.memory is not None:
+            self.memory.max_tokens = limits["memory"]
+        
+        self._call_budget.update({
+            "system": system, "question": question, "limits": limits,
+            "context": count(context_text), "context_trimmed": context_trimmed,
+            "scratchpad": 0, "scratchpad_trimmed": 0
+        })
+        return context_text
+    
+    @property
+    def _call_budget(self) -> Dict[str, Any]:
+        """Budget of the current process() call (empty outside one)"""
+        budget = _CALL_BUDGET.get()
+        return budget if budget is not None else {}
+    
+    def _trim_scratchpad(self, steps: List[Any]) -> List[Any]:
+        """AgentExecutor hook: fit tool observations into this call's scratchpad share"""
+        limit = self._call_budget.get("limits", {}).get("scratchpad")
+        if limit is None:
+            return steps
+        steps, trimmed = self.context_budget.trim_steps(steps, limit)
+        count = self.context_budget.count
+        self._call_budget["scratchpad"] = sum(count(action.log) + count(text) for action, text in steps)
+        self._call_budget["scratchpad_trimmed"] = max(self._call_budget["scratchpad_trimmed"], trimmed)
+        return steps
+    
+    def _budget_report(self) -> Dict[str, Any]:
+        """Per-call token usage by prompt section (estimated) against the context window"""
+        call = self._call_budget
+        memory_tokens = self.memory.last_tokens if self.memory is not None else 0
+        used = {
+            "system": call["system"], "question": call["question"], "memory": memory_tokens,
+            "context": call["context"], "scratchpad": call["scratchpad"]
+        }
+        trimmed = {
+            "memory": self.memory.last_trimmed if self.memory is not None else 0,
+            "context": call["context_trimmed"], "scratchpad": call["scratchpad_trimmed"]
+        }
+        for section, tokens in used.items():
+            PROMPT_TOKENS.labels(agent=self.role, section=section).inc(tokens)
+        for section, tokens in trimmed.items():
+            if tokens:
+                PROMPT_TRIMMED_TOKENS.labels(agent=self.role, section=section).inc(tokens)
+        
+        total = sum(used.values())
+        return {
+            "num_ctx": self.context_budget.num_ctx,
+            "reserved_output": self.context_budget.reserve_output,
+            "used": used,
+            "limits": call["limits"],
+            "trimmed": trimmed,
+            "utilization": round(total / self.context_budget.input_tokens, 3)
+        }
     
     async def stream_response(
         self, 
@@ -308,12 +523,18 @@ class FederalJobAgent(ABC):
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get agent performance metrics"""
+        # Latency distribution is shared by every instance of this role
+        counts, _, _ = AGENT_LATENCY.merged(lambda labels: labels["agent"] == self.role)
         return {
             **self.metrics,
             "success_rate": (
                 self.metrics["successes"] / self.metrics["requests"] 
                 if self.metrics["requests"] > 0 else 0
-            )
+            ),
+            "role_latency": {
+                f"p{int(q * 100)}": round(quantile_from_counts(counts, q), 4)
+                for q in (0.5, 0.95, 0.99)
+            }
         }
     
     async def reset_memory(self):
@@ -0,0 +1,104 @@
+"""
+Batch agent analysis - one agent over many inputs
+
+Each input is analyzed by the same agent instance, so agent setup (LLM client,
+prompt, tools) is paid once per batch instead of once per document. At most
+`max_concurrency` analyses run at a time; records are yielded as each item
+finishes, so callers can stream them back as NDJSON. A failing or timed-out
+item becomes an error record and the rest of the batch carries on.
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+def _as_dict(response: Any) -> Dict[str, Any]:
+    # Most agents return AgentResponse; a few return plain dicts
+    if hasattr(response, "dict"):
+        return response.dict()
+    return response if isinstance(response, dict) else {"success": True, "data": response}
+
+
+class BatchAnalyzer:
+    """Bounded-concurrency fan-out of an analyze callable over a list of inputs"""
+
+    def __init__(self, max_concurrency: Optional[int] = None, item_timeout: Optional[float] = None):
+        self.max_concurrency = max(1, max_concurrency or int(os.getenv("AGENT_BATCH_CONCURRENCY",
+                                                                       str(DEFAULT_MAX_CONCURRENCY))))
+        if item_timeout is None:
+            item_timeout = float(os.getenv("AGENT_BATCH_ITEM_TIMEOUT", "0"))
+        # 0 leaves each item to the agent's own timeout
+        self.item_timeout = item_timeout or None
+
+    async def _run_item(self, analyze: Callable[[Dict[str, Any]], Awaitable[Any]], index: int,
+                        item: Any) -> Dict[str, Any]:
+        started = time.perf_counter()
+        item_id = item.get("id") if isinstance(item, dict) else None
+        try:
+            if not isinstance(item, dict):
+                raise ValueError(f"item must be a JSON object, got {type(item).__name__}")
+            response = _as_dict(await asyncio.wait_for(analyze(item), timeout=self.item_timeout))
+            if response.get("success", True):
+                record = {"type": "result", "index": index, "id": item_id, "response": response}
+            else:
+                record = {"type": "error", "index": index, "id": item_id,
+                          "error": response.get("message") or "Analysis failed", "response": response}
+        except asyncio.TimeoutError:
+            record = {"type": "error", "index": index, "id": item_id, "timed_out": True,
+                      "error": f"Timed out after {self.item_timeout}s"}
+        except Exception as e:
+            logger.error(f"Batch item {index} failed: {e}")
+            record = {"type": "error", "index": index, "id": item_id, "error": str(e)}
+        record["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+        return record
+
+    async def run(self, analyze: Callable[[Dict[str, Any]], Awaitable[Any]],
+                  items: Iterable[Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Yield a result or error record per item in completion order, then a summary record"""
+        items = list(items)
+        started = time.perf_counter()
+        stats = {"submitted": len(items), "completed": 0, "failed": 0, "timed_out": 0}
+        # Only max_concurrency tasks exist at once, so a large batch holds no idle coroutines
+        queue = iter(enumerate(items))
+        pending: Dict[asyncio.Task, Tuple[int, Any]] = {}
+
+        def refill() -> None:
+            for index, item in queue:
+                pending[asyncio.ensure_future(self._run_item(analyze, index, item))] = (index, item)
+                if len(pending) >= self.max_concurrency:
+                    return
+
+        try:
+            refill()
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    pending.pop(task)
+                    record = task.result()
+                    stats["failed" if record["type"] == "error" else "completed"] += 1
+                    stats["timed_out"] += bool(record.get("timed_out"))
+                    yield record
+                refill()
+        finally:
+            # The client went away (or the consumer stopped early): abandon the rest
+            for task in pending:
+                task.cancel()
+
+        elapsed = time.perf_counter() - started
+        summary = dict(
+            stats,
+            type="summary",
+            max_concurrency=self.max_concurrency,
+            elapsed_seconds=round(elapsed, 3),
+            items_per_second=round(len(items) / elapsed, 2) if elapsed > 0 else None,
+        )
+        logger.info("Batch analysis finished", **{k: v for k, v in summary.items() if k != "type"})
+        yield summary
@@ -0,0 +1,308 @@
+"""
+Bulk candidate screening - deterministic role tools over many profiles
+
+Profiles arrive as NDJSON lines (or a JSON array file), are grouped into chunks
+and screened in a process-wide pool shared by all requests: the role tools are pure-Python CPU work, so
+threads would serialize on the GIL. Results are yielded as each chunk
+completes, interleaved with progress records, so callers can stream them back
+as NDJSON while later chunks are still running.
+"""
+
+import asyncio
+import importlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import structlog
+
+from .candidate_profile import CandidateProfile
+from .factory import AgentRoles
+from .metrics import BATCH_PROFILES
+
+logger = structlog.get_logger()
+
+# Role -> ("module:Class", deterministic tool methods). Tool names match the
+# methods behind each agent's LangChain tools; none of them call the LLM.
+SCREENING_ROLES: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    AgentRoles.DATA_SCIENTIST: (".roles.data_scientist:DataScientistAgent", (
+        "_match_skills", "_analyze_projects", "_check_technical_depth",
+        "_find_publications", "_validate_certifications",
+    )),
+    AgentRoles.STATISTICIAN: (".roles.statistician:StatisticianAgent", (
+        "_check_statistical_methodology", "_analyze_survey_design", "_validate_statistical_software",
+        "_scan_research_experience", "_match_agency_requirements",
+    )),
+    AgentRoles.DATABASE_ADMIN: (".roles.database_admin:DatabaseAdminAgent", (
+        "_analyze_database_platforms", "_check_security_experience", "_evaluate_performance_tuning",
+        "_validate_backup_recovery", "_advise_clearance_requirements",
+    )),
+    AgentRoles.DEVOPS: (".roles.devops_engineer:DevOpsEngineerAgent", (
+        "_analyze_cicd_experience", "_check_container_experience", "_evaluate_cloud_platforms",
+        "_scan_automation_tools", "_validate_devsecops",
+    )),
+    AgentRoles.IT_SPECIALIST: (".roles.it_specialist:ITSpecialistAgent", (
+        "_match_it_specialty", "_analyze_systems_experience", "_check_network_skills",
+        "_evaluate_cybersecurity", "_assess_customer_support",
+    )),
+}
+
+DEFAULT_CHUNK_SIZE = 64
+
+# Per-process tool hosts, built on first use in each worker
+_tool_hosts: Dict[str, Any] = {}
+
+# Process-wide worker pools by size, shared by every screening request
+_pools: Dict[int, ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def parse_roles(roles: Optional[Union[str, Sequence[str]]]) -> List[str]:
+    """Validate a role list ("a,b" or a sequence); empty means every screening role"""
+    if isinstance(roles, str):
+        roles = [role.strip() for role in roles.split(",")]
+    selected = [role for role in (roles or []) if role]
+    if not selected:
+        return list(SCREENING_ROLES)
+
+    unknown = [role for role in selected if role not in SCREENING_ROLES]
+    if unknown:
+        raise ValueError(f"Unknown screening roles: {', '.join(unknown)} "
+                         f"(available: {', '.join(SCREENING_ROLES)})")
+    return list(dict.fromkeys(selected))
+
+
+def _tool_host(role: str) -> Any:
+    host = _tool_hosts.get(role)
+    if host is None:
+        module_name, class_name = SCREENING_ROLES[role][0].split(":", 1)
+        agent_class = getattr(importlib.import_module(module_name, __package__), class_name)
+        # The deterministic tools read no LLM, memory or config state, so workers
+        # skip FederalJobAgent.__init__ (Ollama client, Redis-backed memory)
+        host = _tool_hosts[role] = agent_class.__new__(agent_class)
+    return host
+
+
+def screen_profile(data: Dict[str, Any], roles: Sequence[str]) -> Tuple[Dict[str, Any], List[Dict[str, str]]]:
+    """Run every tool of each role on one profile; returns (analyses by role, tool errors)"""
+    # Built directly rather than via from_input: batch profiles are seen once,
+    # so caching them would only evict profiles that interactive agents reuse
+    profile = CandidateProfile(data)
+    analyses: Dict[str, Any] = {}
+    errors: List[Dict[str, str]] = []
+
+    for role in roles:
+        host = _tool_host(role)
+        role_results = {}
+        for tool in SCREENING_ROLES[role][1]:
+            output = getattr(host, tool)(profile)
+            try:
+                role_results[tool.lstrip("_")] = json.loads(output)
+            except ValueError:
+                # Tools report failures as plain "Error ...: reason" strings
+                errors.append({"role": role, "tool": tool.lstrip("_"), "error": output})
+        analyses[role] = role_results
+
+    return analyses, errors
+
+
+def screen_chunk(chunk: List[Tuple[int, Union[str, Dict[str, Any]]]], roles: Sequence[str]) -> List[Dict[str, Any]]:
+    """Worker entry point: screen (index, profile) pairs, one record per profile"""
+    records = []
+    for index, profile in chunk:
+        try:
+            data = json.loads(profile) if isinstance(profile, str) else profile
+            if not isinstance(data, dict):
+                raise ValueError(f"profile must be a JSON object, got {type(data).__name__}")
+            analyses, errors = screen_profile(data, roles)
+            record = {"type": "result", "index": index, "id": data.get("id"), "roles": analyses}
+            if errors:
+                record["errors"] = errors
+        except Exception as e:
+            record = {"type": "error", "index": index, "error": str(e)}
+        records.append(record)
+    return records
+
+
+async def iter_profiles(chunks: AsyncIterator[bytes]) -> AsyncIterator[Union[str, Dict[str, Any]]]:
+    """
+    Split a byte stream into profiles without buffering it whole
+
+    NDJSON input yields one raw line per profile (parsed in the workers); input
+    starting with "[" is read fully and treated as a JSON array of profiles.
+    """
+    buffer = b""
+    first = True
+    async for chunk in chunks:
+        if not chunk:
+            continue
+        if first:
+            first = False
+            if chunk.lstrip()[:1] == b"[":
+                rest = [chunk]
+                async for more in chunks:
+                    rest.append(more)
+                for item in json.loads(b"".join(rest)):
+                    yield item
+                return
+        buffer += chunk
+        lines = buffer.split(b"\n")
+        buffer = lines.pop()
+        for line in lines:
+            if line.strip():
+                yield line.decode("utf-8", errors="replace")
+    if buffer.strip():
+        yield buffer.decode("utf-8", errors="replace")
+
+
+def get_screening_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Process-wide pool of max_workers screening processes, created on first use
+    so requests reuse warm workers (imported roles, built tool hosts)
+    """
+    with _pools_lock:
+        pool = _pools.get(max_workers)
+        if pool is None:
+            pool = _pools[max_workers] = ProcessPoolExecutor(max_workers=max_workers)
+        return pool
+
+
+def discard_screening_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a pool whose worker crashed; the next request creates a fresh one"""
+    with _pools_lock:
+        for size, current in list(_pools.items()):
+            # Another request may already have replaced it
+            if current is pool:
+                del _pools[size]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_screening_pools() -> None:
+    """Stop every screening pool (service shutdown)"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _aiter(items: Iterable[Any]) -> AsyncIterator[Any]:
+    for item in items:
+        yield item
+
+
+class BatchScreener:
+    """Chunked, process-parallel screening of a profile stream"""
+
+    def __init__(self, roles: Optional[Sequence[str]] = None, max_workers: Optional[int] = None,
+                 chunk_size: Optional[int] = None, progress_every: int = 1):
+        self.roles = parse_roles(roles)
+        self.max_workers = max_workers or int(os.getenv("BATCH_SCREEN_WORKERS", "0")) or os.cpu_count() or 1
+        self.chunk_size = chunk_size or int(os.getenv("BATCH_SCREEN_CHUNK_SIZE", str(DEFAULT_CHUNK_SIZE)))
+        # Chunks in flight; bounds memory when the input is far larger than the pool
+        self.max_pending = self.max_workers * 2
+        self.progress_every = max(1, progress_every)
+
+    async def screen(self, profiles: Union[AsyncIterator[Any], Iterable[Any]]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield result/error records as chunks finish, a progress record after
+        every `progress_every` chunks, and a final summary record
+        """
+        if not hasattr(profiles, "__aiter__"):
+            profiles = _aiter(profiles)
+
+        loop = asyncio.get_running_loop()
+        # Chunk indices and the pool each chunk went to (None: screened in a thread)
+        pending: Dict[asyncio.Future, Tuple[List[int], Optional[ProcessPoolExecutor]]] = {}
+        started = time.perf_counter()
+        stats = {"submitted": 0, "completed": 0, "failed": 0, "tool_errors": 0, "chunks": 0}
+
+        def submit(chunk: List[Tuple[int, Any]]) -> None:
+            pool = None
+            if self.max_workers <= 1:
+                future = asyncio.ensure_future(asyncio.to_thread(screen_chunk, chunk, self.roles))
+            else:
+                pool = get_screening_pool(self.max_workers)
+                try:
+                    future = loop.run_in_executor(pool, screen_chunk, chunk, self.roles)
+                except RuntimeError:
+                    # BrokenProcessPool, or already shut down: a worker crashed in another request
+                    discard_screening_pool(pool)
+                    pool = get_screening_pool(self.max_workers)
+                    future = loop.run_in_executor(pool, screen_chunk, chunk, self.roles)
+            pending[future] = ([index for index, _ in chunk], pool)
+            stats["submitted"] += len(chunk)
+
+        async def drain(wait_for_all: bool) -> AsyncIterator[Dict[str, Any]]:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    indices, pool = pending.pop(future)
+                    try:
+                        records = future.result()
+                    except (Exception, asyncio.CancelledError) as e:
+                        # A crashed worker fails its chunk, not the whole batch; chunks still
+                        # queued on its pool are cancelled when that pool is discarded
+                        reason = "chunk cancelled" if isinstance(e, asyncio.CancelledError) else str(e)
+                        logger.error(f"Batch screening chunk failed: {reason}")
+                        records = [{"type": "error", "index": i, "error": f"worker failed: {reason}"}
+                                   for i in indices]
+                        if isinstance(e, BrokenProcessPool) and pool is not None:
+                            discard_screening_pool(pool)
+
+                    for record in records:
+                        failed = record["type"] == "error"
+                        stats["failed" if failed else "completed"] += 1
+                        stats["tool_errors"] += len(record.get("errors", ()))
+                        BATCH_PROFILES.labels(outcome="error" if failed else "ok").inc()
+                        yield record
+
+                    stats["chunks"] += 1
+                    if stats["chunks"] % self.progress_every == 0:
+                        yield self._progress(stats, started)
+                if not wait_for_all:
+                    return
+
+        try:
+            chunk: List[Tuple[int, Any]] = []
+            index = 0
+            async for profile in profiles:
+                chunk.append((index, profile))
+                index += 1
+                if len(chunk) >= self.chunk_size:
+                    submit(chunk)
+                    chunk = []
+                    if len(pending) >= self.max_pending:
+                        async for record in drain(wait_for_all=False):
+                            yield record
+            if chunk:
+                submit(chunk)
+            async for record in drain(wait_for_all=True):
+                yield record
+        finally:
+            # The pool is shared: cancel only this request's chunks that have not started
+            for future in pending:
+                future.cancel()
+
+        summary = self._progress(stats, started)
+        summary.update(type="summary", roles=self.roles, workers=self.max_workers, chunk_size=self.chunk_size)
+        logger.info("Batch screening finished", **{k: v for k, v in summary.items() if k != "type"})
+        yield summary
+
+    @staticmethod
+    def _progress(stats: Dict[str, int], started: float) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - started
+        done = stats["completed"] + stats["failed"]
+        return {
+            "type": "progress",
+            "submitted": stats["submitted"],
+            "completed": stats["completed"],
+            "failed": stats["failed"],
+            "tool_errors": stats["tool_errors"],
+            "elapsed_seconds": round(elapsed, 3),
+            "profiles_per_second": round(done / elapsed, 1) if elapsed > 0 else None,
+        }
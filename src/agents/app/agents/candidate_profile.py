@@ -0,0 +1,300 @@
+"""
+Parsed candidate profile shared by the role-agent tools
+
+Every specialist tool used to json.loads its input, lowercase the same fields
+and scan the same experience text for its own keyword table. CandidateProfile
+does that work once per distinct input: profiles are cached by input content,
+and the experience text is scanned once for the union of the keyword tables the
+role modules register. Each searchable field's hit vector is derived from that
+scan, so `profile.contains(field, kw)` is a set lookup for every tool sharing
+the profile.
+"""
+
+import copy
+import json
+import re
+import threading
+from collections import OrderedDict
+from functools import cached_property
+from typing import Any, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from .metrics import record_cache
+
+PROFILE_CACHE_SIZE = 256
+
+# Word tokens keeping c++, c#, tcp/ip and 800-53 (shared with job matching)
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#/.\-]*[a-z0-9+#]|[a-z0-9]")
+YEARS_PATTERN = re.compile(r"(\d{1,2})\+?\s*(?:years?|yrs?)")
+GRADE_PATTERN = re.compile(r"\bgs-?\s?(\d{1,2})\b")
+
+Trigram = Tuple[str, str, str]
+
+
+class _Vocabulary(NamedTuple):
+    """Registered keywords; replaced as a whole on registration so readers never see it change"""
+    fields: Dict[str, FrozenSet[str]]
+    keywords: FrozenSet[str]
+    trigrams: Dict[str, FrozenSet[Trigram]]
+    index: Dict[Trigram, FrozenSet[str]]  # leading trigram -> keywords
+    short: FrozenSet[str]  # under three characters, always substring-searched
+    longest: int
+
+
+_vocabulary = _Vocabulary({}, frozenset(), {}, {}, frozenset(), 1)
+_vocabulary_lock = threading.Lock()
+
+
+def _flatten_keywords(table: Any) -> Iterable[str]:
+    """Yield every keyword string in a (possibly nested) keyword table"""
+    if isinstance(table, str):
+        yield table
+    elif isinstance(table, dict):
+        for value in table.values():
+            yield from _flatten_keywords(value)
+    elif isinstance(table, (list, tuple, set, frozenset)):
+        for value in table:
+            yield from _flatten_keywords(value)
+
+
+def _trigrams(text: str) -> FrozenSet[Trigram]:
+    # Character tuples via zip are several times cheaper to build than slices
+    return frozenset(zip(text, text[1:], text[2:]))
+
+
+def register_keywords(field: str, *tables: Any) -> None:
+    """
+    Register keyword tables the tools look up in a profile field
+
+    Tables may be lists or nested dicts of lists (non-string leaves such as
+    weights are ignored). Keywords are matched as lowercase substrings, exactly
+    like `kw in text`.
+    """
+    global _vocabulary
+    keywords = {kw.lower() for table in tables for kw in _flatten_keywords(table)}
+    with _vocabulary_lock:
+        current = _vocabulary
+        new = keywords - current.keywords
+        index = dict(current.index)
+        for kw in new:
+            if len(kw) >= 3:
+                index[tuple(kw[:3])] = index.get(tuple(kw[:3]), frozenset()) | {kw}
+        _vocabulary = _Vocabulary(
+            fields={**current.fields, field: current.fields.get(field, frozenset()) | keywords},
+            keywords=current.keywords | new,
+            trigrams={**current.trigrams, **{kw: _trigrams(kw) for kw in new}},
+            index=index,
+            short=current.short | {kw for kw in new if len(kw) < 3},
+            longest=max([current.longest] + [len(kw) for kw in new]),
+        )
+
+
+def scan_keywords(text: str, keywords: FrozenSet[str], vocabulary: Optional[_Vocabulary] = None) -> FrozenSet[str]:
+    """
+    Registered keywords occurring in text as substrings
+
+    A keyword can only occur if its leading trigram, and every other trigram,
+    occurs in the text; intersecting the text's trigrams with the keyword index
+    leaves a short candidate list for the actual substring searches.
+    """
+    vocabulary = vocabulary or _vocabulary
+    grams = _trigrams(text)
+    candidates = set(vocabulary.short)
+    for gram in grams & vocabulary.index.keys():
+        candidates.update(vocabulary.index[gram])
+    trigrams = vocabulary.trigrams
+    return frozenset(kw for kw in candidates & keywords if trigrams[kw] <= grams and kw in text)
+
+
+class CandidateProfile:
+    """
+    Normalized candidate input shared across role-agent tools
+
+    Build with `CandidateProfile.from_input(input_data)`; the same JSON (or dict)
+    yields the same cached instance, so the tools of every role agent handling a
+    request parse and scan the candidate once. Keyword checks go through
+    `contains`/`matches` with one of the searchable fields: "skills",
+    "experience", "skills_and_experience" or "experience_and_certifications".
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        # A private copy: the profile is cached and shared, its fields derive from data
+        self.data = copy.deepcopy(data)
+        data = self.data
+        self.skills: List[str] = [str(s).lower() for s in data.get("skills", []) or []]
+        self.skill_set: FrozenSet[str] = frozenset(self.skills)
+        # `kw in skills_text` == any(kw in skill for skill in skills) for keywords without newlines
+        self.skills_text: str = "\n".join(self.skills)
+        self.certifications: List[str] = [
+            str(c.get("name", "") if isinstance(c, dict) else c).lower()
+            for c in data.get("certifications", []) or []
+        ]
+        self.target_agency: str = str(data.get("target_agency", "") or "").lower()
+        self.target_grade: str = str(data.get("target_grade", "") or "")
+
+        # Lowercased texts; the combined ones wrap the experience text in a head or tail
+        self.experience: str = str(data.get("experience", "") or "").lower()
+        skills_head = " ".join(self.skills) + " "
+        certifications_tail = " " + " ".join(self.certifications)
+        self.skills_and_experience: str = skills_head + self.experience
+        self.experience_and_certifications: str = self.experience + certifications_tail
+        self._texts = {
+            "skills": self.skills_text,
+            "experience": self.experience,
+            "skills_and_experience": self.skills_and_experience,
+            "experience_and_certifications": self.experience_and_certifications,
+        }
+        self._wrappers = {
+            "experience": ("", ""),
+            "skills_and_experience": (skills_head, ""),
+            "experience_and_certifications": ("", certifications_tail),
+        }
+
+        # (name, lowercased description) and (title, lowercased "title venue")
+        self.projects: List[Tuple[str, str]] = [
+            (p.get("name", "Unknown"), p.get("description", "").lower()) for p in data.get("projects", []) or []
+        ]
+        self.publications: List[Tuple[Optional[str], str]] = [
+            (p.get("title"), (p.get("title", "") + " " + p.get("venue", "")).lower())
+            for p in data.get("publications", []) or []
+        ]
+
+        # Filled on first keyword lookup; recomputing after a race gives the same result
+        self._experience_scan: Optional[Tuple[FrozenSet[str], FrozenSet[str]]] = None
+        self._hits: Dict[str, Tuple[FrozenSet[str], FrozenSet[str]]] = {}
+
+    @classmethod
+    def from_input(cls, input_data: Union[str, Dict[str, Any], "CandidateProfile"]) -> "CandidateProfile":
+        """Return the cached profile for a tool input (JSON string, dict or profile)"""
+        if isinstance(input_data, CandidateProfile):
+            return input_data
+
+        # Keyed by the input text itself: str hashes are cached per object and a
+        # hit costs one memcmp, cheaper than digesting the payload on every call
+        key = input_data if isinstance(input_data, str) else json.dumps(input_data, sort_keys=True, default=str)
+
+        with _cache_lock:
+            profile = _PROFILE_CACHE.get(key)
+            if profile is not None:
+                _PROFILE_CACHE.move_to_end(key)
+        record_cache("candidate_profile", profile is not None)
+        if profile is not None:
+            return profile
+
+        data = json.loads(input_data) if isinstance(input_data, str) else input_data
+        profile = cls(data)
+        with _cache_lock:
+            _PROFILE_CACHE[key] = profile
+            while len(_PROFILE_CACHE) > PROFILE_CACHE_SIZE:
+                _PROFILE_CACHE.popitem(last=False)
+        return profile
+
+    # ------------------------------------------------------------ keyword hits
+
+    def _scan_experience(self) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        """The single pass: every registered keyword found in the experience text"""
+        if self._experience_scan is None:
+            vocabulary = _vocabulary
+            self._experience_scan = (scan_keywords(self.experience, vocabulary.keywords, vocabulary),
+                                     vocabulary.keywords)
+        return self._experience_scan
+
+    def _field_hits(self, field: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        """(hits, keywords they were looked up for) of one field"""
+        cached = self._hits.get(field)
+        if cached is not None:
+            return cached
+
+        vocabulary = _vocabulary
+        keywords = vocabulary.fields.get(field, frozenset())
+        if field == "skills":
+            result = (scan_keywords(self.skills_text, keywords, vocabulary), keywords)
+            self._hits[field] = result
+            return result
+
+        base = self.experience
+        shared_hits, shared_keywords = self._scan_experience()
+        hits = set(keywords & shared_hits)
+        # Keywords registered after the shared scan (a role module imported later)
+        hits.update(kw for kw in keywords - shared_keywords if kw in base)
+
+        head, tail = self._wrappers[field]
+        if head or tail:
+            # Any occurrence not inside the experience text overlaps the head or tail,
+            # so it lies within `longest - 1` characters of that boundary
+            window = vocabulary.longest - 1
+            if len(base) <= window:
+                boundaries = [head + base + tail]
+            else:
+                boundaries = [text for text in (
+                    head + base[:window] if head else "",
+                    base[len(base) - window:] + tail if tail else "",
+                ) if text]
+            for boundary in boundaries:
+                hits.update(scan_keywords(boundary, keywords - hits, vocabulary))
+
+        result = (frozenset(hits), keywords)
+        self._hits[field] = result
+        return result
+
+    def hits(self, field: str) -> FrozenSet[str]:
+        """Hit vector of a field: the keywords registered for it that occur in its text"""
+        return self._field_hits(field)[0]
+
+    def contains(self, field: str, keyword: str) -> bool:
+        """`keyword in <field text>`; keywords not registered for the field are searched directly"""
+        hits, keywords = self._field_hits(field)
+        if keyword in hits:
+            return True
+        if keyword in keywords:
+            return False
+        return keyword in self._texts[field]
+
+    def matches(self, field: str, keywords: Sequence[str]) -> List[str]:
+        """The keywords, in order, that occur in the field"""
+        return [kw for kw in keywords if self.contains(field, kw)]
+
+    # ------------------------------------------------------------ derived features
+
+    @cached_property
+    def tokens(self) -> List[str]:
+        """Word tokens of skills + experience (keeps c++, c#, tcp/ip, 800-53)"""
+        return TOKEN_PATTERN.findall(self.skills_and_experience)
+
+    @cached_property
+    def token_set(self) -> FrozenSet[str]:
+        return frozenset(self.tokens)
+
+    @cached_property
+    def ngrams(self) -> FrozenSet[str]:
+        """Unigrams, bigrams and trigrams of the token stream"""
+        tokens = self.tokens
+        grams = set(tokens)
+        for n in (2, 3):
+            grams.update(" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+        return frozenset(grams)
+
+    @cached_property
+    def years_experience(self) -> Optional[int]:
+        """Largest "N years" figure stated in the experience text"""
+        years = [int(y) for y in YEARS_PATTERN.findall(self.experience)]
+        return max(years) if years else None
+
+    @cached_property
+    def grades(self) -> List[int]:
+        """GS grades mentioned in the experience text and target grade, ascending"""
+        found = GRADE_PATTERN.findall(self.experience) + GRADE_PATTERN.findall(self.target_grade.lower())
+        return sorted({int(g) for g in found})
+
+    def stated_experience(self) -> Dict[str, Any]:
+        """Years and GS grades the candidate states, for tools that grade seniority"""
+        return {"years": self.years_experience, "grades": self.grades}
+
+
+_PROFILE_CACHE: "OrderedDict[str, CandidateProfile]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def clear_profile_cache() -> None:
+    """Drop all cached profiles"""
+    with _cache_lock:
+        _PROFILE_CACHE.clear()
@@ -0,0 +1,365 @@
+"""
+Checkpoint State Store
+
+Workflow states for time-travel debugging, stored compactly. A state is a
+JSON object; each top-level value is serialized canonically and addressed by
+its SHA-256. A snapshot stores the state as a manifest of those hashes, with
+the values themselves in a chunk table shared by every snapshot, so a value
+that does not change (a job description, a resume) is stored once. Between
+snapshots a checkpoint stores only a JSON patch (RFC 6902) against its base
+checkpoint, covering just the keys whose hash changed; every
+`snapshot_interval` steps along a chain a full snapshot bounds replay
+work. Writes are queued and committed in batches of `batch_size` in one
+transaction, together with any statements the caller defers.
+
+States are stored as their JSON form (`normalize`): replaying a checkpoint
+returns exactly the normalized state that was written, and `diff` between any
+two checkpoints is a patch that turns one into the other.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_SNAPSHOT_INTERVAL = 50
+
+
+def canonical_json(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def normalize(state: Dict[str, Any]) -> Dict[str, Any]:
+    """The JSON form a state is stored (and replayed) as"""
+    return json.loads(canonical_json(state))
+
+
+def _hash(encoded: str) -> str:
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _pointer(key: str) -> str:
+    return "/" + key.replace("~", "~0").replace("/", "~1")
+
+
+def _same(a: Any, b: Any) -> bool:
+    """JSON equality (unlike ==, 1 and True or 1 and 1.0 differ)"""
+    if a is b:
+        return True
+    kind = type(a)
+    if kind is not type(b):
+        return False
+    if kind is dict:
+        if len(a) != len(b):
+            return False
+        for key, value in a.items():
+            if key not in b or not _same(value, b[key]):
+                return False
+        return True
+    if kind is list:
+        return len(a) == len(b) and all(map(_same, a, b))
+    return a == b
+
+
+def make_patch(old: Any, new: Any, path: str = "", ops: Optional[List[Dict[str, Any]]] = None
+               ) -> List[Dict[str, Any]]:
+    """
+    JSON patch (add/remove/replace) turning `old` into `new`: objects are
+    compared per key; lists keep their common prefix and suffix and patch the
+    middle element by element, so appends and in-place edits stay small
+    """
+    ops = [] if ops is None else ops
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": path + _pointer(key)})
+        for key, value in new.items():
+            if key not in old:
+                ops.append({"op": "add", "path": path + _pointer(key), "value": value})
+            else:
+                make_patch(old[key], value, path + _pointer(key), ops)
+    elif isinstance(old, list) and isinstance(new, list):
+        n, m = len(old), len(new)
+        prefix = 0
+        while prefix < min(n, m) and _same(old[prefix], new[prefix]):
+            prefix += 1
+        suffix = 0
+        while suffix < min(n, m) - prefix and _same(old[n - 1 - suffix], new[m - 1 - suffix]):
+            suffix += 1
+        old_middle, new_middle = n - suffix - prefix, m - suffix - prefix
+        for i in range(min(old_middle, new_middle)):
+            make_patch(old[prefix + i], new[prefix + i], f"{path}/{prefix + i}", ops)
+        for _ in range(old_middle - new_middle):
+            ops.append({"op": "remove", "path": f"{path}/{prefix + new_middle}"})
+        for i in range(old_middle, new_middle):
+            ops.append({"op": "add", "path": f"{path}/{prefix + i}", "value": new[prefix + i]})
+    elif not _same(old, new):
+        ops.append({"op": "replace", "path": path, "value": new})
+    return ops
+
+
+def apply_patch(doc: Dict[str, Any], ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Apply add/remove/replace operations to `doc` in place"""
+    for op in ops:
+        parts = [part.replace("~1", "/").replace("~0", "~") for part in op["path"].split("/")[1:]]
+        parent = doc
+        for part in parts[:-1]:
+            parent = parent[int(part)] if isinstance(parent, list) else parent[part]
+        last = int(parts[-1]) if isinstance(parent, list) else parts[-1]
+        if op["op"] == "remove":
+            del parent[last]
+        elif op["op"] == "add" and isinstance(parent, list):
+            parent.insert(last, op["value"])
+        else:
+            parent[last] = op["value"]
+    return doc
+
+
+class CheckpointStore:
+    """Content-addressed snapshots plus JSON-patch deltas, written in batches"""
+
+    def __init__(self, conn: sqlite3.Connection, batch_size: int = DEFAULT_BATCH_SIZE,
+                 snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL, cache_size: int = 64):
+        self.conn = conn
+        self.batch_size = max(1, batch_size)
+        self.snapshot_interval = max(1, snapshot_interval)
+        self._lock = threading.RLock()
+        # checkpoint_id -> (state, {key: value hash}, depth since snapshot); recent heads and replays
+        self._states: "OrderedDict[str, Tuple[Dict[str, Any], Dict[str, str], int]]" = OrderedDict()
+        self._cache_size = cache_size
+        self._chunks: List[Tuple[str, bytes]] = []
+        self._rows: List[Tuple] = []
+        self._links: List[Tuple[str, str]] = []
+        self._deferred: List[Tuple[str, Sequence[Any]]] = []
+        self.stats = {"snapshots": 0, "deltas": 0, "batches": 0}
+
+        with self.conn:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS state_chunks (
+                    hash TEXT PRIMARY KEY,
+                    data BLOB NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS checkpoint_states (
+                    checkpoint_id TEXT PRIMARY KEY,
+                    base_id TEXT,
+                    kind TEXT NOT NULL,
+                    depth INTEGER NOT NULL,
+                    state_hash TEXT NOT NULL,
+                    payload BLOB NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS snapshot_chunks (
+                    checkpoint_id TEXT NOT NULL,
+                    hash TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_checkpoint_states_base ON checkpoint_states (base_id);
+                CREATE INDEX IF NOT EXISTS idx_snapshot_chunks_checkpoint ON snapshot_chunks (checkpoint_id);
+                CREATE INDEX IF NOT EXISTS idx_snapshot_chunks_hash ON snapshot_chunks (hash);
+            """)
+
+    # Writing
+
+    def put(self, checkpoint_id: str, state: Dict[str, Any], base_id: Optional[str] = None) -> str:
+        """Queue a checkpoint's state (as a delta against base_id when possible); returns the state hash"""
+        # Each value is encoded once; the normalized state is decoded from those encodings
+        encoded = {str(key): canonical_json(value) for key, value in state.items()}
+        state = {key: json.loads(text) for key, text in encoded.items()}
+        hashes = {key: _hash(text) for key, text in encoded.items()}
+        state_hash = _hash(canonical_json(hashes))
+
+        with self._lock:
+            # A full batch is committed before the next checkpoint, so statements deferred
+            # after a put land in the same transaction as its state
+            if len(self._rows) >= self.batch_size:
+                self.flush()
+            base = self._load(base_id) if base_id else None
+            if base is not None and base[2] + 1 < self.snapshot_interval:
+                depth = base[2] + 1
+                patch = self._delta(base[0], base[1], state, hashes)
+                payload = zlib.compress(canonical_json(patch).encode("utf-8"))
+                self._rows.append((checkpoint_id, base_id, "delta", depth, state_hash, payload))
+                self.stats["deltas"] += 1
+            else:
+                depth = 0
+                for key, text in encoded.items():
+                    self._chunks.append((hashes[key], zlib.compress(text.encode("utf-8"))))
+                    self._links.append((checkpoint_id, hashes[key]))
+                payload = zlib.compress(canonical_json(hashes).encode("utf-8"))
+                self._rows.append((checkpoint_id, None, "snapshot", depth, state_hash, payload))
+                self.stats["snapshots"] += 1
+
+            self._remember(checkpoint_id, (state, hashes, depth))
+        return state_hash
+
+    def defer(self, sql: str, params: Sequence[Any]) -> None:
+        """Queue a statement to commit in the same transaction as the current batch"""
+        with self._lock:
+            self._deferred.append((sql, params))
+
+    def flush(self) -> None:
+        """Commit everything queued in one transaction"""
+        with self._lock:
+            if not (self._rows or self._deferred):
+                return
+            with self.conn:
+                self.conn.executemany("INSERT OR IGNORE INTO state_chunks (hash, data) VALUES (?, ?)", self._chunks)
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO checkpoint_states "
+                    "(checkpoint_id, base_id, kind, depth, state_hash, payload) VALUES (?, ?, ?, ?, ?, ?)",
+                    self._rows
+                )
+                self.conn.executemany("INSERT INTO snapshot_chunks (checkpoint_id, hash) VALUES (?, ?)", self._links)
+                # Consecutive statements with the same SQL go through executemany
+                group_sql, group = None, []
+                for sql, params in self._deferred + [(None, None)]:
+                    if sql != group_sql and group:
+                        self.conn.executemany(group_sql, group)
+                        group = []
+                    group_sql = sql
+                    if sql is not None:
+                        group.append(params)
+            self._chunks, self._rows, self._links, self._deferred = [], [], [], []
+            self.stats["batches"] += 1
+
+    @staticmethod
+    def _delta(base: Dict[str, Any], base_hashes: Dict[str, str], state: Dict[str, Any],
+               hashes: Dict[str, str]) -> List[Dict[str, Any]]:
+        """Patch from base to state, diffing only the keys whose hash changed"""
+        patch: List[Dict[str, Any]] = []
+        for key in base_hashes:
+            if key not in hashes:
+                patch.append({"op": "remove", "path": _pointer(key)})
+        for key, value_hash in hashes.items():
+            if key not in base_hashes:
+                patch.append({"op": "add", "path": _pointer(key), "value": state[key]})
+            elif value_hash != base_hashes[key]:
+                make_patch(base[key], state[key], _pointer(key), patch)
+        return patch
+
+    # Reading
+
+    def get(self, checkpoint_id: str) -> Optional[Dict[str, Any]]:
+        """The state written for a checkpoint (a copy), or None if unknown"""
+        with self._lock:
+            loaded = self._load(checkpoint_id)
+        return json.loads(canonical_json(loaded[0])) if loaded else None
+
+    def state_hash(self, checkpoint_id: str) -> Optional[str]:
+        with self._lock:
+            self.flush()
+            row = self.conn.execute(
+                "SELECT state_hash FROM checkpoint_states WHERE checkpoint_id = ?", (checkpoint_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def diff(self, checkpoint_from: str, checkpoint_to: str) -> List[Dict[str, Any]]:
+        """JSON patch that turns one checkpoint's state into the other's"""
+        state_from, state_to = self.get(checkpoint_from), self.get(checkpoint_to)
+        if state_from is None or state_to is None:
+            raise ValueError("Unknown checkpoint")
+        return make_patch(state_from, state_to)
+
+    def _load(self, checkpoint_id: str) -> Optional[Tuple[Dict[str, Any], Dict[str, str], int]]:
+        """Materialize a state: walk back to a snapshot or cached state, then apply the deltas forward"""
+        cached = self._states.get(checkpoint_id)
+        if cached is not None:
+            self._states.move_to_end(checkpoint_id)
+            return cached
+        self.flush()
+
+        chain = []
+        current = checkpoint_id
+        while current not in self._states:
+            row = self.conn.execute(
+                "SELECT base_id, kind, depth, payload FROM checkpoint_states WHERE checkpoint_id = ?", (current,)
+            ).fetchone()
+            if row is None:
+                if chain:
+                    raise ValueError(f"Checkpoint {chain[-1][0]} has a missing base {current}")
+                return None
+            chain.append((current, *row))
+            if row[1] == "snapshot":
+                break
+            current = row[0]
+
+        if chain[-1][2] == "snapshot":
+            snapshot_id, _, _, depth, payload = chain.pop()
+            hashes = json.loads(zlib.decompress(payload))
+            # Keys holding equal values (several empty lists, say) share one chunk
+            unique = list(set(hashes.values()))
+            data = dict(self.conn.execute(
+                f"SELECT hash, data FROM state_chunks WHERE hash IN ({','.join('?' * len(unique))})",
+                unique
+            ).fetchall()) if unique else {}
+            texts = {key: zlib.decompress(data[value_hash]).decode("utf-8") for key, value_hash in hashes.items()}
+            loaded = ({key: json.loads(text) for key, text in texts.items()}, hashes, depth)
+            self._remember(snapshot_id, loaded)
+        else:
+            loaded = self._states[current]
+
+        if not chain:
+            return loaded
+        # Patch a private copy in place; the cached base stays untouched
+        state = json.loads(canonical_json(loaded[0]))
+        for _, _, _, depth, payload in reversed(chain):
+            apply_patch(state, json.loads(zlib.decompress(payload)))
+        loaded = (state, {key: _hash(canonical_json(value)) for key, value in state.items()}, depth)
+        self._remember(checkpoint_id, loaded)
+        return loaded
+
+    def _remember(self, checkpoint_id: str, loaded: Tuple[Dict[str, Any], Dict[str, str], int]) -> None:
+        self._states[checkpoint_id] = loaded
+        self._states.move_to_end(checkpoint_id)
+        while len(self._states) > self._cache_size:
+            self._states.popitem(last=False)
+
+    # Maintenance
+
+    def delete(self, checkpoint_ids: Iterable[str]) -> int:
+        """Delete states; checkpoints based on a deleted one become snapshots first. Returns chunks freed"""
+        doomed = set(checkpoint_ids)
+        with self._lock:
+            self.flush()
+            dependents = [
+                row[0] for row in self.conn.execute(
+                    f"SELECT checkpoint_id FROM checkpoint_states WHERE base_id IN ({','.join('?' * len(doomed))})",
+                    list(doomed)
+                )
+            ] if doomed else []
+            rebased = {}
+            for checkpoint_id in dependents:
+                if checkpoint_id not in doomed:
+                    rebased[checkpoint_id] = self._load(checkpoint_id)[0]
+
+            with self.conn:
+                for checkpoint_id in doomed:
+                    self.conn.execute("DELETE FROM checkpoint_states WHERE checkpoint_id = ?", (checkpoint_id,))
+                    self.conn.execute("DELETE FROM snapshot_chunks WHERE checkpoint_id = ?", (checkpoint_id,))
+                    self._states.pop(checkpoint_id, None)
+            # Survivors become snapshots; their own deltas still apply unchanged
+            for checkpoint_id, state in rebased.items():
+                self._states.pop(checkpoint_id, None)
+                self.put(checkpoint_id, state)
+            self.flush()
+            with self.conn:
+                freed = self.conn.execute(
+                    "DELETE FROM state_chunks WHERE hash NOT IN (SELECT hash FROM snapshot_chunks)"
+                ).rowcount
+        return freed
+
+    def size(self) -> Dict[str, int]:
+        """Stored bytes per table (payloads only)"""
+        with self._lock:
+            self.flush()
+            chunks = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(data)), 0) FROM state_chunks").fetchone()
+            states = self.conn.execute(
+                "SELECT kind, COUNT(*), COALESCE(SUM(LENGTH(payload)), 0) FROM checkpoint_states GROUP BY kind"
+            ).fetchall()
+        report = {"chunks": chunks[0], "chunk_bytes": chunks[1]}
+        for kind, count, size in states:
+            report[f"{kind}s"] = count
+            report[f"{kind}_bytes"] = size
+        return report
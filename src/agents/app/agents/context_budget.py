@@ -0,0 +1,225 @@
+"""
+Context-Window Budget for Agent Prompts
+
+Splits an Ollama context window (num_ctx minus the tokens reserved for the
+reply) between the fixed role prompt, the question, conversation memory, the
+request context and the ReAct scratchpad, and fits each variable part to its
+share: older turns collapse into one-line summaries, oversized JSON fields are
+shortened, and long tool observations keep their head and tail.
+"""
+
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from langchain.memory import ConversationBufferMemory
+from langchain_core.agents import AgentAction
+from langchain_core.messages import BaseMessage, get_buffer_string
+
+# Word pieces and punctuation; words of LONG_WORD_CHARS or more count as several
+# tokens, roughly as BPE vocabularies split them
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+LONG_WORD_CHARS = 8
+
+# Shares of the space left after the role prompt and question; a part that
+# needs less than its share passes the remainder to the others
+DEFAULT_SHARES = {"memory": 0.4, "context": 0.25, "scratchpad": 0.35}
+
+# When memory overflows, older turns are summarized until the verbatim tail is
+# this fraction of its budget, so the transcript head (and Ollama's cached
+# prefix) stays unchanged for several turns instead of shifting every call
+MEMORY_TRIM_TO = 0.6
+SUMMARY_CHARS = 100
+
+
+def count_tokens(text: str) -> int:
+    """Fast token estimate (no tokenizer download or model round trip)"""
+    pieces = TOKEN_PATTERN.findall(text)
+    return len(pieces) + sum(len(p) // LONG_WORD_CHARS for p in pieces if len(p) >= LONG_WORD_CHARS)
+
+
+def fit_text(text: str, limit: int, counter: Callable[[str], int] = count_tokens) -> Tuple[str, int]:
+    """Keep the head and tail of `text` within `limit` tokens; returns (text, tokens trimmed)"""
+    tokens = counter(text)
+    if tokens <= limit:
+        return text, 0
+    if limit <= 0:
+        return "", tokens
+
+    keep = int(len(text) * limit / tokens)
+    for _ in range(4):
+        head, tail = text[:keep * 2 // 3], text[len(text) - keep // 3:] if keep >= 3 else ""
+        fitted = f"{head} …[{tokens - counter(head + tail)} tokens trimmed]… {tail}"
+        if counter(fitted) <= limit:
+            break
+        keep = int(keep * 0.8)
+    return fitted, tokens - counter(fitted)
+
+
+def allocate(available: int, demands: Dict[str, float], shares: Dict[str, float]) -> Dict[str, int]:
+    """
+    Water-filling split of `available` tokens: parts demanding less than their
+    share get their demand, the remainder is re-split among the rest by share
+    """
+    allocation: Dict[str, int] = {}
+    pending = dict(shares)
+    remaining = float(available)
+    while pending:
+        total_share = sum(pending.values())
+        satisfied = {part for part, share in pending.items()
+                     if demands.get(part, float("inf")) <= remaining * share / total_share}
+        if not satisfied:
+            for part, share in pending.items():
+                allocation[part] = int(remaining * share / total_share)
+            break
+        for part in satisfied:
+            allocation[part] = int(demands[part])
+            remaining -= demands[part]
+            del pending[part]
+    return allocation
+
+
+class ContextBudget:
+    """Token accounting and trimming for one model context window"""
+
+    def __init__(self, num_ctx: int, reserve_output: int, shares: Optional[Dict[str, float]] = None,
+                 counter: Callable[[str], int] = count_tokens):
+        self.num_ctx = num_ctx
+        self.reserve_output = min(reserve_output, num_ctx // 2)
+        self.shares = shares or DEFAULT_SHARES
+        self.count = counter
+
+    @property
+    def input_tokens(self) -> int:
+        return self.num_ctx - self.reserve_output
+
+    def plan(self, system: int, question: int, demands: Dict[str, float]) -> Dict[str, int]:
+        """Token limits for memory, context and scratchpad given the fixed parts"""
+        return allocate(max(self.input_tokens - system - question, 0), demands, self.shares)
+
+    def fit_text(self, text: str, limit: int) -> Tuple[str, int]:
+        return fit_text(text, limit, self.count)
+
+    def fit_json(self, value: Any, limit: int) -> Tuple[str, int]:
+        """
+        Serialize `value` (sorted keys) within `limit` tokens by shortening
+        lists and long strings proportionally; returns (json, tokens trimmed)
+        """
+        full = json.dumps(value, sort_keys=True, default=str)
+        tokens = self.count(full)
+        if tokens <= limit:
+            return full, 0
+
+        best = None
+        low, high = 0.0, 1.0
+        for _ in range(8):  # binary search the largest shrink factor that fits
+            factor = (low + high) / 2
+            candidate = json.dumps(_shrink(value, factor), sort_keys=True, default=str)
+            if self.count(candidate) <= limit:
+                best, low = candidate, factor
+            else:
+                high = factor
+        if best is None:
+            best, _ = self.fit_text(json.dumps(_shrink(value, 0.0), sort_keys=True, default=str), limit)
+        return best, tokens - self.count(best)
+
+    def trim_steps(self, steps: List[Tuple[AgentAction, Any]], limit: int) -> Tuple[List[Tuple[AgentAction, str]], int]:
+        """
+        Cut tool observations (and action logs that echo a large Action Input)
+        so the ReAct scratchpad fits `limit`; returns (steps, tokens trimmed)
+        """
+        pieces = [text for action, observation in steps for text in (action.log, str(observation))]
+        demands = {i: self.count(text) for i, text in enumerate(pieces)}
+        if sum(demands.values()) <= limit:
+            return [(action, pieces[2 * i + 1]) for i, (action, _) in enumerate(steps)], 0
+
+        limits = allocate(max(limit, 0), demands, {i: 1.0 for i in demands})
+        fitted, removed = [], 0
+        for i, text in enumerate(pieces):
+            text, cut = self.fit_text(text, limits[i])
+            fitted.append(text)
+            removed += cut
+        trimmed = [
+            (action if fitted[2 * i] == action.log else
+             AgentAction(tool=action.tool, tool_input=action.tool_input, log=fitted[2 * i]), fitted[2 * i + 1])
+            for i, (action, _) in enumerate(steps)
+        ]
+        return trimmed, removed
+
+
+def _shrink(value: Any, factor: float) -> Any:
+    """Proportionally shorten lists (noting what was dropped) and long strings"""
+    if isinstance(value, dict):
+        return {key: _shrink(item, factor) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        keep = max(1, int(len(value) * factor))
+        items = [_shrink(item, factor) for item in value[:keep]]
+        return items + [f"... {len(value) - keep} more"] if keep < len(value) else items
+    if isinstance(value, str) and len(value) > 40:
+        keep = max(40, int(len(value) * factor))
+        return value if keep >= len(value) else value[:keep] + "…"
+    return value
+
+
+def _summary_line(message: BaseMessage, prefix: str) -> str:
+    text = " ".join(str(message.content).split())
+    sentence = re.split(r"(?<=[.?!])\s", text, maxsplit=1)[0]
+    return f"{prefix}: {sentence[:SUMMARY_CHARS]}{'…' if len(sentence) > SUMMARY_CHARS else ''}"
+
+
+class BudgetedConversationMemory(ConversationBufferMemory):
+    """
+    Conversation memory rendered within a token budget
+
+    All messages are kept (and persisted) as before; only the rendered
+    transcript is bounded. Turns that no longer fit verbatim are replaced,
+    oldest first, by one-line summaries, and the boundary only moves when the
+    budget is exceeded again.
+    """
+
+    max_tokens: Optional[int] = None
+    summarized: int = 0  # leading messages shown as summaries
+    last_tokens: int = 0
+    last_trimmed: int = 0
+    counter: Callable[[str], int] = count_tokens
+
+    def _render(self, messages: Sequence[BaseMessage], summarized: int) -> str:
+        parts = []
+        if summarized:
+            prefixes = {"human": self.human_prefix, "ai": self.ai_prefix}
+            lines = [_summary_line(m, prefixes.get(m.type, m.type)) for m in messages[:summarized]]
+            parts.append("Earlier conversation (summarized):\n" + "\n".join(lines))
+        if messages[summarized:]:
+            parts.append(get_buffer_string(messages[summarized:], human_prefix=self.human_prefix,
+                                           ai_prefix=self.ai_prefix))
+        return "\n".join(parts)
+
+    def _buffer_as_str(self, messages: List[BaseMessage]) -> str:
+        full = get_buffer_string(messages, human_prefix=self.human_prefix, ai_prefix=self.ai_prefix)
+        full_tokens = self.counter(full)
+        if self.max_tokens is None or full_tokens <= self.max_tokens:
+            self.summarized = 0
+            self.last_tokens, self.last_trimmed = full_tokens, 0
+            return full
+
+        summarized = min(self.summarized, len(messages))
+        text = self._render(messages, summarized)
+        if self.counter(text) > self.max_tokens:
+            # Summarize whole turns until the transcript is back under MEMORY_TRIM_TO
+            target = self.max_tokens * MEMORY_TRIM_TO
+            while summarized < len(messages) - 2 and self.counter(text) > target:
+                summarized = min(summarized + 2, len(messages) - 2)
+                text = self._render(messages, summarized)
+            self.summarized = summarized
+
+        tokens = self.counter(text)
+        if tokens > self.max_tokens:
+            # Summaries of a very long session, or one oversized turn: keep head and tail
+            text, _ = fit_text(text, self.max_tokens, self.counter)
+            tokens = self.counter(text)
+        self.last_tokens, self.last_trimmed = tokens, full_tokens - tokens
+        return text
+
+    def clear(self) -> None:
+        super().clear()
+        self.summarized = 0
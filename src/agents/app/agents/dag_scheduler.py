@@ -0,0 +1,212 @@
+"""
+DAG scheduler for dependent agent subtasks
+
+Each subtask starts as soon as all of its predecessors have completed, up to a
+concurrency limit. When more tasks are ready than there are free slots, the
+one with the longest critical path (its own estimated duration plus the
+longest chain of dependents behind it) goes first, so long chains are not
+left waiting behind short leaves. A failed task cancels every task
+downstream of it; independent branches keep running. Start and finish times
+are recorded per task so a run's makespan can be compared against running
+the same plan sequentially.
+"""
+
+import asyncio
+import heapq
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence
+
+import structlog
+
+logger = structlog.get_logger()
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+@dataclass
+class TaskRun:
+    """Outcome of one subtask; times are seconds from the start of the run"""
+    task_id: str
+    status: str = "pending"  # completed | failed | cancelled
+    critical_path: float = 0.0
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        return (self.finished - self.started) if self.started is not None and self.finished is not None else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "critical_path": self.critical_path,
+            "started": None if self.started is None else round(self.started, 4),
+            "finished": None if self.finished is None else round(self.finished, 4),
+            "error": self.error,
+        }
+
+
+@dataclass
+class DAGRun:
+    """Per-task schedule of one run"""
+    tasks: Dict[str, TaskRun] = field(default_factory=dict)
+    start_order: List[str] = field(default_factory=list)
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+
+    @property
+    def makespan(self) -> float:
+        return max((run.finished for run in self.tasks.values() if run.finished is not None), default=0.0)
+
+    @property
+    def busy_time(self) -> float:
+        """Sum of task durations: the makespan of running the plan one task at a time"""
+        return sum(run.duration for run in self.tasks.values())
+
+    @property
+    def succeeded(self) -> bool:
+        return all(run.status == "completed" for run in self.tasks.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "makespan": round(self.makespan, 4),
+            "busy_time": round(self.busy_time, 4),
+            "max_concurrency": self.max_concurrency,
+            "start_order": self.start_order,
+            "tasks": {task_id: run.to_dict() for task_id, run in self.tasks.items()},
+        }
+
+
+def topological_order(dependencies: Mapping[str, Sequence[str]]) -> List[str]:
+    """Kahn's algorithm; raises ValueError on unknown dependencies or cycles"""
+    for task_id, deps in dependencies.items():
+        unknown = [dep for dep in deps if dep not in dependencies]
+        if unknown:
+            raise ValueError(f"Task {task_id} depends on unknown tasks: {', '.join(unknown)}")
+
+    remaining = {task_id: len(set(deps)) for task_id, deps in dependencies.items()}
+    dependents = _dependents(dependencies)
+    ready = [task_id for task_id, count in remaining.items() if count == 0]
+    order = []
+    while ready:
+        task_id = ready.pop()
+        order.append(task_id)
+        for child in dependents[task_id]:
+            remaining[child] -= 1
+            if remaining[child] == 0:
+                ready.append(child)
+    if len(order) != len(dependencies):
+        cyclic = sorted(task_id for task_id in dependencies if task_id not in order)
+        raise ValueError(f"Circular dependencies between: {', '.join(cyclic)}")
+    return order
+
+
+def critical_paths(dependencies: Mapping[str, Sequence[str]],
+                   durations: Optional[Mapping[str, float]] = None) -> Dict[str, float]:
+    """Longest duration-weighted path from each task to the end of the plan (itself included)"""
+    durations = durations or {}
+    order = topological_order(dependencies)
+    dependents = _dependents(dependencies)
+    lengths: Dict[str, float] = {}
+    for task_id in reversed(order):
+        tail = max((lengths[child] for child in dependents[task_id]), default=0.0)
+        lengths[task_id] = float(durations.get(task_id, 1.0)) + tail
+    return lengths
+
+
+def _dependents(dependencies: Mapping[str, Sequence[str]]) -> Dict[str, List[str]]:
+    dependents: Dict[str, List[str]] = {task_id: [] for task_id in dependencies}
+    for task_id, deps in dependencies.items():
+        for dep in dict.fromkeys(deps):
+            dependents[dep].append(task_id)
+    return dependents
+
+
+class DAGScheduler:
+    """Runs a dependency graph of coroutine factories with bounded concurrency"""
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY, critical_path_first: bool = True):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.critical_path_first = critical_path_first
+
+    async def run(self, tasks: Mapping[str, Callable[[], Awaitable[Any]]],
+                  dependencies: Optional[Mapping[str, Sequence[str]]] = None,
+                  durations: Optional[Mapping[str, float]] = None) -> DAGRun:
+        """
+        Run `tasks` (id -> coroutine factory) honoring `dependencies`
+        (id -> predecessor ids); `durations` are estimates used only to rank
+        ready tasks. Task exceptions are recorded, not raised.
+        """
+        dependencies = {task_id: list((dependencies or {}).get(task_id, [])) for task_id in tasks}
+        paths = critical_paths(dependencies, durations)
+        dependents = _dependents(dependencies)
+        waiting = {task_id: len(set(deps)) for task_id, deps in dependencies.items()}
+        schedule = DAGRun(tasks={task_id: TaskRun(task_id, critical_path=paths[task_id]) for task_id in tasks},
+                          max_concurrency=self.max_concurrency)
+
+        sequence = {task_id: i for i, task_id in enumerate(tasks)}
+        ready: List[Any] = []
+
+        def push(task_id: str) -> None:
+            rank = -paths[task_id] if self.critical_path_first else 0.0
+            heapq.heappush(ready, (rank, sequence[task_id], task_id))
+
+        def cancel_downstream(task_id: str) -> None:
+            stack = list(dependents[task_id])
+            while stack:
+                child = stack.pop()
+                run = schedule.tasks[child]
+                if run.status == "pending":
+                    run.status = "cancelled"
+                    run.error = f"dependency {task_id} did not complete"
+                    stack.extend(dependents[child])
+
+        for task_id, count in waiting.items():
+            if count == 0:
+                push(task_id)
+
+        started = time.perf_counter()
+        running: Dict[asyncio.Task, str] = {}
+        try:
+            while ready or running:
+                while ready and len(running) < self.max_concurrency:
+                    _, _, task_id = heapq.heappop(ready)
+                    run = schedule.tasks[task_id]
+                    if run.status != "pending":
+                        continue
+                    run.started = time.perf_counter() - started
+                    schedule.start_order.append(task_id)
+                    running[asyncio.ensure_future(tasks[task_id]())] = task_id
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    task_id = running.pop(future)
+                    run = schedule.tasks[task_id]
+                    run.finished = time.perf_counter() - started
+                    error = "cancelled" if future.cancelled() else future.exception()
+                    if error is not None:
+                        run.status, run.error = "failed", str(error)
+                        logger.warning(f"Subtask {task_id} failed: {run.error}")
+                        cancel_downstream(task_id)
+                        continue
+                    run.status, run.result = "completed", future.result()
+                    for child in dependents[task_id]:
+                        waiting[child] -= 1
+                        if waiting[child] == 0:
+                            push(child)
+        finally:
+            # Cancelled from outside (e.g. a request timeout): stop what is still running
+            for future in running:
+                future.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            for task_id in running.values():
+                schedule.tasks[task_id].status = "cancelled"
+
+        return schedule
@@ -3,9 +3,8 @@ Enhanced Agent Factory with Local LLM Support
 Virtual Development Team Implementation
 """
 
-from typing import Dict, List, Any, Optional
-from langchain_community.llms import Ollama
-from langchain.agents import AgentExecutor, create_react_agent
+from typing import Dict, List, Any, Optional, Tuple
+from langchain.agents import AgentExecutor
 from langchain.memory import ConversationSummaryBufferMemory
 from langchain.prompts import PromptTemplate
 from langchain.tools import Tool
@@ -13,6 +12,13 @@ import asyncio
 import json
 from pathlib import Path
 import logging
+import os
+import threading
+import time
+
+from .async_tools import ParallelReActOutputParser, async_tool, create_async_react_agent
+from .llm_cache import attach_llm_cache
+from .ollama_client import OllamaHTTPClient, SharedClientOllama
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -47,17 +53,46 @@ MODEL_ASSIGNMENTS = {
     "customer_support": "llama3.1:8b"   # Speed for support
 }
 
+# Agents unused for this long are dropped and rebuilt on next use
+DEFAULT_IDLE_TTL = float(os.getenv("AGENT_IDLE_TTL", "1800"))
+
+
 class EnhancedAgentFactory:
-    """Factory for creating specialized agents with local LLMs"""
+    """
+    Factory for creating specialized agents with local LLMs
     
-    def __init__(self, config_path: Optional[str] = None):
+    Agents are built on first use (one build per role at a time) and evicted
+    after `idle_ttl` seconds without use. Roles whose model and settings match
+    share one LLM object, and every LLM shares one pooled HTTP client.
+    """
+    
+    def __init__(self, config_path: Optional[str] = None, idle_ttl: Optional[float] = None):
         """Initialize the agent factory"""
         self.agents: Dict[str, AgentExecutor] = {}
-        self.models: Dict[str, Ollama] = {}
+        self.models: Dict[str, SharedClientOllama] = {}
         self.config = self._load_config(config_path)
-        self._initialize_models()
-        self._create_all_agents()
-        logger.info(f"Initialized {len(self.agents)} agents with local LLMs")
+        self.idle_ttl = idle_ttl if idle_ttl is not None else float(
+            self.config["agent_settings"].get("idle_ttl", DEFAULT_IDLE_TTL)
+        )
+        self.http_client = OllamaHTTPClient()
+        self._llms: Dict[Tuple, SharedClientOllama] = {}
+        self._last_used: Dict[str, float] = {}
+        self._build_report: Dict[str, Dict[str, Any]] = {}
+        self._role_locks: Dict[str, asyncio.Lock] = {}
+        self._build_lock = threading.RLock()
+        self._creators = {
+            "backend_engineer": self._create_backend_agent,
+            "frontend_developer": self._create_frontend_agent,
+            "data_scientist": self._create_data_agent,
+            "devops_engineer": self._create_devops_agent,
+            "security_analyst": self._create_security_agent,
+            "content_creator": self._create_content_agent,
+            "project_manager": self._create_pm_agent,
+            "compliance_officer": self._create_compliance_agent,
+            "database_admin": self._create_database_agent,
+            "email_handler": self._create_email_agent
+        }
+        logger.info(f"Agent factory ready: {len(self.list_agents())} roles, built on first use")
     
     def _load_config(self, config_path: Optional[str]) -> Dict:
         """Load configuration from file or use defaults"""
@@ -72,50 +107,85 @@ class EnhancedAgentFactory:
                 "temperature": 0.7,
                 "max_tokens": 4096,
                 "timeout": 30,
-                "retry_attempts": 3
+                "retry_attempts": 3,
+                "idle_ttl": DEFAULT_IDLE_TTL
             }
         }
     
     def _initialize_models(self):
-        """Initialize all Ollama models"""
-        logger.info("Initializing Ollama models...")
-        
-        for role, model_name in self.config["models"].items():
+        """Drop built models and agents so they are rebuilt with the current settings"""
+        with self._build_lock:
+            self._llms.clear()
+            self.models.clear()
+            self.agents.clear()
+            self._last_used.clear()
+        logger.info("Model settings reset; agents will be rebuilt on next use")
+    
+    def _get_model(self, role: str) -> SharedClientOllama:
+        """LLM for a role, shared by every role with the same model and settings"""
+        settings = self.config["agent_settings"]
+        model_name = self.config["models"][role]
+        key = (model_name, settings["temperature"], settings["timeout"], os.getenv("OLLAMA_KEEP_ALIVE", "30m"))
+        llm = self._llms.get(key)
+        if llm is None:
+            llm = SharedClientOllama(
+                model=model_name,
+                base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
+                temperature=settings["temperature"],
+                num_ctx=8192,  # Extended context window
+                num_gpu=1,     # GPU acceleration if available
+                repeat_penalty=1.1,
+                timeout=settings["timeout"],
+                keep_alive=key[3],
+                http_client=self.http_client
+            )
+            attach_llm_cache(llm)  # no-op unless agent_settings.temperature is 0
+            self._llms[key] = llm
+            logger.info(f"✓ Initialized {model_name}")
+        self.models[role] = llm
+        return llm
+    
+    def _build_agent(self, role: str) -> AgentExecutor:
+        """Build (or return) the agent for a role"""
+        with self._build_lock:
+            agent = self.agents.get(role)
+            if agent is None:
+                started = time.perf_counter()
+                self._get_model(role)
+                agent = self._creators[role]()
+                self.agents[role] = agent
+                build_ms = (time.perf_counter() - started) * 1000
+                self._build_report[role] = {"build_ms": round(build_ms, 2), "built_at": time.time()}
+                logger.info(f"✓ Created {role} agent in {build_ms:.1f}ms")
+            self._last_used[role] = time.monotonic()
+            return agent
+    
+    def evict_idle(self) -> List[str]:
+        """Drop agents idle for longer than idle_ttl, and LLMs no remaining agent uses"""
+        cutoff = time.monotonic() - self.idle_ttl
+        with self._build_lock:
+            evicted = [role for role, used in self._last_used.items() if used < cutoff]
+            for role in evicted:
+                self.agents.pop(role, None)
+                self.models.pop(role, None)
+                self._last_used.pop(role, None)
+            in_use = {id(llm) for llm in self.models.values()}
+            self._llms = {key: llm for key, llm in self._llms.items() if id(llm) in in_use}
+        if evicted:
+            logger.info(f"Evicted idle agents: {', '.join(evicted)}")
+        return evicted
+    
+    def warm_up(self, roles: Optional[List[str]] = None) -> Dict[str, str]:
+        """Build agents ahead of first use (default: every available role)"""
+        results = {}
+        for role in (roles or self.list_agents()):
             try:
-                self.models[role] = Ollama(
-                    model=model_name,
-                    temperature=self.config["agent_settings"]["temperature"],
-                    num_ctx=8192,  # Extended context window
-                    num_gpu=1,     # GPU acceleration if available
-                    repeat_penalty=1.1,
-                    timeout=self.config["agent_settings"]["timeout"]
-                )
-                logger.info(f"✓ Initialized {model_name} for {role}")
+                self._build_agent(role)
+                results[role] = "ready"
             except Exception as e:
-                logger.error(f"✗ Failed to initialize {model_name} for {role}: {e}")
-    
-    def _create_all_agents(self):
-        """Create all specialized agents"""
-        agent_creators = {
-            "backend_engineer": self._create_backend_agent,
-            "frontend_developer": self._create_frontend_agent,
-            "data_scientist": self._create_data_agent,
-            "devops_engineer": self._create_devops_agent,
-            "security_analyst": self._create_security_agent,
-            "content_creator": self._create_content_agent,
-            "project_manager": self._create_pm_agent,
-            "compliance_officer": self._create_compliance_agent,
-            "database_admin": self._create_database_agent,
-            "email_handler": self._create_email_agent
-        }
-        
-        for name, creator_func in agent_creators.items():
-            if name in self.models:
-                try:
-                    self.agents[name] = creator_func()
-                    logger.info(f"✓ Created {name} agent")
-                except Exception as e:
-                    logger.error(f"✗ Failed to create {name} agent: {e}")
+                logger.error(f"✗ Failed to create {role} agent: {e}")
+                results[role] = f"failed: {e}"
+        return results
     
     def _create_agent(self, role: str, tools: List[Tool], prompt: str, description: str) -> AgentExecutor:
         """Generic agent creation method"""
@@ -135,11 +205,13 @@ class EnhancedAgentFactory:
             template=prompt
         )
         
-        # Create agent
-        agent = create_react_agent(
+        # Create agent; tools run as timeout-bounded coroutines under ainvoke
+        tools = [async_tool(tool, agent=role) for tool in tools]
+        agent = create_async_react_agent(
             llm=self.models[role],
             tools=tools,
-            prompt=prompt_template
+            prompt=prompt_template,
+            output_parser=ParallelReActOutputParser()
         )
         
         # Create executor
@@ -706,12 +778,30 @@ class EnhancedAgentFactory:
         )
     
     def get_agent(self, role: str) -> Optional[AgentExecutor]:
-        """Get agent by role"""
-        return self.agents.get(role)
+        """Get agent by role, building it on first use"""
+        if role not in self.list_agents():
+            return None
+        return self._build_agent(role)
+    
+    async def aget_agent(self, role: str) -> Optional[AgentExecutor]:
+        """Get agent by role; concurrent first requests for a role wait for one build"""
+        if role not in self.list_agents():
+            return None
+        self.evict_idle()
+        if role in self.agents:
+            self._last_used[role] = time.monotonic()
+            return self.agents[role]
+        
+        lock = self._role_locks.setdefault(role, asyncio.Lock())
+        async with lock:
+            if role in self.agents:
+                self._last_used[role] = time.monotonic()
+                return self.agents[role]
+            return await asyncio.to_thread(self._build_agent, role)
     
     async def execute_task(self, role: str, task: str) -> str:
         """Execute task with specified agent"""
-        agent = self.get_agent(role)
+        agent = await self.aget_agent(role)
         if not agent:
             raise ValueError(f"No agent found for role: {role}")
         
@@ -723,17 +813,20 @@ class EnhancedAgentFactory:
             raise
     
     def list_agents(self) -> List[str]:
-        """List all available agents"""
-        return list(self.agents.keys())
+        """List all available agents (built or not)"""
+        return [role for role in self._creators if role in self.config["models"]]
     
     def get_agent_info(self, role: str) -> Dict[str, Any]:
         """Get information about a specific agent"""
-        if role not in self.agents:
+        if role not in self.list_agents():
             return {"error": f"Agent {role} not found"}
+        if role not in self.agents:
+            return {"role": role, "model": self.config["models"][role], "loaded": False}
         
         return {
             "role": role,
             "model": self.config["models"].get(role, "unknown"),
+            "loaded": True,
             "description": self.agents[role].description if hasattr(self.agents[role], 'description') else "No description",
             "tools": [tool.name for tool in self.agents[role].tools] if hasattr(self.agents[role], 'tools') else []
         }
@@ -743,4 +836,15 @@ class EnhancedAgentFactory:
         return {
             role: self.get_agent_info(role)
             for role in self.list_agents()
-        }
\ No newline at end of file
+        }
+    
+    def build_report(self) -> Dict[str, Any]:
+        """Which agents and LLM objects are resident, and what each build cost"""
+        return {
+            "available": self.list_agents(),
+            "loaded": sorted(self.agents),
+            "llm_objects": len(self._llms),
+            "idle_ttl": self.idle_ttl,
+            "http_client": self.http_client.stats(),
+            "agents": self._build_report
+        }
@@ -2,10 +2,15 @@
 Agent Factory for creating specialized agents
 """
 
-from typing import Dict, Type, Optional
+from typing import Dict, Type, Optional, Union, List, Any, TYPE_CHECKING
+import importlib
+import sys
+import threading
+import time
 import structlog
 
-from .base import FederalJobAgent, AgentConfig
+if TYPE_CHECKING:
+    from .base import FederalJobAgent
 
 # Import role-based agents (to be created)
 # from agents.app.agents.roles.data_scientist import DataScientistAgent
@@ -25,42 +30,128 @@ from .base import FederalJobAgent, AgentConfig
 
 logger = structlog.get_logger()
 
+# user_id prefix of the memoryless instances /agents/batch creates per user
+BATCH_USER_PREFIX = "batch:"
+
 
 class AgentRegistry:
-    """Registry of available agent types"""
+    """
+    Registry of available agent types
+    
+    Agents may be registered as classes or as "module:Class" strings; string
+    entries are imported on first use so startup does not pay for every agent's
+    LangChain/Ollama/Redis import graph. Relative module paths resolve against
+    this package (e.g. ".roles.data_scientist:DataScientistAgent").
+    """
     
     def __init__(self):
-        self._agents: Dict[str, Type[FederalJobAgent]] = {}
+        self._agents: Dict[str, Type["FederalJobAgent"]] = {}
+        self._specs: Dict[str, str] = {}
         self._metadata: Dict[str, Dict] = {}
+        self._warmup_roles: List[str] = []
+        self._import_report: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
         
     def register(
         self, 
         role: str, 
-        agent_class: Type[FederalJobAgent],
-        metadata: Optional[Dict] = None
+        agent_class: Union[Type["FederalJobAgent"], str],
+        metadata: Optional[Dict] = None,
+        warm: bool = False
     ):
-        """Register an agent type"""
-        self._agents[role] = agent_class
-        self._metadata[role] = metadata or {}
+        """Register an agent type (class or lazy "module:Class" string)"""
+        with self._lock:
+            if isinstance(agent_class, str):
+                if ":" not in agent_class:
+                    raise ValueError(f"Lazy agent spec must be 'module:Class', got {agent_class!r}")
+                self._specs[role] = agent_class
+                self._agents.pop(role, None)
+            else:
+                self._agents[role] = agent_class
+                self._specs.pop(role, None)
+            
+            self._metadata[role] = metadata or {}
+            if warm and role not in self._warmup_roles:
+                self._warmup_roles.append(role)
+        
         logger.info(f"Registered agent: {role}")
         
-    def get(self, role: str) -> Optional[Type[FederalJobAgent]]:
-        """Get an agent class by role"""
-        return self._agents.get(role)
+    def get(self, role: str) -> Optional[Type["FederalJobAgent"]]:
+        """Get an agent class by role, importing it on first use"""
+        agent_class = self._agents.get(role)
+        if agent_class is not None or role not in self._specs:
+            return agent_class
+        
+        with self._lock:
+            if role not in self._agents:
+                self._agents[role] = self._import_agent(role, self._specs[role])
+            return self._agents[role]
+    
+    def _import_agent(self, role: str, spec: str) -> Type["FederalJobAgent"]:
+        """Import an agent class and record what the import cost"""
+        module_name, class_name = spec.split(":", 1)
+        modules_before = set(sys.modules)
+        started = time.perf_counter()
+        
+        module = importlib.import_module(module_name, package=__package__)
+        agent_class = getattr(module, class_name)
+        
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        new_modules = sorted(set(sys.modules) - modules_before)
+        self._import_report[role] = {
+            "spec": spec,
+            "module": module.__name__,
+            "import_ms": round(elapsed_ms, 2),
+            "new_modules": len(new_modules),
+            "new_top_level_packages": sorted({name.split(".")[0] for name in new_modules}),
+            "imported_at": time.time()
+        }
+        logger.info(f"Imported agent {role} from {module.__name__} in {elapsed_ms:.1f}ms "
+                    f"({len(new_modules)} new modules)")
+        return agent_class
+    
+    def warm_up(self, roles: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Import the given roles (default: roles registered with warm=True)"""
+        results = {}
+        for role in (self._warmup_roles if roles is None else roles):
+            try:
+                self.get(role)
+                results[role] = "ready"
+            except Exception as e:
+                logger.warning(f"Warm-up failed for {role}: {e}")
+                results[role] = f"failed: {e}"
+        return results
         
     def list_agents(self) -> Dict[str, Dict]:
-        """List all available agents with metadata"""
+        """List all available agents with metadata (does not trigger imports)"""
+        roles = list(self._agents) + [role for role in self._specs if role not in self._agents]
         return {
             role: {
-                "class": agent_class.__name__,
+                "class": self._class_name(role),
+                "loaded": role in self._agents,
                 "metadata": self._metadata.get(role, {})
             }
-            for role, agent_class in self._agents.items()
+            for role in roles
+        }
+    
+    def _class_name(self, role: str) -> str:
+        if role in self._agents:
+            return self._agents[role].__name__
+        return self._specs[role].split(":", 1)[1]
+    
+    def import_report(self) -> Dict[str, Any]:
+        """Per-role import cost for agents loaded so far"""
+        report = dict(sorted(self._import_report.items(), key=lambda item: -item[1]["import_ms"]))
+        return {
+            "loaded": [role for role in self.list_agents() if role in self._agents],
+            "pending": [role for role in self._specs if role not in self._agents],
+            "total_import_ms": round(sum(entry["import_ms"] for entry in report.values()), 2),
+            "agents": report
         }
         
     def is_registered(self, role: str) -> bool:
         """Check if an agent role is registered"""
-        return role in self._agents
+        return role in self._agents or role in self._specs
 
 
 class AgentFactory:
@@ -68,17 +159,18 @@ class AgentFactory:
     
     # Class-level registry
     _registry = AgentRegistry()
-    _instances: Dict[str, FederalJobAgent] = {}
+    _instances: Dict[str, "FederalJobAgent"] = {}
     
     @classmethod
     def register_agent(
         cls,
         role: str,
-        agent_class: Type[FederalJobAgent],
-        metadata: Optional[Dict] = None
+        agent_class: Union[Type["FederalJobAgent"], str],
+        metadata: Optional[Dict] = None,
+        warm: bool = False
     ):
-        """Register a new agent type"""
-        cls._registry.register(role, agent_class, metadata)
+        """Register a new agent type (class or lazy "module:Class" string)"""
+        cls._registry.register(role, agent_class, metadata, warm=warm)
         
     @classmethod
     def create(
@@ -86,19 +178,23 @@ class AgentFactory:
         role: str,
         user_id: str,
         **kwargs
-    ) -> FederalJobAgent:
+    ) -> "FederalJobAgent":
         """
         Create or retrieve an agent instance
         Uses singleton pattern per role-user combination
         """
+        from .base import AgentConfig
+        from .metrics import record_cache
         
         # Create unique instance key
         instance_key = f"{role}:{user_id}"
         
         # Check for existing instance
         if instance_key in cls._instances:
+            record_cache("agent_instances", hit=True)
             logger.debug(f"Returning existing agent: {instance_key}")
             return cls._instances[instance_key]
+        record_cache("agent_instances", hit=False)
             
         # Get agent class
         agent_class = cls._registry.get(role)
@@ -123,6 +219,23 @@ class AgentFactory:
     def list_available_agents(cls) -> Dict[str, Dict]:
         """List all available agent types"""
         return cls._registry.list_agents()
+    
+    @classmethod
+    def active_user_count(cls) -> int:
+        """Distinct users with at least one live agent instance (batch instances count as their user)"""
+        users = (key.split(":", 1)[1] for key in list(cls._instances))
+        return len({user[len(BATCH_USER_PREFIX):] if user.startswith(BATCH_USER_PREFIX) else user
+                    for user in users})
+    
+    @classmethod
+    def warm_up(cls, roles: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Import agent modules ahead of first use"""
+        return cls._registry.warm_up(roles)
+    
+    @classmethod
+    def import_report(cls) -> Dict[str, Any]:
+        """Per-agent import cost report"""
+        return cls._registry.import_report()
         
     @classmethod
     async def cleanup_user_agents(cls, user_id: str):
@@ -0,0 +1,583 @@
+"""
+Candidate-to-job matching over collected USAJobs postings
+
+Postings (title plus the summary, duties and qualifications fields produced by
+the collector's extract_job_data) are tokenized into a sparse job x term matrix
+of raw term counts, stored column-major so scoring a resume only touches the
+columns of terms the resume contains. Scores are BM25: each segment stores the
+saturating, length-normalized TF weights (normalized by the average posting
+length at the time the segment was built), and IDF is applied at query time
+from live document frequencies, so it stays exact as postings arrive and close.
+
+New postings land in a small delta segment that is merged into the main matrix
+once it outgrows a fraction of it, so ingesting a day's jobs never rebuilds a
+100k-posting index.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import structlog
+
+from .candidate_profile import TOKEN_PATTERN, CandidateProfile
+
+logger = structlog.get_logger()
+
+K1 = 1.2
+B = 0.75
+
+# Delta segment is merged once it holds this share of the indexed postings
+DELTA_MERGE_RATIO = 0.1
+DELTA_MERGE_MIN_ROWS = 1000
+
+# Resumes x postings cells in one dense batch score block (float32)
+BATCH_SCORE_CELLS = 16_000_000
+
+JOB_TEXT_FIELDS = ("title", "summary", "duties", "qualifications")
+JOB_METADATA_FIELDS = ("job_id", "title", "agency", "location", "url", "close_date")
+
+STOPWORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'have', 'in',
+    'is', 'it', 'its', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was', 'will',
+    'with', 'you', 'your', 'our', 'we', 'who', 'all', 'any', 'may', 'must', 'such',
+    'other', 'these', 'than', 'which', 'their', 'into', 'not', 'but', 'if', 'can',
+})
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase tokens (keeping c++, c#, tcp/ip) without stopwords"""
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if t not in STOPWORDS]
+
+
+def _flatten_text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        return " ".join(_flatten_text(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return " ".join(_flatten_text(v) for v in value)
+    return str(value)
+
+
+def job_record(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize a posting to the extract_job_data shape
+
+    Accepts already-extracted jobs and raw USAJobs search results
+    (MatchedObjectDescriptor with UserArea.Details).
+    """
+    if "MatchedObjectDescriptor" not in job:
+        return job
+
+    descriptor = job.get("MatchedObjectDescriptor", {})
+    details = descriptor.get("UserArea", {}).get("Details", {})
+    return {
+        "job_id": job.get("MatchedObjectId"),
+        "title": descriptor.get("PositionTitle"),
+        "agency": descriptor.get("OrganizationName"),
+        "location": descriptor.get("PositionLocationDisplay"),
+        "url": descriptor.get("PositionURI"),
+        "close_date": descriptor.get("ApplicationCloseDate"),
+        "summary": details.get("JobSummary"),
+        "duties": details.get("MajorDuties"),
+        "qualifications": details.get("Qualifications") or descriptor.get("QualificationSummary"),
+    }
+
+
+def resume_text(resume: Union[str, Dict[str, Any], CandidateProfile]) -> str:
+    """Searchable text of a resume: plain text, a profile dict/JSON or a CandidateProfile"""
+    if isinstance(resume, CandidateProfile):
+        resume = resume.data
+    elif isinstance(resume, str):
+        if not resume.lstrip().startswith("{"):
+            return resume
+        resume = json.loads(resume)
+
+    certifications = [c.get("name", "") if isinstance(c, dict) else c for c in resume.get("certifications", []) or []]
+    parts = [
+        resume.get("resume"), resume.get("text"), resume.get("skills"), resume.get("experience"),
+        certifications, resume.get("education"),
+        [(p.get("name"), p.get("description")) for p in resume.get("projects", []) or [] if isinstance(p, dict)],
+    ]
+    return _flatten_text(parts)
+
+
+def _query_weights(counts: Counter) -> Dict[str, float]:
+    # Sublinear query TF: a resume repeating "python" ten times is not ten times the evidence
+    return {term: 1.0 + math.log(count) for term, count in counts.items()}
+
+
+class _Segment:
+    """Column-major (CSC) block of the job x term count matrix"""
+
+    __slots__ = ("indptr", "rows", "tfs", "weights")
+
+    def __init__(self, indptr: np.ndarray, rows: np.ndarray, tfs: np.ndarray):
+        self.indptr = indptr
+        self.rows = rows
+        self.tfs = tfs
+        # BM25 TF component per entry, filled in by JobMatchIndex._weigh
+        self.weights = np.zeros(len(tfs), dtype=np.float32)
+
+    @classmethod
+    def build(cls, rows: np.ndarray, terms: np.ndarray, tfs: np.ndarray, n_terms: int) -> "_Segment":
+        order = np.argsort(terms, kind="stable")
+        indptr = np.zeros(n_terms + 1, dtype=np.int64)
+        np.cumsum(np.bincount(terms, minlength=n_terms), out=indptr[1:])
+        return cls(indptr, rows[order].astype(np.int32), tfs[order].astype(np.float32))
+
+    @classmethod
+    def empty(cls) -> "_Segment":
+        return cls(np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32))
+
+    def coo(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        terms = np.repeat(np.arange(len(self.indptr) - 1, dtype=np.int32), np.diff(self.indptr))
+        return self.rows, terms, self.tfs
+
+    def columns(self, term_ids: Sequence[int]) -> List[Tuple[int, int, int]]:
+        """(position in term_ids, start, end) of each non-empty requested column"""
+        n_cols = len(self.indptr) - 1
+        indptr = self.indptr
+        return [(i, indptr[t], indptr[t + 1]) for i, t in enumerate(term_ids)
+                if t < n_cols and indptr[t + 1] > indptr[t]]
+
+
+class _Gathered:
+    """Matrix entries in a set of columns: row, BM25 TF weight and column position"""
+
+    __slots__ = ("rows", "weights", "positions", "df")
+
+    def __init__(self, rows: np.ndarray, weights: np.ndarray, positions: np.ndarray, df: np.ndarray):
+        self.rows = rows
+        self.weights = weights
+        self.positions = positions
+        self.df = df
+
+
+class JobMatchIndex:
+    """
+    BM25 job x term matrix with incremental upserts and top-k resume matching
+
+    Rows are postings keyed by job_id; re-adding a job_id replaces the posting.
+    Closed postings are removed with `remove_jobs`. `save`/`load` persist the
+    main matrix and the pending delta as an .npz file.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._vocab: Dict[str, int] = {}
+        self._terms: List[str] = []
+        self._jobs: List[Dict[str, Any]] = []
+        self._row_of: Dict[str, int] = {}
+        self._doc_len = np.zeros(0, dtype=np.float32)
+        self._live = np.zeros(0, dtype=bool)
+        self._total_len = 0.0
+        self._live_count = 0
+
+        self._main = _Segment.empty()
+        self._main_rows = 0
+        self._delta_entries: List[Tuple[int, np.ndarray, np.ndarray]] = []
+        self._delta: Optional[_Segment] = None
+        self._sources: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------ build
+
+    def add_jobs(self, jobs: Iterable[Dict[str, Any]]) -> int:
+        """Index (or replace) postings; returns the number indexed"""
+        jobs = list(jobs)
+        added = 0
+        with self._lock:
+            # Sized for the whole call so a job_id repeated within it can be dropped like any other
+            self._doc_len = np.concatenate([self._doc_len, np.zeros(len(jobs), dtype=np.float32)])
+            self._live = np.concatenate([self._live, np.zeros(len(jobs), dtype=bool)])
+            for job in jobs:
+                record = job_record(job)
+                job_id = str(record.get("job_id") or record.get("url") or "")
+                if not job_id:
+                    continue
+                counts = Counter(tokenize(" ".join(_flatten_text(record.get(f)) for f in JOB_TEXT_FIELDS)))
+                if not counts:
+                    continue
+
+                self._drop(job_id)
+                row = len(self._jobs)
+                term_ids = np.fromiter((self._term_id(t) for t in counts), dtype=np.int32, count=len(counts))
+                tfs = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+                self._delta_entries.append((row, term_ids, tfs))
+
+                metadata = {f: record.get(f) for f in JOB_METADATA_FIELDS}
+                metadata["job_id"] = job_id
+                self._jobs.append(metadata)
+                self._row_of[job_id] = row
+                self._doc_len[row] = tfs.sum()
+                self._live[row] = True
+                self._live_count += 1
+                self._total_len += float(self._doc_len[row])
+                added += 1
+
+            self._doc_len = self._doc_len[:len(self._jobs)]
+            self._live = self._live[:len(self._jobs)]
+            if added:
+                self._delta = None
+            self._maybe_compact()
+        return added
+
+    def remove_jobs(self, job_ids: Iterable[str]) -> int:
+        """Drop postings (e.g. closed announcements); returns the number removed"""
+        with self._lock:
+            removed = sum(self._drop(str(job_id)) for job_id in job_ids)
+            self._maybe_compact()
+            return removed
+
+    def _maybe_compact(self) -> None:
+        # Removed rows count too: until a merge they cost a live-mask pass per query
+        pending = len(self._delta_entries) + len(self._live) - self._live_count
+        if pending >= max(DELTA_MERGE_MIN_ROWS, DELTA_MERGE_RATIO * self._main_rows):
+            self.compact()
+
+    def _drop(self, job_id: str) -> bool:
+        row = self._row_of.pop(job_id, None)
+        if row is None:
+            return False
+        self._live[row] = False
+        self._live_count -= 1
+        self._total_len -= float(self._doc_len[row])
+        return True
+
+    def _term_id(self, term: str) -> int:
+        term_id = self._vocab.get(term)
+        if term_id is None:
+            term_id = self._vocab[term] = len(self._terms)
+            self._terms.append(term)
+        return term_id
+
+    def _delta_segment(self) -> _Segment:
+        if self._delta is None:
+            if self._delta_entries:
+                rows = np.concatenate([np.full(len(t), r, dtype=np.int32) for r, t, _ in self._delta_entries])
+                terms = np.concatenate([t for _, t, _ in self._delta_entries])
+                tfs = np.concatenate([c for _, _, c in self._delta_entries])
+                self._delta = self._weigh(_Segment.build(rows, terms, tfs, len(self._terms)))
+            else:
+                self._delta = _Segment.empty()
+        return self._delta
+
+    def _weigh(self, segment: _Segment) -> _Segment:
+        """Fill a segment's BM25 TF weights using the current average posting length"""
+        avg_len = self._total_len / max(self._live_count, 1)
+        norm = K1 * (1 - B + B * self._doc_len[segment.rows] / np.float32(avg_len))
+        segment.weights = (segment.tfs * (K1 + 1) / (segment.tfs + norm)).astype(np.float32)
+        return segment
+
+    def compact(self) -> None:
+        """Merge the delta into the main matrix and drop removed postings, renumbering rows"""
+        with self._lock:
+            start = time.perf_counter()
+            segments = [self._main.coo(), self._delta_segment().coo()]
+            rows = np.concatenate([s[0] for s in segments])
+            terms = np.concatenate([s[1] for s in segments])
+            tfs = np.concatenate([s[2] for s in segments])
+
+            keep = self._live[rows]
+            new_row = np.cumsum(self._live, dtype=np.int64) - 1
+            self._main = _Segment.build(new_row[rows[keep]], terms[keep], tfs[keep], len(self._terms))
+
+            live_rows = np.flatnonzero(self._live)
+            self._jobs = [self._jobs[r] for r in live_rows]
+            self._row_of = {job["job_id"]: i for i, job in enumerate(self._jobs)}
+            self._doc_len = self._doc_len[live_rows]
+            self._live = np.ones(len(self._jobs), dtype=bool)
+            self._main_rows = len(self._jobs)
+            self._delta_entries = []
+            self._delta = None
+            self._weigh(self._main)
+            logger.debug(f"Job match index compacted to {self._main_rows} postings "
+                         f"in {time.perf_counter() - start:.2f}s")
+
+    def ingest_files(self, paths: Iterable[Union[str, Path]]) -> Dict[str, int]:
+        """
+        Index collector output files ({"jobs": [...]} or a JSON list),
+        skipping files unchanged since they were last ingested
+        """
+        summary = {"files": 0, "jobs": 0, "skipped": 0}
+        for path in paths:
+            path = Path(path)
+            try:
+                mtime_ns = path.stat().st_mtime_ns
+            except OSError:
+                continue
+            if self._sources.get(str(path)) == mtime_ns:
+                summary["skipped"] += 1
+                continue
+            try:
+                data = json.loads(path.read_text())
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping job file {path}: {e}")
+                continue
+            jobs = data.get("jobs", []) if isinstance(data, dict) else data
+            summary["jobs"] += self.add_jobs(job for job in jobs if isinstance(job, dict))
+            summary["files"] += 1
+            with self._lock:
+                self._sources[str(path)] = mtime_ns
+        return summary
+
+    def sync_directory(self, directory: Union[str, Path], pattern: str = "*.json") -> Dict[str, int]:
+        """Ingest new or changed job files in a directory"""
+        return self.ingest_files(sorted(Path(directory).glob(pattern)))
+
+    # ------------------------------------------------------------------ query
+
+    def _gather(self, term_ids: Sequence[int]) -> _Gathered:
+        spans = [(segment, i, start, end) for segment in (self._main, self._delta_segment())
+                 for i, start, end in segment.columns(term_ids)]
+        # Column-major across segments, so each term's entries are contiguous
+        spans.sort(key=lambda span: span[1])
+        if not spans:
+            empty = np.zeros(0, dtype=np.int32)
+            return _Gathered(empty, np.zeros(0, dtype=np.float32), empty, np.zeros(len(term_ids)))
+
+        rows = np.concatenate([segment.rows[start:end] for segment, _, start, end in spans])
+        weights = np.concatenate([segment.weights[start:end] for segment, _, start, end in spans])
+        column_ids = np.array([i for _, i, _, _ in spans], dtype=np.int32)
+        lengths = np.array([end - start for _, _, start, end in spans], dtype=np.int64)
+        positions = np.repeat(column_ids, lengths)
+
+        if self._live_count < len(self._live):
+            live = self._live[rows]
+            rows, weights, positions = rows[live], weights[live], positions[live]
+            df = np.bincount(positions, minlength=len(term_ids))
+        else:
+            # No removed rows: document frequency is just the column lengths
+            df = np.bincount(column_ids, weights=lengths, minlength=len(term_ids))
+        return _Gathered(rows, weights, positions, df)
+
+    def _idf(self, df: np.ndarray) -> np.ndarray:
+        n = self._live_count
+        return np.log1p((n - df + 0.5) / (df + 0.5)).astype(np.float32)
+
+    def _query_terms(self, text: str) -> Tuple[List[str], List[int], np.ndarray]:
+        weights = _query_weights(Counter(tokenize(text)))
+        terms = [t for t in weights if t in self._vocab]
+        return terms, [self._vocab[t] for t in terms], np.array([weights[t] for t in terms], dtype=np.float32)
+
+    def match(self, resume: Union[str, Dict[str, Any], CandidateProfile], k: int = 10,
+              explain: bool = True, explain_terms: int = 8) -> List[Dict[str, Any]]:
+        """Top-k postings for one resume: one sparse matrix-vector product over the matrix"""
+        with self._lock:
+            if not self._live_count:
+                return []
+            terms, term_ids, query = self._query_terms(resume_text(resume))
+            if not terms:
+                return []
+
+            gathered = self._gather(term_ids)
+            rows, positions = gathered.rows, gathered.positions
+            contributions = gathered.weights * (self._idf(gathered.df) * query)[positions]
+            scores = np.bincount(rows, weights=contributions, minlength=len(self._jobs))
+            top = self._top_k(scores, k)
+
+            if explain and len(top):
+                selected = np.isin(rows, top)
+                explain_rows, explain_positions = rows[selected], positions[selected]
+                explain_values = contributions[selected]
+            results = []
+            for row in top:
+                result = dict(self._jobs[row], score=round(float(scores[row]), 4))
+                if explain:
+                    mask = explain_rows == row
+                    result["explanation"] = self._explain(
+                        float(scores[row]), terms, explain_positions[mask], explain_values[mask], explain_terms
+                    )
+                results.append(result)
+            return results
+
+    def match_many(self, resumes: Sequence[Union[str, Dict[str, Any], CandidateProfile]], k: int = 10,
+                   explain: bool = False) -> List[List[Dict[str, Any]]]:
+        """
+        Top-k postings for many resumes: a sparse (postings x terms) by sparse
+        (terms x resumes) product into dense score blocks, sharing one gather
+        and IDF computation per block
+        """
+        if explain:
+            return [self.match(resume, k=k) for resume in resumes]
+
+        queries = [_query_weights(Counter(tokenize(resume_text(r)))) for r in resumes]
+        with self._lock:
+            if not self._live_count:
+                return [[] for _ in queries]
+            block = max(1, BATCH_SCORE_CELLS // len(self._jobs))
+            results: List[List[Dict[str, Any]]] = []
+            for first in range(0, len(queries), block):
+                results.extend(self._score_block(queries[first:first + block], k))
+            return results
+
+    def _score_block(self, queries: List[Dict[str, float]], k: int) -> List[List[Dict[str, Any]]]:
+        union: Dict[str, Tuple[List[int], List[float]]] = {}
+        for column, query in enumerate(queries):
+            for term, weight in query.items():
+                if term in self._vocab:
+                    users = union.setdefault(term, ([], []))
+                    users[0].append(column)
+                    users[1].append(weight)
+        if not union:
+            return [[] for _ in queries]
+
+        gathered = self._gather([self._vocab[t] for t in union])
+        idf = self._idf(gathered.df)
+        bounds = np.searchsorted(gathered.positions, np.arange(len(union) + 1))
+
+        scores = np.zeros((len(queries), len(self._jobs)), dtype=np.float32)
+        for j, (columns, weights) in enumerate(union.values()):
+            start, end = bounds[j], bounds[j + 1]
+            if start == end:
+                continue
+            rows = gathered.rows[start:end]
+            entries = gathered.weights[start:end]
+            coefficients = np.array(weights, dtype=np.float32) * idf[j]
+            # A posting appears once per column, so fancy-indexed += never collides
+            if len(columns) == 1:
+                scores[columns[0], rows] += entries * coefficients[0]
+            else:
+                scores[np.array(columns)[:, None], rows] += coefficients[:, None] * entries
+
+        return [
+            [dict(self._jobs[row], score=round(float(row_scores[row]), 4)) for row in self._top_k(row_scores, k)]
+            for row_scores in scores
+        ]
+
+    @staticmethod
+    def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+        k = max(1, k)
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+    @staticmethod
+    def _explain(score: float, terms: List[str], positions: np.ndarray, values: np.ndarray,
+                 limit: int) -> Dict[str, Any]:
+        order = np.argsort(-values)
+        matched = [
+            {"term": terms[positions[i]], "weight": round(float(values[i]), 4),
+             "share": round(float(values[i]) / score, 3) if score else 0.0}
+            for i in order[:limit]
+        ]
+        strongest = ", ".join(m["term"] for m in matched[:3])
+        return {
+            "matched_terms": matched,
+            "matched_count": int(len(values)),
+            "query_terms": len(terms),
+            "summary": f"Shares {len(values)} of {len(terms)} indexed resume terms; strongest: {strongest}",
+        }
+
+    # ------------------------------------------------------------------ persistence
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Write the index to an .npz file (atomically)
+
+        The delta segment and removed rows are written as they are rather than
+        compacted first, so saving after a small update costs a file write, not
+        a matrix rebuild; merging stays on the DELTA_MERGE_* thresholds.
+        """
+        path = Path(path)
+        with self._lock:
+            delta = self._delta_segment()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(path.name + ".tmp")
+            with open(tmp, "wb") as f:
+                np.savez(
+                    f,
+                    indptr=self._main.indptr, rows=self._main.rows, tfs=self._main.tfs, weights=self._main.weights,
+                    delta_indptr=delta.indptr, delta_rows=delta.rows, delta_tfs=delta.tfs,
+                    delta_weights=delta.weights, main_rows=np.array(self._main_rows), live=self._live,
+                    doc_len=self._doc_len, terms=np.array(self._terms, dtype=str),
+                    jobs=_encode_json(self._jobs), sources=_encode_json(self._sources),
+                )
+            os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "JobMatchIndex":
+        index = cls()
+        with np.load(path, allow_pickle=False) as data:
+            index._terms = data["terms"].tolist()
+            index._vocab = {t: i for i, t in enumerate(index._terms)}
+            index._main = _Segment(data["indptr"], data["rows"], data["tfs"])
+            index._doc_len = data["doc_len"]
+            index._jobs = json.loads(data["jobs"].tobytes())
+            index._sources = json.loads(data["sources"].tobytes())
+            # Files written by compacting saves hold only the main segment
+            incremental = "live" in data.files
+            if incremental:
+                index._main.weights = data["weights"]
+                index._main_rows = int(data["main_rows"])
+                index._live = data["live"]
+                delta = _Segment(data["delta_indptr"], data["delta_rows"], data["delta_tfs"])
+                delta.weights = data["delta_weights"]
+            else:
+                index._main_rows = len(index._jobs)
+                index._live = np.ones(len(index._jobs), dtype=bool)
+
+        live_rows = np.flatnonzero(index._live)
+        index._row_of = {index._jobs[row]["job_id"]: int(row) for row in live_rows}
+        index._live_count = len(live_rows)
+        index._total_len = float(index._doc_len[live_rows].sum())
+        if incremental:
+            rows, terms, tfs = delta.coo()
+            order = np.argsort(rows, kind="stable")
+            rows, terms, tfs = rows[order], terms[order], tfs[order]
+            bounds = np.flatnonzero(np.diff(rows)) + 1
+            index._delta_entries = [(int(r[0]), t, c) for r, t, c in
+                                    zip(np.split(rows, bounds), np.split(terms, bounds), np.split(tfs, bounds))
+                                    if len(r)]
+            index._delta = delta
+        else:
+            index._weigh(index._main)
+        return index
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "postings": self._live_count,
+                "terms": len(self._terms),
+                "nonzeros": int(len(self._main.rows)) + sum(len(t) for _, t, _ in self._delta_entries),
+                "delta_postings": len(self._delta_entries),
+                "source_files": len(self._sources),
+            }
+
+
+def _encode_json(value: Any) -> np.ndarray:
+    # UTF-8 bytes: a str array would be stored as 4-byte code points
+    return np.frombuffer(json.dumps(value).encode("utf-8"), dtype=np.uint8)
+
+
+_index: Optional[JobMatchIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_job_match_index() -> JobMatchIndex:
+    """
+    Process-wide index, loaded from JOB_MATCH_INDEX_PATH when it exists and
+    synced with new collector files in JOB_STORE_DIR on first use
+    """
+    global _index
+
+    with _index_lock:
+        if _index is None:
+            path = os.getenv("JOB_MATCH_INDEX_PATH", "")
+            _index = JobMatchIndex.load(path) if path and os.path.exists(path) else JobMatchIndex()
+            store = os.getenv("JOB_STORE_DIR", "")
+            if store and os.path.isdir(store):
+                summary = _index.ingest_files(sorted(Path(store).glob("*.json")))
+                if summary["files"] and path:
+                    _index.save(path)
+    return _index
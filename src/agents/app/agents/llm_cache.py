@@ -0,0 +1,326 @@
+"""
+LLM Response Cache
+
+Deterministic (temperature 0) Ollama calls are answered from a local SQLite
+store keyed on the model parameters and a hash of the whitespace-normalized
+prompt. Optionally, a prompt whose embedding is within LLM_CACHE_SIMILARITY
+(cosine) of a cached prompt for the same model parameters is answered from
+that entry. Concurrent identical requests generate once: the first lookup
+takes a lease and later ones wait for its result. The store is bounded by
+size, evicting least recently used entries.
+
+Sampling models are never cached. Of the agents, only OllamaOptimizedAgent runs
+at temperature 0 by default; FederalJobAgent (AgentConfig.temperature 0.3) and
+EnhancedAgentFactory agents (agent_settings.temperature 0.7) reach the cache
+only when configured with temperature 0.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import structlog
+from langchain_core.caches import BaseCache
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import Generation
+
+from .metrics import LLM_CACHE_SAVED_SECONDS, record_cache
+
+logger = structlog.get_logger()
+
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent.parent.parent / ".cache" / "llm" / "responses.sqlite"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# How long a lookup waits for an identical in-flight generation before generating itself
+DEFAULT_LEASE_SECONDS = 120.0
+# Evict down to this fraction of max_bytes so eviction is not run on every insert
+EVICT_TO = 0.9
+
+WHITESPACE = re.compile(r"\s+")
+MODEL_PARAM = re.compile(r"\('model', '([^']*)'\)")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Collapse whitespace runs so formatting-only differences share an entry"""
+    return WHITESPACE.sub(" ", prompt).strip()
+
+
+def is_deterministic(llm: Any) -> bool:
+    """Only greedy decoding returns the same text for the same prompt"""
+    temperature = getattr(llm, "temperature", None)
+    return temperature is not None and float(temperature) == 0.0
+
+
+class _Flight:
+    """An in-progress generation other lookups of the same key can wait on"""
+
+    __slots__ = ("event", "started", "prompt_hash")
+
+    def __init__(self, prompt_hash: str):
+        self.event = threading.Event()
+        self.started = time.monotonic()
+        self.prompt_hash = prompt_hash
+
+
+class LLMResponseCache(BaseCache):
+    """
+    Disk-backed langchain cache for deterministic LLM calls
+
+    Attach per model with `attach_llm_cache(llm)`, which skips sampling
+    (temperature > 0) models. Each entry stores the generations, the
+    time the model took to produce them (credited as saved on every hit) and,
+    when near-duplicate lookup is enabled, the prompt embedding.
+    """
+
+    def __init__(self, db_path: Path, max_bytes: int = DEFAULT_MAX_BYTES,
+                 similarity: float = 0.0, embedder: Any = None,
+                 lease_seconds: float = DEFAULT_LEASE_SECONDS):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.similarity = similarity if embedder is not None else 0.0
+        self.embedder = embedder
+        self.lease_seconds = lease_seconds
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                llm_hash TEXT NOT NULL,
+                generations TEXT NOT NULL,
+                generation_seconds REAL NOT NULL,
+                embedding BLOB,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses (last_used)")
+        self._conn.commit()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+        self._flights: Dict[str, _Flight] = {}
+        # llm_hash -> (keys, unit-norm embedding matrix), loaded on first near-duplicate lookup
+        self._vectors: Dict[str, Tuple[List[str], np.ndarray]] = {}
+
+        self.stats_counters = {"hits": 0, "similar_hits": 0, "misses": 0, "waits": 0,
+                               "evictions": 0, "saved_seconds": 0.0}
+
+    @staticmethod
+    def _keys(prompt: str, llm_string: str) -> Tuple[str, str, str]:
+        llm_hash = hashlib.sha256(llm_string.encode("utf-8")).hexdigest()[:32]
+        prompt_hash = hashlib.sha256(normalize_prompt(prompt).encode("utf-8")).hexdigest()
+        return f"{llm_hash}:{prompt_hash}", llm_hash, prompt_hash
+
+    def _embed(self, prompt: str) -> np.ndarray:
+        return np.asarray(self.embedder.embed([normalize_prompt(prompt)])[0], dtype=np.float32)
+
+    def _get(self, key: str) -> Optional[Tuple[List[Generation], float]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT generations, generation_seconds FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        return [Generation(**g) for g in json.loads(row[0])], row[1]
+
+    def _similar(self, llm_hash: str, prompt: str) -> Optional[str]:
+        """Key of the closest cached prompt for the same model parameters, if close enough"""
+        with self._lock:
+            if llm_hash not in self._vectors:
+                rows = self._conn.execute(
+                    "SELECT key, embedding FROM responses WHERE llm_hash = ? AND embedding IS NOT NULL", (llm_hash,)
+                ).fetchall()
+                self._vectors[llm_hash] = (
+                    [key for key, _ in rows],
+                    np.array([np.frombuffer(blob, dtype=np.float32) for _, blob in rows], dtype=np.float32)
+                )
+            keys, matrix = self._vectors[llm_hash]
+        if not keys:
+            return None
+        scores = matrix @ self._embed(prompt)
+        best = int(np.argmax(scores))
+        return keys[best] if scores[best] >= self.similarity else None
+
+    def _hit(self, llm_string: str, seconds: float, similar: bool = False) -> None:
+        record_cache("llm_response", True)
+        match = MODEL_PARAM.search(llm_string)
+        LLM_CACHE_SAVED_SECONDS.labels(model=match.group(1) if match else "unknown").inc(seconds)
+        with self._lock:
+            self.stats_counters["similar_hits" if similar else "hits"] += 1
+            self.stats_counters["saved_seconds"] += seconds
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[List[Generation]]:
+        key, llm_hash, prompt_hash = self._keys(prompt, llm_string)
+
+        while True:
+            cached = self._get(key)
+            if cached is not None:
+                self._hit(llm_string, cached[1])
+                return cached[0]
+
+            if self.similarity:
+                similar = self._similar(llm_hash, prompt)
+                cached = self._get(similar) if similar else None
+                if cached is not None:
+                    self._hit(llm_string, cached[1], similar=True)
+                    return cached[0]
+
+            with self._lock:
+                flight = self._flights.get(key)
+                if flight is None or time.monotonic() - flight.started > self.lease_seconds:
+                    # Lease: this caller generates, identical lookups wait for update()
+                    self._flights[key] = _Flight(prompt_hash)
+                    self.stats_counters["misses"] += 1
+                    record_cache("llm_response", False)
+                    return None
+                self.stats_counters["waits"] += 1
+
+            remaining = self.lease_seconds - (time.monotonic() - flight.started)
+            flight.event.wait(max(remaining, 0.0))
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        key, llm_hash, prompt_hash = self._keys(prompt, llm_string)
+        generations = json.dumps([{"text": g.text, "generation_info": g.generation_info} for g in return_val])
+        embedding = self._embed(prompt) if self.similarity else None
+
+        with self._lock:
+            flight = self._flights.pop(key, None)
+            seconds = time.monotonic() - flight.started if flight else 0.0
+            size = len(generations) + len(key)
+            previous = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, llm_hash, generations, generation_seconds, embedding, size, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, llm_hash, generations, seconds,
+                 embedding.tobytes() if embedding is not None else None, size, time.time())
+            )
+            self._conn.commit()
+            self._total_bytes += size - (previous[0] if previous else 0)
+            if embedding is not None and llm_hash in self._vectors and not previous:
+                keys, matrix = self._vectors[llm_hash]
+                self._vectors[llm_hash] = (keys + [key], np.vstack([matrix.reshape(-1, len(embedding)), embedding]))
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+        if flight:
+            flight.event.set()
+
+    def release(self, prompts: Sequence[str]) -> None:
+        """Drop leases for prompts whose generation failed, waking any waiters"""
+        hashes = {hashlib.sha256(normalize_prompt(p).encode("utf-8")).hexdigest() for p in prompts}
+        with self._lock:
+            failed = [key for key, flight in self._flights.items() if flight.prompt_hash in hashes]
+            flights = [self._flights.pop(key) for key in failed]
+        for flight in flights:
+            flight.event.set()
+
+    def _evict(self) -> None:
+        """Delete least recently used entries down to EVICT_TO of max_bytes (caller holds the lock)"""
+        target = self.max_bytes * EVICT_TO
+        evicted = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY last_used").fetchall():
+            if self._total_bytes <= target:
+                break
+            evicted.append((key,))
+            self._total_bytes -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self._conn.commit()
+        self.stats_counters["evictions"] += len(evicted)
+        self._vectors.clear()
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._total_bytes = 0
+            self._vectors.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self.stats_counters)
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            in_flight = len(self._flights)
+        lookups = counters["hits"] + counters["similar_hits"] + counters["misses"]
+        return {
+            **counters,
+            "saved_seconds": round(counters["saved_seconds"], 3),
+            "hit_rate": round((counters["hits"] + counters["similar_hits"]) / lookups, 3) if lookups else 0.0,
+            "entries": entries,
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "in_flight": in_flight,
+            "similarity": self.similarity,
+            "path": str(self.db_path)
+        }
+
+
+class _LeaseReleaseCallback(BaseCallbackHandler):
+    """Releases cache leases when a generation fails, so waiters do not sit out the lease"""
+
+    def __init__(self, cache: LLMResponseCache):
+        self.cache = cache
+        self._prompts: Dict[Any, List[str]] = {}
+
+    def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], *, run_id=None, **kwargs) -> None:
+        self._prompts[run_id] = prompts
+
+    def on_llm_end(self, response, *, run_id=None, **kwargs) -> None:
+        self._prompts.pop(run_id, None)
+
+    def on_llm_error(self, error: BaseException, *, run_id=None, **kwargs) -> None:
+        self.cache.release(self._prompts.pop(run_id, []))
+
+
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """
+    Process-wide response cache (None when LLM_CACHE_ENABLED=false), stored at
+    LLM_CACHE_PATH and bounded by LLM_CACHE_MAX_MB; LLM_CACHE_SIMILARITY > 0
+    enables near-duplicate lookup with the shared text embedder
+    """
+    global _cache
+
+    if os.getenv("LLM_CACHE_ENABLED", "true").lower() == "false":
+        return None
+    with _cache_lock:
+        if _cache is None:
+            similarity = float(os.getenv("LLM_CACHE_SIMILARITY", "") or 0.0)
+            embedder = None
+            if similarity > 0:
+                try:
+                    from ....mcp_services.utils.embeddings import get_embedder
+                except ImportError:  # agents imported with src/ on sys.path
+                    from mcp_services.utils.embeddings import get_embedder
+                embedder = get_embedder()
+            max_mb = float(os.getenv("LLM_CACHE_MAX_MB", "") or DEFAULT_MAX_BYTES / (1024 * 1024))
+            _cache = LLMResponseCache(
+                Path(os.getenv("LLM_CACHE_PATH", "") or DEFAULT_CACHE_PATH),
+                max_bytes=int(max_mb * 1024 * 1024),
+                similarity=similarity,
+                embedder=embedder
+            )
+    return _cache
+
+
+def attach_llm_cache(llm: Any, cache: Optional[LLMResponseCache] = None) -> Any:
+    """Route a deterministic model's calls through the response cache (sampling models are left alone)"""
+    cache = cache or get_llm_cache()
+    if cache is not None and is_deterministic(llm):
+        llm.cache = cache
+        llm.callbacks = list(llm.callbacks or []) + [_LeaseReleaseCallback(cache)]
+    return llm
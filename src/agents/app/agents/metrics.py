@@ -0,0 +1,438 @@
+"""
+In-Process Metrics for the Federal Job Advisory Agent System
+prometheus_client counters and gauges, latency histograms with HDR-style
+log-linear buckets exported through a custom collector, and a fixed-size
+NumPy ring buffer of sampled system metrics
+"""
+
+import asyncio
+import math
+import os
+import shutil
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional, Tuple, Callable, Sequence, Iterator
+
+import numpy as np
+import structlog
+from prometheus_client import CollectorRegistry, Counter, Gauge
+from prometheus_client.core import HistogramMetricFamily
+
+logger = structlog.get_logger()
+
+
+# HDR-style log-linear buckets: each power of two is split into BUCKETS_PER_OCTAVE
+# linear sub-buckets (~6% relative error), covering 2^-20 s (~1 µs) to 2^12 s
+BUCKETS_PER_OCTAVE = 8
+MIN_EXP = -20
+MAX_EXP = 12
+NUM_BUCKETS = (MAX_EXP - MIN_EXP) * BUCKETS_PER_OCTAVE + 2  # + underflow and overflow
+
+UPPER_BOUNDS = np.array(
+    [2.0 ** MIN_EXP]
+    + [
+        2.0 ** (MIN_EXP + i // BUCKETS_PER_OCTAVE) * (1 + (i % BUCKETS_PER_OCTAVE + 1) / BUCKETS_PER_OCTAVE)
+        for i in range(NUM_BUCKETS - 2)
+    ]
+    + [math.inf]
+)
+
+# Prometheus "le" buckets are exported at octave boundaries (exact powers of two)
+EXPORT_BUCKETS = [0] + [i + 1 for i in range(NUM_BUCKETS - 2) if i % BUCKETS_PER_OCTAVE == BUCKETS_PER_OCTAVE - 1]
+
+
+def bucket_index(value: float) -> int:
+    """Histogram bucket for a value (seconds)"""
+    if value <= 0:
+        return 0
+    mantissa, exponent = math.frexp(value)  # value = mantissa * 2**exponent, mantissa in [0.5, 1)
+    octave = exponent - 1 - MIN_EXP
+    if octave < 0:
+        return 0
+    if octave >= MAX_EXP - MIN_EXP:
+        return NUM_BUCKETS - 1
+    return 1 + octave * BUCKETS_PER_OCTAVE + int((mantissa - 0.5) * 2 * BUCKETS_PER_OCTAVE)
+
+
+def quantile_from_counts(counts: np.ndarray, q: float) -> float:
+    """Estimate a quantile from bucket counts (linear interpolation inside the bucket)"""
+    total = counts.sum()
+    if total == 0:
+        return 0.0
+
+    cumulative = np.cumsum(counts)
+    rank = q * total
+    index = int(np.searchsorted(cumulative, rank))
+    index = min(index, NUM_BUCKETS - 1)
+
+    lower = UPPER_BOUNDS[index - 1] if index > 0 else 0.0
+    upper = UPPER_BOUNDS[index] if index < NUM_BUCKETS - 1 else UPPER_BOUNDS[-2]
+    before = cumulative[index - 1] if index > 0 else 0
+    fraction = (rank - before) / counts[index] if counts[index] else 1.0
+    return float(lower + (upper - lower) * min(max(fraction, 0.0), 1.0))
+
+
+def metric_values(metric) -> Dict[Tuple[str, ...], float]:
+    """Current value per label-value tuple of a prometheus_client counter or gauge"""
+    values = {}
+    for family in metric.collect():
+        value_name = f"{family.name}_total" if family.type == "counter" else family.name
+        for sample in family.samples:
+            if sample.name == value_name:
+                values[tuple(sample.labels.values())] = sample.value
+    return values
+
+
+def metric_total(metric) -> float:
+    """Sum of a counter or gauge across all label sets"""
+    return sum(metric_values(metric).values())
+
+
+class _HistogramCell:
+    """Bucket counts, sum and count of one label set"""
+    __slots__ = ("counts", "sum", "count", "_lock")
+
+    def __init__(self, lock: threading.Lock):
+        self.counts = [0] * NUM_BUCKETS
+        self.sum = 0.0
+        self.count = 0
+        self._lock = lock
+
+    def observe(self, value: float) -> None:
+        index = bucket_index(value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+
+class Histogram:
+    """
+    Latency histogram with HDR-style log-linear buckets, registered with a
+    prometheus_client registry as a custom collector
+
+    Recording mirrors prometheus_client: histogram.labels(**labels).observe(v).
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 registry: Optional[CollectorRegistry] = None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._cells: Dict[Tuple[str, ...], _HistogramCell] = {}
+        if registry is not None:
+            registry.register(self)
+
+    def labels(self, **labels) -> _HistogramCell:
+        if len(labels) != len(self.labelnames) or not all(name in labels for name in self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        cell = self._cells.get(key)
+        if cell is None:
+            with self._lock:
+                cell = self._cells.setdefault(key, _HistogramCell(self._lock))
+        return cell
+
+    def series(self) -> Dict[Tuple[str, ...], Tuple[np.ndarray, float, int]]:
+        """(bucket counts, sum, count) per label set"""
+        with self._lock:
+            return {key: (np.array(cell.counts, dtype=np.int64), cell.sum, cell.count)
+                    for key, cell in self._cells.items()}
+
+    def merged(self, predicate: Optional[Callable[[Dict[str, str]], bool]] = None) -> Tuple[np.ndarray, float, int]:
+        """Bucket counts, sum and count across every label set matching predicate"""
+        counts = np.zeros(NUM_BUCKETS, dtype=np.int64)
+        total_sum, total_count = 0.0, 0
+        for key, (series_counts, series_sum, series_count) in self.series().items():
+            if predicate is None or predicate(dict(zip(self.labelnames, key))):
+                counts += series_counts
+                total_sum += series_sum
+                total_count += series_count
+        return counts, total_sum, total_count
+
+    def summary(self, quantiles: Sequence[float] = (0.5, 0.95, 0.99)) -> Dict[str, Dict[str, Any]]:
+        """Count, mean and quantiles per label set, keyed by "label=value,..." """
+        result = {}
+        for key, (counts, total, count) in self.series().items():
+            label = ",".join(f"{name}={value}" for name, value in zip(self.labelnames, key)) or "all"
+            result[label] = {
+                "count": count,
+                "mean": total / count if count else 0.0,
+                **{f"p{int(q * 100)}": quantile_from_counts(counts, q) for q in quantiles}
+            }
+        return result
+
+    def describe(self) -> List[HistogramMetricFamily]:
+        return [HistogramMetricFamily(self.name, self.documentation, labels=self.labelnames)]
+
+    def collect(self) -> List[HistogramMetricFamily]:
+        """Cumulative buckets at octave boundaries plus +Inf, sum and count per label set"""
+        family = HistogramMetricFamily(self.name, self.documentation, labels=self.labelnames)
+        for key, (counts, total, count) in sorted(self.series().items()):
+            cumulative = np.cumsum(counts)
+            buckets = [(f"{UPPER_BOUNDS[index]:.9g}", int(cumulative[index])) for index in EXPORT_BUCKETS]
+            family.add_metric(list(key), buckets + [("+Inf", count)], total)
+        return [family]
+
+
+# Per module rather than prometheus_client's global registry, so importing this
+# module under two package paths (agents.* and src.agents.*) does not collide
+REGISTRY = CollectorRegistry()
+
+# Standard instruments shared across the service
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template", ("route", "method", "status"),
+    registry=REGISTRY
+)
+HTTP_IN_FLIGHT = Gauge("http_requests_in_flight", "HTTP requests currently being served", registry=REGISTRY)
+AGENT_LATENCY = Histogram(
+    "agent_request_duration_seconds", "Agent query processing latency", ("agent", "outcome"), registry=REGISTRY
+)
+AGENT_QUEUE_DEPTH = Gauge(
+    "agent_queue_depth", "Agent requests waiting on or running in the LLM", ("agent",), registry=REGISTRY
+)
+LLM_CALLS = Counter("llm_calls_total", "LLM invocations", ("agent", "model", "outcome"), registry=REGISTRY)
+LLM_LATENCY = Histogram("llm_call_duration_seconds", "LLM call latency", ("agent", "model"), registry=REGISTRY)
+LLM_TOKENS = Counter(
+    "llm_tokens_total", "LLM tokens reported by the model server", ("agent", "model", "kind"), registry=REGISTRY
+)
+TOOL_LATENCY = Histogram(
+    "agent_tool_duration_seconds", "Agent tool call latency", ("agent", "tool", "outcome"), registry=REGISTRY
+)
+CACHE_REQUESTS = Counter("cache_requests_total", "Cache lookups", ("cache", "result"), registry=REGISTRY)
+PROMPT_TOKENS = Counter(
+    "agent_prompt_tokens_total", "Estimated prompt tokens by section after context budgeting", ("agent", "section"),
+    registry=REGISTRY
+)
+PROMPT_TRIMMED_TOKENS = Counter(
+    "agent_prompt_trimmed_tokens_total", "Tokens trimmed to fit the context window", ("agent", "section"),
+    registry=REGISTRY
+)
+LLM_CACHE_SAVED_SECONDS = Counter(
+    "llm_cache_saved_seconds_total", "LLM generation time avoided by response cache hits", ("model",),
+    registry=REGISTRY
+)
+BATCH_PROFILES = Counter(
+    "batch_profiles_total", "Profiles screened by the batch endpoint", ("outcome",), registry=REGISTRY
+)
+ACTIVE_USERS = Gauge("active_users", "Users with live agent instances", registry=REGISTRY)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """Count a cache lookup as hit or miss"""
+    CACHE_REQUESTS.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+
+# ---------------------------------------------------------------- process stats
+
+def process_rss_bytes() -> int:
+    """Current resident set size (peak RSS where /proc is unavailable)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except ImportError:
+        return 0
+
+
+def physical_memory_bytes() -> int:
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (ValueError, AttributeError, OSError):
+        return 0
+
+
+class MetricsRingBuffer:
+    """
+    Fixed-size NumPy ring buffer of metric samples (one row per sample,
+    one column per field); windows are returned oldest-first
+    """
+
+    def __init__(self, capacity: int, fields: Sequence[str]):
+        self.capacity = capacity
+        self.fields = tuple(fields)
+        self._columns = {name: i for i, name in enumerate(self.fields)}
+        self._data = np.full((capacity, len(self.fields)), np.nan)
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, sample: Dict[str, float]) -> None:
+        self._data[self._next] = [sample.get(name, np.nan) for name in self.fields]
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def window(self, seconds: Optional[float] = None, last: Optional[int] = None) -> np.ndarray:
+        """Rows within the last `seconds` (by timestamp column) and/or the last `last` samples"""
+        start = (self._next - self._size) % self.capacity
+        rows = self._data[(start + np.arange(self._size)) % self.capacity]
+        if last is not None:
+            rows = rows[-last:]
+        if seconds is not None and "timestamp" in self._columns:
+            rows = rows[rows[:, self._columns["timestamp"]] >= time.time() - seconds]
+        return rows
+
+    def column(self, name: str, seconds: Optional[float] = None, last: Optional[int] = None) -> np.ndarray:
+        return self.window(seconds, last)[:, self._columns[name]]
+
+    def latest(self) -> Optional[Dict[str, float]]:
+        if not self._size:
+            return None
+        return dict(zip(self.fields, self._data[(self._next - 1) % self.capacity].tolist()))
+
+    def stats(self, name: str, seconds: Optional[float] = None, last: Optional[int] = None) -> Dict[str, Any]:
+        """Vectorized window statistics including a least-squares slope per minute"""
+        rows = self.window(seconds, last)
+        values = rows[:, self._columns[name]]
+        mask = ~np.isnan(values)
+        values = values[mask]
+        if not values.size:
+            return {"samples": 0}
+
+        result = {
+            "samples": int(values.size),
+            "mean": float(values.mean()),
+            "min": float(values.min()),
+            "max": float(values.max()),
+            "p50": float(np.percentile(values, 50)),
+            "p95": float(np.percentile(values, 95)),
+            "slope_per_minute": 0.0
+        }
+        if values.size >= 2 and "timestamp" in self._columns:
+            timestamps = rows[mask, self._columns["timestamp"]]
+            if np.ptp(timestamps) > 0:
+                result["slope_per_minute"] = float(np.polyfit(timestamps - timestamps[0], values, 1)[0] * 60)
+        return result
+
+
+SAMPLE_FIELDS = (
+    "timestamp", "cpu_usage", "memory_usage", "rss_mb", "disk_usage",
+    "requests", "errors", "error_rate", "avg_response_time", "p95_response_time",
+    "throughput", "in_flight", "llm_calls", "llm_tokens", "active_users"
+)
+
+
+class ProcessSampler:
+    """
+    Periodically samples process CPU/RSS and deltas of the request/LLM
+    instruments into a MetricsRingBuffer
+    """
+
+    def __init__(self, capacity: int = 5760, disk_path: str = "."):
+        self.history = MetricsRingBuffer(capacity, SAMPLE_FIELDS)
+        self.disk_path = disk_path
+        self._task: Optional[asyncio.Task] = None
+        self._lock = threading.Lock()
+        self._previous = self._read_totals()
+
+    def _read_totals(self) -> Dict[str, Any]:
+        counts, latency_sum, requests = HTTP_LATENCY.merged()
+        error_counts, _, errors = HTTP_LATENCY.merged(lambda labels: labels["status"].startswith("5"))
+        cpu = os.times()
+        return {
+            "wall": time.time(),
+            "cpu": cpu.user + cpu.system,
+            "counts": counts,
+            "latency_sum": latency_sum,
+            "requests": requests,
+            "errors": errors,
+            "llm_calls": metric_total(LLM_CALLS),
+            "llm_tokens": metric_total(LLM_TOKENS)
+        }
+
+    def sample(self, min_interval: float = 0.0) -> Dict[str, float]:
+        """
+        Take one sample now (delta since the previous sample) and append it;
+        returns the latest sample instead if it is younger than min_interval seconds
+        """
+        with self._lock:
+            latest = self.history.latest()
+            if latest and time.time() - latest["timestamp"] < min_interval:
+                return latest
+
+            current = self._read_totals()
+            previous, self._previous = self._previous, current
+
+            elapsed = max(current["wall"] - previous["wall"], 1e-6)
+            requests = current["requests"] - previous["requests"]
+            errors = current["errors"] - previous["errors"]
+            interval_counts = current["counts"] - previous["counts"]
+
+            memory_total = physical_memory_bytes()
+            rss = process_rss_bytes()
+            try:
+                disk = shutil.disk_usage(self.disk_path)
+                disk_usage = disk.used / disk.total
+            except OSError:
+                disk_usage = float("nan")
+
+            sample = {
+                "timestamp": current["wall"],
+                "cpu_usage": min((current["cpu"] - previous["cpu"]) / elapsed / (os.cpu_count() or 1), 1.0),
+                "memory_usage": rss / memory_total if memory_total else float("nan"),
+                "rss_mb": rss / (1024 * 1024),
+                "disk_usage": disk_usage,
+                "requests": requests,
+                "errors": errors,
+                "error_rate": errors / requests if requests else 0.0,
+                "avg_response_time": (current["latency_sum"] - previous["latency_sum"]) / requests if requests else 0.0,
+                "p95_response_time": quantile_from_counts(interval_counts, 0.95),
+                "throughput": requests / elapsed * 60,  # requests per minute
+                "in_flight": metric_total(HTTP_IN_FLIGHT),
+                "llm_calls": current["llm_calls"] - previous["llm_calls"],
+                "llm_tokens": current["llm_tokens"] - previous["llm_tokens"],
+                "active_users": metric_total(ACTIVE_USERS)
+            }
+            self.history.append(sample)
+            return sample
+
+    async def _run(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.sample()
+            except Exception as e:
+                logger.warning(f"Metrics sampling failed: {e}")
+
+    def start(self, interval: float = 15.0) -> None:
+        """Sample every `interval` seconds on the running event loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run(interval))
+
+    def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+
+_sampler: Optional[ProcessSampler] = None
+_sampler_lock = threading.Lock()
+
+
+def get_process_sampler() -> ProcessSampler:
+    """Process-wide sampler (24h of history at the default 15s interval)"""
+    global _sampler
+    if _sampler is None:
+        with _sampler_lock:
+            if _sampler is None:
+                _sampler = ProcessSampler()
+    return _sampler
@@ -0,0 +1,140 @@
+"""
+Shared HTTP client for Ollama LLM objects
+
+langchain's Ollama opens a fresh connection per call (requests.post, and a new
+aiohttp.ClientSession per async call). SharedClientOllama sends its requests
+through an OllamaHTTPClient instead, so every LLM object a factory builds
+reuses one pooled requests.Session and, per event loop, one aiohttp session.
+Token counts use the offline estimate from context_budget.
+"""
+
+import asyncio
+import threading
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+import aiohttp
+import requests
+from langchain_community.llms import Ollama
+from langchain_community.llms.ollama import OllamaEndpointNotFoundError
+
+from .context_budget import count_tokens
+
+
+class OllamaHTTPClient:
+    """Pooled sync and async HTTP sessions shared by LLM objects"""
+
+    def __init__(self, pool_size: int = 16):
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.pool_size = pool_size
+        self._async_sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    def async_session(self) -> aiohttp.ClientSession:
+        """The aiohttp session of the running loop (sessions cannot cross loops)"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            session = self._async_sessions.get(loop)
+            if session is None or session.closed:
+                # Forget sessions of loops that have since closed
+                self._async_sessions = {l: s for l, s in self._async_sessions.items() if not l.is_closed()}
+                session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.pool_size))
+                self._async_sessions[loop] = session
+            return session
+
+    def stats(self) -> Dict[str, Any]:
+        return {"requests": self.requests, "async_sessions": len(self._async_sessions), "pool_size": self.pool_size}
+
+    async def aclose(self) -> None:
+        """Close the running loop's aiohttp session and the sync session"""
+        session = self._async_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+        self.session.close()
+
+
+class SharedClientOllama(Ollama):
+    """Ollama LLM that sends /api/generate requests through a shared OllamaHTTPClient"""
+
+    http_client: Optional[Any] = None
+
+    def get_num_tokens(self, text: str) -> int:
+        # Summary memory sizes the buffer with this; the default loads a GPT-2
+        # tokenizer (transformers + a download) on first use
+        return count_tokens(text)
+
+    def _request(self, prompt: str, stop: Optional[List[str]], images: Optional[List[str]],
+                 **kwargs: Any) -> Dict[str, Any]:
+        # Same option handling as _OllamaCommon._create_stream
+        if self.stop is not None and stop is not None:
+            raise ValueError("`stop` found in both the input and default params.")
+        elif self.stop is not None:
+            stop = self.stop
+
+        params = self._default_params
+        for key in self._default_params:
+            if key in kwargs:
+                params[key] = kwargs[key]
+        if "options" in kwargs:
+            params["options"] = kwargs["options"]
+        else:
+            params["options"] = {
+                **params["options"],
+                "stop": stop,
+                **{k: v for k, v in kwargs.items() if k not in self._default_params},
+            }
+        return {"prompt": prompt, "images": images or [], **params}
+
+    def _headers(self) -> Dict[str, str]:
+        return {"Content-Type": "application/json", **(self.headers if isinstance(self.headers, dict) else {})}
+
+    def _raise_for_status(self, status: int, detail: Any) -> None:
+        if status == 404:
+            raise OllamaEndpointNotFoundError(
+                f"Ollama call failed with status code 404. Maybe your model is not found "
+                f"and you should pull the model with `ollama pull {self.model}`."
+            )
+        raise ValueError(f"Ollama call failed with status code {status}. Details: {detail}")
+
+    def _create_generate_stream(self, prompt: str, stop: Optional[List[str]] = None,
+                                images: Optional[List[str]] = None, **kwargs: Any) -> Iterator[str]:
+        if self.http_client is None:
+            yield from super()._create_generate_stream(prompt, stop=stop, images=images, **kwargs)
+            return
+
+        self.http_client.requests += 1
+        response = self.http_client.session.post(
+            url=f"{self.base_url}/api/generate",
+            headers=self._headers(),
+            auth=self.auth,
+            json=self._request(prompt, stop, images, **kwargs),
+            stream=True,
+            timeout=self.timeout,
+        )
+        response.encoding = "utf-8"
+        if response.status_code != 200:
+            self._raise_for_status(response.status_code, response.text)
+        yield from response.iter_lines(decode_unicode=True)
+
+    async def _acreate_generate_stream(self, prompt: str, stop: Optional[List[str]] = None,
+                                       images: Optional[List[str]] = None, **kwargs: Any) -> AsyncIterator[str]:
+        if self.http_client is None:
+            async for line in super()._acreate_generate_stream(prompt, stop=stop, images=images, **kwargs):
+                yield line
+            return
+
+        self.http_client.requests += 1
+        async with self.http_client.async_session().post(
+            url=f"{self.base_url}/api/generate",
+            headers=self._headers(),
+            auth=self.auth,
+            json=self._request(prompt, stop, images, **kwargs),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        ) as response:
+            if response.status != 200:
+                self._raise_for_status(response.status, await response.text())
+            async for line in response.content:
+                yield line.decode("utf-8")
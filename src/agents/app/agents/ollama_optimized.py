@@ -4,6 +4,7 @@ Works WITH the model's tendencies instead of fighting them
 """
 
 import json
+import os
 import re
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -11,6 +12,8 @@ from langchain_community.llms import Ollama
 from pydantic import BaseModel, Field
 import structlog
 
+from .llm_cache import attach_llm_cache
+
 logger = structlog.get_logger()
 
 
@@ -32,8 +35,10 @@ class OllamaOptimizedAgent:
             top_k=5,          # Very focused token selection
             top_p=0.8,        # Narrow probability range
             repeat_penalty=1.3,  # Strong repetition penalty
-            stop=["Question:", "**Question", "---", "###"]  # Stop sequences
+            stop=["Question:", "**Question", "---", "###"],  # Stop sequences
+            keep_alive=os.getenv("OLLAMA_KEEP_ALIVE", "30m")  # Keep model and prompt cache warm
         )
+        attach_llm_cache(self.llm)  # Deterministic settings: identical analyses are served from cache
         
         logger.info(f"Initialized Ollama-optimized {role} agent")
     
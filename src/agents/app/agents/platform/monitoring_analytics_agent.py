@@ -12,10 +12,15 @@ import asyncio
 from dataclasses import dataclass, asdict
 import statistics
 
+import numpy as np
+
 from langchain.tools import Tool
 import structlog
 
 from ..base import FederalJobAgent, AgentConfig, AgentResponse
+from ..metrics import (
+    HTTP_LATENCY, AGENT_LATENCY, CACHE_REQUESTS, get_process_sampler, metric_values, quantile_from_counts
+)
 
 logger = structlog.get_logger()
 
@@ -74,7 +79,8 @@ class MonitoringAnalyticsAgent(FederalJobAgent):
     
     def __init__(self, config: AgentConfig):
         self.monitoring_config = MonitoringConfig()
-        self.system_metrics_history = []  # Store recent metrics
+        self.metrics_sampler = get_process_sampler()
+        self.system_metrics_history = self.metrics_sampler.history  # Fixed-size NumPy ring buffer
         self.performance_alerts = []  # Store active alerts
         self.cost_tracking = {"daily_costs": {}, "monthly_total": 0.0}
         self.api_health_cache = {}
@@ -418,21 +424,12 @@ Question: {input}
     def _detect_performance_issues(self, performance_data: str) -> str:
         """Detect performance bottlenecks and issues"""
         try:
-            # Parse performance data or use simulated data
+            # Parse performance data or read live metrics
             if performance_data and performance_data != "detect_issues":
                 data = json.loads(performance_data)
                 metrics = data.get("metrics", {})
             else:
-                # Simulated current performance metrics
-                metrics = {
-                    "avg_response_time": 1.2,
-                    "error_rate": 0.02,
-                    "throughput": 150,
-                    "memory_usage": 0.75,
-                    "cpu_usage": 0.60,
-                    "database_query_time": 0.3,
-                    "api_response_time": 0.8
-                }
+                metrics = self._live_performance_metrics()
             
             issues_detected = []
             performance_score = 100
@@ -539,7 +536,10 @@ Question: {input}
                     "Maintain current optimization level"
                 ],
                 "target_score": 90,  # 72% improvement goal
-                "improvement_needed": max(0, 90 - performance_score)
+                "improvement_needed": max(0, 90 - performance_score),
+                "measured_metrics": metrics,
+                "slowest_routes": self._slowest_series(HTTP_LATENCY),
+                "slowest_agents": self._slowest_series(AGENT_LATENCY)
             }
             
             return f"Performance Analysis: {json.dumps(analysis_result, indent=2)}"
@@ -626,26 +626,22 @@ Question: {input}
             # Generate current system health metrics
             current_time = datetime.utcnow()
             
-            # Simulated system health data (in production, would come from actual monitoring)
+            # Fresh sample (appended to the ring buffer) plus a 5 minute window for smoothing
+            sample = self.metrics_sampler.sample(min_interval=5.0)
+            window = self._window_means(300)
+            
             health_metrics = SystemMetrics(
                 timestamp=current_time.isoformat(),
-                error_rate=0.02,  # 2% error rate
-                avg_response_time=1.2,  # 1.2 seconds
-                throughput=150,  # requests per minute
-                memory_usage=0.75,  # 75%
-                cpu_usage=0.60,  # 60%
-                disk_usage=0.45,  # 45%
-                active_users=25,
-                api_health_score=0.95  # 95% healthy
+                error_rate=window.get("error_rate", sample["error_rate"]),
+                avg_response_time=window.get("avg_response_time", sample["avg_response_time"]),
+                throughput=int(round(window.get("throughput", sample["throughput"]))),
+                memory_usage=sample["memory_usage"],
+                cpu_usage=sample["cpu_usage"],
+                disk_usage=sample["disk_usage"],
+                active_users=int(sample["active_users"]),
+                api_health_score=1.0 - window.get("error_rate", sample["error_rate"])
             )
             
-            # Add to history
-            self.system_metrics_history.append(health_metrics)
-            
-            # Keep only last 24 hours of metrics (assuming 1 minute intervals)
-            if len(self.system_metrics_history) > 1440:
-                self.system_metrics_history = self.system_metrics_history[-1440:]
-            
             # Calculate health scores
             performance_score = self._calculate_performance_score(health_metrics)
             availability_score = self._calculate_availability_score()
@@ -689,8 +685,14 @@ Question: {input}
                 "trends": {
                     "error_rate_trend": self._calculate_trend("error_rate"),
                     "response_time_trend": self._calculate_trend("avg_response_time"),
-                    "throughput_trend": self._calculate_trend("throughput")
+                    "throughput_trend": self._calculate_trend("throughput"),
+                    "memory_trend": self._calculate_trend("memory_usage")
                 },
+                "window_statistics": {
+                    name: self.system_metrics_history.stats(name, seconds=3600)
+                    for name in ("avg_response_time", "p95_response_time", "error_rate", "cpu_usage", "rss_mb")
+                },
+                "history_samples": len(self.system_metrics_history),
                 "system_capacity": {
                     "current_load": f"{health_metrics.cpu_usage * 100:.1f}%",
                     "memory_available": f"{(1 - health_metrics.memory_usage) * 100:.1f}%",
@@ -1075,32 +1077,98 @@ Question: {input}
         
         return max(score, 0)
     
-    def _calculate_availability_score(self) -> float:
-        """Calculate availability score"""
-        # In production, would calculate from actual uptime data
-        return 99.2  # Simulated uptime percentage
+    def _calculate_availability_score(self, seconds: float = 86400) -> float:
+        """Percentage of requests served without a 5xx over the window (default 24h)"""
+        requests = np.nansum(self.system_metrics_history.column("requests", seconds=seconds))
+        errors = np.nansum(self.system_metrics_history.column("errors", seconds=seconds))
+        if requests == 0:
+            return 100.0
+        return float(100.0 * (1 - errors / requests))
     
-    def _calculate_reliability_score(self) -> float:
-        """Calculate reliability score"""
-        # In production, would calculate from error patterns and recovery metrics
-        return 94.5  # Simulated reliability score
+    def _calculate_reliability_score(self, seconds: float = 86400) -> float:
+        """Percentage of sampled intervals within the error-rate and latency alert thresholds"""
+        rows = self.system_metrics_history.window(seconds=seconds)
+        if not len(rows):
+            return 100.0
+        
+        fields = self.system_metrics_history.fields
+        error_rate = rows[:, fields.index("error_rate")]
+        latency = rows[:, fields.index("p95_response_time")]
+        healthy = (
+            (np.nan_to_num(error_rate) <= self.monitoring_config.alert_threshold_error_rate)
+            & (np.nan_to_num(latency) <= self.monitoring_config.alert_threshold_response_time)
+        )
+        return float(100.0 * healthy.mean())
     
-    def _calculate_trend(self, metric_name: str) -> str:
-        """Calculate trend for a specific metric"""
-        if len(self.system_metrics_history) < 2:
+    def _calculate_trend(self, metric_name: str, last: int = 20) -> str:
+        """Trend from the least-squares slope over recent samples, relative to their mean"""
+        stats = self.system_metrics_history.stats(metric_name, last=last)
+        if stats["samples"] < 2:
             return "insufficient_data"
         
-        # Simple trend calculation (would be more sophisticated in production)
-        recent = getattr(self.system_metrics_history[-1], metric_name)
-        older = getattr(self.system_metrics_history[-min(10, len(self.system_metrics_history))], metric_name)
+        # Projected change across the window as a fraction of the window mean
+        timestamps = self.system_metrics_history.column("timestamp", last=last)
+        span_minutes = (np.nanmax(timestamps) - np.nanmin(timestamps)) / 60
+        baseline = abs(stats["mean"]) or 1e-9
+        relative_change = stats["slope_per_minute"] * span_minutes / baseline
         
-        if recent > older * 1.1:
+        if relative_change > 0.1:
             return "increasing"
-        elif recent < older * 0.9:
+        elif relative_change < -0.1:
             return "decreasing"
         else:
             return "stable"
     
+    def _window_means(self, seconds: float) -> Dict[str, float]:
+        """Request-weighted error rate / latency and mean throughput over a window"""
+        rows = self.system_metrics_history.window(seconds=seconds)
+        if not len(rows):
+            return {}
+        
+        fields = self.system_metrics_history.fields
+        requests = np.nan_to_num(rows[:, fields.index("requests")])
+        total = requests.sum()
+        if total == 0:
+            return {"throughput": 0.0}
+        
+        return {
+            "error_rate": float(np.nan_to_num(rows[:, fields.index("errors")]).sum() / total),
+            "avg_response_time": float(
+                np.average(np.nan_to_num(rows[:, fields.index("avg_response_time")]), weights=requests)
+            ),
+            "throughput": float(np.nanmean(rows[:, fields.index("throughput")]))
+        }
+    
+    def _live_performance_metrics(self) -> Dict[str, float]:
+        """Current performance metrics from the live instruments and sampled history"""
+        sample = self.metrics_sampler.sample(min_interval=5.0)
+        window = self._window_means(300)
+        counts, _, _ = HTTP_LATENCY.merged()
+        cache = metric_values(CACHE_REQUESTS)
+        hits = sum(v for key, v in cache.items() if key[1] == "hit")
+        lookups = sum(cache.values())
+        
+        return {
+            "avg_response_time": window.get("avg_response_time", sample["avg_response_time"]),
+            "p95_response_time": quantile_from_counts(counts, 0.95),
+            "error_rate": window.get("error_rate", sample["error_rate"]),
+            "throughput": window.get("throughput", sample["throughput"]),
+            "memory_usage": sample["memory_usage"],
+            "cpu_usage": sample["cpu_usage"],
+            "rss_mb": sample["rss_mb"],
+            "cache_hit_ratio": hits / lookups if lookups else None
+        }
+    
+    def _slowest_series(self, histogram, limit: int = 5) -> List[Dict[str, Any]]:
+        """Label sets with the highest p95 latency"""
+        summary = histogram.summary()
+        ranked = sorted(summary.items(), key=lambda item: item[1]["p95"], reverse=True)[:limit]
+        return [
+            {"series": label, "count": stats["count"], "p95_seconds": round(stats["p95"], 4),
+             "p99_seconds": round(stats["p99"], 4)}
+            for label, stats in ranked
+        ]
+    
     def _get_health_recommendations(self, metrics: SystemMetrics, score: float) -> List[str]:
         """Get health-based recommendations"""
         recommendations = []
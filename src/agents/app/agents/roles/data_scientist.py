@@ -91,6 +91,51 @@ import json
 import re
 
 from ..base import FederalJobAgent, AgentResponse
+from ..candidate_profile import CandidateProfile, register_keywords
+
+# Core data science skills for federal positions
+REQUIRED_SKILLS = {
+    "programming": ["Python", "R", "SQL", "SAS", "MATLAB"],
+    "ml_frameworks": ["scikit-learn", "TensorFlow", "PyTorch", "Keras"],
+    "big_data": ["Spark", "Hadoop", "Hive", "HBase"],
+    "visualization": ["Tableau", "Power BI", "D3.js", "Plotly"],
+    "statistics": ["regression", "hypothesis testing", "time series", "Bayesian"],
+    "databases": ["PostgreSQL", "MongoDB", "Oracle", "Redshift"],
+    "cloud": ["AWS", "Azure", "GCP", "Databricks"]
+}
+
+FEDERAL_RELEVANCE_KEYWORDS = [
+    "classification", "prediction", "forecasting", "optimization",
+    "fraud detection", "risk assessment", "resource allocation",
+    "policy analysis", "program evaluation", "performance metrics",
+    "survey analysis", "census", "demographic", "economic modeling",
+    "healthcare analytics", "security", "compliance"
+]
+
+PROJECT_TECHNICAL_TERMS = ["model", "algorithm", "pipeline", "api", "database", "deployment"]
+
+DEPTH_AREAS = {
+    "statistics": ["regression", "hypothesis", "anova", "time series", "bayesian"],
+    "machine_learning": ["supervised", "unsupervised", "deep learning", "neural", "ensemble"],
+    "data_engineering": ["etl", "pipeline", "streaming", "batch", "workflow"],
+    "experimentation": ["a/b test", "experiment", "causal", "randomized"],
+    "domain_knowledge": ["federal", "government", "policy", "regulation", "compliance"]
+}
+
+FEDERAL_VALUE_INDICATORS = [
+    "peer-reviewed", "journal", "conference", "white paper",
+    "technical report", "github", "open source", "methodology"
+]
+
+VALUABLE_CERTS = {
+    "cloud": ["AWS Certified", "Azure", "GCP", "Solutions Architect"],
+    "data": ["Certified Analytics Professional", "SAS Certified", "Databricks"],
+    "project": ["PMP", "Agile", "Scrum Master"],
+    "security": ["Security+", "CISSP", "Certified Ethical Hacker"]
+}
+
+register_keywords("skills", REQUIRED_SKILLS)
+register_keywords("experience", DEPTH_AREAS)
 
 
 class DataScientistAgent(FederalJobAgent):
@@ -181,31 +226,19 @@ class DataScientistAgent(FederalJobAgent):
         """Match candidate skills to position requirements"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            
-            # Core data science skills for federal positions
-            required_skills = {
-                "programming": ["Python", "R", "SQL", "SAS", "MATLAB"],
-                "ml_frameworks": ["scikit-learn", "TensorFlow", "PyTorch", "Keras"],
-                "big_data": ["Spark", "Hadoop", "Hive", "HBase"],
-                "visualization": ["Tableau", "Power BI", "D3.js", "Plotly"],
-                "statistics": ["regression", "hypothesis testing", "time series", "Bayesian"],
-                "databases": ["PostgreSQL", "MongoDB", "Oracle", "Redshift"],
-                "cloud": ["AWS", "Azure", "GCP", "Databricks"]
-            }
-            
-            candidate_skills = data.get("skills", [])
+            profile = CandidateProfile.from_input(input_data)
             matched = {}
             gaps = {}
             
-            for category, skills in required_skills.items():
-                matched[category] = [s for s in skills if any(s.lower() in c.lower() for c in candidate_skills)]
+            for category, skills in REQUIRED_SKILLS.items():
+                matched[category] = [s for s in skills if profile.contains("skills", s.lower())]
                 gaps[category] = [s for s in skills if s not in matched[category]][:3]  # Top 3 gaps
             
             return json.dumps({
                 "matched_skills": matched,
                 "skill_gaps": gaps,
-                "match_percentage": len([s for m in matched.values() for s in m]) / len([s for r in required_skills.values() for s in r]) * 100
+                "match_percentage": len([s for m in matched.values() for s in m]) / len([s for r in REQUIRED_SKILLS.values() for s in r]) * 100,
+                "stated_experience": profile.stated_experience()
             })
             
         except Exception as e:
@@ -215,34 +248,21 @@ class DataScientistAgent(FederalJobAgent):
         """Analyze data science projects for federal relevance"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            projects = data.get("projects", [])
-            
-            federal_relevance_keywords = [
-                "classification", "prediction", "forecasting", "optimization",
-                "fraud detection", "risk assessment", "resource allocation",
-                "policy analysis", "program evaluation", "performance metrics",
-                "survey analysis", "census", "demographic", "economic modeling",
-                "healthcare analytics", "security", "compliance"
-            ]
-            
+            profile = CandidateProfile.from_input(input_data)
             analyzed_projects = []
             
-            for project in projects:
-                project_text = project.get("description", "").lower()
-                
+            for project_name, project_text in profile.projects:
                 # Check for federal relevance
-                relevance_score = sum(1 for kw in federal_relevance_keywords if kw in project_text)
+                relevance_score = sum(1 for kw in FEDERAL_RELEVANCE_KEYWORDS if kw in project_text)
                 
                 # Check for quantifiable results
                 has_metrics = bool(re.search(r'\d+%|\$\d+|\d+x|improved|reduced|increased', project_text))
                 
                 # Check for technical depth
-                technical_terms = ["model", "algorithm", "pipeline", "api", "database", "deployment"]
-                technical_score = sum(1 for term in technical_terms if term in project_text)
+                technical_score = sum(1 for term in PROJECT_TECHNICAL_TERMS if term in project_text)
                 
                 analyzed_projects.append({
-                    "project": project.get("name", "Unknown"),
+                    "project": project_name,
                     "federal_relevance": relevance_score,
                     "has_metrics": has_metrics,
                     "technical_depth": technical_score,
@@ -268,21 +288,11 @@ class DataScientistAgent(FederalJobAgent):
         """Evaluate technical depth in key areas"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            experience = data.get("experience", "")
-            
-            depth_areas = {
-                "statistics": ["regression", "hypothesis", "anova", "time series", "bayesian"],
-                "machine_learning": ["supervised", "unsupervised", "deep learning", "neural", "ensemble"],
-                "data_engineering": ["etl", "pipeline", "streaming", "batch", "workflow"],
-                "experimentation": ["a/b test", "experiment", "causal", "randomized"],
-                "domain_knowledge": ["federal", "government", "policy", "regulation", "compliance"]
-            }
-            
+            profile = CandidateProfile.from_input(input_data)
             depth_assessment = {}
             
-            for area, keywords in depth_areas.items():
-                count = sum(1 for kw in keywords if kw in experience.lower())
+            for area, keywords in DEPTH_AREAS.items():
+                count = len(profile.matches("experience", keywords))
                 depth_assessment[area] = {
                     "depth": "Strong" if count >= 3 else "Moderate" if count >= 1 else "Limited",
                     "evidence_count": count
@@ -297,23 +307,15 @@ class DataScientistAgent(FederalJobAgent):
         """Identify relevant publications and research"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            publications = data.get("publications", [])
-            
-            federal_value_indicators = [
-                "peer-reviewed", "journal", "conference", "white paper",
-                "technical report", "github", "open source", "methodology"
-            ]
-            
+            profile = CandidateProfile.from_input(input_data)
             valuable_pubs = []
             
-            for pub in publications:
-                pub_text = pub.get("title", "") + " " + pub.get("venue", "")
-                value_score = sum(1 for ind in federal_value_indicators if ind in pub_text.lower())
+            for title, pub_text in profile.publications:
+                value_score = sum(1 for ind in FEDERAL_VALUE_INDICATORS if ind in pub_text)
                 
                 if value_score > 0:
                     valuable_pubs.append({
-                        "publication": pub.get("title"),
+                        "publication": title,
                         "value_score": value_score,
                         "recommendation": "Include - demonstrates research capability"
                     })
@@ -330,25 +332,15 @@ class DataScientistAgent(FederalJobAgent):
         """Check relevant certifications and training"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            certifications = data.get("certifications", [])
-            
-            valuable_certs = {
-                "cloud": ["AWS Certified", "Azure", "GCP", "Solutions Architect"],
-                "data": ["Certified Analytics Professional", "SAS Certified", "Databricks"],
-                "project": ["PMP", "Agile", "Scrum Master"],
-                "security": ["Security+", "CISSP", "Certified Ethical Hacker"]
-            }
-            
+            profile = CandidateProfile.from_input(input_data)
             cert_assessment = []
             
-            for cert in certifications:
-                cert_name = cert.get("name", "").lower()
-                
-                for category, keywords in valuable_certs.items():
+            # Certifications may be plain names or {"name": ...} records
+            for cert, cert_name in zip(profile.data.get("certifications") or [], profile.certifications):
+                for category, keywords in VALUABLE_CERTS.items():
                     if any(kw.lower() in cert_name for kw in keywords):
                         cert_assessment.append({
-                            "certification": cert.get("name"),
+                            "certification": cert.get("name") if isinstance(cert, dict) else cert,
                             "category": category,
                             "federal_value": "High" if category in ["security", "cloud"] else "Medium"
                         })
@@ -157,6 +157,88 @@ import json
 import re
 
 from ..base import FederalJobAgent, AgentResponse
+from ..candidate_profile import CandidateProfile, register_keywords
+
+# Federal agency database preferences
+DATABASE_PLATFORMS = {
+    "enterprise": {
+        "Oracle": ["oracle", "oracle database", "11g", "12c", "19c", "rac", "exadata"],
+        "SQL Server": ["sql server", "mssql", "t-sql", "ssms", "ssis", "ssrs"],
+        "DB2": ["db2", "ibm db2", "db2 z/os", "db2 luw"]
+    },
+    "open_source": {
+        "PostgreSQL": ["postgresql", "postgres", "pgadmin", "plpgsql"],
+        "MySQL": ["mysql", "mariadb", "percona"],
+        "MongoDB": ["mongodb", "nosql", "document database"]
+    },
+    "cloud": {
+        "AWS": ["rds", "dynamodb", "aurora", "redshift", "elasticache"],
+        "Azure": ["azure sql", "cosmos db", "azure database"],
+        "GCP": ["cloud sql", "bigtable", "firestore"]
+    }
+}
+
+SECURITY_AREAS = {
+    "encryption": ["encryption", "tde", "transparent data", "column encryption", "key management"],
+    "access_control": ["rbac", "role-based", "privileges", "grants", "permissions", "least privilege"],
+    "auditing": ["audit", "compliance", "logging", "monitoring", "siem", "splunk"],
+    "federal_standards": ["fisma", "fedramp", "stig", "nist", "fips", "800-53"],
+    "vulnerability": ["vulnerability", "scanning", "patch", "cve", "security updates"],
+    "data_protection": ["pii", "phi", "data masking", "redaction", "classification"]
+}
+
+CLEARANCE_TERMS = ["clearance", "secret", "ts/sci", "public trust"]
+
+PERFORMANCE_AREAS = {
+    "query_optimization": ["query optimization", "explain plan", "execution plan", "query tuning", "slow query"],
+    "indexing": ["index", "indexing strategy", "covering index", "composite index", "index maintenance"],
+    "monitoring": ["performance monitoring", "awr", "statspack", "dmv", "performance metrics", "baseline"],
+    "troubleshooting": ["troubleshooting", "bottleneck", "deadlock", "locking", "blocking", "wait stats"],
+    "capacity": ["capacity planning", "sizing", "growth", "forecasting", "resource planning"],
+    "automation": ["automation", "scripting", "powershell", "python", "bash", "scheduled jobs"]
+}
+
+BACKUP_AREAS = {
+    "backup_types": ["full backup", "incremental", "differential", "snapshot", "hot backup", "cold backup"],
+    "recovery": ["recovery", "restore", "point-in-time", "pitr", "rollback", "flashback"],
+    "high_availability": ["replication", "mirroring", "clustering", "always on", "rac", "failover"],
+    "disaster_recovery": ["disaster recovery", "dr plan", "rpo", "rto", "business continuity", "bcdr"],
+    "tools": ["rman", "backup exec", "veeam", "commvault", "netbackup", "azure backup"],
+    "testing": ["backup testing", "recovery testing", "dr drill", "restore verification"]
+}
+
+# Agency clearance requirements
+CLEARANCE_LEVELS = {
+    "dod": {
+        "typical": "Secret or Top Secret",
+        "database_systems": ["SIPR", "JWICS", "classified systems"],
+        "importance": "Critical"
+    },
+    "dhs": {
+        "typical": "Secret or Public Trust",
+        "database_systems": ["CBP systems", "TSA systems", "USCIS databases"],
+        "importance": "High"
+    },
+    "va": {
+        "typical": "Public Trust",
+        "database_systems": ["VistA", "patient records", "benefits systems"],
+        "importance": "Moderate"
+    },
+    "irs": {
+        "typical": "Public Trust (High Risk)",
+        "database_systems": ["tax systems", "compliance databases"],
+        "importance": "High"
+    },
+    "civilian": {
+        "typical": "Public Trust or None",
+        "database_systems": ["general federal databases"],
+        "importance": "Low to Moderate"
+    }
+}
+
+
+register_keywords("experience", SECURITY_AREAS, CLEARANCE_TERMS, PERFORMANCE_AREAS, BACKUP_AREAS, ["rpo", "rto"])
+register_keywords("skills_and_experience", DATABASE_PLATFORMS)
 
 
 class DatabaseAdminAgent(FederalJobAgent):
@@ -248,37 +330,13 @@ class DatabaseAdminAgent(FederalJobAgent):
         """Evaluate experience with database platforms"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            experience = data.get("experience", "").lower()
-            skills = [s.lower() for s in data.get("skills", [])]
-            
-            # Federal agency database preferences
-            platforms = {
-                "enterprise": {
-                    "Oracle": ["oracle", "oracle database", "11g", "12c", "19c", "rac", "exadata"],
-                    "SQL Server": ["sql server", "mssql", "t-sql", "ssms", "ssis", "ssrs"],
-                    "DB2": ["db2", "ibm db2", "db2 z/os", "db2 luw"]
-                },
-                "open_source": {
-                    "PostgreSQL": ["postgresql", "postgres", "pgadmin", "plpgsql"],
-                    "MySQL": ["mysql", "mariadb", "percona"],
-                    "MongoDB": ["mongodb", "nosql", "document database"]
-                },
-                "cloud": {
-                    "AWS": ["rds", "dynamodb", "aurora", "redshift", "elasticache"],
-                    "Azure": ["azure sql", "cosmos db", "azure database"],
-                    "GCP": ["cloud sql", "bigtable", "firestore"]
-                }
-            }
-            
+            profile = CandidateProfile.from_input(input_data)
             platform_experience = {}
             total_platforms = 0
             
-            combined_text = " ".join(skills) + " " + experience
-            
-            for category, platform_list in platforms.items():
+            for category, platform_list in DATABASE_PLATFORMS.items():
                 for platform, keywords in platform_list.items():
-                    if any(kw in combined_text for kw in keywords):
+                    if any(profile.contains("skills_and_experience", kw) for kw in keywords):
                         if category not in platform_experience:
                             platform_experience[category] = []
                         platform_experience[category].append(platform)
@@ -297,6 +355,7 @@ class DatabaseAdminAgent(FederalJobAgent):
                 "total_platforms": total_platforms,
                 "expertise_level": expertise_level,
                 "federal_ready": federal_ready,
+                "stated_experience": profile.stated_experience(),
                 "recommendation": self._get_platform_recommendation(platform_experience, federal_ready)
             })
             
@@ -317,30 +376,19 @@ class DatabaseAdminAgent(FederalJobAgent):
         """Assess database security and compliance knowledge"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            experience = data.get("experience", "").lower()
-            
-            security_areas = {
-                "encryption": ["encryption", "tde", "transparent data", "column encryption", "key management"],
-                "access_control": ["rbac", "role-based", "privileges", "grants", "permissions", "least privilege"],
-                "auditing": ["audit", "compliance", "logging", "monitoring", "siem", "splunk"],
-                "federal_standards": ["fisma", "fedramp", "stig", "nist", "fips", "800-53"],
-                "vulnerability": ["vulnerability", "scanning", "patch", "cve", "security updates"],
-                "data_protection": ["pii", "phi", "data masking", "redaction", "classification"]
-            }
-            
+            profile = CandidateProfile.from_input(input_data)
             security_profile = {}
             security_score = 0
             
-            for area, keywords in security_areas.items():
-                found = [kw for kw in keywords if kw in experience]
+            for area, keywords in SECURITY_AREAS.items():
+                found = profile.matches("experience", keywords)
                 if found:
                     security_profile[area] = found
                     security_score += len(found)
             
             # Check for specific federal compliance
             has_federal = "federal_standards" in security_profile
-            has_clearance = any(term in experience for term in ["clearance", "secret", "ts/sci", "public trust"])
+            has_clearance = any(profile.contains("experience", term) for term in CLEARANCE_TERMS)
             
             security_level = "Expert" if security_score >= 10 else "Advanced" if security_score >= 6 else "Intermediate" if security_score >= 3 else "Basic"
             
@@ -374,30 +422,19 @@ class DatabaseAdminAgent(FederalJobAgent):
         """Check performance optimization experience"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            experience = data.get("experience", "").lower()
-            
-            performance_areas = {
-                "query_optimization": ["query optimization", "explain plan", "execution plan", "query tuning", "slow query"],
-                "indexing": ["index", "indexing strategy", "covering index", "composite index", "index maintenance"],
-                "monitoring": ["performance monitoring", "awr", "statspack", "dmv", "performance metrics", "baseline"],
-                "troubleshooting": ["troubleshooting", "bottleneck", "deadlock", "locking", "blocking", "wait stats"],
-                "capacity": ["capacity planning", "sizing", "growth", "forecasting", "resource planning"],
-                "automation": ["automation", "scripting", "powershell", "python", "bash", "scheduled jobs"]
-            }
-            
+            profile = CandidateProfile.from_input(input_data)
             performance_profile = {}
             total_skills = 0
             
-            for area, keywords in performance_areas.items():
-                found = [kw for kw in keywords if kw in experience]
+            for area, keywords in PERFORMANCE_AREAS.items():
+                found = profile.matches("experience", keywords)
                 if found:
                     performance_profile[area] = found
                     total_skills += len(found)
             
             # Check for specific achievements
             metrics_pattern = r'\d+%?\s*(improvement|reduction|faster|increase|decrease)'
-            has_metrics = bool(re.search(metrics_pattern, experience))
+            has_metrics = bool(re.search(metrics_pattern, profile.experience))
             
             performance_level = "Expert" if total_skills >= 12 else "Advanced" if total_skills >= 8 else "Intermediate" if total_skills >= 4 else "Basic"
             
@@ -428,29 +465,18 @@ class DatabaseAdminAgent(FederalJobAgent):
         """Validate backup and disaster recovery skills"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            experience = data.get("experience", "").lower()
-            
-            backup_areas = {
-                "backup_types": ["full backup", "incremental", "differential", "snapshot", "hot backup", "cold backup"],
-                "recovery": ["recovery", "restore", "point-in-time", "pitr", "rollback", "flashback"],
-                "high_availability": ["replication", "mirroring", "clustering", "always on", "rac", "failover"],
-                "disaster_recovery": ["disaster recovery", "dr plan", "rpo", "rto", "business continuity", "bcdr"],
-                "tools": ["rman", "backup exec", "veeam", "commvault", "netbackup", "azure backup"],
-                "testing": ["backup testing", "recovery testing", "dr drill", "restore verification"]
-            }
-            
+            profile = CandidateProfile.from_input(input_data)
             backup_profile = {}
             total_experience = 0
             
-            for area, keywords in backup_areas.items():
-                found = [kw for kw in keywords if kw in experience]
+            for area, keywords in BACKUP_AREAS.items():
+                found = profile.matches("experience", keywords)
                 if found:
                     backup_profile[area] = found
                     total_experience += len(found)
             
             # Check for specific DR metrics
-            has_rpo_rto = "rpo" in experience or "rto" in experience
+            has_rpo_rto = profile.contains("experience", "rpo") or profile.contains("experience", "rto")
             has_ha = "high_availability" in backup_profile
             
             dr_readiness = "High" if total_experience >= 10 and has_rpo_rto else "Medium" if total_experience >= 5 else "Low"
@@ -483,51 +509,23 @@ class DatabaseAdminAgent(FederalJobAgent):
         """Provide guidance on security clearance needs"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            target_agency = data.get("target_agency", "").lower()
-            experience = data.get("experience", "").lower()
-            
-            # Agency clearance requirements
-            clearance_levels = {
-                "dod": {
-                    "typical": "Secret or Top Secret",
-                    "database_systems": ["SIPR", "JWICS", "classified systems"],
-                    "importance": "Critical"
-                },
-                "dhs": {
-                    "typical": "Secret or Public Trust",
-                    "database_systems": ["CBP systems", "TSA systems", "USCIS databases"],
-                    "importance": "High"
-                },
-                "va": {
-                    "typical": "Public Trust",
-                    "database_systems": ["VistA", "patient records", "benefits systems"],
-                    "importance": "Moderate"
-                },
-                "irs": {
-                    "typical": "Public Trust (High Risk)",
-                    "database_systems": ["tax systems", "compliance databases"],
-                    "importance": "High"
-                },
-                "civilian": {
-                    "typical": "Public Trust or None",
-                    "database_systems": ["general federal databases"],
-                    "importance": "Low to Moderate"
-                }
-            }
+            profile = CandidateProfile.from_input(input_data)
+            target_agency = profile.target_agency
+            # Whole words and phrases, so "secretary" is not a Secret clearance
+            phrases = profile.ngrams
             
             # Check current clearance status
             current_clearance = None
-            if "ts/sci" in experience or "top secret" in experience:
+            if "ts/sci" in phrases or "top secret" in phrases:
                 current_clearance = "Top Secret"
-            elif "secret" in experience:
+            elif "secret" in phrases:
                 current_clearance = "Secret"
-            elif "public trust" in experience:
+            elif "public trust" in phrases:
                 current_clearance = "Public Trust"
             
             # Determine agency requirements
             agency_key = None
-            for key in clearance_levels.keys():
+            for key in CLEARANCE_LEVELS.keys():
                 if key in target_agency:
                     agency_key = key
                     break
@@ -535,7 +533,7 @@ class DatabaseAdminAgent(FederalJobAgent):
             if not agency_key:
                 agency_key = "civilian"
             
-            agency_req = clearance_levels[agency_key]
+            agency_req = CLEARANCE_LEVELS[agency_key]
             
             # Clearance match assessment
             if current_clearance == "Top Secret":
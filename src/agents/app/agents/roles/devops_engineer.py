@@ -167,6 +167,88 @@ import json
 import re
 
 from ..base import FederalJobAgent, AgentResponse
+from ..candidate_profile import CandidateProfile, register_keywords
+
+CICD_TOOLS = {
+    "enterprise_ci": {
+        "Jenkins": ["jenkins", "jenkinsfile", "groovy pipeline", "blue ocean"],
+        "GitLab CI": ["gitlab ci", "gitlab-ci.yml", ".gitlab-ci"],
+        "Azure DevOps": ["azure devops", "azure pipelines", "yaml pipeline"]
+    },
+    "modern_ci": {
+        "GitHub Actions": ["github actions", "workflow", ".github/workflows"],
+        "CircleCI": ["circleci", "circle ci", ".circleci"],
+        "Travis CI": ["travis", "travis ci", ".travis.yml"]
+    },
+    "practices": {
+        "Pipeline Design": ["pipeline", "stages", "artifacts", "parallel execution"],
+        "Testing": ["unit test", "integration test", "smoke test", "automated testing"],
+        "Deployment": ["deployment", "blue-green", "canary", "rolling update", "rollback"]
+    }
+}
+
+CONTAINER_TECH = {
+    "containerization": ["docker", "dockerfile", "container", "docker-compose", "buildah", "podman"],
+    "orchestration": ["kubernetes", "k8s", "openshift", "helm", "kubectl", "pods", "deployments"],
+    "service_mesh": ["istio", "linkerd", "consul", "envoy", "service mesh"],
+    "registries": ["docker hub", "ecr", "acr", "harbor", "artifactory", "nexus"],
+    "security": ["container scanning", "vulnerability", "cve", "trivy", "clair", "twistlock"]
+}
+
+CLOUD_PLATFORMS = {
+    "AWS": {
+        "services": ["ec2", "s3", "lambda", "rds", "eks", "fargate", "cloudformation"],
+        "certs": ["aws certified", "solutions architect", "devops engineer", "sysops"]
+    },
+    "Azure": {
+        "services": ["azure vm", "blob storage", "aks", "azure functions", "arm templates"],
+        "certs": ["azure certified", "az-400", "azure devops", "azure administrator"]
+    },
+    "GCP": {
+        "services": ["compute engine", "gke", "cloud storage", "cloud functions"],
+        "certs": ["google cloud", "gcp certified", "cloud engineer"]
+    },
+    "Federal": {
+        "services": ["govcloud", "azure government", "il4", "il5", "fedramp"],
+        "certs": ["fedramp", "federal cloud"]
+    }
+}
+
+AUTOMATION_CATEGORIES = {
+    "iac": {
+        "Terraform": ["terraform", "hcl", "tfvars", "terraform modules"],
+        "CloudFormation": ["cloudformation", "cfn", "sam", "cdk"],
+        "ARM": ["arm template", "azure resource manager", "bicep"]
+    },
+    "config_mgmt": {
+        "Ansible": ["ansible", "playbook", "ansible tower", "awx"],
+        "Puppet": ["puppet", "puppet enterprise", "hiera"],
+        "Chef": ["chef", "cookbook", "chef server", "inspec"]
+    },
+    "scripting": {
+        "Python": ["python", "boto3", "python automation"],
+        "PowerShell": ["powershell", "ps1", "psdsc"],
+        "Bash": ["bash", "shell script", "linux automation"]
+    }
+}
+
+SECURITY_PRACTICES = {
+    "scanning": ["sonarqube", "fortify", "checkmarx", "veracode", "sast", "dast", "iast"],
+    "container_security": ["twistlock", "aqua", "trivy", "clair", "anchore", "snyk"],
+    "secrets": ["vault", "hashicorp vault", "secrets management", "key management", "aws secrets"],
+    "compliance": ["compliance as code", "oscal", "scap", "stig", "cis benchmark", "nist"],
+    "monitoring": ["security monitoring", "siem", "splunk", "elk", "log analysis"],
+    "practices": ["shift left", "security gates", "devsecops", "security pipeline", "zero trust"]
+}
+
+STIG_TERMS = ["stig", "security technical implementation"]
+NIST_TERMS = ["nist", "800-53", "800-171"]
+
+
+register_keywords("experience", CONTAINER_TECH, SECURITY_PRACTICES, STIG_TERMS, NIST_TERMS,
+                  ["kubernetes", "k8s", "openshift", "docker", "fedramp"])
+register_keywords("skills_and_experience", CICD_TOOLS, AUTOMATION_CATEGORIES)
+register_keywords("experience_and_certifications", CLOUD_PLATFORMS)
 
 
 class DevOpsEngineerAgent(FederalJobAgent):
@@ -258,36 +340,13 @@ class DevOpsEngineerAgent(FederalJobAgent):
         """Evaluate CI/CD pipeline experience"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            experience = data.get("experience", "").lower()
-            skills = [s.lower() for s in data.get("skills", [])]
-            
-            cicd_tools = {
-                "enterprise_ci": {
-                    "Jenkins": ["jenkins", "jenkinsfile", "groovy pipeline", "blue ocean"],
-                    "GitLab CI": ["gitlab ci", "gitlab-ci.yml", ".gitlab-ci"],
-                    "Azure DevOps": ["azure devops", "azure pipelines", "yaml pipeline"]
-                },
-                "modern_ci": {
-                    "GitHub Actions": ["github actions", "workflow", ".github/workflows"],
-                    "CircleCI": ["circleci", "circle ci", ".circleci"],
-                    "Travis CI": ["travis", "travis ci", ".travis.yml"]
-                },
-                "practices": {
-                    "Pipeline Design": ["pipeline", "stages", "artifacts", "parallel execution"],
-                    "Testing": ["unit test", "integration test", "smoke test", "automated testing"],
-                    "Deployment": ["deployment", "blue-green", "canary", "rolling update", "rollback"]
-                }
-            }
-            
+            profile = CandidateProfile.from_input(input_data)
             cicd_profile = {}
             total_experience = 0
             
-            combined_text = " ".join(skills) + " " + experience
-            
-            for category, tools_list in cicd_tools.items():
+            for category, tools_list in CICD_TOOLS.items():
                 for tool, keywords in tools_list.items():
-                    if any(kw in combined_text for kw in keywords):
+                    if any(profile.contains("skills_and_experience", kw) for kw in keywords):
                         if category not in cicd_profile:
                             cicd_profile[category] = []
                         cicd_profile[category].append(tool)
@@ -301,7 +360,7 @@ class DevOpsEngineerAgent(FederalJobAgent):
             
             # Check for pipeline metrics
             metrics_pattern = r'\d+%?\s*(faster|reduction|improvement|automated|deployments)'
-            has_metrics = bool(re.search(metrics_pattern, experience))
+            has_metrics = bool(re.search(metrics_pattern, profile.experience))
             
             return json.dumps({
                 "cicd_experience": cicd_profile,
@@ -331,30 +390,20 @@ class DevOpsEngineerAgent(FederalJobAgent):
         """Assess containerization and orchestration skills"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            experience = data.get("experience", "").lower()
-            
-            container_tech = {
-                "containerization": ["docker", "dockerfile", "container", "docker-compose", "buildah", "podman"],
-                "orchestration": ["kubernetes", "k8s", "openshift", "helm", "kubectl", "pods", "deployments"],
-                "service_mesh": ["istio", "linkerd", "consul", "envoy", "service mesh"],
-                "registries": ["docker hub", "ecr", "acr", "harbor", "artifactory", "nexus"],
-                "security": ["container scanning", "vulnerability", "cve", "trivy", "clair", "twistlock"]
-            }
-            
+            profile = CandidateProfile.from_input(input_data)
             container_profile = {}
             skill_count = 0
             
-            for category, keywords in container_tech.items():
-                found = [kw for kw in keywords if kw in experience]
+            for category, keywords in CONTAINER_TECH.items():
+                found = profile.matches("experience", keywords)
                 if found:
                     container_profile[category] = found
                     skill_count += len(found)
             
             # Check for specific federal preferences
-            has_kubernetes = any(k in experience for k in ["kubernetes", "k8s"])
-            has_openshift = "openshift" in experience
-            has_docker = "docker" in experience
+            has_kubernetes = any(profile.contains("experience", k) for k in ["kubernetes", "k8s"])
+            has_openshift = profile.contains("experience", "openshift")
+            has_docker = profile.contains("experience", "docker")
             
             # Federal alignment (OpenShift is heavily used in DoD)
             if has_openshift:
@@ -372,6 +421,7 @@ class DevOpsEngineerAgent(FederalJobAgent):
                 "container_skills": container_profile,
                 "skill_count": skill_count,
                 "expertise_level": expertise_level,
+                "stated_experience": profile.stated_experience(),
                 "kubernetes": has_kubernetes,
                 "openshift": has_openshift,
                 "docker": has_docker,
@@ -398,45 +448,21 @@ class DevOpsEngineerAgent(FederalJobAgent):
         """Check cloud platform expertise"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            experience = data.get("experience", "").lower()
-            certifications = [c.lower() for c in data.get("certifications", [])]
-            
-            cloud_platforms = {
-                "AWS": {
-                    "services": ["ec2", "s3", "lambda", "rds", "eks", "fargate", "cloudformation"],
-                    "certs": ["aws certified", "solutions architect", "devops engineer", "sysops"]
-                },
-                "Azure": {
-                    "services": ["azure vm", "blob storage", "aks", "azure functions", "arm templates"],
-                    "certs": ["azure certified", "az-400", "azure devops", "azure administrator"]
-                },
-                "GCP": {
-                    "services": ["compute engine", "gke", "cloud storage", "cloud functions"],
-                    "certs": ["google cloud", "gcp certified", "cloud engineer"]
-                },
-                "Federal": {
-                    "services": ["govcloud", "azure government", "il4", "il5", "fedramp"],
-                    "certs": ["fedramp", "federal cloud"]
-                }
-            }
-            
+            profile = CandidateProfile.from_input(input_data)
             cloud_experience = {}
             total_platforms = 0
             has_govcloud = False
             
-            combined_text = experience + " " + " ".join(certifications)
-            
-            for platform, details in cloud_platforms.items():
+            for platform, details in CLOUD_PLATFORMS.items():
                 platform_found = False
                 
                 # Check services
-                services_found = [s for s in details["services"] if s in combined_text]
+                services_found = profile.matches("experience_and_certifications", details["services"])
                 if services_found:
                     platform_found = True
                     
                 # Check certifications
-                certs_found = [c for c in details["certs"] if c in combined_text]
+                certs_found = profile.matches("experience_and_certifications", details["certs"])
                 if certs_found:
                     platform_found = True
                 
@@ -488,36 +514,13 @@ class DevOpsEngineerAgent(FederalJobAgent):
         """Analyze infrastructure automation experience"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            experience = data.get("experience", "").lower()
-            skills = [s.lower() for s in data.get("skills", [])]
-            
-            automation_categories = {
-                "iac": {
-                    "Terraform": ["terraform", "hcl", "tfvars", "terraform modules"],
-                    "CloudFormation": ["cloudformation", "cfn", "sam", "cdk"],
-                    "ARM": ["arm template", "azure resource manager", "bicep"]
-                },
-                "config_mgmt": {
-                    "Ansible": ["ansible", "playbook", "ansible tower", "awx"],
-                    "Puppet": ["puppet", "puppet enterprise", "hiera"],
-                    "Chef": ["chef", "cookbook", "chef server", "inspec"]
-                },
-                "scripting": {
-                    "Python": ["python", "boto3", "python automation"],
-                    "PowerShell": ["powershell", "ps1", "psdsc"],
-                    "Bash": ["bash", "shell script", "linux automation"]
-                }
-            }
-            
+            profile = CandidateProfile.from_input(input_data)
             automation_profile = {}
             tool_count = 0
             
-            combined_text = " ".join(skills) + " " + experience
-            
-            for category, tools in automation_categories.items():
+            for category, tools in AUTOMATION_CATEGORIES.items():
                 for tool, keywords in tools.items():
-                    if any(kw in combined_text for kw in keywords):
+                    if any(profile.contains("skills_and_experience", kw) for kw in keywords):
                         if category not in automation_profile:
                             automation_profile[category] = []
                         automation_profile[category].append(tool)
@@ -529,7 +532,7 @@ class DevOpsEngineerAgent(FederalJobAgent):
             
             # Check for automation metrics
             metrics_pattern = r'\d+%?\s*(automated|reduction|faster|efficiency|saved)'
-            has_metrics = bool(re.search(metrics_pattern, experience))
+            has_metrics = bool(re.search(metrics_pattern, profile.experience))
             
             automation_maturity = "High" if tool_count >= 6 else "Medium" if tool_count >= 3 else "Low"
             
@@ -562,31 +565,20 @@ class DevOpsEngineerAgent(FederalJobAgent):
         """Validate DevSecOps and security practices"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            experience = data.get("experience", "").lower()
-            
-            security_practices = {
-                "scanning": ["sonarqube", "fortify", "checkmarx", "veracode", "sast", "dast", "iast"],
-                "container_security": ["twistlock", "aqua", "trivy", "clair", "anchore", "snyk"],
-                "secrets": ["vault", "hashicorp vault", "secrets management", "key management", "aws secrets"],
-                "compliance": ["compliance as code", "oscal", "scap", "stig", "cis benchmark", "nist"],
-                "monitoring": ["security monitoring", "siem", "splunk", "elk", "log analysis"],
-                "practices": ["shift left", "security gates", "devsecops", "security pipeline", "zero trust"]
-            }
-            
+            profile = CandidateProfile.from_input(input_data)
             security_profile = {}
             security_score = 0
             
-            for category, keywords in security_practices.items():
-                found = [kw for kw in keywords if kw in experience]
+            for category, keywords in SECURITY_PRACTICES.items():
+                found = profile.matches("experience", keywords)
                 if found:
                     security_profile[category] = found
                     security_score += len(found)
             
             # Check for federal security standards
-            has_stig = any(s in experience for s in ["stig", "security technical implementation"])
-            has_fedramp = "fedramp" in experience
-            has_nist = any(n in experience for n in ["nist", "800-53", "800-171"])
+            has_stig = any(profile.contains("experience", s) for s in STIG_TERMS)
+            has_fedramp = profile.contains("experience", "fedramp")
+            has_nist = any(profile.contains("experience", n) for n in NIST_TERMS)
             
             federal_compliance = has_stig or has_fedramp or has_nist
             
@@ -179,6 +179,83 @@ import json
 import re
 
 from ..base import FederalJobAgent, AgentResponse
+from ..candidate_profile import CandidateProfile, register_keywords
+
+# IT Specialty area indicators
+SPECIALTY_KEYWORDS = {
+    "INFOSEC": ["security", "vulnerability", "incident response", "siem", "firewall", "ids", "ips", "forensics"],
+    "SYSADMIN": ["server", "windows server", "linux", "vmware", "active directory", "group policy", "backup"],
+    "NETWORK": ["network", "cisco", "routing", "switching", "tcp/ip", "vlan", "vpn", "wan", "lan"],
+    "CUSTSPT": ["help desk", "ticket", "customer service", "troubleshoot", "support", "sla", "end user"],
+    "DATAMGT": ["database", "data management", "sql", "etl", "data warehouse", "reporting", "analytics"],
+    "INTERNET": ["web", "website", "html", "css", "javascript", "api", "rest", "content management"],
+    "SYSANALYSIS": ["requirements", "analysis", "design", "documentation", "process improvement", "workflow"],
+    "APPSW": ["application", "software development", "programming", "code", "testing", "deployment"]
+}
+
+SYSTEMS_AREAS = {
+    "windows": ["windows server", "active directory", "group policy", "exchange", "sharepoint", "iis", "wsus"],
+    "linux": ["linux", "rhel", "centos", "ubuntu", "debian", "bash", "shell scripting", "apache"],
+    "virtualization": ["vmware", "vsphere", "esxi", "hyper-v", "kvm", "virtual machine", "vdi"],
+    "cloud_systems": ["aws ec2", "azure vm", "iaas", "cloud migration", "hybrid cloud"],
+    "storage": ["san", "nas", "iscsi", "raid", "backup", "disaster recovery", "netapp", "emc"],
+    "monitoring": ["monitoring", "nagios", "zabbix", "scom", "performance", "capacity planning"],
+    "automation": ["powershell", "ansible", "puppet", "scripting", "automation", "gpo", "sccm"]
+}
+
+NETWORK_AREAS = {
+    "routing_switching": ["routing", "switching", "ospf", "bgp", "eigrp", "vlan", "stp", "vpc"],
+    "network_security": ["firewall", "vpn", "ipsec", "ssl vpn", "nat", "acl", "ids", "ips"],
+    "wireless": ["wireless", "wifi", "802.11", "wlan", "access point", "controller"],
+    "wan_tech": ["mpls", "sd-wan", "wan optimization", "qos", "voip", "sip"],
+    "vendors": ["cisco", "juniper", "palo alto", "fortinet", "aruba", "f5"],
+    "protocols": ["tcp/ip", "dns", "dhcp", "snmp", "ipv6", "multicast"]
+}
+
+NETWORK_CERTS = {
+    "ccna": "CCNA",
+    "ccnp": "CCNP",
+    "ccie": "CCIE",
+    "network+": "Network+",
+    "jncia": "JNCIA",
+    "jncis": "JNCIS"
+}
+
+SECURITY_DOMAINS = {
+    "incident_response": ["incident response", "soc", "csirt", "forensics", "malware analysis", "threat hunting"],
+    "vulnerability_mgmt": ["vulnerability", "scanning", "nessus", "qualys", "patch management", "remediation"],
+    "compliance": ["fisma", "nist", "800-53", "800-171", "fedramp", "stig", "hipaa", "pci"],
+    "identity_mgmt": ["identity", "iam", "sso", "mfa", "privileged access", "pam", "okta", "ping"],
+    "security_tools": ["siem", "splunk", "qradar", "edr", "crowdstrike", "carbon black", "firewall"],
+    "frameworks": ["zero trust", "defense in depth", "risk management", "rmf", "cybersecurity framework"]
+}
+
+SECURITY_CERTS = {
+    "cissp": "CISSP",
+    "security+": "Security+",
+    "cysa+": "CySA+",
+    "ceh": "CEH",
+    "gcih": "GCIH",
+    "gsec": "GSEC",
+    "casp": "CASP+"
+}
+
+SUPPORT_AREAS = {
+    "help_desk": ["help desk", "service desk", "tier 1", "tier 2", "tier 3", "desktop support"],
+    "ticketing": ["ticket", "servicenow", "remedy", "jira", "incident", "request", "change management"],
+    "customer_service": ["customer service", "customer satisfaction", "sla", "kpi", "metrics", "survey"],
+    "troubleshooting": ["troubleshoot", "diagnose", "resolve", "root cause", "problem solving"],
+    "documentation": ["documentation", "knowledge base", "kb article", "sop", "runbook", "training"],
+    "communication": ["communicate", "explain", "non-technical", "stakeholder", "briefing", "presentation"]
+}
+
+ITIL_TERMS = ["itil", "it service management", "itsm"]
+
+
+register_keywords("experience", SYSTEMS_AREAS, SUPPORT_AREAS, ITIL_TERMS, ["vmware"])
+register_keywords("skills_and_experience", SPECIALTY_KEYWORDS)
+register_keywords("experience_and_certifications", NETWORK_AREAS, list(NETWORK_CERTS),
+                  SECURITY_DOMAINS, list(SECURITY_CERTS), ["cisco"])
 
 
 class ITSpecialistAgent(FederalJobAgent):
@@ -277,57 +354,17 @@ class ITSpecialistAgent(FederalJobAgent):
         """Match experience to IT specialty areas"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            experience = data.get("experience", "").lower()
-            skills = [s.lower() for s in data.get("skills", [])]
-            
-            # IT Specialty area indicators
-            specialties = {
-                "INFOSEC": {
-                    "keywords": ["security", "vulnerability", "incident response", "siem", "firewall", "ids", "ips", "forensics"],
-                    "weight": 0
-                },
-                "SYSADMIN": {
-                    "keywords": ["server", "windows server", "linux", "vmware", "active directory", "group policy", "backup"],
-                    "weight": 0
-                },
-                "NETWORK": {
-                    "keywords": ["network", "cisco", "routing", "switching", "tcp/ip", "vlan", "vpn", "wan", "lan"],
-                    "weight": 0
-                },
-                "CUSTSPT": {
-                    "keywords": ["help desk", "ticket", "customer service", "troubleshoot", "support", "sla", "end user"],
-                    "weight": 0
-                },
-                "DATAMGT": {
-                    "keywords": ["database", "data management", "sql", "etl", "data warehouse", "reporting", "analytics"],
-                    "weight": 0
-                },
-                "INTERNET": {
-                    "keywords": ["web", "website", "html", "css", "javascript", "api", "rest", "content management"],
-                    "weight": 0
-                },
-                "SYSANALYSIS": {
-                    "keywords": ["requirements", "analysis", "design", "documentation", "process improvement", "workflow"],
-                    "weight": 0
-                },
-                "APPSW": {
-                    "keywords": ["application", "software development", "programming", "code", "testing", "deployment"],
-                    "weight": 0
-                }
-            }
-            
-            combined_text = " ".join(skills) + " " + experience
+            profile = CandidateProfile.from_input(input_data)
             
             # Calculate weights for each specialty
-            for specialty, info in specialties.items():
-                for keyword in info["keywords"]:
-                    if keyword in combined_text:
-                        info["weight"] += 1
+            weights = {
+                specialty: len(profile.matches("skills_and_experience", keywords))
+                for specialty, keywords in SPECIALTY_KEYWORDS.items()
+            }
             
             # Sort specialties by weight
             ranked_specialties = sorted(
-                [(s, info["weight"]) for s, info in specialties.items() if info["weight"] > 0],
+                [(s, weight) for s, weight in weights.items() if weight > 0],
                 key=lambda x: x[1],
                 reverse=True
             )
@@ -380,31 +417,19 @@ class ITSpecialistAgent(FederalJobAgent):
         """Evaluate systems administration experience"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            experience = data.get("experience", "").lower()
-            
-            systems_areas = {
-                "windows": ["windows server", "active directory", "group policy", "exchange", "sharepoint", "iis", "wsus"],
-                "linux": ["linux", "rhel", "centos", "ubuntu", "debian", "bash", "shell scripting", "apache"],
-                "virtualization": ["vmware", "vsphere", "esxi", "hyper-v", "kvm", "virtual machine", "vdi"],
-                "cloud_systems": ["aws ec2", "azure vm", "iaas", "cloud migration", "hybrid cloud"],
-                "storage": ["san", "nas", "iscsi", "raid", "backup", "disaster recovery", "netapp", "emc"],
-                "monitoring": ["monitoring", "nagios", "zabbix", "scom", "performance", "capacity planning"],
-                "automation": ["powershell", "ansible", "puppet", "scripting", "automation", "gpo", "sccm"]
-            }
-            
+            profile = CandidateProfile.from_input(input_data)
             systems_profile = {}
             total_skills = 0
             
-            for area, keywords in systems_areas.items():
-                found = [kw for kw in keywords if kw in experience]
+            for area, keywords in SYSTEMS_AREAS.items():
+                found = profile.matches("experience", keywords)
                 if found:
                     systems_profile[area] = found
                     total_skills += len(found)
             
             # Check for scale indicators
             scale_pattern = r'\d+\+?\s*(servers?|systems?|users|vms?|machines)'
-            scale_matches = re.findall(scale_pattern, experience)
+            scale_matches = re.findall(scale_pattern, profile.experience)
             has_scale = len(scale_matches) > 0
             
             # Determine expertise level
@@ -420,12 +445,13 @@ class ITSpecialistAgent(FederalJobAgent):
             # Check for federal preferences
             has_windows = bool(systems_profile.get("windows"))
             has_linux = bool(systems_profile.get("linux"))
-            has_vmware = "vmware" in experience
+            has_vmware = profile.contains("experience", "vmware")
             
             return json.dumps({
                 "systems_experience": systems_profile,
                 "skill_count": total_skills,
                 "expertise_level": expertise,
+                "stated_experience": profile.stated_experience(),
                 "manages_scale": has_scale,
                 "windows_admin": has_windows,
                 "linux_admin": has_linux,
@@ -454,56 +480,33 @@ class ITSpecialistAgent(FederalJobAgent):
         """Assess network administration capabilities"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            experience = data.get("experience", "").lower()
-            certifications = [c.lower() for c in data.get("certifications", [])]
-            
-            network_areas = {
-                "routing_switching": ["routing", "switching", "ospf", "bgp", "eigrp", "vlan", "stp", "vpc"],
-                "network_security": ["firewall", "vpn", "ipsec", "ssl vpn", "nat", "acl", "ids", "ips"],
-                "wireless": ["wireless", "wifi", "802.11", "wlan", "access point", "controller"],
-                "wan_tech": ["mpls", "sd-wan", "wan optimization", "qos", "voip", "sip"],
-                "vendors": ["cisco", "juniper", "palo alto", "fortinet", "aruba", "f5"],
-                "protocols": ["tcp/ip", "dns", "dhcp", "snmp", "ipv6", "multicast"]
-            }
-            
+            profile = CandidateProfile.from_input(input_data)
             network_profile = {}
             skill_count = 0
             
-            combined_text = experience + " " + " ".join(certifications)
-            
-            for area, keywords in network_areas.items():
-                found = [kw for kw in keywords if kw in combined_text]
+            for area, keywords in NETWORK_AREAS.items():
+                found = profile.matches("experience_and_certifications", keywords)
                 if found:
                     network_profile[area] = found
                     skill_count += len(found)
             
             # Check for certifications
-            network_certs = {
-                "ccna": "CCNA",
-                "ccnp": "CCNP",
-                "ccie": "CCIE",
-                "network+": "Network+",
-                "jncia": "JNCIA",
-                "jncis": "JNCIS"
-            }
-            
             found_certs = []
-            for cert_key, cert_name in network_certs.items():
-                if cert_key in combined_text:
+            for cert_key, cert_name in NETWORK_CERTS.items():
+                if profile.contains("experience_and_certifications", cert_key):
                     found_certs.append(cert_name)
             
             # Determine network expertise
-            if skill_count >= 12 or "ccie" in combined_text:
+            if skill_count >= 12 or profile.contains("experience_and_certifications", "ccie"):
                 network_level = "Network Architect"
-            elif skill_count >= 8 or "ccnp" in combined_text:
+            elif skill_count >= 8 or profile.contains("experience_and_certifications", "ccnp"):
                 network_level = "Senior Network Engineer"
-            elif skill_count >= 4 or "ccna" in combined_text:
+            elif skill_count >= 4 or profile.contains("experience_and_certifications", "ccna"):
                 network_level = "Network Engineer"
             else:
                 network_level = "Basic Networking"
             
-            has_cisco = "cisco" in combined_text
+            has_cisco = profile.contains("experience_and_certifications", "cisco")
             
             return json.dumps({
                 "network_skills": network_profile,
@@ -535,51 +538,27 @@ class ITSpecialistAgent(FederalJobAgent):
         """Check cybersecurity knowledge and practices"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            experience = data.get("experience", "").lower()
-            certifications = [c.lower() for c in data.get("certifications", [])]
-            
-            security_domains = {
-                "incident_response": ["incident response", "soc", "csirt", "forensics", "malware analysis", "threat hunting"],
-                "vulnerability_mgmt": ["vulnerability", "scanning", "nessus", "qualys", "patch management", "remediation"],
-                "compliance": ["fisma", "nist", "800-53", "800-171", "fedramp", "stig", "hipaa", "pci"],
-                "identity_mgmt": ["identity", "iam", "sso", "mfa", "privileged access", "pam", "okta", "ping"],
-                "security_tools": ["siem", "splunk", "qradar", "edr", "crowdstrike", "carbon black", "firewall"],
-                "frameworks": ["zero trust", "defense in depth", "risk management", "rmf", "cybersecurity framework"]
-            }
-            
+            profile = CandidateProfile.from_input(input_data)
             security_profile = {}
             security_score = 0
             
-            combined_text = experience + " " + " ".join(certifications)
-            
-            for domain, keywords in security_domains.items():
-                found = [kw for kw in keywords if kw in combined_text]
+            for domain, keywords in SECURITY_DOMAINS.items():
+                found = profile.matches("experience_and_certifications", keywords)
                 if found:
                     security_profile[domain] = found
                     security_score += len(found)
             
             # Check for security certifications
-            security_certs = {
-                "cissp": "CISSP",
-                "security+": "Security+",
-                "cysa+": "CySA+",
-                "ceh": "CEH",
-                "gcih": "GCIH",
-                "gsec": "GSEC",
-                "casp": "CASP+"
-            }
-            
             found_certs = []
-            for cert_key, cert_name in security_certs.items():
-                if cert_key in combined_text:
+            for cert_key, cert_name in SECURITY_CERTS.items():
+                if profile.contains("experience_and_certifications", cert_key):
                     found_certs.append(cert_name)
             
             # Check for federal compliance
             has_federal_compliance = bool(security_profile.get("compliance"))
             
             # Determine security level
-            if security_score >= 12 or "cissp" in combined_text:
+            if security_score >= 12 or profile.contains("experience_and_certifications", "cissp"):
                 security_level = "Senior Security Professional"
             elif security_score >= 8 or found_certs:
                 security_level = "Security Analyst"
@@ -618,33 +597,22 @@ class ITSpecialistAgent(FederalJobAgent):
         """Evaluate customer service and support experience"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            experience = data.get("experience", "").lower()
-            
-            support_areas = {
-                "help_desk": ["help desk", "service desk", "tier 1", "tier 2", "tier 3", "desktop support"],
-                "ticketing": ["ticket", "servicenow", "remedy", "jira", "incident", "request", "change management"],
-                "customer_service": ["customer service", "customer satisfaction", "sla", "kpi", "metrics", "survey"],
-                "troubleshooting": ["troubleshoot", "diagnose", "resolve", "root cause", "problem solving"],
-                "documentation": ["documentation", "knowledge base", "kb article", "sop", "runbook", "training"],
-                "communication": ["communicate", "explain", "non-technical", "stakeholder", "briefing", "presentation"]
-            }
-            
+            profile = CandidateProfile.from_input(input_data)
             support_profile = {}
             support_score = 0
             
-            for area, keywords in support_areas.items():
-                found = [kw for kw in keywords if kw in experience]
+            for area, keywords in SUPPORT_AREAS.items():
+                found = profile.matches("experience", keywords)
                 if found:
                     support_profile[area] = found
                     support_score += len(found)
             
             # Check for metrics
             metrics_pattern = r'\d+%?\s*(satisfaction|resolution|tickets?|calls?|users?)'
-            has_metrics = bool(re.search(metrics_pattern, experience))
+            has_metrics = bool(re.search(metrics_pattern, profile.experience))
             
             # Check for ITIL
-            has_itil = any(term in experience for term in ["itil", "it service management", "itsm"])
+            has_itil = any(profile.contains("experience", term) for term in ITIL_TERMS)
             
             # Determine support level
             if support_score >= 10 and has_itil:
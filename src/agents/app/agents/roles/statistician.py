@@ -127,6 +127,83 @@ import json
 import re
 
 from ..base import FederalJobAgent, AgentResponse
+from ..candidate_profile import CandidateProfile, register_keywords
+
+METHODOLOGIES = {
+    "regression": ["linear regression", "logistic", "glm", "mixed models", "hierarchical"],
+    "hypothesis_testing": ["t-test", "anova", "chi-square", "fisher", "bonferroni"],
+    "time_series": ["arima", "arma", "forecasting", "seasonal", "trend analysis"],
+    "sampling": ["stratified", "cluster", "systematic", "probability", "weighting"],
+    "bayesian": ["bayesian", "mcmc", "prior", "posterior", "gibbs"],
+    "multivariate": ["pca", "factor analysis", "discriminant", "manova", "canonical"],
+    "nonparametric": ["mann-whitney", "wilcoxon", "kruskal", "spearman", "kendall"],
+    "experimental": ["design of experiments", "randomized", "factorial", "blocking"]
+}
+
+SURVEY_KEYWORDS = {
+    "design": ["questionnaire", "survey design", "instrument", "validation", "pilot"],
+    "sampling": ["sample size", "sampling frame", "response rate", "non-response", "weights"],
+    "collection": ["cati", "capi", "web survey", "mail survey", "field work"],
+    "quality": ["data quality", "editing", "imputation", "disclosure", "confidentiality"],
+    "federal": ["census", "acs", "cps", "nhis", "nhanes", "brfss"]
+}
+
+FEDERAL_SURVEYS = ["census", "american community survey", "current population survey",
+                   "national health interview survey", "nhanes", "brfss"]
+
+# Federal agencies' preferred software
+SOFTWARE_TIERS = {
+    "critical": {
+        "SAS": ["sas", "proc sql", "sas macro", "sas/stat"],
+        "R": ["r programming", "rstudio", "tidyverse", "ggplot"],
+        "Python": ["python", "pandas", "scipy", "statsmodels"]
+    },
+    "important": {
+        "SPSS": ["spss", "spss syntax"],
+        "Stata": ["stata", "stata programming"],
+        "SQL": ["sql", "postgresql", "mysql", "oracle"]
+    },
+    "valuable": {
+        "Tableau": ["tableau", "data visualization"],
+        "Excel": ["excel", "vba", "pivot tables"],
+        "MATLAB": ["matlab", "statistical toolbox"]
+    }
+}
+
+RESEARCH_INDICATORS = {
+    "peer_reviewed": ["journal", "peer-reviewed", "published", "forthcoming"],
+    "government": ["technical report", "statistical brief", "working paper", "bulletin"],
+    "conference": ["conference", "proceedings", "presentation", "poster"],
+    "methodology": ["methodology", "methods", "technique", "algorithm"],
+    "policy": ["policy", "evaluation", "assessment", "impact"]
+}
+
+AGENCY_PROFILES = {
+    "census": {
+        "keywords": ["population", "demographic", "survey", "acs", "decennial", "geography"],
+        "focus": "Population statistics and survey methodology"
+    },
+    "bls": {
+        "keywords": ["employment", "labor", "wages", "cpi", "inflation", "productivity"],
+        "focus": "Labor economics and price statistics"
+    },
+    "nchs": {
+        "keywords": ["health", "vital", "mortality", "disease", "surveillance", "epidemiology"],
+        "focus": "Health statistics and vital records"
+    },
+    "bea": {
+        "keywords": ["gdp", "economic", "accounts", "trade", "regional", "input-output"],
+        "focus": "Economic accounts and regional analysis"
+    },
+    "usda": {
+        "keywords": ["agriculture", "farm", "rural", "food", "nutrition", "crop"],
+        "focus": "Agricultural economics and rural statistics"
+    }
+}
+
+register_keywords("experience", METHODOLOGIES, SURVEY_KEYWORDS, FEDERAL_SURVEYS,
+                  [p["keywords"] for p in AGENCY_PROFILES.values()])
+register_keywords("skills_and_experience", SOFTWARE_TIERS)
 
 
 class StatisticianAgent(FederalJobAgent):
@@ -216,25 +293,12 @@ class StatisticianAgent(FederalJobAgent):
         """Evaluate statistical methodology experience"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            experience = data.get("experience", "").lower()
-            
-            methodologies = {
-                "regression": ["linear regression", "logistic", "glm", "mixed models", "hierarchical"],
-                "hypothesis_testing": ["t-test", "anova", "chi-square", "fisher", "bonferroni"],
-                "time_series": ["arima", "arma", "forecasting", "seasonal", "trend analysis"],
-                "sampling": ["stratified", "cluster", "systematic", "probability", "weighting"],
-                "bayesian": ["bayesian", "mcmc", "prior", "posterior", "gibbs"],
-                "multivariate": ["pca", "factor analysis", "discriminant", "manova", "canonical"],
-                "nonparametric": ["mann-whitney", "wilcoxon", "kruskal", "spearman", "kendall"],
-                "experimental": ["design of experiments", "randomized", "factorial", "blocking"]
-            }
-            
+            profile = CandidateProfile.from_input(input_data)
             found_methods = {}
             expertise_score = 0
             
-            for category, methods in methodologies.items():
-                found = [m for m in methods if m in experience]
+            for category, methods in METHODOLOGIES.items():
+                found = profile.matches("experience", methods)
                 if found:
                     found_methods[category] = found
                     expertise_score += len(found)
@@ -253,6 +317,7 @@ class StatisticianAgent(FederalJobAgent):
                 "methodologies_found": found_methods,
                 "expertise_score": expertise_score,
                 "expertise_level": level,
+                "stated_experience": profile.stated_experience(),
                 "recommendation": self._get_methodology_recommendation(level, found_methods)
             })
             
@@ -275,31 +340,18 @@ class StatisticianAgent(FederalJobAgent):
         """Assess survey design and sampling experience"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            experience = data.get("experience", "").lower()
-            
-            survey_keywords = {
-                "design": ["questionnaire", "survey design", "instrument", "validation", "pilot"],
-                "sampling": ["sample size", "sampling frame", "response rate", "non-response", "weights"],
-                "collection": ["cati", "capi", "web survey", "mail survey", "field work"],
-                "quality": ["data quality", "editing", "imputation", "disclosure", "confidentiality"],
-                "federal": ["census", "acs", "cps", "nhis", "nhanes", "brfss"]
-            }
-            
+            profile = CandidateProfile.from_input(input_data)
             survey_experience = {}
             total_keywords = 0
             
-            for category, keywords in survey_keywords.items():
-                found = [k for k in keywords if k in experience]
+            for category, keywords in SURVEY_KEYWORDS.items():
+                found = profile.matches("experience", keywords)
                 if found:
                     survey_experience[category] = found
                     total_keywords += len(found)
             
             # Check for specific federal survey experience
-            federal_surveys = ["census", "american community survey", "current population survey",
-                             "national health interview survey", "nhanes", "brfss"]
-            
-            federal_exp = [s for s in federal_surveys if s in experience]
+            federal_exp = profile.matches("experience", FEDERAL_SURVEYS)
             
             return json.dumps({
                 "survey_experience": survey_experience,
@@ -316,37 +368,13 @@ class StatisticianAgent(FederalJobAgent):
         """Check proficiency in statistical software"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            skills = [s.lower() for s in data.get("skills", [])]
-            experience = data.get("experience", "").lower()
-            
-            # Federal agencies' preferred software
-            software_tiers = {
-                "critical": {
-                    "SAS": ["sas", "proc sql", "sas macro", "sas/stat"],
-                    "R": ["r programming", "rstudio", "tidyverse", "ggplot"],
-                    "Python": ["python", "pandas", "scipy", "statsmodels"]
-                },
-                "important": {
-                    "SPSS": ["spss", "spss syntax"],
-                    "Stata": ["stata", "stata programming"],
-                    "SQL": ["sql", "postgresql", "mysql", "oracle"]
-                },
-                "valuable": {
-                    "Tableau": ["tableau", "data visualization"],
-                    "Excel": ["excel", "vba", "pivot tables"],
-                    "MATLAB": ["matlab", "statistical toolbox"]
-                }
-            }
-            
+            profile = CandidateProfile.from_input(input_data)
             proficiency = {}
             software_score = 0
             
-            combined_text = " ".join(skills) + " " + experience
-            
-            for tier, software_list in software_tiers.items():
+            for tier, software_list in SOFTWARE_TIERS.items():
                 for software, keywords in software_list.items():
-                    if any(kw in combined_text for kw in keywords):
+                    if any(profile.contains("skills_and_experience", kw) for kw in keywords):
                         proficiency[software] = tier
                         software_score += 3 if tier == "critical" else 2 if tier == "important" else 1
             
@@ -383,18 +411,7 @@ class StatisticianAgent(FederalJobAgent):
         """Evaluate research and publication record"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            publications = data.get("publications", [])
-            experience = data.get("experience", "")
-            
-            research_indicators = {
-                "peer_reviewed": ["journal", "peer-reviewed", "published", "forthcoming"],
-                "government": ["technical report", "statistical brief", "working paper", "bulletin"],
-                "conference": ["conference", "proceedings", "presentation", "poster"],
-                "methodology": ["methodology", "methods", "technique", "algorithm"],
-                "policy": ["policy", "evaluation", "assessment", "impact"]
-            }
-            
+            publications = CandidateProfile.from_input(input_data).publications
             research_profile = {
                 "total_publications": len(publications),
                 "research_types": [],
@@ -403,10 +420,8 @@ class StatisticianAgent(FederalJobAgent):
             }
             
             # Analyze publications
-            for pub in publications:
-                pub_text = (pub.get("title", "") + " " + pub.get("venue", "")).lower()
-                
-                for category, keywords in research_indicators.items():
+            for _, pub_text in publications:
+                for category, keywords in RESEARCH_INDICATORS.items():
                     if any(kw in pub_text for kw in keywords):
                         if category not in research_profile["research_types"]:
                             research_profile["research_types"].append(category)
@@ -450,37 +465,12 @@ class StatisticianAgent(FederalJobAgent):
         """Match experience to specific agency needs"""
         
         try:
-            data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            experience = data.get("experience", "").lower()
-            target_agency = data.get("target_agency", "").lower()
-            
-            agency_profiles = {
-                "census": {
-                    "keywords": ["population", "demographic", "survey", "acs", "decennial", "geography"],
-                    "focus": "Population statistics and survey methodology"
-                },
-                "bls": {
-                    "keywords": ["employment", "labor", "wages", "cpi", "inflation", "productivity"],
-                    "focus": "Labor economics and price statistics"
-                },
-                "nchs": {
-                    "keywords": ["health", "vital", "mortality", "disease", "surveillance", "epidemiology"],
-                    "focus": "Health statistics and vital records"
-                },
-                "bea": {
-                    "keywords": ["gdp", "economic", "accounts", "trade", "regional", "input-output"],
-                    "focus": "Economic accounts and regional analysis"
-                },
-                "usda": {
-                    "keywords": ["agriculture", "farm", "rural", "food", "nutrition", "crop"],
-                    "focus": "Agricultural economics and rural statistics"
-                }
-            }
-            
+            candidate = CandidateProfile.from_input(input_data)
+            target_agency = candidate.target_agency
             matches = {}
             
-            for agency, profile in agency_profiles.items():
-                keyword_matches = sum(1 for kw in profile["keywords"] if kw in experience)
+            for agency, profile in AGENCY_PROFILES.items():
+                keyword_matches = len(candidate.matches("experience", profile["keywords"]))
                 if keyword_matches > 0:
                     matches[agency] = {
                         "match_count": keyword_matches,
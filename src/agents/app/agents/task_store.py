@@ -0,0 +1,199 @@
+"""
+Durable Task Store for the Claude Code Controller
+SQLite (WAL) record of every task the controller accepts: its request, each
+status transition, and its result, so tasks survive a restart and can be
+listed by status, agent and time range
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_STORE_PATH = Path(__file__).parent.parent.parent.parent / ".cache" / "tasks" / "tasks.sqlite"
+
+# Results larger than this (serialized JSON) are stored truncated
+DEFAULT_MAX_RESULT_BYTES = int(os.getenv("TASK_RESULT_MAX_BYTES", str(256 * 1024)))
+
+# Allowed status transitions; running -> pending is a task interrupted by a restart
+TRANSITIONS = {
+    "pending": {"running", "cancelled"},
+    "running": {"completed", "failed", "cancelled", "pending"},
+    "completed": set(),
+    "failed": set(),
+    "cancelled": set(),
+}
+
+
+class TaskStore:
+    """
+    SQLite-backed task table plus an append-only log of status transitions
+
+    Every write is one short transaction, so a crash loses at most the
+    transition in flight. On startup `recover()` returns interrupted
+    `running` tasks to `pending` and hands back everything pending to resume.
+    """
+
+    def __init__(self, db_path: Path = DEFAULT_STORE_PATH, max_result_bytes: int = DEFAULT_MAX_RESULT_BYTES):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_result_bytes = max_result_bytes
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                task_id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                agent TEXT,
+                status TEXT NOT NULL,
+                request TEXT NOT NULL,
+                result TEXT,
+                result_bytes INTEGER NOT NULL DEFAULT 0,
+                result_truncated INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS task_events (
+                task_id TEXT NOT NULL,
+                status TEXT NOT NULL,
+                at REAL NOT NULL,
+                detail TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_tasks_status_created ON tasks (status, created_at);
+            CREATE INDEX IF NOT EXISTS idx_tasks_agent_created ON tasks (agent, created_at);
+            CREATE INDEX IF NOT EXISTS idx_tasks_created ON tasks (created_at);
+            CREATE INDEX IF NOT EXISTS idx_task_events_task ON task_events (task_id, at);
+        """)
+        self._conn.commit()
+
+    def create(self, kind: str, request: Dict[str, Any], agent: Optional[str] = None,
+               task_id: Optional[str] = None) -> str:
+        """Record a new pending task and return its id"""
+        task_id = task_id or uuid.uuid4().hex
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO tasks (task_id, kind, agent, status, request, created_at, updated_at) "
+                "VALUES (?, ?, ?, 'pending', ?, ?, ?)",
+                (task_id, kind, agent, json.dumps(request, default=str), now, now)
+            )
+            self._conn.execute("INSERT INTO task_events (task_id, status, at) VALUES (?, 'pending', ?)",
+                               (task_id, now))
+        return task_id
+
+    def transition(self, task_id: str, status: str, result: Any = None, error: Optional[str] = None,
+                   detail: Optional[str] = None) -> None:
+        """Move a task to `status`, storing its result or error; raises ValueError on illegal moves"""
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT status FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+            if row is None:
+                raise ValueError(f"Unknown task: {task_id}")
+            if status not in TRANSITIONS.get(row["status"], ()):
+                raise ValueError(f"Task {task_id} cannot move from {row['status']} to {status}")
+
+            fields = {"status": status, "updated_at": now}
+            if status == "running":
+                self._conn.execute("UPDATE tasks SET attempts = attempts + 1 WHERE task_id = ?", (task_id,))
+            if result is not None:
+                fields["result"], fields["result_bytes"], fields["result_truncated"] = self._cap(result)
+            if error is not None:
+                fields["error"] = error
+            self._conn.execute(
+                f"UPDATE tasks SET {', '.join(f'{name} = ?' for name in fields)} WHERE task_id = ?",
+                (*fields.values(), task_id)
+            )
+            self._conn.execute("INSERT INTO task_events (task_id, status, at, detail) VALUES (?, ?, ?, ?)",
+                               (task_id, status, now, detail or error))
+
+    def _cap(self, result: Any) -> Tuple[str, int, int]:
+        """Serialized result, its full size, and whether it was cut to max_result_bytes"""
+        encoded = json.dumps(result, default=str).encode("utf-8")
+        if len(encoded) <= self.max_result_bytes:
+            return encoded.decode("utf-8"), len(encoded), 0
+        return encoded[:self.max_result_bytes].decode("utf-8", errors="ignore"), len(encoded), 1
+
+    def get(self, task_id: str, events: bool = True) -> Optional[Dict[str, Any]]:
+        """One task with its transition history"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+            if row is None:
+                return None
+            task = self._to_dict(row)
+            if events:
+                task["events"] = [
+                    dict(event) for event in self._conn.execute(
+                        "SELECT status, at, detail FROM task_events WHERE task_id = ? ORDER BY at, rowid", (task_id,)
+                    )
+                ]
+        return task
+
+    def list_tasks(self, status: Optional[str] = None, agent: Optional[str] = None,
+                   since: Optional[float] = None, until: Optional[float] = None,
+                   limit: int = 50, offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """Newest-first page of tasks matching the filters, and the total number that match"""
+        clauses, params = [], []
+        for column, op, value in (("status", "=", status), ("agent", "=", agent),
+                                  ("created_at", ">=", since), ("created_at", "<", until)):
+            if value is not None:
+                clauses.append(f"{column} {op} ?")
+                params.append(value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM tasks {where}", params).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT * FROM tasks {where} ORDER BY created_at DESC, rowid DESC LIMIT ? OFFSET ?",
+                (*params, max(0, min(limit, 500)), max(0, offset))
+            ).fetchall()
+        return [self._to_dict(row, result=False) for row in rows], total
+
+    def recover(self) -> List[Dict[str, Any]]:
+        """Return tasks interrupted while running to pending; list every pending task, oldest first"""
+        with self._lock:
+            interrupted = [row["task_id"] for row in
+                           self._conn.execute("SELECT task_id FROM tasks WHERE status = 'running'")]
+            for task_id in interrupted:
+                self.transition(task_id, "pending", detail="interrupted by restart")
+            rows = self._conn.execute(
+                "SELECT * FROM tasks WHERE status = 'pending' ORDER BY created_at, rowid"
+            ).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        """Number of tasks per status"""
+        with self._lock:
+            return {row["status"]: row["n"] for row in
+                    self._conn.execute("SELECT status, COUNT(*) AS n FROM tasks GROUP BY status")}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row, result: bool = True) -> Dict[str, Any]:
+        task = {
+            "task_id": row["task_id"],
+            "kind": row["kind"],
+            "agent": row["agent"],
+            "status": row["status"],
+            "request": json.loads(row["request"]),
+            "error": row["error"],
+            "attempts": row["attempts"],
+            "result_bytes": row["result_bytes"],
+            "result_truncated": bool(row["result_truncated"]),
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+        }
+        if result and row["result"] is not None:
+            task["result"] = row["result"] if row["result_truncated"] else json.loads(row["result"])
+        return task
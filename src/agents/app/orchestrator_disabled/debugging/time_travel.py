@@ -9,7 +9,8 @@ Advanced debugging features using LangGraph's SqliteSaver for persistent checkpo
 - Temporal workflow analysis
 
 Key Features:
-- Persistent checkpoint storage with SQLite
+- Persistent checkpoint storage with SQLite (content-addressed snapshots,
+  JSON-patch deltas between them, batched writes)
 - State replay from any point in workflow execution
 - Diff analysis between checkpoints
 - Performance bottleneck identification
@@ -26,14 +27,15 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from enum import Enum
-import pickle
-import hashlib
+import itertools
 from contextlib import asynccontextmanager
 
 from langgraph.graph import StateGraph
 from langgraph.checkpoint.sqlite import SqliteSaver
 from langchain_core.runnables import RunnableConfig
 
+from ...agents.checkpoint_store import DEFAULT_BATCH_SIZE, DEFAULT_SNAPSHOT_INTERVAL, CheckpointStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -80,6 +82,7 @@ class StateDiff:
     modified_keys: List[str]
     value_changes: Dict[str, Dict[str, Any]]
     timestamp: datetime
+    patch: Optional[List[Dict[str, Any]]] = None  # JSON patch from -> to (detailed analysis)
 
 
 @dataclass 
@@ -102,7 +105,8 @@ class TimeTravel:
     checkpoint comparison, and performance profiling.
     """
     
-    def __init__(self, db_path: str = "debugging/time_travel.sqlite", debug_level: DebugLevel = DebugLevel.STANDARD):
+    def __init__(self, db_path: str = "debugging/time_travel.sqlite", debug_level: DebugLevel = DebugLevel.STANDARD,
+                 batch_size: int = DEFAULT_BATCH_SIZE, snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL):
         """Initialize time travel debugging system"""
         
         self.debug_level = debug_level
@@ -111,14 +115,21 @@ class TimeTravel:
         
         # Initialize SQLite connections
         self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
         self.checkpointer = SqliteSaver(self.conn)
         
         # Create additional debugging tables
         self._initialize_debug_tables()
         
+        # Checkpoint states: snapshots/deltas, committed in batches with the metadata rows
+        self.state_store = CheckpointStore(self.conn, batch_size=batch_size, snapshot_interval=snapshot_interval)
+        
         # In-memory caches for performance
         self.checkpoint_cache: Dict[str, CheckpointMetadata] = {}
-        self.state_cache: Dict[str, Dict[str, Any]] = {}
+        # Latest checkpoint per thread: the delta base when no parent is given
+        self.thread_heads: Dict[str, str] = {}
+        self._sequence = itertools.count()
         
         logger.info(f"Time travel debugging initialized (level={debug_level.value}, db={db_path})")
     
@@ -143,6 +154,10 @@ class TimeTravel:
                 FOREIGN KEY (parent_checkpoint) REFERENCES checkpoint_metadata (checkpoint_id)
             )
         """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_checkpoint_metadata_thread
+            ON checkpoint_metadata (thread_id, timestamp)
+        """)
         
         # State diffs table
         cursor.execute("""
@@ -193,17 +208,6 @@ class TimeTravel:
         self.conn.commit()
         logger.info("Debug tables initialized")
     
-    def _calculate_state_hash(self, state: Dict[str, Any]) -> str:
-        """Calculate hash of state for change detection"""
-        
-        try:
-            # Create a deterministic string representation
-            state_str = json.dumps(state, sort_keys=True, default=str)
-            return hashlib.md5(state_str.encode()).hexdigest()
-        except Exception as e:
-            logger.warning(f"Could not hash state: {e}")
-            return f"hash_error_{datetime.utcnow().timestamp()}"
-    
     async def create_checkpoint(
         self,
         thread_id: str,
@@ -215,11 +219,15 @@ class TimeTravel:
         performance_metrics: Optional[Dict[str, Any]] = None,
         parent_checkpoint: Optional[str] = None
     ) -> str:
-        """Create a new debugging checkpoint"""
+        """Create a new debugging checkpoint (queued; committed with its batch)"""
         
-        checkpoint_id = f"{thread_id}_{event_type.value}_{datetime.utcnow().timestamp()}"
         timestamp = datetime.utcnow()
-        state_hash = self._calculate_state_hash(state)
+        checkpoint_id = f"{thread_id}_{event_type.value}_{timestamp.timestamp()}_{next(self._sequence)}"
+        
+        # Stored as a delta against the parent (or the thread's previous checkpoint)
+        base_id = parent_checkpoint or self.thread_heads.get(thread_id)
+        state_hash = self.state_store.put(checkpoint_id, state, base_id=base_id)
+        self.thread_heads[thread_id] = checkpoint_id
         
         metadata = CheckpointMetadata(
             checkpoint_id=checkpoint_id,
@@ -235,8 +243,7 @@ class TimeTravel:
         )
         
         # Store in database
-        cursor = self.conn.cursor()
-        cursor.execute("""
+        self.state_store.defer("""
             INSERT INTO checkpoint_metadata VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, (
             checkpoint_id, thread_id, timestamp.isoformat(), event_type.value,
@@ -244,13 +251,12 @@ class TimeTravel:
             debug_notes, parent_checkpoint
         ))
         
-        self.conn.commit()
-        
         # Cache for performance
         self.checkpoint_cache[checkpoint_id] = metadata
         
-        if self.debug_level in [DebugLevel.VERBOSE, DebugLevel.EXHAUSTIVE]:
-            self.state_cache[checkpoint_id] = state.copy()
+        # Workflow ends and errors are committed right away rather than with the batch
+        if event_type in (CheckpointEvent.WORKFLOW_COMPLETE, CheckpointEvent.ERROR_OCCURRED):
+            self.state_store.flush()
         
         logger.debug(f"Created checkpoint {checkpoint_id} for {workflow_type}:{phase}")
         return checkpoint_id
@@ -322,7 +328,7 @@ class TimeTravel:
         state_from = await self._get_state_at_checkpoint(checkpoint_from)
         state_to = await self._get_state_at_checkpoint(checkpoint_to)
         
-        if not state_from or not state_to:
+        if state_from is None or state_to is None:
             raise ValueError("Could not retrieve states for comparison")
         
         # Calculate differences
@@ -355,7 +361,8 @@ class TimeTravel:
             removed_keys=removed_keys,
             modified_keys=modified_keys,
             value_changes=value_changes,
-            timestamp=datetime.utcnow()
+            timestamp=datetime.utcnow(),
+            patch=self.state_store.diff(checkpoint_from, checkpoint_to) if detailed_analysis else None
         )
         
         # Store diff in database
@@ -427,6 +434,7 @@ class TimeTravel:
         session_id = f"debug_{thread_id}_{datetime.utcnow().timestamp()}"
         debug_level = debug_level or self.debug_level
         
+        self.state_store.flush()
         cursor = self.conn.cursor()
         cursor.execute("""
             INSERT INTO debug_sessions VALUES (?, ?, ?, ?, ?, ?, ?)
@@ -448,6 +456,7 @@ class TimeTravel:
     ) -> List[CheckpointMetadata]:
         """Get timeline of checkpoints for a workflow"""
         
+        self.state_store.flush()
         cursor = self.conn.cursor()
         
         query = "SELECT * FROM checkpoint_metadata WHERE thread_id = ?"
@@ -491,6 +500,7 @@ class TimeTravel:
         if checkpoint_id in self.checkpoint_cache:
             return self.checkpoint_cache[checkpoint_id]
         
+        self.state_store.flush()
         cursor = self.conn.cursor()
         cursor.execute("SELECT * FROM checkpoint_metadata WHERE checkpoint_id = ?", (checkpoint_id,))
         row = cursor.fetchone()
@@ -544,11 +554,16 @@ class TimeTravel:
         logger.info(f"Created branch checkpoint {branch_checkpoint_id}")
         return branch_checkpoint_id
     
+    def flush(self):
+        """Commit checkpoints still queued for the current batch"""
+        self.state_store.flush()
+    
     async def cleanup_old_checkpoints(self, days_to_keep: int = 30):
         """Clean up old checkpoints to manage database size"""
         
         cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
         
+        self.state_store.flush()
         cursor = self.conn.cursor()
         
         # Count checkpoints to be deleted
@@ -562,7 +577,14 @@ class TimeTravel:
             logger.info("No old checkpoints to clean up")
             return
         
-        # Delete old checkpoints and related data
+        # Delete old checkpoints and related data; newer deltas based on them become snapshots
+        old_ids = [row[0] for row in cursor.execute(
+            "SELECT checkpoint_id FROM checkpoint_metadata WHERE timestamp < ?", (cutoff_date.isoformat(),)
+        )]
+        self.state_store.delete(old_ids)
+        self.thread_heads = {
+            thread_id: head for thread_id, head in self.thread_heads.items() if head not in set(old_ids)
+        }
         cursor.execute("DELETE FROM state_diffs WHERE timestamp < ?", (cutoff_date.isoformat(),))
         cursor.execute("DELETE FROM performance_profiles WHERE timestamp < ?", (cutoff_date.isoformat(),))
         cursor.execute("DELETE FROM checkpoint_metadata WHERE timestamp < ?", (cutoff_date.isoformat(),))
@@ -571,31 +593,16 @@ class TimeTravel:
         
         # Clear caches
         self.checkpoint_cache.clear()
-        self.state_cache.clear()
         
         logger.info(f"Cleaned up {count} old checkpoints older than {days_to_keep} days")
     
     # Helper methods
     
     async def _get_state_at_checkpoint(self, checkpoint_id: str) -> Optional[Dict[str, Any]]:
-        """Get the workflow state at a specific checkpoint"""
-        
-        # Check cache first
-        if checkpoint_id in self.state_cache:
-            return self.state_cache[checkpoint_id]
-        
-        # Get from checkpointer
-        metadata = await self.get_checkpoint_metadata(checkpoint_id)
-        if not metadata:
-            return None
+        """Get the workflow state at a specific checkpoint (exactly as stored)"""
         
         try:
-            config = RunnableConfig(
-                configurable={"thread_id": metadata.thread_id}
-            )
-            # This would need to be implemented based on how states are stored
-            # For now, return empty state
-            return {}
+            return self.state_store.get(checkpoint_id)
         except Exception as e:
             logger.error(f"Could not retrieve state for checkpoint {checkpoint_id}: {e}")
             return None
@@ -674,8 +681,7 @@ class TimeTravel:
     async def _store_state_diff(self, diff: StateDiff):
         """Store state diff in database"""
         
-        cursor = self.conn.cursor()
-        cursor.execute("""
+        self.state_store.defer("""
             INSERT INTO state_diffs 
             (checkpoint_from, checkpoint_to, added_keys, removed_keys, modified_keys, value_changes, timestamp)
             VALUES (?, ?, ?, ?, ?, ?, ?)
@@ -688,14 +694,11 @@ class TimeTravel:
             json.dumps(diff.value_changes),
             diff.timestamp.isoformat()
         ))
-        
-        self.conn.commit()
     
     async def _store_performance_profile(self, profile: PerformanceProfile):
         """Store performance profile in database"""
         
-        cursor = self.conn.cursor()
-        cursor.execute("""
+        self.state_store.defer("""
             INSERT INTO performance_profiles
             (start_checkpoint, end_checkpoint, duration_ms, memory_usage_mb, 
              agent_execution_times, bottlenecks, recommendations, timestamp)
@@ -710,8 +713,6 @@ class TimeTravel:
             json.dumps(profile.recommendations),
             datetime.utcnow().isoformat()
         ))
-        
-        self.conn.commit()
     
     async def _get_debug_breakpoints(self, thread_id: str) -> List[str]:
         """Get debug breakpoints for a thread"""
@@ -758,6 +759,7 @@ async def debug_session(
         yield session_id
     finally:
         # End debug session
+        time_travel.flush()
         cursor = time_travel.conn.cursor()
         cursor.execute(
             "UPDATE debug_sessions SET end_time = ? WHERE session_id = ?",
@@ -13,6 +13,7 @@ from datetime import datetime
 from enum import Enum
 
 # Import the enhanced factory
+from ..agents.dag_scheduler import DEFAULT_MAX_CONCURRENCY, DAGScheduler
 from ..agents.enhanced_factory import EnhancedAgentFactory
 
 # Configure logging
@@ -71,9 +72,11 @@ class TeamState(TypedDict):
 class VirtualTeamOrchestrator:
     """Orchestrates virtual development team using LangGraph"""
     
-    def __init__(self, factory: Optional[EnhancedAgentFactory] = None):
+    def __init__(self, factory: Optional[EnhancedAgentFactory] = None,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
         """Initialize the orchestrator"""
         self.factory = factory or EnhancedAgentFactory()
+        self.scheduler = DAGScheduler(max_concurrency=max_concurrency)
         self.checkpointer = MemorySaver()
         self.workflow = self._build_workflow()
         self.active_tasks: Dict[str, TeamState] = {}
@@ -90,6 +93,7 @@ class VirtualTeamOrchestrator:
         workflow.add_node("check_dependencies", self.check_dependencies)
         workflow.add_node("execute_parallel", self.execute_parallel)
         workflow.add_node("execute_sequential", self.execute_sequential)
+        workflow.add_node("execute_dag", self.execute_dag)
         workflow.add_node("review_results", self.review_results)
         workflow.add_node("human_review", self.human_review)
         workflow.add_node("integrate_work", self.integrate_work)
@@ -108,13 +112,15 @@ class VirtualTeamOrchestrator:
             {
                 "parallel": "execute_parallel",
                 "sequential": "execute_sequential",
+                "dag": "execute_dag",
                 "error": "handle_errors"
             }
         )
         
-        # Both execution paths lead to review
+        # All execution paths lead to review
         workflow.add_edge("execute_parallel", "review_results")
         workflow.add_edge("execute_sequential", "review_results")
+        workflow.add_edge("execute_dag", "review_results")
         
         # Conditional routing after review
         workflow.add_conditional_edges(
@@ -297,7 +303,7 @@ class VirtualTeamOrchestrator:
         state["progress"] = 25.0
         return state
     
-    def execution_strategy(self, state: TeamState) -> Literal["parallel", "sequential", "error"]:
+    def execution_strategy(self, state: TeamState) -> Literal["parallel", "sequential", "dag", "error"]:
         """Determine execution strategy based on dependencies"""
         if state["errors"]:
             return "error"
@@ -309,8 +315,8 @@ class VirtualTeamOrchestrator:
         )
         
         if has_dependencies:
-            logger.info("Sequential execution required due to dependencies")
-            return "sequential"
+            logger.info("DAG execution: subtasks start as their dependencies finish")
+            return "dag"
         else:
             logger.info("Parallel execution possible")
             return "parallel"
@@ -410,6 +416,53 @@ class VirtualTeamOrchestrator:
         
         return state
     
+    async def execute_dag(self, state: TeamState) -> TeamState:
+        """Execute subtasks as soon as their dependencies complete"""
+        pending = [s for s in state["subtasks"] if s.get("status") != "completed"]
+        completed_ids = {s["id"] for s in state["subtasks"] if s.get("status") == "completed"}
+        logger.info(f"Executing {len(pending)} subtasks as a DAG "
+                    f"(max concurrency {self.scheduler.max_concurrency})")
+        
+        def job(subtask: Dict[str, Any]):
+            async def run() -> Dict[str, Any]:
+                agent_role = state["assigned_agents"].get(subtask["id"])
+                if not agent_role:
+                    raise RuntimeError(f"No agent assigned to {subtask['id']}")
+                result = await self._execute_subtask(agent_role, subtask["description"], subtask["id"])
+                if result["status"] == "failed":
+                    raise RuntimeError(result.get("error") or "subtask failed")
+                return result
+            return run
+        
+        # Dependencies on subtasks completed in an earlier attempt are already met;
+        # any other id is left in so the scheduler rejects an unknown dependency
+        run = await self.scheduler.run(
+            {s["id"]: job(s) for s in pending},
+            {s["id"]: [d for d in state["dependencies"].get(s["id"], []) if d not in completed_ids]
+             for s in pending},
+            durations={s["id"]: s.get("estimated_time", 1) for s in pending}
+        )
+        
+        for subtask in pending:
+            task_run = run.tasks[subtask["id"]]
+            subtask["status"] = task_run.status
+            if task_run.status == "completed":
+                state["results"][subtask["id"]] = task_run.result.get("output")
+            else:
+                state["errors"].append({
+                    "step": "execute_dag",
+                    "subtask": subtask["id"],
+                    "error": task_run.error
+                })
+        
+        completed = len([s for s in state["subtasks"] if s.get("status") == "completed"])
+        state["progress"] = 25.0 + (45.0 * completed / max(len(state["subtasks"]), 1))
+        state["current_step"] += 1
+        
+        self._log_event(state, "dag_execution_complete", run.to_dict())
+        
+        return state
+    
     async def review_results(self, state: TeamState) -> TeamState:
         """Review execution results"""
         logger.info("Reviewing execution results")
@@ -6,6 +6,7 @@ Main API interface for controlling the agent system
 
 import asyncio
 import json
+import os
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 from datetime import datetime
@@ -23,6 +24,7 @@ from agents.app.orchestrator.virtual_team_orchestrator import (
     TaskPriority,
     TaskStatus
 )
+from agents.app.agents.task_store import DEFAULT_STORE_PATH, TaskStore
 
 # Configure logging
 logging.basicConfig(
@@ -52,6 +54,13 @@ class SystemConfigRequest(BaseModel):
     max_tokens: Optional[int] = Field(default=None, description="Maximum tokens")
     timeout: Optional[int] = Field(default=None, description="Execution timeout")
 
+PRIORITY_MAP = {
+    "critical": TaskPriority.CRITICAL,
+    "high": TaskPriority.HIGH,
+    "medium": TaskPriority.MEDIUM,
+    "low": TaskPriority.LOW
+}
+
 class ClaudeCodeController:
     """Main controller for Claude Code integration with virtual team"""
     
@@ -68,6 +77,7 @@ class ClaudeCodeController:
         self.orchestrator = None
         self.active_sessions = {}
         self.system_status = "initializing"
+        self.task_store = TaskStore(os.getenv("TASK_STORE_PATH", str(DEFAULT_STORE_PATH)))
         
         # Setup middleware
         self.app.add_middleware(
@@ -99,6 +109,14 @@ class ClaudeCodeController:
             self.system_status = "operational"
             logger.info("✅ Virtual Development Team is operational")
             
+            # Resume tasks accepted before the last shutdown or crash
+            pending = self.task_store.recover()
+            for task in pending:
+                task_id = task["task_id"]
+                self.active_sessions[task_id] = asyncio.create_task(self._run_task_in_background(task_id))
+            if pending:
+                logger.info(f"Resuming {len(pending)} pending tasks")
+            
         except Exception as e:
             logger.error(f"Failed to initialize system: {e}")
             self.system_status = "error"
@@ -107,6 +125,10 @@ class ClaudeCodeController:
         """Cleanup on shutdown"""
         logger.info("Shutting down Virtual Development Team...")
         self.system_status = "shutdown"
+        # Tasks still running are marked pending again by recover() on next startup
+        for session in self.active_sessions.values():
+            session.cancel()
+        self.task_store.close()
     
     def setup_routes(self):
         """Setup API routes"""
@@ -140,16 +162,19 @@ class ClaudeCodeController:
             return {
                 "status": self.system_status,
                 "agents": {
-                    "total": len(self.factory.agents),
+                    "total": len(self.factory.list_agents()),
+                    "loaded": len(self.factory.agents),
                     "available": self.factory.list_agents()
                 },
                 "models": {
                     "loaded": len(self.factory.models),
+                    "llm_objects": self.factory.build_report()["llm_objects"],
                     "configuration": self.factory.config["models"]
                 },
                 "orchestrator": {
                     "active_tasks": len(self.orchestrator.active_tasks) if self.orchestrator else 0
                 },
+                "tasks": self.task_store.counts(),
                 "timestamp": datetime.now().isoformat()
             }
         
@@ -162,7 +187,7 @@ class ClaudeCodeController:
             
             return {
                 "agents": self.factory.get_all_agents_info(),
-                "total": len(self.factory.agents)
+                "total": len(self.factory.list_agents())
             }
         
         @self.app.get("/agents/{agent_role}")
@@ -183,10 +208,12 @@ class ClaudeCodeController:
             if not self.factory:
                 raise HTTPException(status_code=503, detail="System not initialized")
             
+            task_id = self.task_store.create("agent", request.dict(), agent=request.agent)
             try:
-                result = await self.factory.execute_task(request.agent, request.task)
+                result = await self._run_task(task_id)
                 return {
                     "status": "success",
+                    "task_id": task_id,
                     "agent": request.agent,
                     "result": result,
                     "timestamp": datetime.now().isoformat()
@@ -204,28 +231,15 @@ class ClaudeCodeController:
             if not self.orchestrator:
                 raise HTTPException(status_code=503, detail="System not initialized")
             
-            # Convert priority string to enum
-            priority_map = {
-                "critical": TaskPriority.CRITICAL,
-                "high": TaskPriority.HIGH,
-                "medium": TaskPriority.MEDIUM,
-                "low": TaskPriority.LOW
-            }
-            priority = priority_map.get(request.priority.lower(), TaskPriority.MEDIUM)
-            
+            task_id = self.task_store.create("team", request.dict())
             try:
                 # Execute task
-                result = await self.orchestrator.execute_task(
-                    task_description=request.description,
-                    priority=priority,
-                    agents=request.agents,
-                    require_human_approval=request.require_approval,
-                    max_iterations=request.max_retries
-                )
+                result = await self._run_task(task_id)
                 
                 return {
                     "status": "completed",
-                    "task_id": result["task_id"],
+                    "task_id": task_id,
+                    "orchestrator_task_id": result["task_id"],
                     "results": result["results"],
                     "errors": result["errors"],
                     "execution_time": result["execution_time"],
@@ -237,23 +251,35 @@ class ClaudeCodeController:
                 raise HTTPException(status_code=500, detail=str(e))
         
         @self.app.get("/tasks")
-        async def list_tasks():
-            """List all active tasks"""
-            if not self.orchestrator:
-                raise HTTPException(status_code=503, detail="System not initialized")
-            
+        async def list_tasks(status: Optional[str] = None, agent: Optional[str] = None,
+                             since: Optional[datetime] = None, until: Optional[datetime] = None,
+                             limit: int = 50, offset: int = 0):
+            """List stored tasks, newest first, filtered by status, agent and creation time"""
+            tasks, total = self.task_store.list_tasks(
+                status=status,
+                agent=agent,
+                since=since.timestamp() if since else None,
+                until=until.timestamp() if until else None,
+                limit=limit,
+                offset=offset
+            )
             return {
-                "tasks": self.orchestrator.list_active_tasks(),
-                "total": len(self.orchestrator.active_tasks)
+                "tasks": tasks,
+                "total": total,
+                "limit": limit,
+                "offset": offset,
+                "counts": self.task_store.counts()
             }
         
         @self.app.get("/tasks/{task_id}")
         async def get_task_status(task_id: str):
             """Get status of a specific task"""
-            if not self.orchestrator:
-                raise HTTPException(status_code=503, detail="System not initialized")
+            task = self.task_store.get(task_id)
+            if task:
+                return task
             
-            status = self.orchestrator.get_task_status(task_id)
+            # Orchestrator task ids (from results of earlier runs) are still in memory
+            status = self.orchestrator.get_task_status(task_id) if self.orchestrator else None
             if not status:
                 raise HTTPException(status_code=404, detail="Task not found")
             
@@ -341,15 +367,16 @@ class ClaudeCodeController:
             5. Generate documentation
             """
             
-            # Execute in background
-            background_tasks.add_task(
-                self._process_github_issue,
-                issue_number,
-                task_description
-            )
+            # Execute in background; the stored task resumes after a restart
+            task_id = self.task_store.create("github_issue", {
+                "issue_number": issue_number,
+                "description": task_description
+            })
+            background_tasks.add_task(self._run_task_in_background, task_id)
             
             return {
                 "status": "processing",
+                "task_id": task_id,
                 "issue": issue_number,
                 "message": "Task queued for processing"
             }
@@ -381,7 +408,46 @@ class ClaudeCodeController:
                 logger.error(f"Error resetting system: {e}")
                 raise HTTPException(status_code=500, detail=str(e))
     
-    async def _process_github_issue(self, issue_number: int, task_description: str):
+    async def _run_task(self, task_id: str) -> Any:
+        """Run a stored task, recording running -> completed/failed; re-raises task errors"""
+        task = self.task_store.get(task_id, events=False)
+        request = task["request"]
+        self.task_store.transition(task_id, "running")
+        try:
+            if task["kind"] == "agent":
+                result = await self.factory.execute_task(request["agent"], request["task"])
+            elif task["kind"] == "team":
+                result = await self.orchestrator.execute_task(
+                    task_description=request["description"],
+                    priority=PRIORITY_MAP.get(request["priority"].lower(), TaskPriority.MEDIUM),
+                    agents=request["agents"],
+                    require_human_approval=request["require_approval"],
+                    max_iterations=request["max_retries"]
+                )
+            elif task["kind"] == "github_issue":
+                result = await self._process_github_issue(request["issue_number"], request["description"])
+            else:
+                raise ValueError(f"Unknown task kind: {task['kind']}")
+        except asyncio.CancelledError:
+            # Shutdown: leave the task running so recover() resumes it
+            raise
+        except Exception as e:
+            self.task_store.transition(task_id, "failed", error=str(e))
+            raise
+        else:
+            self.task_store.transition(task_id, "completed", result=result)
+            return result
+        finally:
+            self.active_sessions.pop(task_id, None)
+    
+    async def _run_task_in_background(self, task_id: str):
+        """Run a stored task whose caller is not waiting on it (failures are logged and stored)"""
+        try:
+            await self._run_task(task_id)
+        except Exception as e:
+            logger.error(f"Task {task_id} failed: {e}")
+    
+    async def _process_github_issue(self, issue_number: int, task_description: str) -> Dict[str, Any]:
         """Process GitHub issue in background"""
         try:
             result = await self.orchestrator.execute_task(
@@ -392,9 +458,11 @@ class ClaudeCodeController:
             )
             
             logger.info(f"GitHub issue #{issue_number} processed: {result['status']}")
+            return result
             
         except Exception as e:
             logger.error(f"Error processing GitHub issue #{issue_number}: {e}")
+            raise
     
     def run(self, host: str = "127.0.0.1", port: int = 8002):
         """Run the controller"""
@@ -3,35 +3,31 @@ Federal Job Advisory Agent System
 Main FastAPI application for agent services
 """
 
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import StreamingResponse, PlainTextResponse
 from pydantic import BaseModel
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
 import asyncio
 import os
 from dotenv import load_dotenv
 import structlog
 import json
+import time
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+from ..agents.app.agents.factory import AgentFactory, AgentRoles, BATCH_USER_PREFIX
+from ..agents.app.agents.batch_screening import BatchScreener, iter_profiles, shutdown_screening_pools
+from ..agents.app.agents.batch_analysis import BatchAnalyzer
+from ..agents.app.agents.job_matching import get_job_match_index
+from ..agents.app.agents.llm_cache import get_llm_cache
+from ..mcp_services.utils.semantic_index import get_semantic_index
+from ..agents.app.agents.metrics import (
+    REGISTRY, ACTIVE_USERS, HTTP_LATENCY, HTTP_IN_FLIGHT, get_process_sampler, process_rss_bytes
+)
 
-from ..agents.app.agents.factory import AgentFactory, AgentRoles
-from ..agents.app.agents.base import AgentConfig
-
-# Import all agents
-from ..agents.app.agents.roles.data_scientist import DataScientistAgent
-from ..agents.app.agents.roles.statistician import StatisticianAgent
-from ..agents.app.agents.roles.database_admin import DatabaseAdminAgent
-from ..agents.app.agents.roles.devops_engineer import DevOpsEngineerAgent
-from ..agents.app.agents.roles.it_specialist import ITSpecialistAgent
-from ..agents.app.agents.compliance.essay_guidance import EssayGuidanceAgent
-from ..agents.app.agents.compliance.resume_compression import ResumeCompressionAgent
-from ..agents.app.agents.compliance.executive_order_research import ExecutiveOrderResearchAgent
-from ..agents.app.agents.automation.job_collection_orchestrator import JobCollectionOrchestratorAgent
-from ..agents.app.agents.automation.analytics_intelligence import AnalyticsIntelligenceAgent
-from ..agents.app.agents.roles.agent_router import AgentRouter
-from ..agents.app.agents.roles.general_purpose import GeneralPurposeAgent
-from ..agents.app.agents.roles.researcher import ResearcherAgent
-from ..agents.app.agents.roles.ux_designer import UXDesignerAgent
+# Agent modules are registered as "module:Class" strings and imported on first
+# use (see AgentRegistry); only roles listed in AGENT_WARMUP_ROLES load at startup.
 
 # Import LangGraph orchestrator and related components - Temporarily disabled
 # from ..agents.app.orchestrator.fed_job_orchestrator import get_orchestrator, WorkflowType
@@ -92,6 +88,27 @@ app.add_middleware(
 )
 
 
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """Per-route latency histogram and in-flight gauge"""
+    started = time.perf_counter()
+    status = "500"
+    HTTP_IN_FLIGHT.inc()
+    try:
+        response = await call_next(request)
+        status = str(response.status_code)
+        return response
+    finally:
+        HTTP_IN_FLIGHT.dec()
+        # Route template (e.g. /agents/{role}/{user_id}/metrics) keeps label cardinality bounded
+        route = request.scope.get("route")
+        HTTP_LATENCY.labels(
+            route=getattr(route, "path", "unmatched"),
+            method=request.method,
+            status=status
+        ).observe(time.perf_counter() - started)
+
+
 # Request/Response Models
 class AgentRequest(BaseModel):
     """Request model for agent interactions"""
@@ -109,6 +126,15 @@ class AgentAnalysisRequest(BaseModel):
     data: Dict[str, Any]
 
 
+class BatchAgentRequest(BaseModel):
+    """Request model for running one agent's analysis over many inputs"""
+    role: str
+    user_id: str
+    items: List[Dict[str, Any]]
+    max_concurrency: Optional[int] = None
+    item_timeout: Optional[float] = None
+
+
 class EssayAnalysisRequest(BaseModel):
     """Request model for essay analysis"""
     user_id: str
@@ -154,6 +180,33 @@ class WebscrapingRequest(BaseModel):
     data: Dict[str, Any]
 
 
+class JobMatchRequest(BaseModel):
+    """Request model for resume-to-job matching"""
+    resume: Union[str, Dict[str, Any]]
+    k: int = 10
+    explain: bool = True
+
+
+class BatchJobMatchRequest(BaseModel):
+    """Request model for matching many resumes at once"""
+    resumes: List[Union[str, Dict[str, Any]]]
+    k: int = 10
+
+
+class JobIngestRequest(BaseModel):
+    """Request model for adding or closing postings in the job match index"""
+    jobs: List[Dict[str, Any]] = []
+    remove_job_ids: List[str] = []
+
+
+class SemanticSearchRequest(BaseModel):
+    """Request model for embedding search over docs, job postings and research reports"""
+    query: Optional[str] = None
+    queries: List[str] = []
+    k: int = 10
+    kinds: List[str] = []
+
+
 # Global orchestrator instance
 orchestrator = None
 compliance_gates = None
@@ -189,78 +242,99 @@ async def startup_event():
     # Register ALL 13 Fed Job Advisor agents (10 original + 3 new general-purpose)
     agents_to_register = [
         # Technical Role Agents (5)
-        (AgentRoles.DATA_SCIENTIST, DataScientistAgent, {
+        (AgentRoles.DATA_SCIENTIST, ".roles.data_scientist:DataScientistAgent", {
             "description": "Data science and ML/AI development specialist",
             "tools": ["skill_matcher", "project_analyzer", "technical_depth_checker"]
         }),
-        (AgentRoles.STATISTICIAN, StatisticianAgent, {
+        (AgentRoles.STATISTICIAN, ".roles.statistician:StatisticianAgent", {
             "description": "Statistical analysis and hypothesis testing specialist",
             "tools": ["statistical_analyzer", "data_visualizer", "test_designer"]
         }),
-        (AgentRoles.DATABASE_ADMIN, DatabaseAdminAgent, {
+        (AgentRoles.DATABASE_ADMIN, ".roles.database_admin:DatabaseAdminAgent", {
             "description": "Database administration and optimization specialist",
             "tools": ["query_optimizer", "schema_manager", "performance_monitor"]
         }),
-        (AgentRoles.DEVOPS, DevOpsEngineerAgent, {
+        (AgentRoles.DEVOPS, ".roles.devops_engineer:DevOpsEngineerAgent", {
             "description": "DevOps and infrastructure specialist for deployment, monitoring, and backup systems",
             "tools": ["infrastructure_analyzer", "deployment_manager", "backup_monitor"]
         }),
-        (AgentRoles.IT_SPECIALIST, ITSpecialistAgent, {
+        (AgentRoles.IT_SPECIALIST, ".roles.it_specialist:ITSpecialistAgent", {
             "description": "IT systems and technical support specialist",
             "tools": ["system_diagnostics", "technical_troubleshooter", "configuration_manager"]
         }),
         
         # Compliance Agents (3)
-        (AgentRoles.ESSAY_GUIDANCE, EssayGuidanceAgent, {
+        (AgentRoles.ESSAY_GUIDANCE, ".compliance.essay_guidance:EssayGuidanceAgent", {
             "description": "Merit hiring compliance and essay writing guidance specialist",
             "tools": ["merit_analyzer", "compliance_checker", "writing_coach"]
         }),
-        (AgentRoles.RESUME_COMPRESSION, ResumeCompressionAgent, {
+        (AgentRoles.RESUME_COMPRESSION, ".compliance.resume_compression:ResumeCompressionAgent", {
             "description": "Federal resume optimization and compression specialist",
             "tools": ["resume_optimizer", "keyword_analyzer", "format_validator"]
         }),
-        (AgentRoles.EXECUTIVE_ORDER, ExecutiveOrderResearchAgent, {
+        (AgentRoles.EXECUTIVE_ORDER, ".compliance.executive_order_research:ExecutiveOrderResearchAgent", {
             "description": "Executive order research and policy compliance specialist",
             "tools": ["policy_researcher", "executive_order_tracker", "compliance_validator"]
         }),
         
         # Analytics & Intelligence Agents (2)
-        (AgentRoles.JOB_COLLECTOR, JobCollectionOrchestratorAgent, {
+        (AgentRoles.JOB_COLLECTOR, ".automation.job_collection_orchestrator:JobCollectionOrchestratorAgent", {
             "description": "Job data collection orchestration and monitoring specialist",
             "tools": ["collection_monitor", "pipeline_orchestrator", "data_quality_checker"]
         }),
-        (AgentRoles.ANALYTICS, AnalyticsIntelligenceAgent, {
+        (AgentRoles.ANALYTICS, ".automation.analytics_intelligence:AnalyticsIntelligenceAgent", {
             "description": "Job market analytics and intelligence specialist", 
             "tools": ["market_analyzer", "trend_tracker", "intelligence_aggregator"]
         }),
         
         # General-Purpose Agents (3)
-        (AgentRoles.GENERAL_PURPOSE, GeneralPurposeAgent, {
+        (AgentRoles.GENERAL_PURPOSE, ".roles.general_purpose:GeneralPurposeAgent", {
             "description": "General research, analysis, and multi-step task coordination specialist",
             "tools": ["research_analyzer", "problem_solver", "task_coordinator", "requirements_gatherer", "risk_assessor"]
         }),
-        (AgentRoles.RESEARCHER, ResearcherAgent, {
+        (AgentRoles.RESEARCHER, ".roles.researcher:ResearcherAgent", {
             "description": "Deep research, investigation, and information gathering specialist",
             "tools": ["research_planner", "source_evaluator", "information_synthesizer", "fact_checker", "trend_analyzer", "gap_identifier"]
         }),
-        (AgentRoles.UX_DESIGNER, UXDesignerAgent, {
+        (AgentRoles.UX_DESIGNER, ".roles.ux_designer:UXDesignerAgent", {
             "description": "UX/UI design, web design, and user experience specialist with federal compliance focus",
             "tools": ["accessibility_auditor", "user_flow_analyzer", "design_system_advisor", "shadcn_ui_components", "usability_evaluator", "responsive_design_checker", "federal_compliance_validator"]
         })
     ]
     
+    # Optional per-role warm-up: AGENT_WARMUP_ROLES="data_scientist,essay_guidance" or "all"
+    warmup_setting = os.getenv("AGENT_WARMUP_ROLES", "").strip()
+    warmup_roles = {role.strip() for role in warmup_setting.split(",") if role.strip()}
+    warm_all = warmup_setting.lower() == "all"
+    
     registered_count = 0
-    for role, agent_class, metadata in agents_to_register:
+    for role, agent_spec, metadata in agents_to_register:
         try:
-            AgentFactory.register_agent(role, agent_class, metadata=metadata)
-            logger.info(f"Registered {agent_class.__name__}")
+            AgentFactory.register_agent(
+                role, agent_spec, metadata=metadata,
+                warm=warm_all or role in warmup_roles
+            )
+            logger.info(f"Registered {agent_spec}")
             registered_count += 1
         except Exception as e:
-            logger.warning(f"Failed to register {agent_class.__name__}: {e}")
+            logger.warning(f"Failed to register {agent_spec}: {e}")
     
     logger.info(f"Successfully registered {registered_count} agents")
     
+    # Warm-up runs off the event loop so the server accepts traffic immediately,
+    # unless AGENT_WARMUP_BLOCKING=true (restores eager-import startup behaviour)
+    if warm_all or warmup_roles:
+        if os.getenv("AGENT_WARMUP_BLOCKING", "false").lower() == "true":
+            AgentFactory.warm_up()
+        else:
+            asyncio.get_running_loop().run_in_executor(None, AgentFactory.warm_up)
+    
     logger.info(f"Registered {len(AgentFactory.list_available_agents())} agents")
+    
+    # Live system metrics history for /metrics and MonitoringAnalyticsAgent
+    ACTIVE_USERS.set_function(AgentFactory.active_user_count)
+    get_process_sampler().start(float(os.getenv("METRICS_SAMPLE_INTERVAL", "15")))
+    
     logger.info("Federal Job Advisory Agent System with LangGraph ready")
 
 
@@ -270,7 +344,9 @@ async def shutdown_event():
     global orchestrator, compliance_gates
     
     logger.info("Shutting down agent system and orchestrator")
+    get_process_sampler().stop()
     await AgentFactory.cleanup_all_agents()
+    shutdown_screening_pools()
     
     # Cleanup orchestrator resources if needed
     if orchestrator:
@@ -394,6 +470,86 @@ async def analyze_data_scientist_profile(request: DataScientistAnalysisRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/agents/batch")
+async def analyze_batch_with_agent(request: BatchAgentRequest):
+    """
+    Run the specified agent's analysis over many inputs in one request
+
+    Items share one agent instance and run at most `max_concurrency` at a
+    time (AGENT_BATCH_CONCURRENCY by default). Results stream back as NDJSON
+    result/error records in completion order, each carrying its input index,
+    followed by a summary; a failed item does not fail the batch.
+    """
+    try:
+        # A memoryless agent per user and role: batch items are independent
+        # documents, and concurrent analyses must not share conversation history
+        agent = AgentFactory.create(
+            role=request.role,
+            user_id=f"{BATCH_USER_PREFIX}{request.user_id}",
+            enable_memory=False
+        )
+        analyzer = BatchAnalyzer(request.max_concurrency, request.item_timeout)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def generate():
+        async for record in analyzer.run(agent.analyze, request.items):
+            yield json.dumps(record, default=str) + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+@app.post("/agents/batch/analyze")
+async def batch_analyze_profiles(request: Request, roles: Optional[str] = None):
+    """
+    Screen many profiles with the deterministic role tools
+
+    The body is NDJSON (one profile per line) or a multipart upload with a
+    "file" part holding NDJSON or a JSON array (spooled to disk, so prefer it
+    for large batches); `roles` is a comma-separated role list (default: every
+    screening role). Results stream back as NDJSON result/error records with
+    progress records per chunk and a final summary.
+    """
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("multipart/form-data"):
+        form = await request.form()
+        upload = form.get("file")
+        if upload is None or isinstance(upload, str):
+            raise HTTPException(status_code=400, detail="Multipart requests need a 'file' part")
+        roles = roles or form.get("roles")
+
+        async def read_upload():
+            while chunk := await upload.read(64 * 1024):
+                yield chunk
+
+        body = read_upload()
+    else:
+        # Read before responding: StreamingResponse listens for disconnects on
+        # the same receive channel, so the body can't be consumed mid-response
+        payload = await request.body()
+
+        async def read_payload():
+            yield payload
+
+        body = read_payload()
+
+    try:
+        screener = BatchScreener(roles=roles)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def generate():
+        try:
+            async for record in screener.screen(iter_profiles(body)):
+                yield json.dumps(record) + "\n"
+        except Exception as e:
+            # Input that cannot be split into profiles ends the stream with an error record
+            logger.error(f"Batch screening error: {e}")
+            yield json.dumps({"type": "error", "error": str(e)}) + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @app.post("/agents/essay/analyze")
 async def analyze_essay_compliance(request: EssayAnalysisRequest):
     """Analyze essay for Merit Hiring compliance"""
@@ -445,6 +601,82 @@ async def analyze_webscraping_request(request: WebscrapingRequest):
         raise HTTPException(status_code=500, detail=f"Webscraping error: {str(e)}")
 
 
+# Job Matching Endpoints
+@app.post("/jobs/match")
+async def match_jobs(request: JobMatchRequest):
+    """Top-k collected postings for a resume (text or profile), with matched-term explanations"""
+    try:
+        # The first call loads and syncs the index from disk
+        index = await asyncio.to_thread(get_job_match_index)
+        matches = await asyncio.to_thread(index.match, request.resume, request.k, request.explain)
+        return {"matches": matches, "index": index.stats()}
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Job matching error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/jobs/match/batch")
+async def match_jobs_batch(request: BatchJobMatchRequest):
+    """Top-k postings for each of many resumes, scored together"""
+    try:
+        index = await asyncio.to_thread(get_job_match_index)
+        matches = await asyncio.to_thread(index.match_many, request.resumes, request.k)
+        return {"matches": matches}
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Batch job matching error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/jobs/index")
+async def update_job_index(request: JobIngestRequest):
+    """Add (or replace) postings and drop closed ones; persisted when JOB_MATCH_INDEX_PATH is set"""
+    try:
+        index = await asyncio.to_thread(get_job_match_index)
+
+        def update():
+            added = index.add_jobs(request.jobs)
+            removed = index.remove_jobs(request.remove_job_ids)
+            path = os.getenv("JOB_MATCH_INDEX_PATH")
+            if path and (added or removed):
+                index.save(path)
+            return {"added": added, "removed": removed, "index": index.stats()}
+
+        return await asyncio.to_thread(update)
+
+    except Exception as e:
+        logger.error(f"Job index update error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# Semantic Retrieval Endpoints
+@app.post("/search/semantic")
+async def semantic_search(request: SemanticSearchRequest):
+    """Nearest docs passages, postings and research reports by embedding similarity"""
+    queries = ([request.query] if request.query else []) + request.queries
+    if not queries:
+        raise HTTPException(status_code=400, detail="query or queries is required")
+
+    try:
+        def search():
+            index = get_semantic_index()
+            return index.search_many(queries, k=request.k, kinds=request.kinds or None), index.stats()
+
+        results, stats = await asyncio.to_thread(search)
+        if request.query and not request.queries:
+            return {"results": results[0], "index": stats}
+        return {"results": results, "index": stats}
+
+    except Exception as e:
+        logger.error(f"Semantic search error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # Memory Management Endpoints
 @app.post("/agents/{role}/{user_id}/reset-memory")
 async def reset_agent_memory(role: str, user_id: str):
@@ -669,7 +901,35 @@ async def get_compliance_audit_log(limit: Optional[int] = None):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Metrics Endpoint
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Prometheus text exposition of request, agent, LLM and cache metrics"""
+    return PlainTextResponse(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
+
+
+@app.get("/llm/cache")
+async def llm_cache_stats():
+    """Response cache hit ratio, saved generation seconds and size"""
+    cache = get_llm_cache()
+    return cache.stats() if cache else {"enabled": False}
+
+
 # Debug and Development Endpoints
+@app.get("/debug/imports")
+async def get_agent_import_report():
+    """Per-agent import cost (lazy registry) and process memory"""
+    report = AgentFactory.import_report()
+    report["rss_kb"] = _process_rss_kb()
+    return report
+
+
+def _process_rss_kb() -> Optional[int]:
+    """Current resident set size in KB (peak RSS where /proc is unavailable)"""
+    rss = process_rss_bytes()
+    return rss // 1024 if rss else None
+
+
 @app.get("/debug/orchestrator")
 async def get_orchestrator_debug_info():
     """Get orchestrator debug information"""
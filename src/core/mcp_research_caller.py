@@ -10,7 +10,9 @@ This module implements the MCP-first research methodology from TASK_APPROACH_BLU
 """
 
 import json
+import os
 import asyncio
+import tempfile
 import aiohttp
 from datetime import datetime
 from pathlib import Path
@@ -21,13 +23,60 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+class AtomicBatchWriter:
+    """Queue report writes and flush them in batches off the event loop, each file via temp file + rename"""
+
+    def __init__(self, batch_size: int = 16):
+        self.batch_size = batch_size
+        self._pending: Dict[Path, str] = {}
+        self._lock = asyncio.Lock()
+        self.stats = {"files": 0, "batches": 0}
+
+    async def write(self, path: Path, content: str) -> str:
+        """Queue a write; a later write to the same path replaces one not yet flushed"""
+        self._pending[Path(path)] = content
+        if len(self._pending) >= self.batch_size:
+            await self.flush()
+        return str(path)
+
+    async def flush(self) -> None:
+        """Write everything queued so far in one worker-thread batch"""
+        async with self._lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, {}
+            await asyncio.to_thread(self._write_batch, batch)
+            self.stats["files"] += len(batch)
+            self.stats["batches"] += 1
+
+    @staticmethod
+    def _write_batch(batch: Dict[Path, str]) -> None:
+        for path, content in batch.items():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    f.write(content)
+                os.replace(tmp_path, path)  # readers see the old file or the new one, never half of it
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+
 class MCPResearchCaller:
     """Interface for Claude Code to request systematic research from MCP agents"""
     
     def __init__(self, 
                  mcp_server_url: str = "http://localhost:8002",
-                 research_dir: str = "/Users/jasonewillis/Developer/jwRepos/JLWAI/fedJobAdvisor/_Management/_PM/_Tasks"):
+                 research_dir: str = "/Users/jasonewillis/Developer/jwRepos/JLWAI/fedJobAdvisor/_Management/_PM/_Tasks",
+                 max_concurrency: int = 4,
+                 agent_timeout: float = 120.0,
+                 write_batch_size: int = 16):
         self.mcp_server_url = mcp_server_url
+        self.max_concurrency = max_concurrency
+        self.agent_timeout = agent_timeout
+        self.writer = AtomicBatchWriter(batch_size=write_batch_size)
         self.research_dir = Path(research_dir)
         self.active_dir = self.research_dir / "active"
         self.completed_dir = self.research_dir / "completed" 
@@ -151,9 +200,7 @@ class MCPResearchCaller:
 **Next Phase**: MCP Research Assignment
 """
 
-        # Write context file
-        with open(context_file, 'w') as f:
-            f.write(context_content)
+        await self.writer.write(context_file, context_content)
             
         return {
             "context_file": str(context_file),
@@ -164,32 +211,43 @@ class MCPResearchCaller:
     async def _assign_mcp_research(self, task_name: str, task_description: str, agents: List[str]) -> Dict[str, Any]:
         """Phase 1.2: MCP Research Assignment - 80% of thinking happens here"""
         
-        research_results = {}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
         
-        for agent in agents:
-            logger.info(f"Requesting research from {agent}")
-            
-            # Create research request following template
-            research_request = self._create_research_request(
-                task_name, task_description, agent
-            )
-            
-            # This would call the actual MCP agent (simulated for now)
-            agent_research = await self._call_mcp_agent(agent, research_request)
-            
-            # Save agent research to file
+        async def research(agent: str) -> Dict[str, Any]:
+            async with semaphore:
+                logger.info(f"Requesting research from {agent}")
+                
+                # Create research request following template
+                research_request = self._create_research_request(
+                    task_name, task_description, agent
+                )
+                
+                # Sections the agent returns before a timeout are kept in partial
+                partial: Dict[str, Any] = {"agent": agent}
+                try:
+                    agent_research = await asyncio.wait_for(
+                        self._call_mcp_agent(agent, research_request, partial), self.agent_timeout
+                    )
+                    timed_out = False
+                except asyncio.TimeoutError:
+                    logger.warning(f"{agent} timed out after {self.agent_timeout}s, keeping partial research")
+                    agent_research = dict(partial, timed_out=True)
+                    timed_out = True
+                
             research_file = await self._save_agent_research(
                 task_name, agent, agent_research
             )
             
-            research_results[agent] = {
+            return {
                 "research_file": research_file,
                 "research_quality": agent_research.get("quality_score", 0),
                 "sources_cited": agent_research.get("sources_count", 0),
-                "limitations_noted": agent_research.get("limitations_count", 0)
+                "limitations_noted": agent_research.get("limitations_count", 0),
+                "timed_out": timed_out
             }
-            
-        return research_results
+        
+        outcomes = await asyncio.gather(*(research(agent) for agent in agents))
+        return dict(zip(agents, outcomes))
         
     def _create_research_request(self, task_name: str, task_description: str, agent: str) -> Dict[str, Any]:
         """Create structured research request for MCP agent"""
@@ -212,8 +270,13 @@ class MCPResearchCaller:
             "template_path": str(self.research_dir / "templates" / "MCP_RESEARCH_TEMPLATE.md")
         }
         
-    async def _call_mcp_agent(self, agent: str, research_request: Dict[str, Any]) -> Dict[str, Any]:
-        """Call MCP agent for research (actual implementation would use MCP protocol)"""
+    async def _call_mcp_agent(self, agent: str, research_request: Dict[str, Any],
+                              partial: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Call MCP agent for research (actual implementation would use MCP protocol)
+        
+        Research received so far is copied into partial, so a call cut off by
+        the timeout still leaves what the agent had produced.
+        """
         
         # For now, simulate the research call
         # In actual implementation, this would:
@@ -225,7 +288,7 @@ class MCPResearchCaller:
         logger.info(f"Simulating MCP call to {agent}")
         
         # Simulate research response
-        return {
+        research = {
             "agent": agent,
             "research_content": f"# Research from {agent}\n\nDetailed technical research would be here...",
             "quality_score": 85,
@@ -234,6 +297,9 @@ class MCPResearchCaller:
             "implementation_examples": 5,
             "honesty_validation": "passed"
         }
+        if partial is not None:
+            partial.update(research)
+        return research
         
     async def _save_agent_research(self, task_name: str, agent: str, research: Dict[str, Any]) -> str:
         """Save agent research to structured file"""
@@ -246,6 +312,7 @@ class MCPResearchCaller:
 **Date**: {datetime.now().isoformat()}
 **Agent**: {agent}
 **Quality Score**: {research.get('quality_score', 'N/A')}
+**Status**: {"Timed out - partial research only" if research.get('timed_out') else "Complete"}
 
 ## Research Content
 
@@ -270,10 +337,9 @@ This research leverages the {agent} technical mastery documentation for:
 **Implementation Ready**: Pending validation
 """
 
-        with open(research_file, 'w') as f:
-            f.write(research_content)
+        await self.writer.write(research_file, research_content)
             
-        logger.info(f"Saved {agent} research to {research_file}")
+        logger.info(f"Queued {agent} research for {research_file}")
         return str(research_file)
         
     async def _validate_research(self, task_name: str, research_results: Dict[str, Any]) -> Dict[str, Any]:
@@ -291,6 +357,9 @@ This research leverages the {agent} technical mastery documentation for:
             sources_cited = result["sources_cited"]
             limitations_noted = result["limitations_noted"]
             
+            if result.get("timed_out"):
+                validation_results["issues"].append(f"{agent}: Timed out, research is partial")
+                
             # Quality validation
             if quality_score < 70:
                 validation_results["issues"].append(f"{agent}: Low quality score ({quality_score})")
@@ -353,10 +422,7 @@ This research leverages the {agent} technical mastery documentation for:
 **Next Phase**: {"Implementation Planning" if validation_results["passed"] else "Research Revision"}
 """
 
-        with open(validation_file, 'w') as f:
-            f.write(validation_content)
-            
-        return str(validation_file)
+        return await self.writer.write(validation_file, validation_content)
         
     async def _create_research_package(self, task_name: str, context_result: Dict, 
                                      research_results: Dict, validation_result: Dict) -> Dict[str, Any]:
@@ -422,8 +488,19 @@ This research leverages the {agent} technical mastery documentation for:
 **Estimated Effort**: [Based on research complexity]
 """
 
-        with open(plan_file, 'w') as f:
-            f.write(plan_content)
+        await self.writer.write(plan_file, plan_content)
+        
+        # Index of the whole package, written once after every agent has reported
+        index_file = self.active_dir / f"{timestamp}_{task_name}_INDEX.json"
+        await self.writer.write(index_file, json.dumps({
+            "task_name": task_name,
+            "created": datetime.now().isoformat(),
+            "context_file": context_result["context_file"],
+            "agents": research_results,
+            "validation": validation_result,
+            "plan_file": str(plan_file)
+        }, indent=2))
+        await self.writer.flush()
             
         # If validation passed, move to completed directory
         if validation_result["passed"]:
@@ -434,7 +511,8 @@ This research leverages the {agent} technical mastery documentation for:
                 "context": context_result["context_file"],
                 "research": [result["research_file"] for result in research_results.values()],
                 "validation": str(self.active_dir / f"{timestamp}_{task_name}_ANALYSIS.md"),
-                "plan": str(plan_file)
+                "plan": str(plan_file),
+                "index": str(index_file)
             },
             "next_steps": [
                 "Review all research files",
@@ -448,6 +526,7 @@ This research leverages the {agent} technical mastery documentation for:
     async def _move_to_completed(self, task_name: str) -> None:
         """Move research package to completed directory when ready for implementation"""
         
+        await self.writer.flush()
         completed_package_dir = self.completed_dir / f"{task_name}_COMPLETE"
         completed_package_dir.mkdir(exist_ok=True)
         
@@ -9,7 +9,7 @@ import httpx
 import json
 import logging
 import os
-from typing import Any, Sequence, Dict, Optional
+from typing import Any, Sequence, Dict, Optional, Tuple
 
 try:
     from mcp.server import Server
@@ -19,23 +19,72 @@ except ImportError:
     print("MCP not installed. Run: pip install mcp")
     exit(1)
 
-# Load configuration
+from .tool_cache import ToolResultCache, DEFAULT_TTL_SECONDS
+
+# Load configuration; without a config file the defaults below apply
 config_path = os.path.join(os.path.dirname(__file__), '../../config/mcp_server.json')
-with open(config_path, 'r') as f:
-    MCP_CONFIG = json.load(f)
+MCP_CONFIG = {}
+if os.path.exists(config_path):
+    with open(config_path, 'r') as f:
+        MCP_CONFIG = json.load(f)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("fed-job-advisor-mcp")
 
+# Seconds a tool's result may be reused; tools not listed use DEFAULT_TTL_SECONDS.
+# Overridable under "tool_cache" in config/mcp_server.json.
+TOOL_CACHE_TTLS = {
+    "analyze_job_market": 300,
+    "research_executive_orders": 3600,
+    "route_to_best_agent": 3600,
+}
+
+# Tools that report live state or act on the outside world; always sent upstream
+UNCACHED_TOOLS = ["orchestrate_job_collection", "scrape_web_page", "traverse_documentation"]
+
+# Document analysis tools that analyze_batch can run over many inputs in one call
+BATCH_TOOLS = [
+    "analyze_data_scientist_profile",
+    "analyze_statistician_profile",
+    "analyze_database_admin_profile",
+    "analyze_devops_profile",
+    "analyze_it_specialist_profile",
+    "check_essay_compliance",
+    "analyze_resume_compression",
+]
+
 class FedJobAdvisorMCP:
     """MCP Server for Fed Job Advisor Agents"""
     
     def __init__(self):
         self.agent_base_url = MCP_CONFIG.get("agent_base_url", "http://localhost:8001")
-        server_name = MCP_CONFIG["server_info"]["name"]
+        server_name = MCP_CONFIG.get("server_info", {}).get("name", "fed-job-advisor")
         self.server = Server(server_name)
         self.agent_tools = {}
+        
+        cache_config = MCP_CONFIG.get("tool_cache", {})
+        cache_enabled = cache_config.get("enabled", True)
+        self.tool_cache = ToolResultCache(
+            default_ttl=cache_config.get("default_ttl_seconds", DEFAULT_TTL_SECONDS) if cache_enabled else 0,
+            ttls={**TOOL_CACHE_TTLS, **cache_config.get("ttl_seconds", {})} if cache_enabled else {},
+            uncached=cache_config.get("uncached_tools", UNCACHED_TOOLS),
+            max_entries=cache_config.get("max_entries", 512)
+        )
+        
+        # Tools answered by the MCP server itself rather than the agent service
+        self.local_tools = {
+            "tool_cache_stats": {
+                "description": "Diagnostics for the MCP tool result cache: hit rate, upstream calls saved by caching and by collapsing identical concurrent calls, and agent latency saved.",
+                "handler": self._tool_cache_stats,
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "clear": {"type": "boolean", "default": False, "description": "Drop all cached results after reporting"}
+                    }
+                }
+            }
+        }
         self._setup_tools()
     
     def _setup_tools(self):
@@ -274,6 +323,22 @@ class FedJobAdvisorMCP:
             }
         }
         
+        agent_tools["analyze_batch"] = {
+            "description": "Run one analysis tool over many resumes, profiles or essays in a single call. Items are analyzed concurrently by one agent; a failed item is reported without failing the rest.",
+            "agent_role": None,
+            "endpoint": "batch",
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "user_id": {"type": "string", "description": "User identifier"},
+                    "tool": {"type": "string", "enum": BATCH_TOOLS, "description": "Analysis tool to run on every item"},
+                    "items": {"type": "array", "items": {"type": "object"}, "description": "Arguments for each analysis, as for a single call of the tool (user_id not needed)"},
+                    "max_concurrency": {"type": "integer", "description": "Maximum items analyzed at once (agent service default if omitted)"}
+                },
+                "required": ["user_id", "tool", "items"]
+            }
+        }
+        
         # Store tool configurations for later use
         self.agent_tools = agent_tools
         
@@ -290,6 +355,8 @@ class FedJobAdvisorMCP:
                         inputSchema=config["schema"]
                     )
                 )
+            for tool_name, config in self.local_tools.items():
+                tools.append(Tool(name=tool_name, description=config["description"], inputSchema=config["schema"]))
             return tools
         
         @self.server.call_tool()
@@ -298,7 +365,10 @@ class FedJobAdvisorMCP:
             return await self._call_agent(name, arguments)
     
     async def _call_agent(self, tool_name: str, args: dict) -> Sequence[TextContent]:
-        """Call the appropriate agent via HTTP API"""
+        """Call the appropriate agent, reusing a cached or in-flight result for identical calls"""
+        
+        if tool_name in self.local_tools:
+            return await self.local_tools[tool_name]["handler"](args)
         
         if tool_name not in self.agent_tools:
             return [TextContent(
@@ -306,6 +376,19 @@ class FedJobAdvisorMCP:
                 text=f"❌ Unknown agent tool: {tool_name}"
             )]
         
+        return await self.tool_cache.get_or_call(tool_name, args, lambda: self._invoke_agent(tool_name, args))
+    
+    async def _tool_cache_stats(self, args: dict) -> Sequence[TextContent]:
+        """Report tool result cache effectiveness"""
+        
+        report = self.tool_cache.report()
+        if args.get("clear"):
+            report["cleared"] = self.tool_cache.invalidate()
+        return [TextContent(type="text", text=json.dumps(report, indent=2))]
+    
+    async def _invoke_agent(self, tool_name: str, args: dict) -> Tuple[Sequence[TextContent], bool]:
+        """Call the appropriate agent via HTTP API; returns (content, whether it may be cached)"""
+        
         config = self.agent_tools[tool_name]
         agent_role = config["agent_role"]
         endpoint = config["endpoint"]
@@ -319,12 +402,15 @@ class FedJobAdvisorMCP:
                         return [TextContent(
                             type="text",
                             text="❌ Agent service is not running. Start with: cd /Users/jasonewillis/Developer/jwRepos/JLWAI/Agents && python main.py"
-                        )]
+                        )], False
                 except httpx.ConnectError:
                     return [TextContent(
                         type="text",
                         text="❌ Cannot connect to agent service. Start with: cd /Users/jasonewillis/Developer/jwRepos/JLWAI/Agents && python main.py"
-                    )]
+                    )], False
+                
+                if endpoint == "batch":
+                    return await self._invoke_batch(client, args)
                 
                 # Make the agent call
                 if endpoint == "analyze":
@@ -345,7 +431,7 @@ class FedJobAdvisorMCP:
                 else:
                     # Specialized endpoint
                     url = f"{self.agent_base_url}/agents/{endpoint}"
-                    payload = args
+                    payload = dict(args)
                     payload["user_id"] = args.get("user_id", "claude_code_user")
                 
                 logger.info(f"Calling agent: {tool_name} -> {url}")
@@ -372,30 +458,90 @@ class FedJobAdvisorMCP:
                             formatted_response += "**Detailed Results:**\n"
                             formatted_response += self._format_agent_data(data)
                         
-                        return [TextContent(type="text", text=formatted_response)]
+                        return [TextContent(type="text", text=formatted_response)], True
                     else:
                         return [TextContent(
                             type="text",
                             text=f"❌ Agent analysis failed: {message}"
-                        )]
+                        )], False
                 else:
                     error_detail = response.text if response.text else f"HTTP {response.status_code}"
                     return [TextContent(
                         type="text",
                         text=f"❌ Agent API error: {error_detail}"
-                    )]
+                    )], False
                     
         except httpx.TimeoutException:
             return [TextContent(
                 type="text",
                 text="⏱️ Agent request timed out. The analysis may be complex - try again or check agent service."
-            )]
+            )], False
         except Exception as e:
             logger.error(f"Agent call failed: {e}")
             return [TextContent(
                 type="text",
                 text=f"❌ Unexpected error calling agent: {str(e)}"
-            )]
+            )], False
+    
+    async def _invoke_batch(self, client: httpx.AsyncClient, args: dict) -> Tuple[Sequence[TextContent], bool]:
+        """Run one analysis tool over many inputs through the streaming batch endpoint"""
+        
+        tool_name = args.get("tool")
+        if tool_name not in BATCH_TOOLS:
+            return [TextContent(
+                type="text",
+                text=f"❌ Batch analysis supports: {', '.join(BATCH_TOOLS)}"
+            )], False
+        
+        items = args.get("items") or []
+        payload = {
+            "role": self.agent_tools[tool_name]["agent_role"],
+            "user_id": args.get("user_id", "claude_code_user"),
+            "items": items,
+            "max_concurrency": args.get("max_concurrency")
+        }
+        url = f"{self.agent_base_url}/agents/batch"
+        logger.info(f"Calling agent batch: {tool_name} x{len(items)} -> {url}")
+        
+        records: Dict[int, Dict[str, Any]] = {}
+        summary: Dict[str, Any] = {}
+        # The timeout applies to each read, so a long batch is fine while items keep arriving
+        async with client.stream("POST", url, json=payload, timeout=60.0) as response:
+            if response.status_code != 200:
+                error_detail = (await response.aread()).decode(errors="replace") or f"HTTP {response.status_code}"
+                return [TextContent(type="text", text=f"❌ Agent API error: {error_detail}")], False
+            
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record.get("type") == "summary":
+                    summary = record
+                else:
+                    records[record["index"]] = record
+                    logger.info(f"Batch {tool_name}: item {record['index']} {record['type']} ({len(records)}/{len(items)})")
+        
+        contents = []
+        failed = 0
+        for index in range(len(items)):
+            record = records.get(index, {"type": "error", "error": "No result received (batch ended early)"})
+            label = f" ({record['id']})" if record.get("id") else ""
+            if record["type"] == "result":
+                result = record.get("response", {})
+                text = f"### Item {index + 1}{label}\n\n**Analysis:** {result.get('message', 'Analysis completed')}\n"
+                if result.get("data"):
+                    text += self._format_agent_data(result["data"])
+            else:
+                failed += 1
+                text = f"### Item {index + 1}{label}\n\n❌ {record.get('error', 'Analysis failed')}\n"
+            contents.append(TextContent(type="text", text=text))
+        
+        header = f"{'✅' if not failed else '⚠️'} **{tool_name.replace('_', ' ').title()} (Batch)**\n\n"
+        header += f"**Items:** {len(items) - failed}/{len(items)} succeeded"
+        if summary:
+            header += f" in {summary.get('elapsed_seconds')}s (concurrency {summary.get('max_concurrency')})"
+        # Cache only a batch where every item went through
+        return [TextContent(type="text", text=header + "\n")] + contents, failed == 0
     
     def _format_agent_data(self, data: Dict) -> str:
         """Format agent response data for display"""
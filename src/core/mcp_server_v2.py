@@ -12,8 +12,8 @@ import sys
 from pathlib import Path
 from typing import Any, Sequence, Dict, Optional
 
-# Add the mcp_services directory to path
-sys.path.append(str(Path(__file__).parent / "mcp_services"))
+# Add src to path so mcp_services resolves as a package
+sys.path.append(str(Path(__file__).parent.parent))
 
 try:
     from mcp.server import Server
@@ -24,7 +24,9 @@ except ImportError:
     exit(1)
 
 # Import service provider researchers
-from external.usajobs_researcher import USAJobsResearcher
+from mcp_services.external.usajobs_researcher import USAJobsResearcher
+from mcp_services.utils.documentation_search import get_documentation_search_index
+from mcp_services.utils.semantic_index import get_semantic_index
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -96,6 +98,55 @@ class FedJobAdvisorMCPv2:
                     },
                     "required": ["code"]
                 }
+            },
+
+            "search_documentation": {
+                "description": "Full-text search (BM25) over the local docs/ corpus. Returns ranked passages with file offsets instead of whole files. Quote a phrase to require it verbatim.",
+                "handler": self._search_documentation,
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "query": {
+                            "type": "string",
+                            "description": "Search terms, e.g. 'Fields=Full pagination' or '\"rate limit\"'"
+                        },
+                        "service": {
+                            "type": "string",
+                            "description": "Restrict to one service (e.g. usajobs, stripe, docker)"
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "default": 5,
+                            "description": "Maximum passages to return"
+                        }
+                    },
+                    "required": ["query"]
+                }
+            },
+
+            "semantic_search": {
+                "description": "Meaning-based search (local embeddings + ANN index) over docs, collected job postings and prior research reports. Finds related material that shares no keywords with the query.",
+                "handler": self._semantic_search,
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "query": {
+                            "type": "string",
+                            "description": "Natural-language description of what you are looking for"
+                        },
+                        "kinds": {
+                            "type": "array",
+                            "items": {"type": "string", "enum": ["docs", "jobs", "reports"]},
+                            "description": "Restrict to these collections"
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "default": 5,
+                            "description": "Maximum results to return"
+                        }
+                    },
+                    "required": ["query"]
+                }
             }
         }
         
@@ -221,6 +272,65 @@ class FedJobAdvisorMCPv2:
                 text=f"❌ Research error: {str(e)}"
             )]
     
+    async def _search_documentation(self, args: dict) -> Sequence[TextContent]:
+        """Handle documentation search requests"""
+        try:
+            index = await asyncio.to_thread(get_documentation_search_index)
+            results = index.search(
+                args.get("query", ""),
+                limit=int(args.get("limit", 5)),
+                service=args.get("service")
+            )
+
+            if not results:
+                return [TextContent(type="text", text=f"🔍 No documentation matches for: {args.get('query', '')}")]
+
+            response = f"🔍 **Documentation Search**: {args.get('query', '')}\n"
+            for result in results:
+                location = f"{result['path']}:{result['start']}-{result['end']}"
+                heading = f" § {result['heading']}" if result['heading'] else ""
+                response += f"\n**{result['title']}**{heading}\n`{location}` (score {result['score']})\n"
+                response += f"```\n{result['snippet']}\n```\n"
+
+            return [TextContent(type="text", text=response)]
+
+        except Exception as e:
+            logger.error(f"Documentation search failed: {e}")
+            return [TextContent(
+                type="text",
+                text=f"❌ Search error: {str(e)}"
+            )]
+
+    async def _semantic_search(self, args: dict) -> Sequence[TextContent]:
+        """Handle semantic search requests"""
+        try:
+            query = args.get("query", "")
+            index = await asyncio.to_thread(get_semantic_index)
+            results = await asyncio.to_thread(
+                index.search, query, int(args.get("limit", 5)), args.get("kinds") or None
+            )
+
+            if not results:
+                return [TextContent(type="text", text=f"🧭 No semantic matches for: {query}")]
+
+            response = f"🧭 **Semantic Search**: {query}\n"
+            for result in results:
+                heading = f" § {result['heading']}" if result.get('heading') else ""
+                location = result['path'] if 'start' not in result else f"{result['path']}:{result['start']}-{result['end']}"
+                response += f"\n**[{result['kind']}] {result['title']}**{heading}\n`{location}` (similarity {result['score']})\n"
+                if result.get('url'):
+                    response += f"{result['url']}\n"
+                response += f"```\n{result['snippet']}\n```\n"
+
+            return [TextContent(type="text", text=response)]
+
+        except Exception as e:
+            logger.error(f"Semantic search failed: {e}")
+            return [TextContent(
+                type="text",
+                text=f"❌ Search error: {str(e)}"
+            )]
+
     async def _review_usajobs(self, args: dict) -> Sequence[TextContent]:
         """Handle USAJobs implementation review"""
         try:
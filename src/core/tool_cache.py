@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+MCP Tool Result Cache
+Results of idempotent agent tools keyed on the tool name plus canonicalized
+arguments, each tool with its own TTL; identical calls arriving while the
+first is still with the agent service wait for that one upstream request
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+DEFAULT_TTL_SECONDS = 600.0
+DEFAULT_MAX_ENTRIES = 512
+
+
+def canonical_arguments(args: Any) -> Any:
+    """Arguments with dict keys sorted, None values dropped and surrounding whitespace trimmed"""
+    if isinstance(args, dict):
+        return {str(key): canonical_arguments(value)
+                for key, value in sorted(args.items(), key=lambda item: str(item[0])) if value is not None}
+    if isinstance(args, (list, tuple)):
+        return [canonical_arguments(value) for value in args]
+    if isinstance(args, str):
+        return args.strip()
+    return args
+
+
+def cache_key(tool_name: str, args: Dict[str, Any]) -> str:
+    encoded = json.dumps(canonical_arguments(args), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(f"{tool_name}\0{encoded}".encode()).hexdigest()
+
+
+class ToolResultCache:
+    """
+    In-process TTL + LRU cache with in-flight deduplication for MCP tool calls
+
+    ttls maps tool name -> seconds (0 disables caching for that tool);
+    tools in uncached always go upstream. Only results the caller marks
+    as cacheable (successful agent responses) are stored.
+    """
+
+    def __init__(self, default_ttl: float = DEFAULT_TTL_SECONDS, ttls: Optional[Dict[str, float]] = None,
+                 uncached: Iterable[str] = (), max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.uncached = set(uncached)
+        self.max_entries = max_entries
+
+        # key -> (tool name, expires at, upstream seconds, value)
+        self._entries: "OrderedDict[str, Tuple[str, float, float, Any]]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.stats = {"lookups": 0, "hits": 0, "misses": 0, "collapsed": 0, "bypassed": 0,
+                      "stored": 0, "expired": 0, "evicted": 0, "saved_seconds": 0.0}
+        self.per_tool: Dict[str, Dict[str, int]] = {}
+
+    def ttl_for(self, tool_name: str) -> float:
+        if tool_name in self.uncached:
+            return 0.0
+        return self.ttls.get(tool_name, self.default_ttl)
+
+    def _count(self, tool_name: str, outcome: str) -> None:
+        self.stats[outcome] += 1
+        counts = self.per_tool.setdefault(tool_name, {"hits": 0, "misses": 0, "collapsed": 0, "bypassed": 0})
+        counts[outcome] += 1
+
+    async def get_or_call(self, tool_name: str, args: Dict[str, Any],
+                          call: Callable[[], Awaitable[Tuple[Any, bool]]]) -> Any:
+        """
+        Cached result for (tool_name, args), else the result of call()
+
+        call returns (value, cacheable). Concurrent identical calls share
+        one call(), whether or not its value ends up cached.
+        """
+        ttl = self.ttl_for(tool_name)
+        if ttl <= 0:
+            self._count(tool_name, "bypassed")
+            value, _ = await call()
+            return value
+
+        self.stats["lookups"] += 1
+        key = cache_key(tool_name, args)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[1] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._count(tool_name, "hits")
+                self.stats["saved_seconds"] += entry[2]
+                return entry[3]
+            del self._entries[key]
+            self.stats["expired"] += 1
+
+        flight = self._in_flight.get(key)
+        if flight is not None:
+            self._count(tool_name, "collapsed")
+            # wait() leaves the flight running if this waiter is cancelled (the
+            # CancelledError propagates) and returns normally if the flight is
+            await asyncio.wait((flight,))
+            if flight.cancelled():
+                # The caller that made the request was cancelled, not this one: ask again
+                return await self.get_or_call(tool_name, args, call)
+            return flight.result()
+
+        self._count(tool_name, "misses")
+        flight = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = flight
+        started = time.monotonic()
+        try:
+            value, cacheable = await call()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as e:
+            flight.set_exception(e)
+            flight.exception()  # retrieved here so an unawaited flight does not log a warning
+            raise
+        else:
+            if cacheable:
+                self._store(key, tool_name, ttl, time.monotonic() - started, value)
+            flight.set_result(value)
+            return value
+        finally:
+            self._in_flight.pop(key, None)
+
+    def _store(self, key: str, tool_name: str, ttl: float, seconds: float, value: Any) -> None:
+        self._entries[key] = (tool_name, time.monotonic() + ttl, seconds, value)
+        self._entries.move_to_end(key)
+        self.stats["stored"] += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evicted"] += 1
+
+    def invalidate(self, tool_name: Optional[str] = None) -> int:
+        """Drop cached results, for one tool or all; returns how many were dropped"""
+        keys = [key for key, entry in self._entries.items() if tool_name is None or entry[0] == tool_name]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def report(self) -> Dict[str, Any]:
+        """Counters plus hit rate, entry count and upstream calls avoided"""
+        lookups = self.stats["lookups"]
+        return dict(
+            self.stats,
+            saved_seconds=round(self.stats["saved_seconds"], 3),
+            hit_rate=round(self.stats["hits"] / lookups, 4) if lookups else 0.0,
+            upstream_calls_saved=self.stats["hits"] + self.stats["collapsed"],
+            entries=len(self._entries),
+            in_flight=len(self._in_flight),
+            per_tool={name: dict(counts) for name, counts in sorted(self.per_tool.items())},
+        )
@@ -359,24 +359,48 @@ CREATE TABLE authentication_audit_log (
             Python code for registration and authentication verification
         """
         return '''
+import asyncio
 import base64
 import cbor2
 import hashlib
 import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import ec, rsa
-from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
+from cryptography.hazmat.primitives.asymmetric import ec, rsa, padding
 from cryptography.exceptions import InvalidSignature
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, List
 import structlog
 
+# COSE algorithm identifiers supported for assertions
+COSE_ALG_ES256 = -7
+COSE_ALG_RS256 = -257
+
 class WebAuthnVerifier:
-    """WebAuthn verification for Fed Job Advisor"""
+    """
+    WebAuthn verification for Fed Job Advisor
     
-    def __init__(self, rp_id: str, origin: str):
+    Keep one instance per (rp_id, origin) for the life of the process: parsed
+    public keys are cached per credential ID and the RP ID hash is computed once.
+    """
+    
+    def __init__(self, rp_id: str, origin: str, key_cache_size: int = 4096,
+                 max_workers: Optional[int] = None):
         self.rp_id = rp_id
         self.origin = origin
+        self.rp_id_hash = hashlib.sha256(rp_id.encode('utf-8')).digest()
         self.logger = structlog.get_logger(__name__)
+        
+        # LRU of credential_id -> (stored public key, parsed key object, COSE alg)
+        self.key_cache_size = key_cache_size
+        self._key_cache: "OrderedDict[str, Tuple[str, Any, int]]" = OrderedDict()
+        self._key_cache_lock = threading.Lock()
+        self.key_cache_stats = {"hits": 0, "misses": 0}
+        
+        # Worker pool for batch verification (signature checks run in OpenSSL)
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
     
     def verify_registration(self, credential: Dict[str, Any], 
                           challenge: bytes, user_id: str) -> Dict[str, Any]:
@@ -413,8 +437,7 @@ class WebAuthnVerifier:
             auth_data_parsed = self._parse_authenticator_data(auth_data)
             
             # Verify RP ID hash
-            rp_id_hash = hashlib.sha256(self.rp_id.encode('utf-8')).digest()
-            if auth_data_parsed['rp_id_hash'] != rp_id_hash:
+            if auth_data_parsed['rp_id_hash'] != self.rp_id_hash:
                 return {"verified": False, "error": "RP ID hash mismatch"}
             
             # Verify user present flag
@@ -462,6 +485,7 @@ class WebAuthnVerifier:
             assertion: Authentication assertion from client
             challenge: Original challenge sent to client
             stored_credential: Previously stored credential data
+                (credential_id, public_key, signature_counter)
             
         Returns:
             Verification result
@@ -484,8 +508,7 @@ class WebAuthnVerifier:
             auth_data_parsed = self._parse_authenticator_data(authenticator_data)
             
             # Verify RP ID hash
-            rp_id_hash = hashlib.sha256(self.rp_id.encode('utf-8')).digest()
-            if auth_data_parsed['rp_id_hash'] != rp_id_hash:
+            if auth_data_parsed['rp_id_hash'] != self.rp_id_hash:
                 return {"verified": False, "error": "RP ID hash mismatch"}
             
             # Verify flags
@@ -513,10 +536,10 @@ class WebAuthnVerifier:
             client_data_hash = hashlib.sha256(client_data_json).digest()
             signed_data = authenticator_data + client_data_hash
             
-            # Verify signature with stored public key
-            public_key_bytes = base64.urlsafe_b64decode(stored_credential['public_key'] + '==')
+            # Verify signature with the (cached) parsed public key
+            public_key, alg = self._get_public_key(stored_credential)
             signature_valid = self._verify_signature(
-                public_key_bytes, signed_data, signature
+                public_key, alg, signed_data, signature
             )
             
             if not signature_valid:
@@ -532,6 +555,66 @@ class WebAuthnVerifier:
             self.logger.error("Authentication verification failed", error=str(e))
             return {"verified": False, "error": f"Verification error: {str(e)}"}
     
+    async def verify_authentication_batch(
+        self, requests: List[Tuple[Dict[str, Any], bytes, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Verify many assertions concurrently without blocking the event loop
+        
+        Args:
+            requests: (assertion, challenge, stored_credential) tuples
+            
+        Returns:
+            Verification results in request order
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="webauthn-verify"
+            )
+        
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(*[
+            loop.run_in_executor(self._executor, self.verify_authentication, assertion, challenge, stored)
+            for assertion, challenge, stored in requests
+        ])
+    
+    def invalidate_credential(self, credential_id: str) -> None:
+        """Drop a cached public key (call on credential revocation or deletion)"""
+        with self._key_cache_lock:
+            self._key_cache.pop(credential_id, None)
+    
+    def close(self) -> None:
+        """Shut down the batch verification worker pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
+    def _get_public_key(self, stored_credential: Dict[str, Any]) -> Tuple[Any, int]:
+        """Return the parsed public key for a stored credential, using the LRU cache"""
+        stored_key = stored_credential['public_key']
+        cache_key = stored_credential.get('credential_id') or stored_key
+        
+        with self._key_cache_lock:
+            cached = self._key_cache.get(cache_key)
+            # The stored key is compared so a replaced credential never reuses a stale key
+            if cached is not None and cached[0] == stored_key:
+                self._key_cache.move_to_end(cache_key)
+                self.key_cache_stats["hits"] += 1
+                return cached[1], cached[2]
+        
+        public_key, alg = self._load_public_key(
+            base64.urlsafe_b64decode(stored_key + '==')
+        )
+        
+        with self._key_cache_lock:
+            self.key_cache_stats["misses"] += 1
+            self._key_cache[cache_key] = (stored_key, public_key, alg)
+            self._key_cache.move_to_end(cache_key)
+            while len(self._key_cache) > self.key_cache_size:
+                self._key_cache.popitem(last=False)
+        
+        return public_key, alg
+    
     def _verify_client_data(self, client_data: Dict[str, Any], 
                           challenge: bytes, expected_type: str) -> bool:
         """Verify client data JSON"""
@@ -615,58 +698,47 @@ class WebAuthnVerifier:
         
         return result
     
-    def _verify_signature(self, public_key_bytes: bytes, 
-                         signed_data: bytes, signature: bytes) -> bool:
-        """Verify signature with public key"""
-        try:
-            # Parse CBOR public key
-            public_key_cbor = cbor2.loads(public_key_bytes)
+    def _load_public_key(self, public_key_bytes: bytes) -> Tuple[Any, int]:
+        """Parse a COSE_Key into a cryptography public key object"""
+        cose_key = cbor2.loads(public_key_bytes)
+        
+        kty = cose_key[1]  # Key type
+        alg = cose_key[3]  # Algorithm
+        
+        if kty == 2:  # EC2 key type
+            curve = cose_key[-1]
+            x = cose_key[-2]
+            y = cose_key[-3]
             
-            kty = public_key_cbor[1]  # Key type
-            alg = public_key_cbor[3]  # Algorithm
+            if curve != 1:  # P-256
+                raise ValueError(f"Unsupported curve: {curve}")
             
-            if kty == 2:  # EC2 key type
-                # Extract coordinates
-                x = public_key_cbor[-2]
-                y = public_key_cbor[-1]
-                curve = public_key_cbor[-1]
-                
-                # Create EC public key
-                if curve == 1:  # P-256
-                    curve_obj = ec.SECP256R1()
-                else:
-                    raise ValueError(f"Unsupported curve: {curve}")
-                
-                public_key = ec.EllipticCurvePublicKey.from_encoded_point(
-                    curve_obj, b'\x04' + x + y
+            public_key = ec.EllipticCurvePublicKey.from_encoded_point(
+                ec.SECP256R1(), b'\x04' + x + y
+            )
+        elif kty == 3:  # RSA key type
+            n = int.from_bytes(cose_key[-1], 'big')
+            e = int.from_bytes(cose_key[-2], 'big')
+            public_key = rsa.RSAPublicNumbers(e, n).public_key()
+        else:
+            raise ValueError(f"Unsupported key type: {kty}")
+        
+        return public_key, alg
+    
+    def _verify_signature(self, public_key: Any, alg: int,
+                         signed_data: bytes, signature: bytes) -> bool:
+        """Verify signature with a parsed public key"""
+        try:
+            if alg == COSE_ALG_ES256:
+                # WebAuthn ES256 signatures are DER encoded, as cryptography expects
+                public_key.verify(signature, signed_data, ec.ECDSA(hashes.SHA256()))
+            elif alg == COSE_ALG_RS256:
+                public_key.verify(
+                    signature, signed_data,
+                    padding.PKCS1v15(), hashes.SHA256()
                 )
-                
-                # For ES256, signature is DER encoded
-                if alg == -7:  # ES256
-                    # Convert to raw format if needed
-                    try:
-                        r, s = decode_dss_signature(signature)
-                        signature = r.to_bytes(32, 'big') + s.to_bytes(32, 'big')
-                    except:
-                        pass  # Already in raw format
-                    
-                    public_key.verify(signature, signed_data, ec.ECDSA(hashes.SHA256()))
-                
-            elif kty == 3:  # RSA key type
-                # Extract modulus and exponent
-                n = int.from_bytes(public_key_cbor[-1], 'big')
-                e = int.from_bytes(public_key_cbor[-2], 'big')
-                
-                # Create RSA public key
-                public_numbers = rsa.RSAPublicNumbers(e, n)
-                public_key = public_numbers.public_key()
-                
-                # For RS256
-                if alg == -257:  # RS256
-                    public_key.verify(
-                        signature, signed_data, 
-                        padding.PKCS1v15(), hashes.SHA256()
-                    )
+            else:
+                raise ValueError(f"Unsupported algorithm: {alg}")
             
             return True
             
@@ -1022,6 +1094,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi.security import HTTPBearer
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, List
+from functools import lru_cache
 import base64
 import secrets
 import json
@@ -1056,11 +1129,16 @@ class AuthenticationCompleteRequest(BaseModel):
     assertion: Dict[str, Any]
     user_id: Optional[str] = None
 
+# One verifier per (rp_id, origin) so its public-key cache survives across requests
+@lru_cache(maxsize=8)
+def _verifier_for(rp_id: str, origin: str) -> WebAuthnVerifier:
+    return WebAuthnVerifier(rp_id=rp_id, origin=origin)
+
 # Dependency to get WebAuthn verifier
 def get_webauthn_verifier(request: Request) -> WebAuthnVerifier:
     rp_id = request.url.hostname
     origin = str(request.url).replace(request.url.path, "")
-    return WebAuthnVerifier(rp_id=rp_id, origin=origin)
+    return _verifier_for(rp_id, origin)
 
 @router.post("/register/begin")
 async def webauthn_register_begin(
@@ -1359,6 +1437,7 @@ async def webauthn_authenticate_complete(
         
         # Prepare stored credential data for verification
         stored_cred_data = {
+            "credential_id": request.assertion["rawId"],
             "public_key": base64.urlsafe_b64encode(stored_credential.public_key).decode(),
             "signature_counter": stored_credential.signature_counter
         }
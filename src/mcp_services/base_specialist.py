@@ -1,35 +1,37 @@
 #!/usr/bin/env python3
 """
-Base Specialist Agent with TTL Documentation Management
+Base Specialist Agent with shared Documentation Store
 All service specialist agents inherit from this base class
 """
 
 from pathlib import Path
-import json
 import os
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
-import hashlib
-import pickle
 from abc import ABC, abstractmethod
 
+from .utils.documentation_store import get_documentation_store, LazyDocumentation
+from .utils.documentation_search import get_documentation_search_index
+
 class ServiceSpecialistBase(ABC):
     """
-    Base class for all service specialist agents with TTL documentation management
-    Weekly refresh pattern for all documentation
+    Base class for all service specialist agents
+    Documentation sections load lazily from the process-wide DocumentationStore;
+    each source file is re-read only when its mtime/size changes
     """
     
-    def __init__(self, service_name: str):
+    def __init__(self, service_name: str, docs_path: Optional[Path] = None):
         self.service_name = service_name
         self.base_path = Path(__file__).parent.parent
-        self.docs_path = self.base_path / "documentation" / "external_services" / service_name
+        self.docs_path = docs_path or self.base_path / "documentation" / "external_services" / service_name
         self.cache_path = self.base_path / ".cache" / "docs" / service_name
         self.cache_path.mkdir(parents=True, exist_ok=True)
         self.research_output = self.base_path / "research_outputs" / f"{service_name}_outputs"
         self.research_output.mkdir(parents=True, exist_ok=True)
         
-        # Universal TTL pattern - 1 week for everything
-        self.cache_ttl_days = 7  # All documentation refreshes weekly
+        # Reported for compatibility; sources are now validated per file on access
+        self.cache_ttl_days = 7
+        self.doc_store = get_documentation_store()
         
         # Load documentation and knowledge base
         self.documentation = self._load_all_documentation()
@@ -38,177 +40,85 @@ class ServiceSpecialistBase(ABC):
         # Check documentation freshness
         self._check_documentation_freshness()
     
-    def _load_all_documentation(self) -> Dict[str, Any]:
-        """Load all documentation with TTL caching"""
-        docs = {}
-        
-        # Check if cached documentation exists and is fresh
-        cache_file = self.cache_path / "complete_docs.cache"
-        
-        if self._is_cache_fresh(cache_file):
-            try:
-                with open(cache_file, 'rb') as f:
-                    docs = pickle.load(f)
-                    print(f"📚 Loaded cached {self.service_name} documentation (TTL: {self.cache_ttl_days} days)")
-                    return docs
-            except Exception as e:
-                print(f"⚠️ Cache load failed: {e}, refreshing documentation...")
-        
-        # Load fresh documentation
-        print(f"🔄 Refreshing {self.service_name} documentation (weekly TTL expired or cache missing)")
-        
-        docs = {
-            "manifest": self._load_manifest(),
-            "api_reference": self._load_api_reference(),
-            "best_practices": self._load_best_practices(),
-            "troubleshooting": self._load_troubleshooting(),
-            "examples": self._load_examples(),
-            "fed_job_advisor": self._load_fed_job_advisor_config(),
-            "last_refreshed": datetime.now().isoformat()
-        }
-        
-        # Cache the complete documentation
-        try:
-            with open(cache_file, 'wb') as f:
-                pickle.dump(docs, f)
-                print(f"💾 Cached {self.service_name} documentation (expires in 7 days)")
-        except Exception as e:
-            print(f"⚠️ Failed to cache documentation: {e}")
-        
-        return docs
-    
-    def _is_cache_fresh(self, cache_file: Path) -> bool:
-        """Check if cache is within TTL period (1 week)"""
-        if not cache_file.exists():
-            return False
-        
-        try:
-            cache_age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
-            is_fresh = cache_age.days < self.cache_ttl_days
-            
-            if not is_fresh:
-                print(f"📅 Cache expired: {cache_age.days} days old (TTL: {self.cache_ttl_days} days)")
-            
-            return is_fresh
-        except:
-            return False
+    def _load_all_documentation(self) -> LazyDocumentation:
+        """Map each documentation section to a lazy loader backed by the shared store"""
+        return LazyDocumentation({
+            "manifest": self._load_manifest,
+            "api_reference": self._load_api_reference,
+            "best_practices": self._load_best_practices,
+            "troubleshooting": self._load_troubleshooting,
+            "examples": self._load_examples,
+            "fed_job_advisor": self._load_fed_job_advisor_config,
+            "last_refreshed": lambda: datetime.now().isoformat()
+        })
     
     def _load_manifest(self) -> Dict[str, Any]:
         """Load service manifest"""
-        manifest_file = self.docs_path / "manifest.json"
+        manifest = self.doc_store.get_json(self.docs_path / "manifest.json", self.service_name, "manifest")
         
-        if manifest_file.exists():
-            try:
-                with open(manifest_file, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"⚠️ Error loading manifest: {e}")
-        
-        # Return default manifest with embedded knowledge
-        return self._get_default_manifest()
+        # Fall back to default manifest with embedded knowledge
+        return manifest if manifest is not None else self._get_default_manifest()
     
     def _load_api_reference(self) -> Dict[str, Any]:
         """Load API reference documentation"""
-        api_file = self.docs_path / "official" / "api_reference.json"
-        
-        if api_file.exists():
-            try:
-                with open(api_file, 'r') as f:
-                    return json.load(f)
-            except:
-                pass
-        
-        # Return embedded API reference
-        return self._get_embedded_api_reference()
+        api_reference = self.doc_store.get_json(
+            self.docs_path / "official" / "api_reference.json", self.service_name, "api_reference"
+        )
+        return api_reference if api_reference is not None else self._get_embedded_api_reference()
     
     def _load_best_practices(self) -> Dict[str, Any]:
         """Load best practices"""
-        practices_file = self.docs_path / "best_practices" / "patterns.json"
-        
-        if practices_file.exists():
-            try:
-                with open(practices_file, 'r') as f:
-                    return json.load(f)
-            except:
-                pass
-        
-        return self._get_embedded_best_practices()
+        practices = self.doc_store.get_json(
+            self.docs_path / "best_practices" / "patterns.json", self.service_name, "best_practices"
+        )
+        return practices if practices is not None else self._get_embedded_best_practices()
     
     def _load_troubleshooting(self) -> Dict[str, Any]:
         """Load troubleshooting guide"""
-        troubleshooting_file = self.docs_path / "troubleshooting" / "common_issues.json"
-        
-        if troubleshooting_file.exists():
-            try:
-                with open(troubleshooting_file, 'r') as f:
-                    return json.load(f)
-            except:
-                pass
-        
-        return self._get_embedded_troubleshooting()
+        troubleshooting = self.doc_store.get_json(
+            self.docs_path / "troubleshooting" / "common_issues.json", self.service_name, "troubleshooting"
+        )
+        return troubleshooting if troubleshooting is not None else self._get_embedded_troubleshooting()
     
     def _load_examples(self) -> Dict[str, str]:
         """Load code examples"""
-        examples_dir = self.docs_path / "examples"
-        examples = {}
-        
-        if examples_dir.exists():
-            for example_file in examples_dir.glob("*"):
-                if example_file.is_file():
-                    try:
-                        with open(example_file, 'r') as f:
-                            examples[example_file.stem] = f.read()
-                    except:
-                        pass
-        
+        examples = self.doc_store.get_directory(self.docs_path / "examples", self.service_name, "examples")
         return examples if examples else self._get_embedded_examples()
     
     def _load_fed_job_advisor_config(self) -> Dict[str, Any]:
         """Load Fed Job Advisor specific configuration"""
-        config_file = self.docs_path / "fed_job_advisor" / "configuration.json"
-        
-        if config_file.exists():
-            try:
-                with open(config_file, 'r') as f:
-                    return json.load(f)
-            except:
-                pass
-        
-        return {}
+        config = self.doc_store.get_json(
+            self.docs_path / "fed_job_advisor" / "configuration.json", self.service_name, "fed_job_advisor"
+        )
+        return config if config is not None else {}
     
     def _check_documentation_freshness(self):
-        """Check if documentation needs updating (weekly check)"""
-        last_refreshed = self.documentation.get("last_refreshed")
-        
-        if last_refreshed:
-            try:
-                refresh_date = datetime.fromisoformat(last_refreshed)
-                days_old = (datetime.now() - refresh_date).days
-                
-                if days_old >= self.cache_ttl_days:
-                    print(f"⚠️ {self.service_name} documentation is {days_old} days old (TTL: {self.cache_ttl_days} days)")
-                    print(f"   Run refresh_documentation() to update")
-                else:
-                    print(f"✅ {self.service_name} documentation is fresh ({days_old}/{self.cache_ttl_days} days)")
-            except:
-                pass
+        """Report stored documentation for this service (sources are validated per file on access)"""
+        status = self.doc_store.service_status(self.service_name)
+        if status["documents"]:
+            print(f"✅ {self.service_name} documentation: {status['documents']} stored files "
+                  f"(newest source {status['newest_source']})")
     
     def refresh_documentation(self):
-        """Force refresh of all documentation (clears cache)"""
+        """Force refresh of all documentation (drops stored rows for this service)"""
         print(f"🔄 Force refreshing {self.service_name} documentation...")
         
-        # Clear cache
-        cache_file = self.cache_path / "complete_docs.cache"
-        if cache_file.exists():
-            cache_file.unlink()
-            print(f"🗑️ Cleared cache for {self.service_name}")
+        cleared = self.doc_store.invalidate(self.service_name)
+        if cleared:
+            print(f"🗑️ Cleared {cleared} stored documents for {self.service_name}")
         
-        # Reload documentation
-        self.documentation = self._load_all_documentation()
+        # Sections reload lazily on next access
+        self.documentation.reload()
         self.knowledge_base = self._initialize_knowledge_base()
         
         print(f"✅ {self.service_name} documentation refreshed")
     
+    def search_documentation(self, query: str, limit: int = 3) -> List[Dict[str, Any]]:
+        """Ranked docs/ passages for this service (all services if none are indexed for it)"""
+        index = get_documentation_search_index()
+        results = index.search(query, limit=limit, service=self.service_name)
+        return results or index.search(query, limit=limit)
+    
     def get_critical_info(self) -> Dict[str, Any]:
         """Get critical service information"""
         manifest = self.documentation.get("manifest", {})
@@ -230,6 +140,8 @@ class ServiceSpecialistBase(ABC):
             "ttl_days": self.cache_ttl_days,
             "last_refreshed": last_refreshed,
             "documentation_loaded": bool(self.documentation),
+            "sections_loaded": self.documentation.loaded_sections(),
+            "stored_documents": self.doc_store.service_status(self.service_name)["documents"],
             "has_manifest": bool(self.documentation.get("manifest")),
             "has_api_reference": bool(self.documentation.get("api_reference")),
             "has_examples": bool(self.documentation.get("examples"))
@@ -283,8 +195,8 @@ class ServiceSpecialistBase(ABC):
 
 class DocumentationTTLManager:
     """
-    Manages TTL for all service documentation
-    Ensures weekly refresh pattern across all agents
+    Manages TTL for legacy pickled documentation caches (complete_docs.cache)
+    Specialists now read through the shared DocumentationStore instead
     """
     
     def __init__(self):
@@ -11,6 +11,8 @@ from typing import Dict, Any, Optional
 import httpx
 import asyncio
 
+from ..utils.documentation_search import get_documentation_search_index
+
 class USAJobsResearcher:
     """
     Research-only agent for USAJobs API
@@ -107,7 +109,9 @@ class USAJobsResearcher:
             "api_endpoints": self._identify_endpoints(task_analysis),
             "parameters": self._determine_parameters(task_analysis),
             "warnings": [],
-            "best_practices": []
+            "best_practices": [],
+            # Only the passages relevant to this task, not whole documentation files
+            "documentation_snippets": await asyncio.to_thread(self._relevant_documentation, task)
         }
         
         # Add specific warnings
@@ -137,6 +141,23 @@ class USAJobsResearcher:
             "api_calls": len(research["api_endpoints"])
         }
     
+    def _relevant_documentation(self, task: str, limit: int = 3) -> list:
+        """Ranked USAJobs documentation passages for a task (file path + offsets + snippet)"""
+        try:
+            index = get_documentation_search_index()
+        except Exception as e:
+            print(f"⚠️ Documentation search unavailable: {e}")
+            return []
+
+        return [
+            {
+                "source": f"{result['path']}:{result['start']}-{result['end']}",
+                "heading": result["heading"],
+                "snippet": result["snippet"]
+            }
+            for result in index.search(task, limit=limit, service="usajobs")
+        ]
+    
     def _analyze_task(self, task: str) -> Dict[str, Any]:
         """Analyze what the task is asking for"""
         task_lower = task.lower()
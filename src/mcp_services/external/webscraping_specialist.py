@@ -11,7 +11,7 @@ import json
 import re
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Set
-from urllib.parse import urljoin, urlparse, urlunparse
+from urllib.parse import urljoin, urlparse, urlunparse, urldefrag
 from bs4 import BeautifulSoup
 import hashlib
 from datetime import datetime
@@ -19,6 +19,8 @@ import time
 import logging
 
 from ..base_specialist import ServiceSpecialistBase
+from ..utils.http_cache import get_http_cache, empty_stats, hit_ratio
+from ..utils.near_duplicates import SimHashIndex, canonicalize_url, simhash, MIN_FINGERPRINT_WORDS
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -37,6 +39,7 @@ class WebscrapingSpecialist(ServiceSpecialistBase):
         self.delay_between_requests = 1.0  # seconds
         self.timeout = 30
         self.max_concurrent = 5
+        self.skip_near_duplicates = True
         
         super().__init__("webscraping")
         
@@ -68,6 +71,13 @@ class WebscrapingSpecialist(ServiceSpecialistBase):
         # Cache for scraped content
         self.scraped_cache = {}
         
+        # Conditional-fetch cache shared across runs; counters cover this instance's run
+        self.http_cache = get_http_cache()
+        self.cache_stats = empty_stats()
+        
+        # SimHash fingerprints of pages kept so far, keyed by canonical URL, across crawls
+        self.page_index = SimHashIndex()
+        
     def _initialize_knowledge_base(self) -> Dict[str, Any]:
         """Initialize webscraping knowledge base"""
         return {
@@ -233,38 +243,38 @@ async def traverse_documentation(start_url, max_depth=2):
                 
                 logger.info(f"Scraping: {url}")
                 
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        return {
-                            "success": False,
-                            "error": f"HTTP {response.status}: {response.reason}",
-                            "url": url
-                        }
-                    
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Extract main content
-                    content = self._extract_main_content(soup, content_selector)
-                    
-                    # Extract links if requested
-                    links = []
-                    if extract_links:
-                        links = self._extract_links(soup, url)
-                    
-                    # Extract metadata
-                    metadata = self._extract_metadata(soup)
-                    
+                fetched = await self._fetch(session, url)
+                if fetched["status"] != 200:
                     return {
-                        "success": True,
-                        "url": url,
-                        "title": metadata.get("title", ""),
-                        "content": content,
-                        "links": links,
-                        "metadata": metadata,
-                        "scraped_at": datetime.now().isoformat()
+                        "success": False,
+                        "error": f"HTTP {fetched['status']}: {fetched['reason']}",
+                        "url": url
                     }
-                    
+                
+                soup = BeautifulSoup(fetched["text"], 'html.parser')
+                
+                # Extract main content
+                content = self._extract_main_content(soup, content_selector)
+                
+                # Extract links if requested
+                links = []
+                if extract_links:
+                    links = self._extract_links(soup, url)
+                
+                # Extract metadata
+                metadata = self._extract_metadata(soup)
+                
+                return {
+                    "success": True,
+                    "url": url,
+                    "title": metadata.get("title", ""),
+                    "content": content,
+                    "links": links,
+                    "metadata": metadata,
+                    "from_cache": fetched["from_cache"],
+                    "scraped_at": datetime.now().isoformat()
+                }
+                
         except Exception as e:
             logger.error(f"Error scraping {url}: {e}")
             return {
@@ -273,6 +283,28 @@ async def traverse_documentation(start_url, max_depth=2):
                 "url": url
             }
     
+    async def _fetch(self, session: aiohttp.ClientSession, url: str) -> Dict[str, Any]:
+        """GET a page, conditionally when the HTTP cache holds validators for it"""
+        
+        if self.http_cache is not None:
+            return await self.http_cache.fetch(session, url, stats=self.cache_stats)
+        
+        async with session.get(url) as response:
+            return {
+                "status": response.status,
+                "reason": response.reason,
+                "text": await response.text(),
+                "from_cache": False
+            }
+    
+    def record_cache_run(self, label: str) -> Dict[str, Any]:
+        """Persist this run's HTTP cache hit/miss counters and start a new run"""
+        
+        stats, self.cache_stats = self.cache_stats, empty_stats()
+        if self.http_cache is None:
+            return dict(stats, hit_ratio=hit_ratio(stats))
+        return self.http_cache.record_run(label, stats)
+    
     async def traverse_documentation(self, start_url: str, max_depth: Optional[int] = None,
                                    max_pages: Optional[int] = None, 
                                    link_patterns: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -282,9 +314,11 @@ async def traverse_documentation(start_url, max_depth=2):
         max_depth = max_depth or self.max_depth
         max_pages = max_pages or self.max_pages
         
-        visited = set()
+        visited = set()  # canonical URLs
         to_visit = [(start_url, 0)]
         scraped_content = {}
+        duplicates = {}  # near-duplicate URL -> canonical URL of the page kept
+        dedup_stats = {"pages_fetched": 0, "near_duplicates": 0, "skipped_bytes": 0}
         errors = []
         
         logger.info(f"Starting documentation traversal from: {start_url}")
@@ -293,27 +327,37 @@ async def traverse_documentation(start_url, max_depth=2):
         try:
             while to_visit and len(scraped_content) < max_pages:
                 url, depth = to_visit.pop(0)
+                canonical = canonicalize_url(url)
                 
-                if url in visited or depth > max_depth:
+                if canonical in visited or depth > max_depth:
                     continue
                 
-                visited.add(url)
+                visited.add(canonical)
                 
                 # Scrape the page
-                result = await self.scrape_single_page(url, extract_links=True)
+                result = await self.scrape_single_page(urldefrag(url)[0], extract_links=True)
                 
                 if result["success"]:
-                    scraped_content[url] = result
+                    dedup_stats["pages_fetched"] += 1
+                    original = self._near_duplicate_of(canonical, result["content"])
+                    if original:
+                        # Same content under another URL: link back instead of storing a copy
+                        duplicates[url] = original
+                        dedup_stats["near_duplicates"] += 1
+                        dedup_stats["skipped_bytes"] += len(result["content"].encode())
+                        logger.info(f"Skipping {url}: near-duplicate of {original}")
+                    else:
+                        scraped_content[url] = result
                     
                     # Extract and filter links for next level
-                    if depth < max_depth:
+                    if not original and depth < max_depth:
                         page_links = result.get("links", [])
                         filtered_links = self._filter_documentation_links(
                             page_links, start_url, link_patterns
                         )
                         
                         for link in filtered_links:
-                            if link not in visited:
+                            if canonicalize_url(link) not in visited:
                                 to_visit.append((link, depth + 1))
                 else:
                     errors.append(result)
@@ -332,6 +376,12 @@ async def traverse_documentation(start_url, max_depth=2):
                 "total_pages": len(scraped_content),
                 "content": scraped_content,
                 "errors": errors,
+                "pages_from_cache": sum(1 for page in scraped_content.values() if page.get("from_cache")),
+                "duplicates": duplicates,
+                "deduplication": dict(
+                    dedup_stats,
+                    duplicate_ratio=round(dedup_stats["near_duplicates"] / max(dedup_stats["pages_fetched"], 1), 4)
+                ),
                 "traversal_completed_at": datetime.now().isoformat(),
                 "configuration": {
                     "max_depth": max_depth,
@@ -349,6 +399,20 @@ async def traverse_documentation(start_url, max_depth=2):
                 "errors": errors
             }
     
+    def _near_duplicate_of(self, canonical: str, content: str) -> Optional[str]:
+        """Canonical URL of an already kept page with near-identical text; indexes the page otherwise"""
+        
+        if len(content.split()) < MIN_FINGERPRINT_WORDS:
+            return None
+        
+        fingerprint = simhash(content)
+        match = self.page_index.find(fingerprint)
+        if self.skip_near_duplicates and match and match[0] != canonical:
+            return match[0]
+        
+        self.page_index.add(canonical, fingerprint)
+        return None
+    
     def _extract_main_content(self, soup: BeautifulSoup, selector: Optional[str] = None) -> str:
         """Extract main content from page"""
         
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Incremental Codebase Scanner - manifest-backed, process-parallel service scanning
+Unchanged files are skipped via a persistent SQLite manifest of (mtime, size, hash, findings),
+changed files are read once and matched pattern by pattern in a process pool
+"""
+
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Tuple, Optional, Iterable
+import asyncio
+import bisect
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+from contextlib import closing
+
+# Default file types worth scanning for service references
+SCAN_EXTENSIONS = {'.py', '.js', '.ts', '.jsx', '.tsx', '.json', '.md', '.env', '.yaml', '.yml'}
+
+# Directories that never contain first-party service references
+SKIP_DIRS = {'.git', 'node_modules', '__pycache__', '.venv', 'venv', '.mypy_cache',
+             '.pytest_cache', '.ruff_cache', '.tox', '.cache', 'dist', 'build', '.next'}
+
+# Common false positives shared with ServiceDiscoveryAgent._is_valid_service
+FALSE_POSITIVES = {
+    'os', 'sys', 'json', 'path', 'date', 'time', 'user', 'data',
+    'config', 'util', 'helper', 'test', 'main', 'app', 'api',
+    'db', 'client', 'server', 'local', 'dev', 'prod', 'env'
+}
+
+MANIFEST_VERSION = 2
+
+
+def is_valid_service_name(service_name: str) -> bool:
+    """Check if discovered name is likely a real service"""
+    return (
+        len(service_name) > 2 and
+        service_name not in FALSE_POSITIVES and
+        not service_name.isdigit() and
+        service_name.isalpha()
+    )
+
+
+def flatten_patterns(service_patterns: Dict[str, List[str]]) -> List[Tuple[str, str]]:
+    """
+    Flatten the pattern table into (pattern_type, pattern) pairs in scan order.
+    Patterns are matched one at a time rather than as a single alternation: an
+    alternation consumes text another pattern would also match (`from stripe
+    import twilio` holds matches for two import patterns that overlap).
+    """
+    return [(pattern_type, pattern) for pattern_type, patterns in service_patterns.items() for pattern in patterns]
+
+
+def _line_context(content: str, line_starts: List[int], position: int) -> str:
+    """Return the matched line with one line of surrounding context"""
+    line_no = bisect.bisect_right(line_starts, position) - 1
+    start = line_starts[max(0, line_no - 1)]
+    end_line = min(len(line_starts), line_no + 2)
+    end = line_starts[end_line] - 1 if end_line < len(line_starts) else len(content)
+    return ' | '.join(content[start:end].split('\n'))
+
+
+def scan_file_worker(file_path: str, patterns: List[Tuple[str, str]],
+                     known_hash: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Read, hash and match one file (runs inside the process pool).
+    If the content hash equals known_hash the regex pass is skipped.
+    """
+    try:
+        raw = Path(file_path).read_bytes()
+    except OSError as e:
+        return {"path": file_path, "error": str(e)}
+
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    if known_hash is not None and digest == known_hash:
+        return {"path": file_path, "hash": digest, "unchanged": True}
+
+    # Universal newlines, as Path.read_text() would give
+    content = raw.decode('utf-8', errors='ignore').replace('\r\n', '\n').replace('\r', '\n')
+    line_starts = [0] + [m.end() for m in re.finditer('\n', content)]
+    contexts: Dict[str, str] = {}
+
+    def context_for(match: str) -> str:
+        # Context is taken from the first line containing the matched text
+        if match not in contexts:
+            position = content.find(match) if '\n' not in match else -1
+            contexts[match] = _line_context(content, line_starts, position) if position >= 0 else ""
+        return contexts[match]
+
+    findings = []
+    for pattern_type, pattern in patterns:
+        regex = _compiled(pattern)
+        for match in regex.finditer(content):
+            # findall() semantics: first group if the pattern has one, else the whole match
+            value = match.group(1 if regex.groups else 0) or ""
+            service_name = value.lower().strip()
+            if is_valid_service_name(service_name):
+                findings.append({
+                    "pattern_type": pattern_type,
+                    "service": service_name,
+                    "pattern": pattern,
+                    "context": context_for(value)
+                })
+
+    return {"path": file_path, "hash": digest, "findings": findings}
+
+
+def scan_batch_worker(batch: List[Tuple[str, Optional[str]]],
+                      patterns: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    """Scan a chunk of files in one task to amortize process-pool IPC"""
+    return [scan_file_worker(path, patterns, known_hash) for path, known_hash in batch]
+
+
+_REGEX_CACHE: Dict[str, "re.Pattern[str]"] = {}
+
+
+def _compiled(pattern: str) -> "re.Pattern[str]":
+    """Compile each pattern once per worker process"""
+    regex = _REGEX_CACHE.get(pattern)
+    if regex is None:
+        regex = re.compile(pattern, re.IGNORECASE)
+        _REGEX_CACHE[pattern] = regex
+    return regex
+
+
+class IncrementalCodebaseScanner:
+    """
+    Scans directory trees for service references, reusing findings for files
+    whose (mtime, size) or content hash match the persistent manifest
+    """
+
+    def __init__(self, service_patterns: Dict[str, List[str]], manifest_path: Path,
+                 extensions: Optional[Iterable[str]] = None, max_workers: Optional[int] = None,
+                 parallel_threshold: int = 64, batch_size: int = 32):
+        self.service_patterns = service_patterns
+        self.manifest_path = Path(manifest_path)
+        self.extensions = set(extensions or SCAN_EXTENSIONS)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.parallel_threshold = parallel_threshold
+        self.batch_size = batch_size
+
+        self.patterns = flatten_patterns(service_patterns)
+        self.patterns_key = hashlib.sha1(json.dumps(self.patterns).encode()).hexdigest()
+        self.manifest = self._load_manifest()
+        self.last_stats: Dict[str, Any] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the manifest database, creating the schema on first use"""
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.manifest_path))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, hash TEXT, findings TEXT)"
+        )
+        return conn
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Load manifest entries, discarding them if the pattern set changed"""
+        try:
+            with closing(self._connect()) as conn:
+                meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+                if meta.get("version") != str(MANIFEST_VERSION) or meta.get("patterns_key") != self.patterns_key:
+                    with conn:
+                        conn.execute("DELETE FROM files")
+                        conn.executemany(
+                            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                            [("version", str(MANIFEST_VERSION)), ("patterns_key", self.patterns_key)]
+                        )
+                    return {}
+
+                return {
+                    path: {"mtime_ns": mtime_ns, "size": size, "hash": digest, "findings": json.loads(findings)}
+                    for path, mtime_ns, size, digest, findings in conn.execute(
+                        "SELECT path, mtime_ns, size, hash, findings FROM files"
+                    )
+                }
+        except sqlite3.Error as e:
+            print(f"⚠️ Scan manifest unreadable ({e}), starting cold scan")
+            return {}
+
+    def save_manifest(self, changed: Iterable[str], removed: Iterable[str]) -> None:
+        """Write only changed and removed rows, in a single transaction"""
+        rows = [
+            (path, entry["mtime_ns"], entry["size"], entry["hash"], json.dumps(entry["findings"]))
+            for path in changed
+            for entry in (self.manifest[path],)
+        ]
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO files (path, mtime_ns, size, hash, findings) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            conn.executemany("DELETE FROM files WHERE path = ?", [(path,) for path in removed])
+
+    def iter_files(self, directory: Path) -> Iterable[Tuple[str, os.stat_result]]:
+        """Walk the tree with os.scandir, pruning vendored/cache directories"""
+        stack = [str(directory)]
+
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name not in SKIP_DIRS:
+                                    stack.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                if os.path.splitext(entry.name)[1] in self.extensions or entry.name == '.env':
+                                    yield entry.path, entry.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+
+    async def scan(self, directories: Iterable[Path]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Scan directories and return path -> findings for every file present.
+        Only new or modified files are read; the manifest is updated and saved.
+        """
+        directories = [Path(directory) for directory in directories]
+        started = time.perf_counter()
+        seen: Dict[str, Tuple[int, int]] = {}
+        to_scan: List[Tuple[str, Optional[str]]] = []
+        reused = 0
+
+        for directory in directories:
+            if not directory.exists():
+                continue
+            for path, stat in self.iter_files(directory):
+                key = (stat.st_mtime_ns, stat.st_size)
+                seen[path] = key
+                entry = self.manifest.get(path)
+
+                if entry and entry["mtime_ns"] == key[0] and entry["size"] == key[1]:
+                    reused += 1
+                elif entry and entry["size"] == key[1]:
+                    # Touched but possibly identical - let the worker compare hashes
+                    to_scan.append((path, entry["hash"]))
+                else:
+                    to_scan.append((path, None))
+
+        walked = time.perf_counter()
+        results = await self._run_workers(to_scan)
+
+        rescanned = 0
+        hash_hits = 0
+        changed = []
+        for result in results:
+            path = result["path"]
+            if "error" in result:
+                seen.pop(path, None)
+                continue
+
+            mtime_ns, size = seen[path]
+            changed.append(path)
+            if result.get("unchanged"):
+                hash_hits += 1
+                self.manifest[path].update({"mtime_ns": mtime_ns, "size": size})
+            else:
+                rescanned += 1
+                self.manifest[path] = {
+                    "mtime_ns": mtime_ns,
+                    "size": size,
+                    "hash": result["hash"],
+                    "findings": result["findings"]
+                }
+
+        # Forget files that disappeared from the scanned trees (other trees are left alone)
+        roots = tuple(os.path.join(str(directory), '') for directory in directories)
+        removed = [path for path in self.manifest if path not in seen and path.startswith(roots)]
+        for path in removed:
+            del self.manifest[path]
+
+        if changed or removed:
+            self.save_manifest(changed, removed)
+
+        finished = time.perf_counter()
+        self.last_stats = {
+            "mode": "warm" if reused or hash_hits else "cold",
+            "files_seen": len(seen),
+            "files_reused": reused,
+            "files_rescanned": rescanned,
+            "files_hash_unchanged": hash_hits,
+            "files_removed": len(removed),
+            "walk_seconds": round(walked - started, 4),
+            "match_seconds": round(finished - walked, 4),
+            "total_seconds": round(finished - started, 4)
+        }
+
+        return {path: self.manifest[path]["findings"] for path in seen}
+
+    async def _run_workers(self, to_scan: List[Tuple[str, Optional[str]]]) -> List[Dict[str, Any]]:
+        """Match changed files off the event loop - process pool for large sets, thread otherwise"""
+        if not to_scan:
+            return []
+
+        if len(to_scan) < self.parallel_threshold or self.max_workers == 1:
+            return await asyncio.to_thread(scan_batch_worker, to_scan, self.patterns)
+
+        loop = asyncio.get_running_loop()
+        batches = [to_scan[i:i + self.batch_size] for i in range(0, len(to_scan), self.batch_size)]
+
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(batches))) as pool:
+            futures = [
+                loop.run_in_executor(pool, scan_batch_worker, batch, self.patterns)
+                for batch in batches
+            ]
+            chunks = await asyncio.gather(*futures)
+
+        return [result for chunk in chunks for result in chunk]
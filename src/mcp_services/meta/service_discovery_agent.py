@@ -6,11 +6,12 @@ Uses qwen2.5-coder:7b for pattern recognition (94% success rate)
 
 from pathlib import Path
 import json
-import re
 from datetime import datetime
 from typing import Dict, Any, List, Set
 import asyncio
 
+from .incremental_scanner import IncrementalCodebaseScanner, is_valid_service_name
+
 class ServiceDiscoveryAgent:
     """
     Continuously scans Fed Job Advisor codebase for external service references
@@ -77,6 +78,12 @@ class ServiceDiscoveryAgent:
         }
         
         self.model = "qwen2.5-coder:7b"
+        
+        # Incremental scanner - unchanged files are served from the manifest
+        self.scanner = IncrementalCodebaseScanner(
+            self.service_patterns,
+            manifest_path=self.base_path / ".cache" / "service_discovery" / "scan_manifest.sqlite"
+        )
     
     async def scan_codebase(self) -> Dict[str, Any]:
         """Scan entire Fed Job Advisor codebase for service references"""
@@ -97,9 +104,7 @@ class ServiceDiscoveryAgent:
             self.base_path / "_Management"
         ]
         
-        for path in scan_paths:
-            if path.exists():
-                await self._scan_directory(path, discovered_services, scan_results)
+        await self._scan_directory(scan_paths, discovered_services, scan_results)
         
         # Categorize discovered services
         categorized = self._categorize_services(discovered_services)
@@ -112,76 +117,33 @@ class ServiceDiscoveryAgent:
             "categorized": categorized,
             "missing_agents": missing_agents,
             "scan_results": scan_results,
+            "scan_stats": self.scanner.last_stats,
             "scan_timestamp": datetime.now().isoformat()
         }
     
-    async def _scan_directory(self, directory: Path, services: Set[str], results: Dict) -> None:
-        """Recursively scan directory for service references"""
+    async def _scan_directory(self, directories: List[Path], services: Set[str], results: Dict) -> None:
+        """Scan directories incrementally and merge per-file findings into results"""
         
-        # File types to scan
-        extensions = {'.py', '.js', '.ts', '.jsx', '.tsx', '.json', '.md', '.env', '.yaml', '.yml'}
-        
-        for file_path in directory.rglob('*'):
-            if file_path.is_file() and file_path.suffix in extensions:
-                await self._scan_file(file_path, services, results)
-    
-    async def _scan_file(self, file_path: Path, services: Set[str], results: Dict) -> None:
-        """Scan individual file for service references"""
+        file_findings = await self.scanner.scan(directories)
         
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+        for file_path, findings in file_findings.items():
+            try:
+                relative_path = str(Path(file_path).relative_to(self.base_path))
+            except ValueError:
+                relative_path = file_path
             
-            # Scan for each pattern type
-            for pattern_type, patterns in self.service_patterns.items():
-                for pattern in patterns:
-                    matches = re.findall(pattern, content, re.IGNORECASE)
-                    for match in matches:
-                        if isinstance(match, tuple):
-                            match = match[0]  # Extract from tuple
-                        
-                        service_name = match.lower().strip()
-                        
-                        # Filter out common false positives
-                        if self._is_valid_service(service_name):
-                            services.add(service_name)
-                            results[pattern_type].append({
-                                "service": service_name,
-                                "file": str(file_path.relative_to(self.base_path)),
-                                "pattern": pattern,
-                                "context": self._extract_context(content, match)
-                            })
-        
-        except Exception as e:
-            # Skip files that can't be read
-            pass
+            for finding in findings:
+                services.add(finding["service"])
+                results[finding["pattern_type"]].append({
+                    "service": finding["service"],
+                    "file": relative_path,
+                    "pattern": finding["pattern"],
+                    "context": finding["context"]
+                })
     
     def _is_valid_service(self, service_name: str) -> bool:
         """Check if discovered name is likely a real service"""
-        
-        # Filter out common false positives
-        false_positives = {
-            'os', 'sys', 'json', 'path', 'date', 'time', 'user', 'data',
-            'config', 'util', 'helper', 'test', 'main', 'app', 'api',
-            'db', 'client', 'server', 'local', 'dev', 'prod', 'env'
-        }
-        
-        return (
-            len(service_name) > 2 and
-            service_name not in false_positives and
-            not service_name.isdigit() and
-            service_name.isalpha()
-        )
-    
-    def _extract_context(self, content: str, match: str) -> str:
-        """Extract context around the match"""
-        lines = content.split('\n')
-        for i, line in enumerate(lines):
-            if match in line:
-                # Return surrounding lines for context
-                start = max(0, i - 1)
-                end = min(len(lines), i + 2)
-                return ' | '.join(lines[start:end])
-        return ""
+        return is_valid_service_name(service_name)
     
     def _categorize_services(self, services: Set[str]) -> Dict[str, List[str]]:
         """Categorize discovered services"""
@@ -277,7 +239,8 @@ class ServiceDiscoveryAgent:
                 "categories": list(scan_results["categorized"].keys())
             },
             "discovery_results": scan_results,
-            "recommendations": self._generate_recommendations(scan_results)
+            "recommendations": self._generate_recommendations(scan_results),
+            "scan_stats": scan_results["scan_stats"]
         }
         
         report_path = self._save_discovery_report(research)
@@ -326,7 +289,13 @@ class ServiceDiscoveryAgent:
             summary = research['scan_summary']
             f.write(f"- **Total Services Found**: {summary['total_services']}\n")
             f.write(f"- **Missing Agents**: {summary['missing_agents']}\n")
-            f.write(f"- **Categories**: {', '.join(summary['categories'])}\n\n")
+            f.write(f"- **Categories**: {', '.join(summary['categories'])}\n")
+            stats = research.get('scan_stats', {})
+            if stats:
+                f.write(f"- **Scan**: {stats['mode']} - {stats['files_rescanned']} rescanned, "
+                        f"{stats['files_reused']} reused of {stats['files_seen']} files "
+                        f"in {stats['total_seconds']}s\n")
+            f.write("\n")
             
             f.write("## Missing Agents (Priority Order)\n")
             for agent in research['discovery_results']['missing_agents']:
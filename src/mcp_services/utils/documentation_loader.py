@@ -7,153 +7,62 @@ Loads and caches external service documentation for agent knowledge bases
 import json
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, List
 from datetime import datetime, timedelta
-import hashlib
-import pickle
+
+from .documentation_store import get_documentation_store
 
 class DocumentationLoader:
     """
     Loads and manages external service documentation for specialist agents
+    Reads go through the shared DocumentationStore (per-file mtime invalidation)
     """
     
     def __init__(self, service_name: str):
         self.service_name = service_name
         self.base_path = Path(__file__).parent.parent.parent
         self.docs_path = self.base_path / "documentation" / "external_services" / service_name
-        self.cache_path = self.base_path / ".cache" / "docs" / service_name
-        self.cache_path.mkdir(parents=True, exist_ok=True)
-        
-        # Cache TTL (Time To Live) in days - Weekly refresh pattern
-        self.cache_ttl = {
-            "official": 7,     # Official docs cached for 1 week
-            "examples": 7,     # Examples refreshed weekly
-            "manifest": 7,     # Manifest checked weekly
-            "api_reference": 7,     # API reference refreshed weekly
-            "best_practices": 7,    # Best practices refreshed weekly
-            "troubleshooting": 7    # Troubleshooting guides refreshed weekly
-        }
-        
-        self._documentation_cache = {}
+        self.store = get_documentation_store()
     
     def load_manifest(self) -> Dict[str, Any]:
         """Load service manifest with critical information"""
-        manifest_file = self.docs_path / "manifest.json"
-        
-        if not manifest_file.exists():
-            return self._create_default_manifest()
-        
-        # Check cache
-        cached = self._get_cached("manifest")
-        if cached:
-            return cached
-        
-        try:
-            with open(manifest_file, 'r') as f:
-                manifest = json.load(f)
-                self._set_cached("manifest", manifest)
-                return manifest
-        except Exception as e:
-            print(f"Error loading manifest: {e}")
-            return self._create_default_manifest()
+        manifest = self.store.get_json(self.docs_path / "manifest.json", self.service_name, "manifest")
+        return manifest if manifest is not None else self._create_default_manifest()
     
     def load_api_reference(self) -> Dict[str, Any]:
         """Load API reference documentation"""
-        api_ref_file = self.docs_path / "official" / "api_reference.json"
-        
-        # Check cache
-        cached = self._get_cached("api_reference")
-        if cached:
-            return cached
-        
-        if api_ref_file.exists():
-            try:
-                with open(api_ref_file, 'r') as f:
-                    api_ref = json.load(f)
-                    self._set_cached("api_reference", api_ref)
-                    return api_ref
-            except Exception as e:
-                print(f"Error loading API reference: {e}")
+        api_ref = self.store.get_json(
+            self.docs_path / "official" / "api_reference.json", self.service_name, "api_reference"
+        )
         
         # Return embedded knowledge if no file
-        return self._get_embedded_api_reference()
+        return api_ref if api_ref is not None else self._get_embedded_api_reference()
     
     def load_best_practices(self) -> Dict[str, Any]:
         """Load best practices documentation"""
-        practices_file = self.docs_path / "best_practices" / "patterns.json"
-        
-        # Check cache
-        cached = self._get_cached("best_practices")
-        if cached:
-            return cached
-        
-        if practices_file.exists():
-            try:
-                with open(practices_file, 'r') as f:
-                    practices = json.load(f)
-                    self._set_cached("best_practices", practices)
-                    return practices
-            except Exception as e:
-                print(f"Error loading best practices: {e}")
-        
-        return self._get_embedded_best_practices()
+        practices = self.store.get_json(
+            self.docs_path / "best_practices" / "patterns.json", self.service_name, "best_practices"
+        )
+        return practices if practices is not None else self._get_embedded_best_practices()
     
     def load_troubleshooting(self) -> Dict[str, Any]:
         """Load troubleshooting guide"""
-        troubleshooting_file = self.docs_path / "troubleshooting" / "common_issues.json"
-        
-        # Check cache
-        cached = self._get_cached("troubleshooting")
-        if cached:
-            return cached
-        
-        if troubleshooting_file.exists():
-            try:
-                with open(troubleshooting_file, 'r') as f:
-                    troubleshooting = json.load(f)
-                    self._set_cached("troubleshooting", troubleshooting)
-                    return troubleshooting
-            except Exception as e:
-                print(f"Error loading troubleshooting: {e}")
-        
-        return self._get_embedded_troubleshooting()
+        troubleshooting = self.store.get_json(
+            self.docs_path / "troubleshooting" / "common_issues.json", self.service_name, "troubleshooting"
+        )
+        return troubleshooting if troubleshooting is not None else self._get_embedded_troubleshooting()
     
     def load_examples(self) -> Dict[str, str]:
         """Load code examples"""
-        examples_dir = self.docs_path / "examples"
-        examples = {}
-        
-        # Check cache
-        cached = self._get_cached("examples")
-        if cached:
-            return cached
-        
-        if examples_dir.exists():
-            for example_file in examples_dir.glob("*"):
-                if example_file.is_file():
-                    try:
-                        with open(example_file, 'r') as f:
-                            examples[example_file.stem] = f.read()
-                    except Exception as e:
-                        print(f"Error loading example {example_file}: {e}")
-        
-        if examples:
-            self._set_cached("examples", examples)
-        
+        examples = self.store.get_directory(self.docs_path / "examples", self.service_name, "examples")
         return examples if examples else self._get_embedded_examples()
     
     def load_fed_job_advisor_config(self) -> Dict[str, Any]:
         """Load Fed Job Advisor specific configuration"""
-        config_file = self.docs_path / "fed_job_advisor" / "configuration.json"
-        
-        if config_file.exists():
-            try:
-                with open(config_file, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Error loading FJA config: {e}")
-        
-        return {}
+        config = self.store.get_json(
+            self.docs_path / "fed_job_advisor" / "configuration.json", self.service_name, "fed_job_advisor"
+        )
+        return config if config is not None else {}
     
     def check_documentation_currency(self) -> Dict[str, Any]:
         """Check if documentation is up to date"""
@@ -181,36 +90,6 @@ class DocumentationLoader:
             "needs_update": True
         }
     
-    def _get_cached(self, key: str) -> Optional[Any]:
-        """Get cached documentation if still valid"""
-        cache_file = self.cache_path / f"{key}.cache"
-        
-        if not cache_file.exists():
-            return None
-        
-        try:
-            # Check cache age
-            cache_age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
-            ttl_days = self.cache_ttl.get(key.split('_')[0], 7)
-            
-            if cache_age.days > ttl_days:
-                return None
-            
-            with open(cache_file, 'rb') as f:
-                return pickle.load(f)
-        except:
-            return None
-    
-    def _set_cached(self, key: str, data: Any) -> None:
-        """Cache documentation data"""
-        cache_file = self.cache_path / f"{key}.cache"
-        
-        try:
-            with open(cache_file, 'wb') as f:
-                pickle.dump(data, f)
-        except Exception as e:
-            print(f"Error caching {key}: {e}")
-    
     def _create_default_manifest(self) -> Dict[str, Any]:
         """Create default manifest if none exists"""
         return {
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Full-Text Documentation Search
+BM25F inverted index over the docs/ and docs_unified/ corpora (markdown + JSON),
+built incrementally from the shared DocumentationStore and returning ranked
+passages with character offsets instead of whole files
+"""
+
+import heapq
+import json
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+
+from .documentation_store import DocumentationStore, get_documentation_store
+
+REPO_ROOT = Path(__file__).parent.parent.parent.parent
+DEFAULT_DOCS_ROOTS = [REPO_ROOT / "docs", REPO_ROOT / "docs_unified"]
+
+SEARCH_EXTENSIONS = {'.md', '.json'}
+
+# BM25F parameters: field weights boost title and heading matches over body text
+FIELDS = ("title", "headings", "body")
+FIELD_WEIGHTS = {"title": 3.0, "headings": 2.0, "body": 1.0}
+FIELD_B = {"title": 0.3, "headings": 0.5, "body": 0.75}
+K1 = 1.2
+PHRASE_BOOST = 1.5
+
+# The shared index re-syncs with the docs roots at most this often
+REFRESH_INTERVAL_SECONDS = float(os.getenv("DOCUMENTATION_SEARCH_REFRESH_SECONDS", "60"))
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9_]*")
+HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$", re.MULTILINE)
+PHRASE_PATTERN = re.compile(r'"([^"]+)"')
+FENCE_PATTERN = re.compile(r"^(```|~~~).*?^\1", re.MULTILINE | re.DOTALL)
+
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'how', 'i', 'in',
+    'is', 'it', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was', 'what', 'when',
+    'with', 'you', 'your', 'do', 'does', 'can', 'should', 'will'
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords"""
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if t not in STOPWORDS]
+
+
+def service_for_path(relative: Path) -> str:
+    """
+    Service name for a docs-relative path, e.g.
+    external_services/apis/usajobs/api_reference.md -> usajobs
+    """
+    parts = relative.parts[:-1]
+    if not parts:
+        return "general"
+    if parts[0] == "external_services" and len(parts) >= 3:
+        return parts[2]
+    if parts[0] == "agents" and len(parts) >= 2:
+        return parts[-1]
+    return parts[0]
+
+
+@dataclass
+class Passage:
+    """Contiguous span of one document, indexed as a unit"""
+    path: str
+    service: str
+    title: str
+    headings: str
+    start: int
+    end: int
+
+
+def split_markdown(content: str, max_chars: int) -> Tuple[str, List[Tuple[str, int, int]]]:
+    """
+    Split markdown into (heading path, start, end) spans at headings, then at
+    paragraph breaks so no passage grows much beyond max_chars
+    """
+    title = None
+    # "# comment" lines inside fenced code blocks are not headings
+    fences = [(m.start(), m.end()) for m in FENCE_PATTERN.finditer(content)]
+    headings = [
+        (m.start(), len(m.group(1)), m.group(2)) for m in HEADING_PATTERN.finditer(content)
+        if not any(start <= m.start() < end for start, end in fences)
+    ]
+    for _, level, text in headings:
+        if level == 1:
+            title = text
+            break
+
+    boundaries = [(0, 0, "")] + headings + [(len(content), 0, "")]
+    stack: List[Tuple[int, str]] = []
+    spans = []
+
+    for (start, level, text), (end, _, _) in zip(boundaries, boundaries[1:]):
+        if level:
+            stack = [(lvl, h) for lvl, h in stack if lvl < level] + [(level, text)]
+        heading_path = " > ".join(h for _, h in stack)
+
+        chunk_start = start
+        while end - chunk_start > max_chars:
+            split = content.rfind("\n\n", chunk_start + max_chars // 2, chunk_start + max_chars)
+            if split == -1:
+                split = chunk_start + max_chars
+            spans.append((heading_path, chunk_start, split))
+            chunk_start = split
+        if content[chunk_start:end].strip():
+            spans.append((heading_path, chunk_start, end))
+
+    return title or "", spans
+
+
+def split_json(content: str, max_chars: int) -> Tuple[str, List[Tuple[str, int, int]]]:
+    """One passage per top-level key of a JSON document, offsets pointing into the file"""
+    whole = [("", start, end) for start, end in _chunk_range(0, len(content), max_chars)]
+    try:
+        data = json.loads(content)
+    except json.JSONDecodeError:
+        return "", whole if content.strip() else []
+
+    if not isinstance(data, dict):
+        return "", whole
+
+    spans = []
+    for key in data:
+        # Keys are located on their own line; compact single-line JSON falls back to fixed chunks
+        match = re.search(r'^\s*' + re.escape(json.dumps(key)) + r'\s*:', content, re.MULTILINE)
+        if match:
+            spans.append((str(key), match.start()))
+
+    if len(spans) != len(data):
+        return "", whole
+
+    spans.append(("", len(content)))
+    return "", [
+        (key, chunk_start, chunk_end) for (key, start), (_, end) in zip(spans, spans[1:])
+        for chunk_start, chunk_end in _chunk_range(start, end, max_chars)
+    ]
+
+
+def _chunk_range(start: int, end: int, max_chars: int) -> Iterable[Tuple[int, int]]:
+    while end - start > max_chars:
+        yield start, start + max_chars
+        start += max_chars
+    yield start, end
+
+
+class DocumentationSearchIndex:
+    """
+    In-memory BM25F index over documentation passages
+
+    Document text comes from the DocumentationStore, so a refresh re-reads and
+    re-indexes only files whose mtime/size changed since the last refresh.
+    """
+
+    def __init__(self, roots: Optional[Iterable[Path]] = None,
+                 store: Optional[DocumentationStore] = None,
+                 passage_chars: int = 1200):
+        self.roots = [Path(r) for r in (roots or DEFAULT_DOCS_ROOTS)]
+        self.store = store or get_documentation_store()
+        self.passage_chars = passage_chars
+
+        self._lock = threading.RLock()
+        self._documents: Dict[str, str] = {}
+        self._doc_versions: Dict[str, int] = {}
+        self._doc_passages: Dict[str, List[int]] = {}
+        self._passages: Dict[int, Passage] = {}
+        self._passage_terms: Dict[int, Dict[str, Tuple[int, int, int]]] = {}
+        self._field_lengths: Dict[int, Tuple[int, int, int]] = {}
+        self._field_totals = [0, 0, 0]
+        self._postings: Dict[str, Dict[int, Tuple[int, int, int]]] = {}
+        self._next_id = 0
+
+        self.last_refresh: Dict[str, Any] = {}
+        self.refreshed_at: Optional[float] = None
+
+    # ------------------------------------------------------------------ build
+
+    def refresh(self) -> Dict[str, Any]:
+        """Sync the docs roots into the store and re-index changed documents"""
+        start = time.perf_counter()
+        current: Dict[str, Tuple[int, str, str]] = {}
+
+        for root in self.roots:
+            if not root.exists():
+                continue
+            self.store.sync_tree(root, service_for=service_for_path, extensions=SEARCH_EXTENSIONS)
+            prefix = os.path.join(str(root), '')
+            for path, service, section, mtime_ns in self.store.document_versions():
+                if path.startswith(prefix):
+                    current[path] = (mtime_ns, service, section)
+
+        with self._lock:
+            removed = [path for path in self._doc_versions if path not in current]
+            for path in removed:
+                self._remove_document(path)
+
+            indexed = 0
+            for path, (mtime_ns, service, section) in current.items():
+                if self._doc_versions.get(path) == mtime_ns:
+                    continue
+                content = self.store.get_text(Path(path), service, section)
+                self._remove_document(path)
+                if content is not None:
+                    self._add_document(path, service, content)
+                    self._doc_versions[path] = mtime_ns
+                    indexed += 1
+
+            self.last_refresh = {
+                "documents": len(self._doc_versions),
+                "passages": len(self._passages),
+                "terms": len(self._postings),
+                "indexed": indexed,
+                "removed": len(removed),
+                "seconds": round(time.perf_counter() - start, 3)
+            }
+            self.refreshed_at = time.monotonic()
+        return self.last_refresh
+
+    def _add_document(self, path: str, service: str, content: str) -> None:
+        splitter = split_json if path.endswith('.json') else split_markdown
+        title, spans = splitter(content, self.passage_chars)
+        title = title or Path(path).stem.replace('_', ' ')
+        title_terms = Counter(tokenize(title))
+
+        self._documents[path] = content
+        passage_ids = []
+
+        for heading_path, start, end in spans:
+            pid = self._next_id
+            self._next_id += 1
+
+            heading_terms = Counter(tokenize(heading_path))
+            body_terms = Counter(tokenize(content[start:end]))
+            lengths = (sum(title_terms.values()), sum(heading_terms.values()), sum(body_terms.values()))
+
+            terms = {}
+            for term in set(title_terms) | set(heading_terms) | set(body_terms):
+                tfs = (title_terms.get(term, 0), heading_terms.get(term, 0), body_terms.get(term, 0))
+                terms[term] = tfs
+                self._postings.setdefault(term, {})[pid] = tfs
+
+            self._passages[pid] = Passage(path, service, title, heading_path, start, end)
+            self._passage_terms[pid] = terms
+            self._field_lengths[pid] = lengths
+            for i, length in enumerate(lengths):
+                self._field_totals[i] += length
+            passage_ids.append(pid)
+
+        self._doc_passages[path] = passage_ids
+
+    def _remove_document(self, path: str) -> None:
+        for pid in self._doc_passages.pop(path, []):
+            for term in self._passage_terms.pop(pid):
+                postings = self._postings[term]
+                del postings[pid]
+                if not postings:
+                    del self._postings[term]
+            for i, length in enumerate(self._field_lengths.pop(pid)):
+                self._field_totals[i] -= length
+            del self._passages[pid]
+
+        self._documents.pop(path, None)
+        self._doc_versions.pop(path, None)
+
+    # ------------------------------------------------------------------ query
+
+    def search(self, query: str, limit: int = 5, service: Optional[str] = None,
+               snippet_chars: int = 400) -> List[Dict[str, Any]]:
+        """
+        Ranked passages for a query. Quoted phrases ("fields full") must appear
+        verbatim; an unquoted multi-word query that appears verbatim is boosted.
+        """
+        phrases = [p.lower() for p in PHRASE_PATTERN.findall(query)]
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        with self._lock:
+            if not self._passages:
+                return []
+
+            scores = self._score(terms, service)
+
+            loose_phrase = " ".join(query.lower().split()) if len(terms) > 1 and not phrases else None
+            candidates = heapq.nlargest(max(limit * 10, 50), scores.items(), key=lambda item: item[1])
+
+            ranked = []
+            for pid, score in candidates:
+                text = self._passage_text(pid).lower()
+                if phrases and not all(phrase in text for phrase in phrases):
+                    continue
+                if phrases or (loose_phrase and loose_phrase in text):
+                    score *= PHRASE_BOOST
+                ranked.append((score, pid))
+
+            ranked.sort(key=lambda item: item[0], reverse=True)
+            return [self._result(pid, score, terms, snippet_chars) for score, pid in ranked[:limit]]
+
+    def _score(self, terms: List[str], service: Optional[str]) -> Dict[int, float]:
+        total_passages = len(self._passages)
+        averages = [max(total / total_passages, 1e-9) for total in self._field_totals]
+        scores: Dict[int, float] = {}
+
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+
+            df = len(postings)
+            idf = math.log(1 + (total_passages - df + 0.5) / (df + 0.5))
+
+            for pid, tfs in postings.items():
+                if service and self._passages[pid].service != service:
+                    continue
+
+                lengths = self._field_lengths[pid]
+                weighted_tf = 0.0
+                for i, field in enumerate(FIELDS):
+                    if tfs[i]:
+                        norm = 1 - FIELD_B[field] + FIELD_B[field] * lengths[i] / averages[i]
+                        weighted_tf += FIELD_WEIGHTS[field] * tfs[i] / norm
+
+                scores[pid] = scores.get(pid, 0.0) + idf * weighted_tf / (K1 + weighted_tf)
+
+        return scores
+
+    def _passage_text(self, pid: int) -> str:
+        passage = self._passages[pid]
+        return self._documents[passage.path][passage.start:passage.end]
+
+    def _result(self, pid: int, score: float, terms: List[str], snippet_chars: int) -> Dict[str, Any]:
+        passage = self._passages[pid]
+        text = self._passage_text(pid)
+        lowered = text.lower()
+
+        # Offsets (relative to the source file) of each query term in the passage
+        highlights = []
+        for term in terms:
+            for match in re.finditer(r'\b' + re.escape(term) + r'\b', lowered):
+                highlights.append((passage.start + match.start(), passage.start + match.end()))
+        highlights.sort()
+
+        # Snippet window around the first highlighted term
+        anchor = highlights[0][0] - passage.start if highlights else 0
+        snippet_start = max(0, min(anchor - snippet_chars // 4, len(text) - snippet_chars))
+        snippet = text[snippet_start:snippet_start + snippet_chars].strip()
+
+        return {
+            "path": os.path.relpath(passage.path, REPO_ROOT),
+            "service": passage.service,
+            "title": passage.title,
+            "heading": passage.headings,
+            "score": round(score, 4),
+            "start": passage.start,
+            "end": passage.end,
+            "snippet": snippet,
+            "highlights": highlights[:20]
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "documents": len(self._doc_versions),
+                "passages": len(self._passages),
+                "terms": len(self._postings),
+                "services": sorted({p.service for p in self._passages.values()}),
+                "last_refresh": self.last_refresh
+            }
+
+
+_index: Optional[DocumentationSearchIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_documentation_search_index(refresh: bool = False) -> DocumentationSearchIndex:
+    """
+    Process-wide search index over the repository docs, built on first use and
+    re-synced (a tree walk plus stat per file) once REFRESH_INTERVAL_SECONDS
+    have passed; refresh=True syncs now. Call through asyncio.to_thread from
+    async code - the first build reads every document.
+    """
+    global _index
+
+    with _index_lock:
+        if _index is None:
+            _index = DocumentationSearchIndex()
+        stale = _index.refreshed_at is None or time.monotonic() - _index.refreshed_at >= REFRESH_INTERVAL_SECONDS
+        if refresh or stale:
+            _index.refresh()
+    return _index
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Shared Documentation Store for Service Specialist Agents
+One process-wide SQLite store (memory-mapped reads) holding every documentation
+source file, re-read only when that file's mtime/size changes
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Mapping
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, Callable, Iterator, Iterable, List, Tuple
+
+DEFAULT_STORE_PATH = Path(__file__).parent.parent.parent / ".cache" / "docs" / "documentation.sqlite"
+
+# File types indexed when syncing a documentation tree
+DOC_EXTENSIONS = {'.md', '.json', '.txt', '.yaml', '.yml'}
+
+
+class DocumentationStore:
+    """
+    SQLite-backed documentation store shared by all specialists in a process
+
+    Each source file is one row (service, section, name, mtime_ns, size, content).
+    Reads go through SQLite's mmap; a row is refreshed only when its source file
+    changed on disk, so there is no all-or-nothing TTL.
+    """
+
+    def __init__(self, db_path: Path, mmap_size: int = 256 * 1024 * 1024):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS documents (
+                path TEXT PRIMARY KEY,
+                service TEXT NOT NULL,
+                section TEXT NOT NULL,
+                name TEXT NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                content TEXT NOT NULL,
+                loaded_at TEXT NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_documents_section ON documents (service, section)"
+        )
+        self._conn.commit()
+
+        self.stats = {"hits": 0, "reloads": 0, "missing": 0}
+
+    def get_text(self, path: Path, service: str, section: str, name: Optional[str] = None) -> Optional[str]:
+        """Return file content, re-reading the source only if it changed"""
+        path = Path(path)
+        key = str(path)
+
+        try:
+            stat = path.stat()
+        except OSError:
+            with self._lock:
+                self.stats["missing"] += 1
+                self._conn.execute("DELETE FROM documents WHERE path = ?", (key,))
+                self._conn.commit()
+            return None
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime_ns, size, content FROM documents WHERE path = ?", (key,)
+            ).fetchone()
+            if row and row[0] == stat.st_mtime_ns and row[1] == stat.st_size:
+                self.stats["hits"] += 1
+                return row[2]
+
+        try:
+            content = path.read_text(encoding='utf-8', errors='ignore')
+        except OSError:
+            return None
+
+        with self._lock:
+            self.stats["reloads"] += 1
+            self._conn.execute(
+                "INSERT OR REPLACE INTO documents "
+                "(path, service, section, name, mtime_ns, size, content, loaded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, service, section, name or path.stem, stat.st_mtime_ns, stat.st_size,
+                 content, datetime.now().isoformat())
+            )
+            self._conn.commit()
+        return content
+
+    def get_json(self, path: Path, service: str, section: str) -> Optional[Any]:
+        """Return parsed JSON for a source file, or None if missing/invalid"""
+        content = self.get_text(path, service, section)
+        if content is None:
+            return None
+
+        try:
+            return json.loads(content)
+        except json.JSONDecodeError as e:
+            print(f"⚠️ Invalid JSON in {path}: {e}")
+            return None
+
+    def get_directory(self, directory: Path, service: str, section: str) -> Dict[str, str]:
+        """Return {file stem: content} for a directory, dropping rows for deleted files"""
+        directory = Path(directory)
+        contents = {}
+
+        if directory.exists():
+            for file_path in sorted(directory.glob("*")):
+                if file_path.is_file():
+                    content = self.get_text(file_path, service, section)
+                    if content is not None:
+                        contents[file_path.stem] = content
+
+        prefix = os.path.join(str(directory), '')
+        with self._lock:
+            stale = [
+                path for (path,) in self._conn.execute(
+                    "SELECT path FROM documents WHERE service = ? AND section = ?", (service, section)
+                )
+                if path.startswith(prefix) and Path(path).stem not in contents
+            ]
+            if stale:
+                self._conn.executemany("DELETE FROM documents WHERE path = ?", [(p,) for p in stale])
+                self._conn.commit()
+
+        return contents
+
+    def sync_tree(self, root: Path, service_for: Optional[Callable[[Path], str]] = None,
+                  extensions: Iterable[str] = DOC_EXTENSIONS) -> Dict[str, int]:
+        """
+        Incrementally index a documentation tree (e.g. docs/).
+        Service defaults to the first directory under root, section to the parent directory.
+        """
+        root = Path(root)
+        extensions = set(extensions)
+        before = dict(self.stats)
+        seen = set()
+
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+            for filename in filenames:
+                file_path = Path(dirpath) / filename
+                if file_path.suffix not in extensions:
+                    continue
+
+                relative = file_path.relative_to(root)
+                service = service_for(relative) if service_for else (
+                    relative.parts[0] if len(relative.parts) > 1 else "general"
+                )
+                section = relative.parent.as_posix() or "."
+                seen.add(str(file_path))
+                self.get_text(file_path, service, section)
+
+        prefix = os.path.join(str(root), '')
+        with self._lock:
+            removed = [
+                path for (path,) in self._conn.execute("SELECT path FROM documents")
+                if path.startswith(prefix) and path not in seen
+            ]
+            if removed:
+                self._conn.executemany("DELETE FROM documents WHERE path = ?", [(p,) for p in removed])
+                self._conn.commit()
+
+        return {
+            "files": len(seen),
+            "reloaded": self.stats["reloads"] - before["reloads"],
+            "unchanged": self.stats["hits"] - before["hits"],
+            "removed": len(removed)
+        }
+
+    def iter_documents(self, service: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate stored documents (optionally for one service)"""
+        query = "SELECT path, service, section, name, mtime_ns, content FROM documents"
+        params: tuple = ()
+        if service:
+            query += " WHERE service = ?"
+            params = (service,)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        for path, svc, section, name, mtime_ns, content in rows:
+            yield {"path": path, "service": svc, "section": section, "name": name,
+                   "mtime_ns": mtime_ns, "content": content}
+
+    def document_versions(self) -> List[Tuple[str, str, str, int]]:
+        """(path, service, section, mtime_ns) for every stored document, without content"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT path, service, section, mtime_ns FROM documents"
+            ).fetchall()
+
+    def invalidate(self, service: str) -> int:
+        """Drop every stored row for a service (next access re-reads sources)"""
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM documents WHERE service = ?", (service,))
+            self._conn.commit()
+            return cursor.rowcount
+
+    def service_status(self, service: str) -> Dict[str, Any]:
+        """Row count and newest source mtime for a service"""
+        with self._lock:
+            count, newest = self._conn.execute(
+                "SELECT COUNT(*), MAX(mtime_ns) FROM documents WHERE service = ?", (service,)
+            ).fetchone()
+
+        return {
+            "documents": count,
+            "newest_source": datetime.fromtimestamp(newest / 1e9).isoformat() if newest else None
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class LazyDocumentation(Mapping):
+    """
+    Read-only mapping of documentation sections loaded on first access
+    Each loader runs at most once per instance; reload() forgets loaded sections
+    """
+
+    def __init__(self, loaders: Dict[str, Callable[[], Any]]):
+        self._loaders = loaders
+        self._loaded: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._loaded:
+            if key not in self._loaders:
+                raise KeyError(key)
+            self._loaded[key] = self._loaders[key]()
+        return self._loaded[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._loaders)
+
+    def __len__(self) -> int:
+        return len(self._loaders)
+
+    def loaded_sections(self) -> list:
+        return list(self._loaded)
+
+    def reload(self) -> None:
+        self._loaded.clear()
+
+
+_store: Optional[DocumentationStore] = None
+_store_lock = threading.Lock()
+
+
+def get_documentation_store(db_path: Optional[Path] = None) -> DocumentationStore:
+    """Process-wide documentation store handle shared by every specialist"""
+    global _store
+
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                path = db_path or Path(os.getenv("DOCUMENTATION_STORE_PATH", str(DEFAULT_STORE_PATH)))
+                _store = DocumentationStore(path)
+    return _store
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Local Text Embeddings
+CPU-only, offline embedding of documentation passages, job postings and
+research reports: stable hashed unigram/bigram TF-IDF features projected to a
+dense space by a truncated SVD (LSA) fitted on the corpus, or a local
+sentence-transformers model when EMBEDDING_MODEL points at one. Texts are
+embedded in batches and vectors are cached by content hash.
+"""
+
+import hashlib
+import logging
+import math
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .documentation_search import tokenize
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # optional: hashing/LSA embeddings need only numpy
+    SentenceTransformer = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FEATURES = 2 ** 16
+DEFAULT_DIM = 128
+
+# Documents used to fit the SVD; more adds fit time but little quality
+FIT_SAMPLE = 10000
+# Non-zeros per block in sparse x dense products (bounds temporary memory)
+SPARSE_BLOCK = 250_000
+
+
+def _block_matmul(out_keys: np.ndarray, in_keys: np.ndarray, values: np.ndarray,
+                  dense: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Sparse x dense product for entries sorted by output row:
+    out[out_keys[i]] += values[i] * dense[in_keys[i]]
+    """
+    out = np.zeros((n_out, dense.shape[1]), dtype=np.float32)
+    for start in range(0, len(values), SPARSE_BLOCK):
+        end = start + SPARSE_BLOCK
+        keys = out_keys[start:end]
+        contributions = values[start:end, None] * dense[in_keys[start:end]]
+        unique, starts = np.unique(keys, return_index=True)
+        # A row split across blocks gets two partial sums, both added
+        out[unique] += np.add.reduceat(contributions, starts, axis=0)
+    return out
+
+
+class _CachedEmbedder:
+    """Batching and a content-hash LRU cache around an encoder's _encode"""
+
+    name = "base"
+    dim = 0
+
+    def __init__(self, cache_size: int = 50000):
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        raise NotImplementedError
+
+    @property
+    def fingerprint(self) -> str:
+        """Identifies the vector space; indexes built with another fingerprint need re-embedding"""
+        return f"{self.name}:{self.dim}"
+
+    def embed(self, texts: Sequence[str], batch_size: int = 256) -> np.ndarray:
+        """L2-normalized float32 vectors, one row per text"""
+        keys = [hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest() for text in texts]
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        missing: Dict[bytes, List[int]] = {}
+
+        with self._cache_lock:
+            for row, key in enumerate(keys):
+                cached = self._cache.get(key)
+                if cached is None:
+                    missing.setdefault(key, []).append(row)
+                else:
+                    self._cache.move_to_end(key)
+                    vectors[row] = cached
+            self.hits += len(texts) - sum(len(rows) for rows in missing.values())
+            self.misses += len(missing)
+
+        pending = list(missing.items())
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            encoded = self._encode([texts[rows[0]] for _, rows in batch])
+            with self._cache_lock:
+                for (key, rows), vector in zip(batch, encoded):
+                    vectors[rows] = vector
+                    self._cache[key] = vector
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return vectors
+
+    def embed_one(self, text: str) -> np.ndarray:
+        return self.embed([text])[0]
+
+    def clear_cache(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "embedder": self.fingerprint,
+            "cached_vectors": len(self._cache),
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0
+        }
+
+
+class HashingEmbedder(_CachedEmbedder):
+    """
+    Hashing-trick TF-IDF + truncated SVD
+
+    Terms and adjacent-term bigrams are hashed (crc32, stable across processes
+    unlike hash()) into `n_features` signed buckets, weighted by sublinear TF
+    and IDF, and projected to `dim` dimensions. Before fit() the projection is
+    a seeded random Gaussian (distance-preserving, deterministic); fit() learns
+    IDF and the top singular vectors of the corpus TF-IDF matrix instead.
+    """
+
+    name = "hashing-lsa"
+
+    def __init__(self, dim: int = DEFAULT_DIM, n_features: int = DEFAULT_FEATURES,
+                 seed: int = 0, cache_size: int = 50000):
+        super().__init__(cache_size)
+        self.dim = dim
+        self.n_features = n_features
+        self.seed = seed
+        self.fitted = False
+        self.idf = np.ones(n_features, dtype=np.float32)
+        rng = np.random.default_rng(seed)
+        self.projection = (rng.standard_normal((n_features, dim)) / math.sqrt(dim)).astype(np.float32)
+
+    @property
+    def fingerprint(self) -> str:
+        state = "lsa" if self.fitted else f"random{self.seed}"
+        digest = hashlib.blake2b(self.projection[:64].tobytes(), digest_size=6).hexdigest()
+        return f"{self.name}:{self.dim}:{self.n_features}:{state}:{digest}"
+
+    def _sparse(self, texts: Sequence[str], idf: bool = True) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(rows, columns, values) of the TF(-IDF) matrix, sorted by row"""
+        hashes: List[int] = []
+        lengths = []
+        for text in texts:
+            tokens = tokenize(text)
+            features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+            hashes.extend(map(zlib.crc32, map(str.encode, features)))
+            lengths.append(len(features))
+
+        rows = np.repeat(np.arange(len(texts), dtype=np.int64), lengths)
+        hashes = np.array(hashes, dtype=np.int64)
+        # Sublinear TF per distinct feature, then signed and summed per bucket
+        features, counts = np.unique((rows << 32) | hashes, return_counts=True)
+        feature_rows, feature_hashes = features >> 32, features & 0xFFFFFFFF
+        signs = np.where(feature_hashes & 0x80000000, 1.0, -1.0)
+        cells, cell_index = np.unique(feature_rows * self.n_features + feature_hashes % self.n_features,
+                                      return_inverse=True)
+        values = np.bincount(cell_index, weights=signs * (1.0 + np.log(counts))).astype(np.float32)
+
+        rows, columns = cells // self.n_features, cells % self.n_features
+        if idf:
+            values *= self.idf[columns]
+        return rows, columns, values
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        rows, columns, values = self._sparse(texts)
+        vectors = _block_matmul(rows, columns, values, self.projection, len(texts))
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+    def fit(self, texts: Sequence[str], sample: int = FIT_SAMPLE, power_iterations: int = 1) -> "HashingEmbedder":
+        """Learn IDF and the LSA projection from a corpus (randomized SVD, numpy only)"""
+        texts = [t for t in texts if t.strip()]
+        if len(texts) < 2:
+            return self
+        if len(texts) > sample:
+            picks = np.random.default_rng(self.seed).choice(len(texts), sample, replace=False)
+            texts = [texts[i] for i in sorted(picks)]
+
+        rows, columns, values = self._sparse(texts, idf=False)
+        df = np.bincount(np.unique(rows * self.n_features + columns) % self.n_features,
+                         minlength=self.n_features)
+        idf = (np.log((1 + len(texts)) / (1 + df)) + 1).astype(np.float32)
+        values = values * idf[columns]
+
+        n_docs = len(texts)
+        rank = min(self.dim, n_docs - 1)
+        by_column = np.argsort(columns, kind="stable")
+        col_rows, col_columns, col_values = rows[by_column], columns[by_column], values[by_column]
+
+        def X(dense):    # (n_docs, k)
+            return _block_matmul(rows, columns, values, dense, n_docs)
+
+        def Xt(dense):   # (n_features, k)
+            return _block_matmul(col_columns, col_rows, col_values, dense, self.n_features)
+
+        rng = np.random.default_rng(self.seed)
+        omega = rng.standard_normal((self.n_features, rank + 10)).astype(np.float32)
+        q, _ = np.linalg.qr(X(omega))
+        for _ in range(power_iterations):
+            q, _ = np.linalg.qr(X(Xt(q)))
+        # Right singular vectors of the small B = Q^T X via the eigenvectors of B B^T,
+        # avoiding a QR/SVD of the tall n_features-row matrix
+        bt = Xt(q)
+        eigenvalues, u = np.linalg.eigh(bt.T @ bt)
+        order = np.argsort(eigenvalues)[::-1][:rank]
+        singular = np.sqrt(np.maximum(eigenvalues[order], 1e-12))
+        components = (bt @ u[:, order]) / singular
+
+        projection = np.zeros((self.n_features, self.dim), dtype=np.float32)
+        projection[:, :rank] = components
+        self.projection = projection
+        self.idf = idf
+        self.fitted = True
+        self.clear_cache()
+        logger.info(f"Fitted {self.dim}-d LSA embeddings on {n_docs} documents")
+        return self
+
+    def save(self, path: Union[str, Path]) -> None:
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp.npz")
+        np.savez(tmp, idf=self.idf, projection=self.projection,
+                 config=np.array([self.dim, self.n_features, self.seed, int(self.fitted)]))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path], cache_size: int = 50000) -> "HashingEmbedder":
+        with np.load(path) as data:
+            dim, n_features, seed, fitted = (int(v) for v in data["config"])
+            embedder = cls(dim=dim, n_features=n_features, seed=seed, cache_size=cache_size)
+            embedder.idf = data["idf"]
+            embedder.projection = data["projection"]
+            embedder.fitted = bool(fitted)
+        return embedder
+
+
+class SentenceEmbedder(_CachedEmbedder):
+    """Local sentence-transformers model (no downloads: the path must exist offline)"""
+
+    name = "sentence-transformers"
+    fitted = True
+
+    def __init__(self, model_path: str, cache_size: int = 50000):
+        super().__init__(cache_size)
+        self.model_path = model_path
+        self.model = SentenceTransformer(model_path, device="cpu", local_files_only=True)
+        self.dim = self.model.get_sentence_embedding_dimension()
+
+    @property
+    def fingerprint(self) -> str:
+        return f"{self.name}:{Path(self.model_path).name}:{self.dim}"
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        return self.model.encode(texts, batch_size=64, normalize_embeddings=True,
+                                 convert_to_numpy=True).astype(np.float32)
+
+    def fit(self, texts: Sequence[str], **kwargs: Any) -> "SentenceEmbedder":
+        return self
+
+
+_embedder: Optional[_CachedEmbedder] = None
+_embedder_lock = threading.Lock()
+
+
+def get_embedder() -> _CachedEmbedder:
+    """
+    Process-wide embedder: the local model at EMBEDDING_MODEL when
+    sentence-transformers is installed, otherwise hashing/LSA embeddings
+    (loaded from SEMANTIC_INDEX_DIR/embedder.npz once an index has been built)
+    """
+    global _embedder
+
+    with _embedder_lock:
+        if _embedder is None:
+            model_path = os.getenv("EMBEDDING_MODEL", "")
+            if model_path and SentenceTransformer is not None and os.path.exists(model_path):
+                try:
+                    _embedder = SentenceEmbedder(model_path)
+                except Exception as e:
+                    logger.warning(f"Could not load embedding model {model_path}: {e}")
+            if _embedder is None:
+                saved = Path(os.getenv("SEMANTIC_INDEX_DIR", "") or ".") / "embedder.npz"
+                _embedder = HashingEmbedder.load(saved) if os.getenv("SEMANTIC_INDEX_DIR") and saved.exists() \
+                    else HashingEmbedder()
+            logger.info(f"Embedder: {_embedder.fingerprint}")
+    return _embedder
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Conditional-fetch HTTP Cache for Documentation Scrapers
+One process-wide SQLite store of response bodies and their validators
+(ETag / Last-Modified) per URL; refetches send If-None-Match /
+If-Modified-Since and a 304 is served from the stored body
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, Mapping, List
+
+import aiohttp
+
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent.parent / ".cache" / "http" / "http_cache.sqlite"
+
+# Per-run counters kept by callers and recorded with record_run()
+RUN_COUNTERS = ("requests", "hits", "misses", "uncacheable", "errors", "bytes_downloaded", "bytes_saved")
+
+
+def empty_stats() -> Dict[str, int]:
+    """Zeroed per-run counters"""
+    return dict.fromkeys(RUN_COUNTERS, 0)
+
+
+def hit_ratio(stats: Mapping[str, int]) -> float:
+    """Share of cache-eligible fetches answered with 304 Not Modified"""
+    revalidated = stats["hits"] + stats["misses"]
+    return round(stats["hits"] / revalidated, 4) if revalidated else 0.0
+
+
+class HTTPCache:
+    """
+    SQLite-backed conditional-fetch cache shared by every scraper in a process
+
+    A 200 response carrying an ETag or Last-Modified header is stored with
+    its body. The next fetch of that URL is conditional; a 304 counts as a
+    hit and returns the stored body, anything else replaces the entry.
+    Responses without validators are passed through and not stored.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                body TEXT NOT NULL,
+                content_type TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at TEXT NOT NULL,
+                validated_at TEXT NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                label TEXT NOT NULL,
+                finished_at TEXT NOT NULL,
+                requests INTEGER NOT NULL,
+                hits INTEGER NOT NULL,
+                misses INTEGER NOT NULL,
+                uncacheable INTEGER NOT NULL,
+                errors INTEGER NOT NULL,
+                bytes_downloaded INTEGER NOT NULL,
+                bytes_saved INTEGER NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+        # Lifetime counters for this process; per-run counters live with the caller
+        self.stats = empty_stats()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Stored entry for a URL, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, content_type, etag, last_modified, fetched_at, validated_at "
+                "FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        keys = ("body", "content_type", "etag", "last_modified", "fetched_at", "validated_at")
+        return dict(zip(keys, row))
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since for a stored entry"""
+        headers = {}
+        if entry:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url: str, body: str, headers: Mapping[str, str]) -> bool:
+        """Store a 200 response if it has validators; returns whether it was stored"""
+        etag, last_modified = headers.get("ETag"), headers.get("Last-Modified")
+        with self._lock:
+            if not (etag or last_modified):
+                self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+                self._conn.commit()
+                return False
+            now = datetime.now().isoformat()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, body, content_type, etag, last_modified, fetched_at, validated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, body, headers.get("Content-Type"), etag, last_modified, now, now)
+            )
+            self._conn.commit()
+        return True
+
+    def revalidated(self, url: str, headers: Mapping[str, str]) -> None:
+        """Record a 304; servers may send updated validators with it"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified), "
+                "validated_at = ? WHERE url = ?",
+                (headers.get("ETag"), headers.get("Last-Modified"), datetime.now().isoformat(), url)
+            )
+            self._conn.commit()
+
+    async def fetch(self, session: aiohttp.ClientSession, url: str,
+                    stats: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        """
+        GET a URL through the cache
+
+        Returns {"status", "reason", "text", "from_cache"}; a revalidated
+        entry is reported as status 200 with from_cache True.
+        """
+        entry = self.get(url)
+        self._count(stats, "requests")
+
+        try:
+            async with session.get(url, headers=self.conditional_headers(entry)) as response:
+                if response.status == 304 and entry is not None:
+                    self.revalidated(url, response.headers)
+                    self._count(stats, "hits")
+                    self._count(stats, "bytes_saved", len(entry["body"].encode()))
+                    return {"status": 200, "reason": "OK", "text": entry["body"], "from_cache": True}
+
+                text = await response.text(errors="replace")
+                self._count(stats, "bytes_downloaded", len(text.encode()))
+                if response.status == 200:
+                    # A changed page is a miss; one without validators can never be revalidated
+                    self._count(stats, "misses" if self.store(url, text, response.headers) else "uncacheable")
+                else:
+                    self._count(stats, "errors")
+                return {"status": response.status, "reason": response.reason, "text": text, "from_cache": False}
+        except Exception:
+            self._count(stats, "errors")
+            raise
+
+    def _count(self, stats: Optional[Dict[str, int]], key: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[key] += amount
+            if stats is not None:
+                stats[key] += amount
+
+    def record_run(self, label: str, stats: Mapping[str, int]) -> Dict[str, Any]:
+        """Persist one run's counters; returns them with the hit ratio"""
+        with self._lock:
+            self._conn.execute(
+                f"INSERT INTO runs (label, finished_at, {', '.join(RUN_COUNTERS)}) "
+                f"VALUES (?, ?, {', '.join('?' * len(RUN_COUNTERS))})",
+                (label, datetime.now().isoformat(), *(stats[key] for key in RUN_COUNTERS))
+            )
+            self._conn.commit()
+        return dict(stats, hit_ratio=hit_ratio(stats))
+
+    def runs(self, label: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """Most recent recorded runs, newest first"""
+        query = f"SELECT label, finished_at, {', '.join(RUN_COUNTERS)} FROM runs"
+        params: tuple = ()
+        if label is not None:
+            query += " WHERE label = ?"
+            params = (label,)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY id DESC LIMIT ?", (*params, limit)).fetchall()
+        return [dict(zip(("label", "finished_at", *RUN_COUNTERS), row)) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_cache: Optional[HTTPCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache(db_path: Optional[Path] = None) -> Optional[HTTPCache]:
+    """Process-wide HTTP cache handle, or None when HTTP_CACHE_ENABLED is false"""
+    global _cache
+
+    if os.getenv("HTTP_CACHE_ENABLED", "true").lower() in ("0", "false", "no"):
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                path = db_path or Path(os.getenv("HTTP_CACHE_PATH", "") or DEFAULT_CACHE_PATH)
+                _cache = HTTPCache(path)
+    return _cache
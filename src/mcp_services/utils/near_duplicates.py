@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate Page Detection for the Documentation Crawler
+URL canonicalization (tracking parameters, fragments, trailing slashes,
+default ports, query order) plus 64-bit SimHash fingerprints of page text,
+looked up through a banded index so a near-duplicate is found without
+comparing against every crawled page
+"""
+
+import hashlib
+import re
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import numpy as np
+
+from .documentation_search import tokenize
+
+FINGERPRINT_BITS = 64
+
+# Pages within this many differing fingerprint bits are treated as the same page
+DEFAULT_MAX_DISTANCE = 3
+
+# Shorter pages (redirect stubs, empty shells) are too small to fingerprint reliably
+MIN_FINGERPRINT_WORDS = 50
+
+# Query parameters that never change page content
+TRACKING_PARAMS = {"gclid", "fbclid", "msclkid", "dclid", "mc_cid", "mc_eid", "_ga", "_gl", "ref", "ref_src"}
+TRACKING_PREFIXES = ("utm_",)
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Canonical form of a URL for crawl bookkeeping: lowercase scheme and host,
+    no default port, fragment, tracking parameters or trailing slash, and
+    remaining query parameters sorted
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    if parts.username:
+        host = f"{parts.username}{':' + parts.password if parts.password else ''}@{host}"
+
+    path = re.sub(r"/{2,}", "/", parts.path) or "/"
+    if len(path) > 1:
+        path = path.rstrip("/") or "/"
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+def _features(text: str, shingle: int) -> Counter:
+    tokens = tokenize(text)
+    if len(tokens) < shingle:
+        return Counter([" ".join(tokens)]) if tokens else Counter()
+    return Counter(" ".join(tokens[i:i + shingle]) for i in range(len(tokens) - shingle + 1))
+
+
+def simhash(text: str, shingle: int = 2) -> int:
+    """64-bit SimHash of word shingles, each weighted by how often it occurs"""
+    features = _features(text, shingle)
+    if not features:
+        return 0
+
+    hashes = np.array(
+        [int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+         for feature in features],
+        dtype=">u8",
+    )
+    weights = np.fromiter(features.values(), dtype=np.float64, count=len(features))
+    # Bit matrix (features x 64), most significant bit first
+    bits = np.unpackbits(hashes.view(np.uint8)).reshape(len(features), FINGERPRINT_BITS)
+    votes = weights @ (bits.astype(np.float64) * 2 - 1)
+    return int.from_bytes(np.packbits(votes > 0).tobytes(), "big")
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class SimHashIndex:
+    """
+    Fingerprints split into max_distance + 1 bands: two fingerprints within
+    max_distance bits agree exactly on at least one band, so candidates are
+    the pages sharing a band value and only those are compared bit by bit
+    """
+
+    def __init__(self, max_distance: int = DEFAULT_MAX_DISTANCE):
+        self.max_distance = max_distance
+        bands = max_distance + 1
+        width, extra = divmod(FINGERPRINT_BITS, bands)
+        self._bands: List[Tuple[int, int]] = []  # (shift, mask) per band
+        shift = FINGERPRINT_BITS
+        for band in range(bands):
+            size = width + (1 if band < extra else 0)
+            shift -= size
+            self._bands.append((shift, (1 << size) - 1))
+        self._tables: List[Dict[int, List[Tuple[int, str]]]] = [defaultdict(list) for _ in self._bands]
+        self.fingerprints: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.fingerprints)
+
+    def _keys(self, fingerprint: int):
+        return [(fingerprint >> shift) & mask for shift, mask in self._bands]
+
+    def add(self, key: str, fingerprint: int) -> None:
+        """Index a page; re-adding a key replaces its previous fingerprint"""
+        if key in self.fingerprints:
+            self.remove(key)
+        self.fingerprints[key] = fingerprint
+        for table, band in zip(self._tables, self._keys(fingerprint)):
+            table[band].append((fingerprint, key))
+
+    def remove(self, key: str) -> None:
+        fingerprint = self.fingerprints.pop(key)
+        for table, band in zip(self._tables, self._keys(fingerprint)):
+            table[band] = [entry for entry in table[band] if entry[1] != key]
+
+    def find(self, fingerprint: int) -> Optional[Tuple[str, int]]:
+        """Closest indexed (key, distance) within max_distance, or None"""
+        best = None
+        for table, band in zip(self._tables, self._keys(fingerprint)):
+            for candidate, key in table.get(band, ()):
+                distance = hamming_distance(fingerprint, candidate)
+                if distance <= self.max_distance and (best is None or distance < best[1]):
+                    best = (key, distance)
+        return best
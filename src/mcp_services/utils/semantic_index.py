@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Semantic Retrieval Index
+Embeds documentation passages (docs/, docs_unified/), collected job postings
+(JOB_STORE_DIR) and prior research reports (research_outputs/tasks) into one
+ANN vector index, so agents and MCP tools can retrieve by meaning rather than
+by shared keywords. Sources are re-embedded only when their mtime changes;
+the index, embedder and item metadata persist under SEMANTIC_INDEX_DIR.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .documentation_search import (
+    DEFAULT_DOCS_ROOTS, REPO_ROOT, SEARCH_EXTENSIONS, service_for_path, split_json, split_markdown
+)
+from .documentation_store import DocumentationStore, get_documentation_store
+from .embeddings import get_embedder
+from .vector_index import VectorIndex
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPORTS_DIR = REPO_ROOT / "research_outputs" / "tasks"
+
+KINDS = ("docs", "jobs", "reports")
+JOB_TEXT_FIELDS = ("title", "summary", "duties", "qualifications")
+SNIPPET_CHARS = 300
+
+# Extra candidates fetched per requested result when filtering by kind
+KIND_FILTER_OVERSAMPLE = 5
+
+
+def _job_fields(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Collector-extracted job fields from either shape (see job_matching.job_record)"""
+    if "MatchedObjectDescriptor" not in job:
+        return job
+    descriptor = job.get("MatchedObjectDescriptor", {})
+    details = descriptor.get("UserArea", {}).get("Details", {})
+    return {
+        "job_id": job.get("MatchedObjectId"),
+        "title": descriptor.get("PositionTitle"),
+        "agency": descriptor.get("OrganizationName"),
+        "url": descriptor.get("PositionURI"),
+        "summary": details.get("JobSummary"),
+        "duties": details.get("MajorDuties"),
+        "qualifications": details.get("Qualifications") or descriptor.get("QualificationSummary"),
+    }
+
+
+def _text(value: Any) -> str:
+    if isinstance(value, (list, tuple)):
+        return " ".join(_text(v) for v in value)
+    return "" if value is None else str(value)
+
+
+class SemanticIndex:
+    """
+    Embedding index over docs, job postings and research reports
+
+    Each item is a passage (docs, reports) or a posting (jobs) with an int id
+    in the vector index and a metadata record (kind, title, path, offsets,
+    snippet) returned by search().
+    """
+
+    def __init__(self, directory: Optional[Path] = None, embedder: Any = None,
+                 docs_roots: Optional[Iterable[Path]] = None,
+                 reports_dir: Optional[Path] = None,
+                 jobs_dir: Optional[Path] = None,
+                 store: Optional[DocumentationStore] = None,
+                 passage_chars: int = 1200):
+        self.directory = Path(directory) if directory else None
+        self.embedder = embedder or get_embedder()
+        self.docs_roots = [Path(r) for r in (DEFAULT_DOCS_ROOTS if docs_roots is None else docs_roots)]
+        self.reports_dir = Path(reports_dir) if reports_dir else DEFAULT_REPORTS_DIR
+        self.jobs_dir = Path(jobs_dir) if jobs_dir else None
+        self._store = store
+        self.passage_chars = passage_chars
+
+        self._lock = threading.RLock()
+        self.vectors = VectorIndex(self.embedder.dim)
+        self._items: Dict[int, Dict[str, Any]] = {}
+        self._keys: Dict[str, int] = {}
+        self._sources: Dict[str, Tuple[int, List[int]]] = {}
+        self._next_id = 0
+        self.last_refresh: Dict[str, Any] = {}
+
+        if self.directory and (self.directory / "items.json").exists():
+            self._load()
+
+    @property
+    def store(self) -> DocumentationStore:
+        if self._store is None:
+            self._store = get_documentation_store()
+        return self._store
+
+    # ------------------------------------------------------------------ build
+
+    def refresh(self) -> Dict[str, Any]:
+        """Embed new and changed sources, drop removed ones, persist if anything changed"""
+        start = time.perf_counter()
+        current = self._current_sources()
+
+        with self._lock:
+            removed = [source for source in self._sources if source not in current]
+            for source in removed:
+                self._remove_source(source)
+
+            changed = {source: version for source, version in current.items()
+                       if self._sources.get(source, (None,))[0] != version[0]}
+            pending: List[Tuple[str, int, List[Tuple[Dict[str, Any], str]]]] = []
+            for source, (mtime_ns, kind, loader) in changed.items():
+                try:
+                    pending.append((source, mtime_ns, list(loader())))
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Skipping {kind} source {source}: {e}")
+
+            texts = [text for _, _, items in pending for _, text in items]
+            if texts and not self._items and not getattr(self.embedder, "fitted", True):
+                # First build: learn the embedding space from the whole corpus
+                self.embedder.fit(texts)
+                self.vectors = VectorIndex(self.embedder.dim)
+
+            added = 0
+            for source, mtime_ns, items in pending:
+                self._remove_source(source)
+                added += self._add_items(source, mtime_ns, items)
+
+            self.last_refresh = {
+                "items": len(self._items),
+                "sources": len(self._sources),
+                "embedded": added,
+                "removed_sources": len(removed),
+                "seconds": round(time.perf_counter() - start, 3)
+            }
+            if (added or removed) and self.directory:
+                self.save()
+        return self.last_refresh
+
+    def _current_sources(self) -> Dict[str, Tuple[int, str, Any]]:
+        """source path -> (mtime_ns, kind, item loader)"""
+        sources: Dict[str, Tuple[int, str, Any]] = {}
+
+        for root in self.docs_roots:
+            if not root.exists():
+                continue
+            self.store.sync_tree(root, service_for=service_for_path, extensions=SEARCH_EXTENSIONS)
+            prefix = os.path.join(str(root), '')
+            for path, service, section, mtime_ns in self.store.document_versions():
+                if path.startswith(prefix):
+                    sources[path] = (mtime_ns, "docs",
+                                     lambda p=path, s=service, sec=section: self._passages(
+                                         "docs", p, self.store.get_text(Path(p), s, sec), service=s))
+
+        if self.reports_dir.is_dir():
+            for path in sorted(self.reports_dir.glob("*.md")):
+                sources[str(path)] = (path.stat().st_mtime_ns, "reports",
+                                      lambda p=path: self._passages("reports", str(p), p.read_text(errors="replace")))
+
+        if self.jobs_dir and self.jobs_dir.is_dir():
+            for path in sorted(self.jobs_dir.glob("*.json")):
+                sources[str(path)] = (path.stat().st_mtime_ns, "jobs", lambda p=path: self._jobs(p))
+
+        return sources
+
+    def _passages(self, kind: str, path: str, content: Optional[str],
+                  service: Optional[str] = None) -> Iterable[Tuple[Dict[str, Any], str]]:
+        if not content:
+            return
+        splitter = split_json if path.endswith('.json') else split_markdown
+        title, spans = splitter(content, self.passage_chars)
+        title = title or Path(path).stem.replace('_', ' ')
+        relative = os.path.relpath(path, REPO_ROOT)
+        for heading, start, end in spans:
+            body = content[start:end]
+            item = {"kind": kind, "key": f"{kind}:{relative}:{start}", "title": title, "heading": heading,
+                    "path": relative, "start": start, "end": end, "snippet": body.strip()[:SNIPPET_CHARS]}
+            if service:
+                item["service"] = service
+            yield item, f"{title}\n{heading}\n{body}"
+
+    def _jobs(self, path: Path) -> Iterable[Tuple[Dict[str, Any], str]]:
+        data = json.loads(path.read_text())
+        jobs = data.get("jobs", []) if isinstance(data, dict) else data
+        for job in jobs:
+            if not isinstance(job, dict):
+                continue
+            fields = _job_fields(job)
+            if not fields.get("job_id"):
+                continue
+            text = "\n".join(_text(fields.get(name)) for name in JOB_TEXT_FIELDS)
+            yield {
+                "kind": "jobs", "key": f"jobs:{fields['job_id']}", "title": fields.get("title") or "",
+                "job_id": fields["job_id"], "agency": fields.get("agency"), "url": fields.get("url"),
+                "path": os.path.relpath(path, REPO_ROOT), "snippet": _text(fields.get("summary"))[:SNIPPET_CHARS]
+            }, text
+
+    def _add_items(self, source: str, mtime_ns: int, items: List[Tuple[Dict[str, Any], str]]) -> int:
+        ids = []
+        for item, _ in items:
+            # A posting seen in a newer file moves there
+            item_id = self._keys.get(item["key"])
+            if item_id is None:
+                item_id = self._keys[item["key"]] = self._next_id
+                self._next_id += 1
+            else:
+                previous = self._items[item_id].get("source")
+                if previous in self._sources and previous != source:
+                    self._sources[previous][1].remove(item_id)
+            item["source"] = source
+            self._items[item_id] = item
+            ids.append(item_id)
+
+        if ids:
+            self.vectors.add(ids, self.embedder.embed([text for _, text in items]))
+        # A posting listed twice in one file is one item
+        self._sources[source] = (mtime_ns, list(dict.fromkeys(ids)))
+        return len(ids)
+
+    def _remove_source(self, source: str) -> None:
+        _, ids = self._sources.pop(source, (None, []))
+        if ids:
+            self.vectors.remove(ids)
+            for item_id in ids:
+                item = self._items.pop(item_id, None)
+                if item is not None:
+                    self._keys.pop(item["key"], None)
+
+    # ------------------------------------------------------------------ query
+
+    def search(self, query: str, k: int = 10, kinds: Optional[Sequence[str]] = None,
+               nprobe: Optional[int] = None, min_score: float = 0.0) -> List[Dict[str, Any]]:
+        """Most similar items to a query text, optionally restricted to kinds (docs/jobs/reports)"""
+        return self.search_many([query], k=k, kinds=kinds, nprobe=nprobe, min_score=min_score)[0]
+
+    def search_many(self, queries: Sequence[str], k: int = 10, kinds: Optional[Sequence[str]] = None,
+                    nprobe: Optional[int] = None, min_score: float = 0.0) -> List[List[Dict[str, Any]]]:
+        """Batch search: all queries embedded and probed together"""
+        wanted = set(kinds) if kinds else None
+        if not queries:
+            return []
+        vectors = self.embedder.embed(list(queries))
+        fetch = k * KIND_FILTER_OVERSAMPLE if wanted else k
+
+        with self._lock:
+            results = []
+            for ids, scores in self.vectors.search(vectors, k=fetch, nprobe=nprobe):
+                ranked = []
+                for item_id, score in zip(ids.tolist(), scores.tolist()):
+                    item = self._items.get(item_id)
+                    if score <= min_score:
+                        break
+                    if item is None or (wanted and item["kind"] not in wanted):
+                        continue
+                    result = {key: value for key, value in item.items() if key not in ("key", "source")}
+                    result["score"] = round(score, 4)
+                    ranked.append(result)
+                    if len(ranked) == k:
+                        break
+                results.append(ranked)
+            return results
+
+    # ------------------------------------------------------------------ persistence
+
+    def save(self) -> None:
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self.vectors.save(self.directory / "vectors")
+            if hasattr(self.embedder, "save"):
+                self.embedder.save(self.directory / "embedder.npz")
+            payload = {
+                "embedder": self.embedder.fingerprint,
+                "next_id": self._next_id,
+                "items": {str(item_id): item for item_id, item in self._items.items()},
+                "sources": {source: [mtime_ns, ids] for source, (mtime_ns, ids) in self._sources.items()},
+            }
+            tmp = self.directory / "items.tmp.json"
+            tmp.write_text(json.dumps(payload))
+            os.replace(tmp, self.directory / "items.json")
+
+    def _load(self) -> None:
+        payload = json.loads((self.directory / "items.json").read_text())
+        if payload.get("embedder") != self.embedder.fingerprint:
+            logger.info(f"Semantic index at {self.directory} was built with {payload.get('embedder')}; rebuilding")
+            return
+        self.vectors = VectorIndex.load(self.directory / "vectors")
+        self._items = {int(item_id): item for item_id, item in payload["items"].items()}
+        self._keys = {item["key"]: item_id for item_id, item in self._items.items()}
+        self._sources = {source: (mtime_ns, ids) for source, (mtime_ns, ids) in payload["sources"].items()}
+        self._next_id = payload["next_id"]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = {kind: 0 for kind in KINDS}
+            for item in self._items.values():
+                counts[item["kind"]] = counts.get(item["kind"], 0) + 1
+            return {
+                "items": len(self._items),
+                "by_kind": counts,
+                "sources": len(self._sources),
+                "index": self.vectors.stats(),
+                "embedder": self.embedder.stats(),
+                "last_refresh": self.last_refresh
+            }
+
+
+_index: Optional[SemanticIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_semantic_index(refresh: bool = True) -> SemanticIndex:
+    """
+    Process-wide semantic index (persisted under SEMANTIC_INDEX_DIR when set,
+    job postings from JOB_STORE_DIR), refreshed on each call by default
+    """
+    global _index
+
+    with _index_lock:
+        if _index is None:
+            directory = os.getenv("SEMANTIC_INDEX_DIR", "")
+            jobs_dir = os.getenv("JOB_STORE_DIR", "")
+            _index = SemanticIndex(directory=Path(directory) if directory else None,
+                                   jobs_dir=Path(jobs_dir) if jobs_dir else None)
+        if refresh or not _index.last_refresh:
+            _index.refresh()
+    return _index
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Approximate Nearest-Neighbour Vector Index
+Inverted-file (IVF) index for inner-product / cosine search over normalized
+embeddings: vectors are clustered by spherical k-means and stored contiguously
+by cluster, so a query scores only the `nprobe` clusters whose centroids are
+closest. Saved as plain .npy files and loaded memory-mapped, so opening a
+million-vector index is instant and only the probed clusters are paged in.
+
+Small collections (below `train_min`) are searched exactly until they grow.
+New vectors go to an exact-search delta that is merged into the clustered
+layout once it outgrows a fraction of it.
+"""
+
+import json
+import logging
+import math
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Exact search below this many vectors; IVF needs enough points per centroid to train
+TRAIN_MIN = 20000
+KMEANS_ITERATIONS = 10
+KMEANS_SAMPLE_PER_LIST = 64
+
+DELTA_MERGE_RATIO = 0.1
+DELTA_MERGE_MIN_ROWS = 5000
+
+# Vectors x queries scored per block in exact search
+SCORE_BLOCK = 65536
+
+
+def default_nlist(count: int) -> int:
+    """Clusters for a collection size: ~2*sqrt(n), the usual IVF balance of probe vs scan cost"""
+    return max(1, min(65536, int(2 * math.sqrt(count))))
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k largest scores, best first"""
+    if k >= len(scores):
+        return np.argsort(-scores, kind="stable")
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top], kind="stable")]
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray, block: int = 32768) -> np.ndarray:
+    """Nearest centroid (max inner product) per vector"""
+    labels = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), block):
+        labels[start:start + block] = np.argmax(
+            np.asarray(vectors[start:start + block], dtype=np.float32) @ centroids.T, axis=1)
+    return labels
+
+
+def train_centroids(vectors: np.ndarray, nlist: int, iterations: int = KMEANS_ITERATIONS,
+                    seed: int = 0) -> np.ndarray:
+    """Spherical k-means on a sample of normalized vectors"""
+    rng = np.random.default_rng(seed)
+    sample_size = min(len(vectors), nlist * KMEANS_SAMPLE_PER_LIST)
+    sample = np.asarray(vectors[np.sort(rng.choice(len(vectors), sample_size, replace=False))],
+                        dtype=np.float32)
+    centroids = sample[rng.choice(sample_size, nlist, replace=False)].copy()
+
+    for _ in range(iterations):
+        labels = _assign(sample, centroids)
+        order = np.argsort(labels, kind="stable")
+        lists, starts = np.unique(labels[order], return_index=True)
+        sums = np.zeros_like(centroids)
+        sums[lists] = np.add.reduceat(sample[order], starts, axis=0)
+
+        # Empty clusters restart from random sample points
+        empty = np.setdiff1d(np.arange(nlist), lists)
+        if len(empty):
+            sums[empty] = sample[rng.choice(sample_size, len(empty), replace=False)]
+        centroids = sums / np.maximum(np.linalg.norm(sums, axis=1, keepdims=True), 1e-12)
+    return centroids.astype(np.float32)
+
+
+class VectorIndex:
+    """
+    IVF index of normalized float32 vectors keyed by int64 ids
+
+    add() upserts, remove() tombstones; search() returns (ids, scores) per
+    query, best first. Not thread-safe for concurrent writers; reads under
+    the instance lock.
+    """
+
+    def __init__(self, dim: int, nlist: Optional[int] = None, nprobe: int = 16,
+                 train_min: int = TRAIN_MIN):
+        self.dim = dim
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.train_min = train_min
+
+        self._lock = threading.RLock()
+        self.centroids: Optional[np.ndarray] = None
+        # Main layout: vectors grouped by cluster, offsets[c]:offsets[c+1] is cluster c
+        self._vectors = np.zeros((0, dim), dtype=np.float32)
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._live = np.ones(0, dtype=bool)
+        self._dead = 0
+        self._id_order: Optional[np.ndarray] = None
+        # Delta: exact-search rows not yet merged
+        self._delta_vectors: List[np.ndarray] = []
+        self._delta_ids: Dict[int, Tuple[int, int]] = {}
+        self._delta_rows = 0
+        self._delta_cache: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self._ids) - self._dead + len(self._delta_ids)
+
+    @property
+    def trained(self) -> bool:
+        return self.centroids is not None
+
+    # ------------------------------------------------------------------ build
+
+    def _main_row(self, ids: np.ndarray) -> np.ndarray:
+        """Main-layout rows of ids (-1 where absent or removed)"""
+        if self._id_order is None:
+            self._id_order = np.argsort(self._ids, kind="stable")
+        sorted_ids = self._ids[self._id_order]
+        positions = np.minimum(np.searchsorted(sorted_ids, ids), max(len(sorted_ids) - 1, 0))
+        if not len(sorted_ids):
+            return np.full(len(ids), -1, dtype=np.int64)
+        rows = self._id_order[positions]
+        found = (sorted_ids[positions] == ids) & self._live[rows]
+        return np.where(found, rows, -1)
+
+    def add(self, ids: Sequence[int], vectors: np.ndarray) -> None:
+        """Insert or replace vectors (rows L2-normalized by the caller)"""
+        ids = np.asarray(ids, dtype=np.int64)
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if vectors.shape != (len(ids), self.dim):
+            raise ValueError(f"expected {len(ids)} x {self.dim} vectors, got {vectors.shape}")
+        if not len(ids):
+            return
+
+        with self._lock:
+            self._remove(ids)
+            chunk = len(self._delta_vectors)
+            self._delta_vectors.append(vectors)
+            for row, vector_id in enumerate(ids.tolist()):
+                # A repeated id within one call keeps its last vector
+                self._delta_ids[vector_id] = (chunk, row)
+            self._delta_rows += len(ids)
+            self._delta_cache = None
+            self._maybe_merge()
+
+    def remove(self, ids: Sequence[int]) -> int:
+        with self._lock:
+            return self._remove(np.asarray(ids, dtype=np.int64))
+
+    def _remove(self, ids: np.ndarray) -> int:
+        removed = 0
+        for vector_id in ids.tolist():
+            if self._delta_ids.pop(vector_id, None) is not None:
+                removed += 1
+                self._delta_cache = None
+        rows = self._main_row(ids)
+        rows = np.unique(rows[rows >= 0])
+        if len(rows):
+            self._live[rows] = False
+            self._dead += len(rows)
+            removed += len(rows)
+        return removed
+
+    def _maybe_merge(self) -> None:
+        main = len(self._ids) - self._dead
+        if not self.trained:
+            if main + len(self._delta_ids) >= self.train_min or self._delta_rows > DELTA_MERGE_MIN_ROWS:
+                self.merge()
+        elif self._delta_rows > max(DELTA_MERGE_MIN_ROWS, DELTA_MERGE_RATIO * main):
+            self.merge()
+
+    def _delta_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._delta_cache is None:
+            if not self._delta_ids:
+                self._delta_cache = (np.zeros(0, dtype=np.int64), np.zeros((0, self.dim), dtype=np.float32))
+            else:
+                ids = np.fromiter(self._delta_ids, dtype=np.int64, count=len(self._delta_ids))
+                vectors = np.stack([self._delta_vectors[chunk][row] for chunk, row in self._delta_ids.values()])
+                self._delta_cache = (ids, vectors)
+        return self._delta_cache
+
+    def merge(self, retrain: bool = False) -> None:
+        """
+        Fold the delta and tombstones into the clustered layout, training the
+        centroids once the collection reaches train_min (or when retrain=True)
+        """
+        with self._lock:
+            start = time.perf_counter()
+            delta_ids, delta_vectors = self._delta_arrays()
+            live = np.flatnonzero(self._live)
+            ids = np.concatenate([self._ids[live], delta_ids])
+            vectors = np.concatenate([np.asarray(self._vectors[live], dtype=np.float32), delta_vectors])
+
+            labels = None
+            if len(ids) >= self.train_min and (retrain or not self.trained):
+                nlist = self.nlist or default_nlist(len(ids))
+                self.centroids = train_centroids(vectors, nlist)
+                self.nlist = nlist
+            elif self.trained:
+                # Existing rows keep their clusters; only the delta is assigned
+                main_labels = np.repeat(np.arange(len(self.centroids), dtype=np.int32), np.diff(self._offsets))
+                labels = np.concatenate([main_labels[live], _assign(delta_vectors, self.centroids)])
+
+            if self.trained:
+                if labels is None:
+                    labels = _assign(vectors, self.centroids)
+                order = np.argsort(labels, kind="stable")
+                ids, vectors = ids[order], vectors[order]
+                counts = np.bincount(labels, minlength=len(self.centroids))
+                self._offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+            else:
+                self._offsets = np.array([0, len(ids)], dtype=np.int64)
+
+            self._vectors, self._ids = vectors, ids
+            self._live = np.ones(len(ids), dtype=bool)
+            self._dead = 0
+            self._id_order = None
+            self._delta_vectors, self._delta_ids, self._delta_rows = [], {}, 0
+            self._delta_cache = None
+            logger.debug(f"Vector index merged to {len(ids)} vectors "
+                         f"({'IVF' if self.trained else 'exact'}) in {time.perf_counter() - start:.2f}s")
+
+    # ------------------------------------------------------------------ query
+
+    def search(self, queries: np.ndarray, k: int = 10, nprobe: Optional[int] = None,
+               exact: bool = False) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Top-k (ids, scores) per query row by inner product; exact=True scans
+        every vector (the ground truth for recall measurements)
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        with self._lock:
+            delta_ids, delta_vectors = self._delta_arrays()
+            delta_scores = queries @ delta_vectors.T
+            if exact or not self.trained:
+                main_scores = self._scan_all(queries)
+                probes = None
+            else:
+                nprobe = min(nprobe or self.nprobe, len(self.centroids))
+                coarse = queries @ self.centroids.T
+                probes = np.argpartition(-coarse, nprobe - 1, axis=1)[:, :nprobe]
+
+            results = []
+            for qi, query in enumerate(queries):
+                if probes is None:
+                    rows = None
+                    scores = main_scores[qi]
+                else:
+                    rows = self._rows(probes[qi])
+                    scores = np.asarray(self._vectors[rows], dtype=np.float32) @ query
+                if self._dead:
+                    scores = np.where(self._live if rows is None else self._live[rows], scores, -np.inf)
+
+                top = _top_k(scores, k)
+                top_ids = self._ids[top if rows is None else rows[top]]
+                top_scores = scores[top]
+                keep = np.isfinite(top_scores)
+                ids = np.concatenate([top_ids[keep], delta_ids])
+                scores = np.concatenate([top_scores[keep], delta_scores[qi]])
+                best = _top_k(scores, k)
+                results.append((ids[best], scores[best]))
+            return results
+
+    def _scan_all(self, queries: np.ndarray) -> np.ndarray:
+        scores = np.empty((len(queries), len(self._ids)), dtype=np.float32)
+        for start in range(0, len(self._ids), SCORE_BLOCK):
+            block = np.asarray(self._vectors[start:start + SCORE_BLOCK], dtype=np.float32)
+            scores[:, start:start + SCORE_BLOCK] = queries @ block.T
+        return scores
+
+    def _rows(self, lists: np.ndarray) -> np.ndarray:
+        starts, ends = self._offsets[lists], self._offsets[lists + 1]
+        lengths = ends - starts
+        # Concatenated aranges of the probed clusters' row ranges
+        return np.repeat(starts - np.concatenate([[0], np.cumsum(lengths)[:-1]]), lengths) \
+            + np.arange(lengths.sum())
+
+    # ------------------------------------------------------------------ persistence
+
+    def save(self, directory: Union[str, Path]) -> None:
+        """Merge and write .npy files (each replaced atomically), metadata last"""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            if self._delta_ids or self._dead:
+                self.merge()
+            arrays = {
+                "vectors": np.asarray(self._vectors, dtype=np.float32),
+                "ids": self._ids,
+                "offsets": self._offsets,
+                "centroids": self.centroids if self.trained else np.zeros((0, self.dim), dtype=np.float32),
+            }
+            for name, array in arrays.items():
+                tmp = directory / f"{name}.tmp.npy"
+                np.save(tmp, array)
+                os.replace(tmp, directory / f"{name}.npy")
+            meta = {"dim": self.dim, "nlist": self.nlist, "nprobe": self.nprobe,
+                    "train_min": self.train_min, "count": len(self._ids)}
+            tmp = directory / "index.tmp.json"
+            tmp.write_text(json.dumps(meta))
+            os.replace(tmp, directory / "index.json")
+
+    @classmethod
+    def load(cls, directory: Union[str, Path], mmap: bool = True) -> "VectorIndex":
+        """Open a saved index; with mmap the vectors stay on disk until probed"""
+        directory = Path(directory)
+        meta = json.loads((directory / "index.json").read_text())
+        index = cls(meta["dim"], nlist=meta["nlist"], nprobe=meta["nprobe"], train_min=meta["train_min"])
+        index._vectors = np.load(directory / "vectors.npy", mmap_mode="r" if mmap else None)
+        index._ids = np.load(directory / "ids.npy")
+        index._offsets = np.load(directory / "offsets.npy")
+        centroids = np.load(directory / "centroids.npy")
+        index.centroids = centroids if len(centroids) else None
+        index._live = np.ones(len(index._ids), dtype=bool)
+        return index
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            sizes = np.diff(self._offsets) if self.trained else np.zeros(0)
+            return {
+                "vectors": len(self),
+                "dim": self.dim,
+                "mode": "ivf" if self.trained else "exact",
+                "nlist": len(self.centroids) if self.trained else 0,
+                "nprobe": self.nprobe,
+                "delta": len(self._delta_ids),
+                "removed_pending": self._dead,
+                "largest_list": int(sizes.max()) if len(sizes) else 0,
+                "memory_mapped": isinstance(self._vectors, np.memmap),
+            }
@@ -0,0 +1,73 @@
+"""
+Test lazy agent registration in AgentRegistry
+"""
+
+import pytest
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from agents.app.agents.factory import AgentFactory, AgentRegistry
+
+
+class TestLazyAgentRegistry:
+    """Test "module:Class" registration and first-use imports"""
+
+    def test_listing_does_not_import(self):
+        """Test listing lazy agents reports class names without importing"""
+        registry = AgentRegistry()
+        registry.register("fractions", "fractions:Fraction", metadata={"description": "lazy"})
+
+        listed = registry.list_agents()["fractions"]
+        assert listed["class"] == "Fraction"
+        assert listed["loaded"] is False
+        assert registry.is_registered("fractions")
+        assert registry.import_report()["pending"] == ["fractions"]
+
+    def test_get_imports_on_first_use(self):
+        """Test get() resolves the class once and records import cost"""
+        registry = AgentRegistry()
+        registry.register("decimal", "decimal:Decimal")
+
+        from decimal import Decimal
+        assert registry.get("decimal") is Decimal
+        assert registry.get("decimal") is Decimal
+
+        report = registry.import_report()
+        assert report["loaded"] == ["decimal"]
+        assert report["agents"]["decimal"]["module"] == "decimal"
+        assert report["agents"]["decimal"]["import_ms"] >= 0
+
+    def test_warm_up_only_flagged_roles(self):
+        """Test warm_up() imports roles registered with warm=True"""
+        registry = AgentRegistry()
+        registry.register("warm", "json:JSONDecoder", warm=True)
+        registry.register("cold", "json:JSONEncoder")
+
+        assert registry.warm_up() == {"warm": "ready"}
+        assert registry.list_agents()["warm"]["loaded"] is True
+        assert registry.list_agents()["cold"]["loaded"] is False
+
+    def test_invalid_spec_rejected(self):
+        """Test specs without a class name are rejected at registration"""
+        registry = AgentRegistry()
+        with pytest.raises(ValueError):
+            registry.register("broken", "roles.data_scientist")
+
+    def test_unknown_role_returns_none(self):
+        """Test unknown roles still return None"""
+        assert AgentRegistry().get("missing") is None
+
+
+class TestActiveUserCount:
+    """Test the active_users gauge source"""
+
+    def test_batch_instances_count_as_their_user(self, monkeypatch):
+        """Test a user's batch instance does not count as another user"""
+        monkeypatch.setattr(AgentFactory, "_instances", {
+            "data_scientist:u1": object(), "resume_compression:batch:u1": object(),
+            "statistician:batch:u2": object(), "devops_engineer:u3": object(),
+        })
+        assert AgentFactory.active_user_count() == 3
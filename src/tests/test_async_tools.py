@@ -0,0 +1,120 @@
+"""
+Test async tool execution and parallel tool calls in the ReAct loop
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+from langchain.agents import AgentExecutor
+from langchain.prompts import PromptTemplate
+from langchain.tools import Tool
+from langchain_core.agents import AgentAction
+from langchain_core.exceptions import OutputParserException
+from langchain_core.language_models import FakeListLLM
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from agents.app.agents.async_tools import ParallelReActOutputParser, async_tool, create_async_react_agent
+
+TWO_ACTIONS = (
+    "Thought: check both\n"
+    "Action: salary_lookup\nAction Input: GS-13\n"
+    "Action: location_lookup\nAction Input: Denver, CO"
+)
+PROMPT = PromptTemplate.from_template(
+    "Tools:\n{tools}\nUse one of [{tool_names}]\nQuestion: {input}\n{agent_scratchpad}"
+)
+
+
+def slow_tool(name: str, delay: float, events: list) -> Tool:
+    async def lookup(query: str) -> str:
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            events.append(f"{name} cancelled")
+            raise
+        return f"{name}: {query}"
+    return Tool(name=name, func=None, coroutine=lookup, description=f"Look up {name}")
+
+
+class TestParallelReActOutputParser:
+    """Test one model turn can request several tool calls"""
+
+    def test_multiple_actions_become_a_list(self):
+        """Test each Action/Action Input pair becomes an action and duplicates collapse"""
+        actions = ParallelReActOutputParser().parse(TWO_ACTIONS + "\nAction: salary_lookup\nAction Input: GS-13")
+
+        assert [(a.tool, a.tool_input) for a in actions] == [
+            ("salary_lookup", "GS-13"), ("location_lookup", "Denver, CO")
+        ]
+        assert actions[0].log.startswith("Thought: check both") and actions[1].log.startswith("Action: location_lookup")
+
+    def test_single_action_and_limits(self):
+        """Test the single-action format is unchanged and mixing actions with an answer is rejected"""
+        single = ParallelReActOutputParser().parse("Thought: x\nAction: salary_lookup\nAction Input: GS-13")
+        assert isinstance(single, AgentAction) and single.tool_input == "GS-13"
+
+        sequential = ParallelReActOutputParser(max_actions=1).parse(TWO_ACTIONS)
+        assert isinstance(sequential, AgentAction) and sequential.tool == "salary_lookup"
+
+        with pytest.raises(OutputParserException):
+            ParallelReActOutputParser().parse(TWO_ACTIONS + "\nFinal Answer: done")
+
+
+class TestAsyncTool:
+    """Test tool coroutines, offloading and timeouts"""
+
+    def test_inline_offload_and_timeout(self):
+        """Test sync tools run on the loop thread unless offloaded, and slow calls time out"""
+        def where(query: str) -> int:
+            return threading.get_ident()
+
+        async def run():
+            inline = await async_tool(Tool(name="where", func=where, description="d")).arun("x")
+            offloaded = await async_tool(Tool(name="where", func=where, description="d"), offload=True).arun("x")
+            timed_out = await async_tool(slow_tool("slow", 1.0, []), timeout=0.05).arun("x")
+            return inline, offloaded, timed_out, threading.get_ident()
+
+        inline, offloaded, timed_out, loop_thread = asyncio.run(run())
+
+        assert inline == loop_thread and offloaded != loop_thread
+        assert timed_out.startswith("Tool slow timed out after 0.05s")
+
+
+class TestParallelExecution:
+    """Test the executor dispatches one step's tool calls concurrently"""
+
+    def test_actions_of_one_step_run_concurrently(self):
+        """Test two 0.2s tools requested together finish in about 0.2s"""
+        events: list = []
+        tools = [async_tool(slow_tool(name, 0.2, events)) for name in ("salary_lookup", "location_lookup")]
+        llm = FakeListLLM(responses=[TWO_ACTIONS, "Thought: done\nFinal Answer: GS-13 in Denver"])
+        executor = AgentExecutor(agent=create_async_react_agent(llm, tools, PROMPT, ParallelReActOutputParser()),
+                                 tools=tools, return_intermediate_steps=True)
+
+        started = time.perf_counter()
+        result = asyncio.run(executor.ainvoke({"input": "Compare offers"}))
+
+        assert time.perf_counter() - started < 0.35
+        assert result["output"] == "GS-13 in Denver"
+        assert [observation for _, observation in result["intermediate_steps"]] == [
+            "salary_lookup: GS-13", "location_lookup: Denver, CO"
+        ]
+
+    def test_request_timeout_cancels_tools(self):
+        """Test cancelling the request cancels in-flight tool calls"""
+        events: list = []
+        tools = [async_tool(slow_tool(name, 5, events)) for name in ("salary_lookup", "location_lookup")]
+        llm = FakeListLLM(responses=[TWO_ACTIONS])
+        executor = AgentExecutor(agent=create_async_react_agent(llm, tools, PROMPT, ParallelReActOutputParser()),
+                                 tools=tools)
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(asyncio.wait_for(executor.ainvoke({"input": "Compare offers"}), timeout=0.1))
+
+        assert sorted(events) == ["location_lookup cancelled", "salary_lookup cancelled"]
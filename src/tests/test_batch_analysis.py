@@ -0,0 +1,184 @@
+"""
+Test batch agent analysis and the MCP batch tool
+"""
+
+import asyncio
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from agents.app.agents.batch_analysis import BatchAnalyzer
+from agents.app.agents.base import AgentConfig, AgentResponse, FederalJobAgent
+from src.core import mcp_server
+from src.core.mcp_server import FedJobAdvisorMCP
+
+# Server configuration for the tests; the real config/mcp_server.json is not read
+TEST_CONFIG = {"server_info": {"name": "fed-job-advisor-test"}, "agent_base_url": "http://agents.test"}
+
+
+class SlowAgent:
+    """Agent stand-in: sleeps per item, tracks peak concurrency, fails on request"""
+
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+
+    async def analyze(self, data):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(data.get("delay", 0.01))
+            if data.get("raise"):
+                raise RuntimeError("model unavailable")
+            if data.get("fail"):
+                return AgentResponse(success=False, message="Resume text is empty")
+            return AgentResponse(success=True, message="Analysis completed", data={"score": data["score"]})
+        finally:
+            self.running -= 1
+
+
+async def _collect(agen):
+    return [record async for record in agen]
+
+
+class TestBatchAnalyzer:
+    """Test fan-out, completion-order streaming and per-item errors"""
+
+    def test_results_stream_in_completion_order_within_the_limit(self):
+        """Test a fast item is yielded before a slow one and no more than max_concurrency run at once"""
+        agent = SlowAgent()
+        items = [{"id": "slow", "score": 1, "delay": 0.1}] + [{"id": f"r{i}", "score": i, "delay": 0.01}
+                                                              for i in range(2, 8)]
+        records = asyncio.run(_collect(BatchAnalyzer(max_concurrency=3).run(agent.analyze, items)))
+
+        results, summary = records[:-1], records[-1]
+        assert [r["index"] for r in results][-1] == 0 and sorted(r["index"] for r in results) == list(range(7))
+        assert agent.peak == 3
+        assert results[0]["response"]["data"]["score"] == results[0]["index"] + 1
+        assert summary["type"] == "summary" and summary["completed"] == 7 and summary["failed"] == 0
+
+    def test_failed_items_do_not_fail_the_batch(self):
+        """Test exceptions, unsuccessful responses, timeouts and non-object items become error records"""
+        agent = SlowAgent()
+        items = [{"score": 1}, {"raise": True}, {"fail": True}, {"delay": 1.0}, "not an object", {"score": 6}]
+        records = asyncio.run(_collect(BatchAnalyzer(max_concurrency=2, item_timeout=0.1).run(agent.analyze, items)))
+
+        by_index = {r["index"]: r for r in records if r["type"] != "summary"}
+        assert [by_index[i]["type"] for i in range(6)] == ["result", "error", "error", "error", "error", "result"]
+        assert by_index[1]["error"] == "model unavailable"
+        assert by_index[2]["error"] == "Resume text is empty"
+        assert by_index[3]["timed_out"] and "must be a JSON object" in by_index[4]["error"]
+        assert records[-1]["completed"] == 2 and records[-1]["failed"] == 4 and records[-1]["timed_out"] == 1
+
+    def test_stopping_early_cancels_in_flight_items(self):
+        """Test a consumer that goes away leaves no analyses running"""
+        agent = SlowAgent()
+
+        async def scenario():
+            stream = BatchAnalyzer(max_concurrency=2).run(agent.analyze, [{"score": i, "delay": 0.05 * i}
+                                                                           for i in range(1, 6)])
+            first = await stream.__anext__()
+            await stream.aclose()
+            await asyncio.sleep(0)
+            return first
+
+        assert asyncio.run(scenario())["index"] == 0 and agent.running == 0
+
+
+class BudgetedAgent(FederalJobAgent):
+    """Memoryless agent whose executor waits, then fits a scratchpad sized by the request"""
+
+    def _load_tools(self):
+        return []
+
+    def _get_prompt_template(self):
+        return "You review resumes.\n\nTools: {tools}\n\nUser Input: {input}\nContext: {context}\n\n{agent_scratchpad}"
+
+    async def analyze(self, data):
+        return await self.process("Review this resume", data)
+
+    async def _invoke(self, agent_input):
+        await asyncio.sleep(0.01)
+        # One tool observation per line of context, so each call's scratchpad size differs
+        lines = json.loads(agent_input["context"])["lines"]
+        self._trim_scratchpad([(SimpleNamespace(log="Action: review"), "finding\n" * lines)])
+        await asyncio.sleep(0.01)
+        return {"output": "done"}
+
+
+class TestSharedAgentBudget:
+    """Test concurrent calls on one agent instance keep their own context budget"""
+
+    def test_concurrent_calls_report_their_own_budget(self):
+        """Test each of several overlapping process() calls reports its own context and scratchpad tokens"""
+        agent = BudgetedAgent(AgentConfig(role="resume_compression", user_id="batch:u1", enable_memory=False))
+        agent.agent = SimpleNamespace(ainvoke=agent._invoke)
+
+        async def scenario():
+            return await asyncio.gather(*(agent.analyze({"lines": lines, "pad": "x" * 40 * lines})
+                                          for lines in (1, 20, 200)))
+
+        budgets = [response.metadata["context_budget"]["used"] for response in asyncio.run(scenario())]
+        assert budgets[0]["context"] < budgets[1]["context"] < budgets[2]["context"]
+        assert budgets[0]["scratchpad"] < budgets[1]["scratchpad"] < budgets[2]["scratchpad"]
+        assert agent._call_budget == {}
+
+
+class TestMCPBatchTool:
+    """Test analyze_batch consumes the streamed records into one tool result"""
+
+    @pytest.fixture(autouse=True)
+    def _config(self, monkeypatch):
+        monkeypatch.setattr(mcp_server, "MCP_CONFIG", TEST_CONFIG)
+
+    def _server(self, handler):
+        server = FedJobAdvisorMCP()
+        transport = httpx.MockTransport(handler)
+        return server, lambda: httpx.AsyncClient(transport=transport, base_url=server.agent_base_url)
+
+    def test_batch_reports_every_item_in_input_order(self):
+        """Test one call returns a header plus one section per item, failures included, and is not cached"""
+        requests = []
+
+        def handler(request):
+            requests.append(json.loads(request.content))
+            lines = [
+                {"type": "error", "index": 1, "id": "b", "error": "Timed out after 30.0s"},
+                {"type": "result", "index": 0, "id": "a",
+                 "response": {"success": True, "message": "Fits on 2 pages", "data": {"score": 91}}},
+                {"type": "summary", "completed": 1, "failed": 1, "elapsed_seconds": 0.5, "max_concurrency": 4},
+            ]
+            return httpx.Response(200, text="".join(json.dumps(line) + "\n" for line in lines))
+
+        server, client = self._server(handler)
+        args = {"user_id": "u1", "tool": "analyze_resume_compression",
+                "items": [{"id": "a", "resume_text": "..."}, {"id": "b", "resume_text": "..."}]}
+
+        async def scenario():
+            async with client() as http:
+                return await server._invoke_batch(http, args)
+
+        contents, cacheable = asyncio.run(scenario())
+        assert requests[0]["role"] == "resume_compression" and len(requests[0]["items"]) == 2
+        assert "1/2 succeeded" in contents[0].text
+        assert "Item 1 (a)" in contents[1].text and "Score:** 91" in contents[1].text
+        assert "Item 2 (b)" in contents[2].text and "Timed out" in contents[2].text
+        assert cacheable is False
+
+    def test_unknown_tool_is_rejected_without_a_request(self):
+        """Test only document analysis tools can be batched"""
+        server, client = self._server(lambda request: pytest.fail("no request expected"))
+
+        async def scenario():
+            async with client() as http:
+                return await server._invoke_batch(http, {"user_id": "u1", "tool": "scrape_web_page", "items": [{}]})
+
+        contents, cacheable = asyncio.run(scenario())
+        assert "supports" in contents[0].text and cacheable is False
@@ -0,0 +1,98 @@
+"""
+Test bulk candidate screening
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+from concurrent.futures.process import BrokenProcessPool
+
+from agents.app.agents.batch_screening import (
+    BatchScreener, get_screening_pool, iter_profiles, parse_roles, screen_chunk, shutdown_screening_pools
+)
+
+PROFILE = {
+    "id": "c-1",
+    "skills": ["Python", "Docker", "Kubernetes"],
+    "experience": "6 years of Jenkins pipelines, Docker and Kubernetes on AWS; PostgreSQL tuning",
+    "certifications": ["AWS Certified Solutions Architect"],
+}
+
+
+async def _chunks(*parts):
+    for part in parts:
+        yield part
+
+
+async def _collect(agen):
+    return [item async for item in agen]
+
+
+class TestScreenChunk:
+    """Test the worker entry point"""
+
+    def test_results_and_errors(self):
+        """Test valid profiles produce per-role analyses and bad lines become error records"""
+        records = screen_chunk([(0, json.dumps(PROFILE)), (1, "{not json"), (2, "[1, 2]")], ["devops"])
+
+        assert [r["type"] for r in records] == ["result", "error", "error"]
+        assert records[0]["id"] == "c-1"
+        assert records[0]["roles"]["devops"]["check_container_experience"]["docker"] is True
+        assert [r["index"] for r in records] == [0, 1, 2]
+
+    def test_unknown_role_rejected(self):
+        """Test role validation"""
+        assert parse_roles("") == parse_roles(None)
+        with pytest.raises(ValueError):
+            parse_roles("devops,astronaut")
+
+
+class TestBatchScreener:
+    """Test streaming screening over profile input"""
+
+    def test_profile_splitting(self):
+        """Test NDJSON lines split across chunks and JSON array uploads"""
+        lines = asyncio.run(_collect(iter_profiles(_chunks(b'{"a": 1}\n{"b"', b': 2}\n\n', b'{"c": 3}'))))
+        assert [json.loads(line) for line in lines] == [{"a": 1}, {"b": 2}, {"c": 3}]
+
+        items = asyncio.run(_collect(iter_profiles(_chunks(b' [{"a": 1}, ', b'{"b": 2}]'))))
+        assert items == [{"a": 1}, {"b": 2}]
+
+    def test_every_profile_reported_once(self):
+        """Test chunked screening yields each index once, progress and a summary"""
+        lines = [json.dumps({**PROFILE, "id": f"c-{i}"}) for i in range(5)] + ["oops"]
+        screener = BatchScreener(roles=["devops", "it_specialist"], max_workers=1, chunk_size=2)
+        records = asyncio.run(_collect(screener.screen(lines)))
+
+        outcomes = {r["index"]: r["type"] for r in records if r["type"] in ("result", "error")}
+        assert outcomes == {0: "result", 1: "result", 2: "result", 3: "result", 4: "result", 5: "error"}
+        assert sum(r["type"] == "progress" for r in records) == 3
+
+        summary = records[-1]
+        assert summary["type"] == "summary"
+        assert (summary["submitted"], summary["completed"], summary["failed"]) == (6, 5, 1)
+
+    def test_requests_share_a_pool_that_is_replaced_when_broken(self):
+        """Test screening reuses the process-wide pool and replaces it only after a worker crash"""
+        lines = [json.dumps({**PROFILE, "id": f"c-{i}"}) for i in range(6)]
+        screener = BatchScreener(roles=["devops"], max_workers=2, chunk_size=2)
+        try:
+            asyncio.run(_collect(screener.screen(lines)))
+            pool = get_screening_pool(2)
+            asyncio.run(_collect(screener.screen(lines)))
+            assert get_screening_pool(2) is pool
+
+            with pytest.raises(BrokenProcessPool):
+                pool.submit(os._exit, 1).result()
+            records = asyncio.run(_collect(screener.screen(lines)))
+            assert [r["type"] for r in records if r["type"] in ("result", "error")] == ["result"] * 6
+            assert get_screening_pool(2) is not pool
+        finally:
+            shutdown_screening_pools()
@@ -0,0 +1,115 @@
+"""
+Test the shared candidate profile used by role-agent tools
+"""
+
+import json
+import os
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from agents.app.agents.candidate_profile import CandidateProfile, clear_profile_cache, register_keywords
+from agents.app.agents.roles.data_scientist import DataScientistAgent
+from agents.app.agents.roles.devops_engineer import DevOpsEngineerAgent
+
+CANDIDATE = {
+    "skills": ["Python", "Terraform"],
+    "experience": "Ansible administration, Kubernetes and Oracle RAC tracking for 7 years at GS-12",
+    "certifications": ["CISSP", {"name": "AWS Certified Solutions Architect"}],
+    "target_grade": "GS-13",
+}
+
+
+class TestNormalizedFields:
+    """Test the lowercased fields the tools search"""
+
+    def test_search_texts(self):
+        """Test keyword texts join skills, experience and certifications in order"""
+        profile = CandidateProfile(CANDIDATE)
+        experience = CANDIDATE["experience"].lower()
+        assert profile.certifications == ["cissp", "aws certified solutions architect"]
+        assert profile.experience == experience
+        assert profile.skills_and_experience == "python terraform " + experience
+        assert profile.experience_and_certifications == experience + " cissp aws certified solutions architect"
+        assert "form ansible" in profile.skills_and_experience and "12 cissp" in profile.experience_and_certifications
+
+    def test_profile_keeps_a_copy_of_its_input(self):
+        """Test mutating the input after construction leaves the cached profile intact"""
+        data = json.loads(json.dumps(CANDIDATE))
+        profile = CandidateProfile(data)
+        data["skills"].append("Go")
+        data["certifications"][1]["name"] = "changed"
+        assert profile.data == CANDIDATE
+
+    def test_derived_features(self):
+        """Test tokens, n-grams, stated years and GS grades"""
+        profile = CandidateProfile(CANDIDATE)
+        assert profile.tokens[:3] == ["python", "terraform", "ansible"]
+        assert {"oracle", "oracle rac", "oracle rac tracking"} <= profile.ngrams
+        assert "secret" not in CandidateProfile({"experience": "Secretary to the board"}).ngrams
+        assert profile.stated_experience() == {"years": 7, "grades": [12, 13]}
+        assert CandidateProfile({}).stated_experience() == {"years": None, "grades": []}
+
+
+class TestKeywordHits:
+    """Test the shared keyword hit vectors against plain substring search"""
+
+    FIELDS = ("skills", "experience", "skills_and_experience", "experience_and_certifications")
+    KEYWORDS = ["python", "ansible", "kubernetes", "rac", "form ansible", "12 cissp", "aws", "gs-12", "go"]
+
+    def test_hits_match_substring_search(self):
+        """Test hits/contains agree with `kw in text`, including keywords straddling a boundary"""
+        for field in self.FIELDS:
+            register_keywords(field, self.KEYWORDS)
+        profile = CandidateProfile(CANDIDATE)
+        texts = {field: getattr(profile, field if field != "skills" else "skills_text") for field in self.FIELDS}
+
+        for field in self.FIELDS:
+            expected = {kw for kw in self.KEYWORDS if kw in texts[field]}
+            assert expected <= profile.hits(field)
+            assert profile.matches(field, self.KEYWORDS) == [kw for kw in self.KEYWORDS if kw in texts[field]]
+        assert profile.contains("skills_and_experience", "form ansible")
+        assert profile.contains("experience_and_certifications", "12 cissp")
+        assert not profile.contains("experience", "12 cissp")
+
+    def test_late_registration_and_unregistered_keywords(self):
+        """Test keywords registered after the shared scan, or never registered, are still found"""
+        profile = CandidateProfile(CANDIDATE)
+        profile.hits("experience")
+        register_keywords("experience", ["oracle rac"])
+        assert profile.contains("experience", "oracle rac")
+        assert "oracle rac" in CandidateProfile(CANDIDATE).hits("experience")
+        assert profile.contains("experience", "tracking for")
+        assert not profile.contains("experience", "mainframe")
+
+
+class TestProfileCache:
+    """Test content-keyed profile reuse"""
+
+    def test_same_content_returns_same_profile(self):
+        """Test JSON and dict inputs reuse one parsed profile per content"""
+        clear_profile_cache()
+        payload = json.dumps(CANDIDATE)
+
+        first = CandidateProfile.from_input(payload)
+        assert CandidateProfile.from_input(json.dumps(CANDIDATE)) is first
+        assert CandidateProfile.from_input(first) is first
+        assert CandidateProfile.from_input(dict(CANDIDATE)) is CandidateProfile.from_input(dict(CANDIDATE))
+        assert CandidateProfile.from_input({**CANDIDATE, "experience": "other"}) is not first
+
+
+class TestRoleTools:
+    """Test role tools built on the shared profile"""
+
+    def test_tools_accept_either_certification_format(self):
+        """Test certification names and {"name": ...} records are both understood"""
+        data_scientist = object.__new__(DataScientistAgent)
+        devops = object.__new__(DevOpsEngineerAgent)
+        payload = json.dumps(CANDIDATE)
+
+        certs = json.loads(data_scientist._validate_certifications(payload))["valuable_certifications"]
+        assert [c["certification"] for c in certs] == ["CISSP", "AWS Certified Solutions Architect"]
+
+        cloud = json.loads(devops._evaluate_cloud_platforms(payload))
+        assert cloud["cloud_platforms"]["AWS"]["certifications"] == ["aws certified", "solutions architect"]
@@ -0,0 +1,135 @@
+"""
+Test content-addressed, delta-encoded checkpoint storage for time-travel debugging
+"""
+
+import os
+import random
+import sqlite3
+import sys
+
+import jsonpatch
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from agents.app.agents.checkpoint_store import CheckpointStore, normalize
+
+JOB_CONTEXT = {"title": "IT Specialist (INFOSEC)", "grade": "GS-13", "duties": ["Assess controls"] * 200}
+
+
+def workflow_states(steps: int, seed: int = 3):
+    """States of one workflow: a growing message list, agent outputs, progress and a large static context"""
+    rng = random.Random(seed)
+    state = {"job_context": JOB_CONTEXT, "messages": [], "agent_outputs": {}, "phase": "analysis",
+             "progress": 0.0, "errors": []}
+    for step in range(steps):
+        state = normalize(state)
+        state["messages"].append({"role": rng.choice(["user", "agent"]), "content": f"step {step}"})
+        agent = rng.choice(["resume", "compliance", "salary"])
+        state.setdefault("agent_outputs", {})[agent] = {"score": rng.random()}
+        state["progress"] = round(step / steps, 3)
+        if step % 7 == 3:
+            state["errors"].append(f"retry {step}")
+        if step % 11 == 5:
+            state["errors"] = state["errors"][1:]
+            state["phase"] = rng.choice(["analysis", "drafting", "review"])
+        if step == steps // 2:
+            state["review/notes~draft"] = "keys with JSON pointer characters"
+            state["handoff"] = state.pop("agent_outputs")
+        yield step, state
+
+
+class TestCheckpointStore:
+    """Test exact replay, chunk deduplication, batching and deletion"""
+
+    def test_replay_and_diff_are_exact(self):
+        """Test every checkpoint replays to the state written and diffs turn one into the other"""
+        store = CheckpointStore(sqlite3.connect(":memory:"), batch_size=16, snapshot_interval=10, cache_size=4)
+        written, base = {}, None
+        for step, state in workflow_states(60):
+            checkpoint_id = f"cp{step}"
+            store.put(checkpoint_id, state, base_id=base)
+            written[checkpoint_id], base = normalize(state), checkpoint_id
+        store.flush()
+
+        reopened = CheckpointStore(store.conn, cache_size=2)  # nothing cached: every read walks the chain
+        for checkpoint_id, state in written.items():
+            assert reopened.get(checkpoint_id) == state
+        for a, b in [("cp3", "cp41"), ("cp59", "cp0"), ("cp29", "cp30")]:
+            assert jsonpatch.apply_patch(written[a], reopened.diff(a, b)) == written[b]
+        assert store.stats["snapshots"] == 6 and store.stats["deltas"] == 54
+        assert reopened.get("missing") is None
+
+    def test_snapshots_share_unchanged_chunks(self):
+        """Test values that do not change are stored once across snapshots and deltas stay small"""
+        store = CheckpointStore(sqlite3.connect(":memory:"), snapshot_interval=5)
+        base = None
+        for step, state in workflow_states(50):
+            store.put(f"cp{step}", state, base_id=base)
+            base = f"cp{step}"
+        size = store.size()
+
+        job_context = len(str(JOB_CONTEXT))
+        assert size["snapshots"] == 10 and size["deltas"] == 40
+        assert size["chunk_bytes"] < job_context  # compressed, and stored once, not per snapshot
+        assert size["delta_bytes"] / size["deltas"] < 300
+
+    def test_writes_commit_in_batches(self, tmp_path):
+        """Test states and deferred statements are committed together once a batch fills"""
+        db_path = str(tmp_path / "checkpoints.sqlite")
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE checkpoint_metadata (checkpoint_id TEXT, phase TEXT)")
+        conn.commit()
+        store = CheckpointStore(conn, batch_size=10)
+        reader = sqlite3.connect(db_path)
+
+        def committed():
+            return (reader.execute("SELECT COUNT(*) FROM checkpoint_states").fetchone()[0],
+                    reader.execute("SELECT COUNT(*) FROM checkpoint_metadata").fetchone()[0])
+
+        base = None
+        for step, state in workflow_states(25):
+            store.put(f"cp{step}", state, base_id=base)
+            store.defer("INSERT INTO checkpoint_metadata VALUES (?, ?)", (f"cp{step}", state["phase"]))
+            base = f"cp{step}"
+            if step == 8:
+                assert committed() == (0, 0)
+        assert committed() == (20, 20) and store.stats["batches"] == 2
+        store.flush()
+        assert committed() == (25, 25)
+
+    def test_replay_from_disk_with_repeated_values(self):
+        """Test states whose top-level keys share a value replay once the state cache is cleared"""
+        store = CheckpointStore(sqlite3.connect(":memory:"), snapshot_interval=2)
+        states = [{"errors": [], "messages": [], "step": 0, "outputs": {}, "notes": {}},
+                  {"errors": [], "messages": ["start"], "step": 1, "outputs": {}, "notes": {}},
+                  {"errors": [], "messages": ["start"], "step": 2, "outputs": {}, "notes": {}}]
+        base = None
+        for step, state in enumerate(states):
+            store.put(f"cp{step}", state, base_id=base)
+            base = f"cp{step}"
+        store.flush()
+        store._states.clear()
+
+        assert [store.get(f"cp{step}") for step in range(3)] == states
+        store._states.clear()
+        store.delete(["cp0"])
+        assert store.get("cp1") == states[1] and store.get("cp2") == states[2]
+
+    def test_deleting_a_base_rebases_its_dependents(self):
+        """Test deleting old checkpoints keeps later ones replayable and frees unreferenced chunks"""
+        store = CheckpointStore(sqlite3.connect(":memory:"), snapshot_interval=100, cache_size=1)
+        written, base = {}, None
+        for step, state in workflow_states(30):
+            store.put(f"cp{step}", state, base_id=base)
+            written[f"cp{step}"], base = normalize(state), f"cp{step}"
+
+        store.delete(f"cp{step}" for step in range(10))
+        assert store.get("cp5") is None
+        for step in range(10, 30):
+            assert store.get(f"cp{step}") == written[f"cp{step}"]
+        assert store.size()["snapshots"] == 1
+
+        with pytest.raises(ValueError):
+            store.diff("cp3", "cp20")
@@ -0,0 +1,81 @@
+"""
+Test the context-window budget for agent prompts
+"""
+
+import json
+import os
+import sys
+
+from langchain_core.agents import AgentAction
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from agents.app.agents.context_budget import BudgetedConversationMemory, ContextBudget, allocate, count_tokens
+
+
+class TestContextBudget:
+    """Test allocation and fitting of the variable prompt sections"""
+
+    def test_allocate_passes_unused_share_on(self):
+        """Test small demands are met in full and the rest is split by share"""
+        limits = allocate(1000, {"memory": 100, "context": 5000, "scratchpad": 5000},
+                          {"memory": 0.4, "context": 0.25, "scratchpad": 0.35})
+
+        assert limits["memory"] == 100
+        assert limits["context"] == 375 and limits["scratchpad"] == 525
+
+    def test_fit_json_shrinks_within_limit(self):
+        """Test oversized context keeps valid JSON, notes dropped items and stays under the limit"""
+        budget = ContextBudget(4096, 2000)
+        context = {"jobs": [{"title": f"Data Scientist {i}", "summary": "Supports mission analytics " * 10}
+                            for i in range(100)], "target_series": "1560"}
+
+        text, trimmed = budget.fit_json(context, 500)
+        fitted = json.loads(text)
+
+        assert count_tokens(text) <= 500 and trimmed > 0
+        assert fitted["target_series"] == "1560" and fitted["jobs"][-1].endswith("more")
+        assert budget.fit_json({"grade": "GS-13"}, 500) == ('{"grade": "GS-13"}', 0)
+
+    def test_trim_steps_cuts_observations_and_logs(self):
+        """Test long tool output and echoed action input are cut to head and tail"""
+        budget = ContextBudget(4096, 2000)
+        big_input = json.dumps({"job_data": [{"series": "2210", "grade": "GS-13"}] * 200})
+        steps = [
+            (AgentAction(tool="trend_analyzer", tool_input=big_input, log=f"Action Input: {big_input}"),
+             "Trend: rising. " * 500),
+            (AgentAction(tool="salary_analyzer", tool_input="{}", log="Action Input: {}"), "Median GS-13 step 5"),
+        ]
+
+        trimmed, removed = budget.trim_steps(steps, 600)
+
+        used = sum(count_tokens(action.log) + count_tokens(text) for action, text in trimmed)
+        assert used <= 600 and removed > 0
+        assert "tokens trimmed" in trimmed[0][1] and trimmed[0][0].tool_input == big_input
+        assert trimmed[1] == (steps[1][0], "Median GS-13 step 5")
+
+
+class TestBudgetedConversationMemory:
+    """Test the rendered transcript stays within budget across a long session"""
+
+    def test_old_turns_are_summarized_with_stable_head(self):
+        """Test overflow summarizes older turns and the summary boundary moves only on overflow"""
+        memory = BudgetedConversationMemory(memory_key="chat_history", input_key="input", max_tokens=400)
+        rendered, boundaries = [], []
+        for turn in range(12):
+            memory.save_context({"input": f"Question {turn}: which agencies hire series 2210?"},
+                                {"output": f"Answer {turn}. " + "Agencies post most roles in spring. " * 8})
+            rendered.append(memory.load_memory_variables({})["chat_history"])
+            boundaries.append(memory.summarized)
+
+        assert count_tokens(rendered[-1]) <= 400 and memory.last_trimmed > 0
+        assert rendered[-1].startswith("Earlier conversation (summarized):\nHuman: Question 0")
+        assert "Answer 11. Agencies post" in rendered[-1]
+        # The summary boundary jumps on overflow, then holds for the following turns
+        moves = sum(1 for before, after in zip(boundaries, boundaries[1:]) if after != before)
+        assert boundaries[-1] > 0 and moves < len([b for b in boundaries if b])
+        assert len(memory.chat_memory.messages) == 24  # only the rendering is bounded
+
+        memory.clear()
+        assert memory.summarized == 0
@@ -0,0 +1,95 @@
+"""
+Test the DAG scheduler used for dependent virtual-team subtasks
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from agents.app.agents.dag_scheduler import DAGScheduler, critical_paths
+
+# The orchestrator's sample plan plus a docs task: api -> (frontend, tests) -> docs
+PLAN = {"api": [], "frontend": ["api"], "tests": ["api"], "docs": ["frontend", "tests"]}
+SECONDS = {"api": 0.1, "frontend": 0.15, "tests": 0.1, "docs": 0.05}
+
+
+def stub_agent(task_id: str, delay: float, active: list, fail: bool = False):
+    """Coroutine factory standing in for an LLM-backed agent"""
+    async def run():
+        active.append(task_id)
+        await asyncio.sleep(delay)
+        active.remove(task_id)
+        if fail:
+            raise RuntimeError(f"{task_id} agent unavailable")
+        return {"subtask_id": task_id, "output": f"{task_id} done"}
+    return run
+
+
+class TestDAGScheduler:
+    """Test dependency order, concurrency, priority and failure handling"""
+
+    def test_tasks_start_when_dependencies_finish(self):
+        """Test independent branches overlap and the makespan beats the sequential baseline"""
+        active: list = []
+        run = asyncio.run(DAGScheduler(max_concurrency=4).run(
+            {task_id: stub_agent(task_id, delay, active) for task_id, delay in SECONDS.items()}, PLAN, SECONDS
+        ))
+
+        tasks = run.tasks
+        assert run.succeeded and tasks["docs"].result["output"] == "docs done"
+        for task_id, deps in PLAN.items():
+            assert all(tasks[task_id].started >= tasks[dep].finished for dep in deps)
+        assert tasks["tests"].started < tasks["frontend"].finished  # siblings overlap
+        assert run.makespan < 0.9 * run.busy_time
+        assert run.makespan == pytest.approx(0.3, abs=0.08)  # api + frontend + docs
+
+    def test_concurrency_limit_and_critical_path_order(self):
+        """Test ready tasks are ranked by critical path and never exceed max_concurrency"""
+        plan = {"leaf": [], "chain_1": [], "chain_2": ["chain_1"], "chain_3": ["chain_2"]}
+        seen: list = []
+
+        def tracked(task_id: str):
+            async def run():
+                seen.append(len(active) + 1)
+                await stub_agent(task_id, 0.02, active)()
+            return run
+
+        active: list = []
+        run = asyncio.run(DAGScheduler(max_concurrency=1).run({task_id: tracked(task_id) for task_id in plan}, plan))
+        fifo = asyncio.run(DAGScheduler(max_concurrency=1, critical_path_first=False).run(
+            {task_id: tracked(task_id) for task_id in plan}, plan
+        ))
+
+        assert run.start_order[0] == "chain_1" and fifo.start_order[0] == "leaf"
+        assert max(seen) == 1
+        assert critical_paths(plan)["chain_1"] == 3.0
+
+    def test_failure_cancels_downstream_only(self):
+        """Test a failed task cancels its dependents while independent tasks complete"""
+        plan = {**PLAN, "security_review": []}
+        active: list = []
+        run = asyncio.run(DAGScheduler().run({
+            "api": stub_agent("api", 0.02, active),
+            "frontend": stub_agent("frontend", 0.02, active),
+            "tests": stub_agent("tests", 0.02, active, fail=True),
+            "docs": stub_agent("docs", 0.02, active),
+            "security_review": stub_agent("security_review", 0.05, active),
+        }, plan))
+
+        statuses = {task_id: task.status for task_id, task in run.tasks.items()}
+        assert statuses == {"api": "completed", "frontend": "completed", "tests": "failed",
+                            "docs": "cancelled", "security_review": "completed"}
+        assert run.tasks["docs"].started is None and "tests" in run.tasks["docs"].error
+        assert "docs" not in run.start_order
+
+    def test_invalid_graphs_are_rejected(self):
+        """Test cycles and unknown dependencies raise before anything runs"""
+        with pytest.raises(ValueError, match="Circular"):
+            critical_paths({"a": ["b"], "b": ["a"], "c": []})
+        with pytest.raises(ValueError, match="unknown"):
+            critical_paths({"a": ["missing"]})
@@ -0,0 +1,109 @@
+"""
+Test BM25 documentation search over a docs tree
+"""
+
+import os
+import sys
+import time
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from mcp_services.utils.documentation_store import DocumentationStore
+from mcp_services.utils import documentation_search
+from mcp_services.utils.documentation_search import DocumentationSearchIndex, split_markdown
+
+
+def build_index(tmp_path):
+    docs = tmp_path / "docs"
+    usajobs = docs / "external_services" / "apis" / "usajobs"
+    stripe = docs / "external_services" / "platforms" / "stripe"
+    usajobs.mkdir(parents=True)
+    stripe.mkdir(parents=True)
+
+    (usajobs / "api_reference.md").write_text(
+        "# USAJobs API\n\nOverview of the search endpoint.\n\n"
+        "## Pagination\n\nUse the Page parameter with ResultsPerPage=500.\n\n"
+        "## Fields\n\nAlways send Fields=Full or data is lost.\n"
+    )
+    (stripe / "webhooks.md").write_text(
+        "# Stripe Webhooks\n\nVerify the webhook signature before trusting events.\n\n"
+        "```python\n# Pagination is not relevant here\n```\n"
+    )
+    (stripe / "settings.json").write_text('{\n  "retry": {"max_attempts": 3},\n  "webhook_secret": "whsec"\n}\n')
+
+    store = DocumentationStore(tmp_path / "docs.sqlite")
+    index = DocumentationSearchIndex(roots=[docs], store=store, passage_chars=400)
+    index.refresh()
+    return docs, index
+
+
+class TestDocumentationSearch:
+    """Test ranking, filtering and incremental refresh"""
+
+    def test_heading_match_ranks_passage(self, tmp_path):
+        """Test the section whose heading matches is returned with offsets into the file"""
+        docs, index = build_index(tmp_path)
+        results = index.search("pagination", limit=2)
+
+        top = results[0]
+        assert top["service"] == "usajobs"
+        assert top["heading"] == "USAJobs API > Pagination"
+        content = (docs / "external_services/apis/usajobs/api_reference.md").read_text()
+        start, end = top["highlights"][0]
+        assert content[start:end].lower() == "pagination"
+
+    def test_quoted_phrase_required(self, tmp_path):
+        """Test quoted phrases filter out passages without the exact phrase"""
+        _, index = build_index(tmp_path)
+
+        assert index.search('"webhook signature"')[0]["title"] == "Stripe Webhooks"
+        assert index.search('"signature webhook"') == []
+
+    def test_service_filter_and_json(self, tmp_path):
+        """Test service filtering and JSON top-level keys as passages"""
+        _, index = build_index(tmp_path)
+
+        assert {r["service"] for r in index.search("webhook", service="stripe")} == {"stripe"}
+        assert index.search("max_attempts")[0]["heading"] == "retry"
+        assert index.search("webhook", service="usajobs") == []
+
+    def test_refresh_reindexes_only_changed(self, tmp_path):
+        """Test refresh picks up edits and deletions without re-indexing unchanged files"""
+        docs, index = build_index(tmp_path)
+        webhooks = docs / "external_services" / "platforms" / "stripe" / "webhooks.md"
+
+        webhooks.write_text("# Stripe Webhooks\n\nIdempotency keys prevent duplicate charges.\n")
+        os.utime(webhooks, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+        (docs / "external_services" / "platforms" / "stripe" / "settings.json").unlink()
+
+        stats = index.refresh()
+        assert stats["indexed"] == 1
+        assert stats["removed"] == 1
+        assert index.search("idempotency")[0]["service"] == "stripe"
+        assert index.search("max_attempts") == []
+
+
+    def test_shared_index_refreshes_after_interval(self, tmp_path, monkeypatch):
+        """Test the shared index is re-synced once per interval rather than on every call"""
+        _, index = build_index(tmp_path)
+        refreshes = []
+        refresh = index.refresh
+        monkeypatch.setattr(index, "refresh", lambda: refreshes.append(1) or refresh())
+        monkeypatch.setattr(documentation_search, "_index", index)
+        monkeypatch.setattr(documentation_search, "REFRESH_INTERVAL_SECONDS", 60)
+
+        for _ in range(3):
+            assert documentation_search.get_documentation_search_index() is index
+        assert refreshes == []
+
+        index.refreshed_at -= 60
+        documentation_search.get_documentation_search_index()
+        documentation_search.get_documentation_search_index(refresh=True)
+        assert len(refreshes) == 2
+
+def test_code_comments_are_not_headings():
+    """Test '# comment' lines in fenced code do not split passages"""
+    title, spans = split_markdown("# Title\n\ntext\n\n```\n# not a heading\n```\n", 1000)
+    assert title == "Title"
+    assert [heading for heading, _, _ in spans] == ["Title"]
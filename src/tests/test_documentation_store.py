@@ -0,0 +1,70 @@
+"""
+Test the shared SQLite documentation store
+"""
+
+import os
+import sys
+import time
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from mcp_services.utils.documentation_store import DocumentationStore, LazyDocumentation
+
+
+class TestDocumentationStore:
+    """Test per-file freshness and directory tracking"""
+
+    def test_reload_only_when_source_changes(self, tmp_path):
+        """Test unchanged files are served from the store and edits are picked up"""
+        store = DocumentationStore(tmp_path / "docs.sqlite")
+        source = tmp_path / "manifest.json"
+        source.write_text('{"version": 1}')
+
+        assert store.get_json(source, "svc", "manifest") == {"version": 1}
+        assert store.get_json(source, "svc", "manifest") == {"version": 1}
+        assert store.stats["reloads"] == 1
+        assert store.stats["hits"] == 1
+
+        source.write_text('{"version": 22}')
+        os.utime(source, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+        assert store.get_json(source, "svc", "manifest") == {"version": 22}
+        assert store.stats["reloads"] == 2
+        store.close()
+
+    def test_sync_tree_tracks_removed_files(self, tmp_path):
+        """Test sync_tree indexes new files and drops deleted ones"""
+        docs = tmp_path / "docs"
+        (docs / "postgres").mkdir(parents=True)
+        (docs / "postgres" / "guide.md").write_text("# Guide")
+        (docs / "postgres" / "notes.md").write_text("# Notes")
+
+        store = DocumentationStore(tmp_path / "docs.sqlite")
+        assert store.sync_tree(docs)["reloaded"] == 2
+
+        (docs / "postgres" / "notes.md").unlink()
+        result = store.sync_tree(docs)
+        assert result["unchanged"] == 1
+        assert result["removed"] == 1
+        assert [d["name"] for d in store.iter_documents("postgres")] == ["guide"]
+        store.close()
+
+
+class TestLazyDocumentation:
+    """Test sections load on first access"""
+
+    def test_sections_load_once(self):
+        """Test each loader runs once until reload()"""
+        calls = []
+        docs = LazyDocumentation({"manifest": lambda: calls.append("m") or {"ok": True},
+                                  "examples": lambda: calls.append("e") or {}})
+
+        assert docs.loaded_sections() == []
+        assert docs["manifest"]["ok"] is True
+        assert docs["manifest"]["ok"] is True
+        assert calls == ["m"]
+        assert set(docs) == {"manifest", "examples"}
+
+        docs.reload()
+        docs["manifest"]
+        assert calls == ["m", "m"]
@@ -0,0 +1,108 @@
+"""
+Test lazy agent construction, shared LLM objects and idle eviction in EnhancedAgentFactory
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from agents.app.agents.enhanced_factory import EnhancedAgentFactory
+
+ANSWER = "Thought: I now know the final answer\nFinal Answer: Endpoint added."
+
+
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+    """Streams a fixed final answer the way /api/generate does"""
+    protocol_version = "HTTP/1.1"
+    connections = set()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        FakeOllamaHandler.connections.add(self.client_address)
+        body = "\n".join([json.dumps({"response": ANSWER, "done": False}), json.dumps({"response": "", "done": True})])
+        payload = body.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_ollama(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOllamaHandler)
+    FakeOllamaHandler.connections = set()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setenv("OLLAMA_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}")
+    yield FakeOllamaHandler
+    server.shutdown()
+
+
+class TestEnhancedAgentFactory:
+    """Test agents are built on demand, share models and are evicted when idle"""
+
+    def test_agents_are_built_on_first_use(self):
+        """Test nothing is built at startup and roles with one model share one LLM"""
+        factory = EnhancedAgentFactory()
+        assert factory.agents == {} and factory.build_report()["llm_objects"] == 0
+        assert factory.get_agent_info("email_handler") == {"role": "email_handler", "model": "llama3.1:8b",
+                                                           "loaded": False}
+
+        backend = factory.get_agent("backend_engineer")
+        assert factory.get_agent("backend_engineer") is backend
+        factory.get_agent("database_admin")  # qwen3:30b as well
+        factory.get_agent("email_handler")   # llama3.1:8b
+
+        assert sorted(factory.agents) == ["backend_engineer", "database_admin", "email_handler"]
+        assert factory.models["backend_engineer"] is factory.models["database_admin"]
+        assert factory.build_report()["llm_objects"] == 2
+        assert factory.models["email_handler"].http_client is factory.http_client
+        assert factory.get_agent("unknown_role") is None
+
+    def test_concurrent_first_requests_build_once(self, fake_ollama):
+        """Test concurrent tasks for an unbuilt role wait for one build and reuse the HTTP client"""
+        factory = EnhancedAgentFactory()
+        builds = []
+        create = factory._creators["backend_engineer"]
+
+        def counted():
+            builds.append(threading.get_ident())
+            return create()
+        factory._creators["backend_engineer"] = counted
+
+        async def run():
+            try:
+                return await asyncio.gather(*(factory.execute_task("backend_engineer", "Add a /health endpoint")
+                                              for _ in range(4)))
+            finally:
+                await factory.http_client.aclose()
+
+        assert asyncio.run(run()) == ["Endpoint added."] * 4
+        assert len(builds) == 1
+        assert factory.http_client.stats()["requests"] >= 4
+        assert len(fake_ollama.connections) <= 4  # pooled, not one connection per call
+
+    def test_idle_agents_are_evicted(self):
+        """Test agents past the idle TTL are dropped with their LLMs and rebuilt on demand"""
+        factory = EnhancedAgentFactory(idle_ttl=60)
+        factory.warm_up(["backend_engineer", "email_handler"])
+        assert factory.evict_idle() == []
+
+        factory._last_used["email_handler"] -= 120
+        assert factory.evict_idle() == ["email_handler"]
+        assert sorted(factory.agents) == ["backend_engineer"]
+        assert factory.build_report()["llm_objects"] == 1
+
+        assert factory.get_agent("email_handler") is not None
+        assert factory.get_agent_info("email_handler")["loaded"] is True
@@ -0,0 +1,152 @@
+"""
+Test the conditional-fetch HTTP cache used by the documentation scrapers
+"""
+
+import os
+import sys
+from contextlib import asynccontextmanager
+from email.utils import formatdate
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from mcp_services.utils.http_cache import HTTPCache, empty_stats
+from mcp_services.external.webscraping_specialist import WebscrapingSpecialist
+
+LAST_MODIFIED = formatdate(1_700_000_000, usegmt=True)
+
+
+class DocsSite:
+    """Local docs site answering conditional requests, with counters per path"""
+
+    def __init__(self):
+        self.pages = {
+            "/docs/etag": ('<html><title>ETag page</title><main>Version one</main></html>', '"v1"', None),
+            "/docs/dated": ('<html><title>Dated page</title><main>Dated body</main></html>', None, LAST_MODIFIED),
+            "/docs/plain": ('<html><title>Plain page</title><main>No validators</main></html>', None, None),
+        }
+        self.full_responses = 0
+        self.not_modified = 0
+        self.conditional_requests = []
+
+    async def handle(self, request):
+        if request.path not in self.pages:
+            return web.Response(status=404)
+        body, etag, last_modified = self.pages[request.path]
+        if_none_match = request.headers.get("If-None-Match")
+        if_modified_since = request.headers.get("If-Modified-Since")
+        if if_none_match or if_modified_since:
+            self.conditional_requests.append(request.path)
+        if (etag and if_none_match == etag) or (not etag and last_modified and if_modified_since == last_modified):
+            self.not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag} if etag else {})
+        self.full_responses += 1
+        headers = {}
+        if etag:
+            headers["ETag"] = etag
+        if last_modified:
+            headers["Last-Modified"] = last_modified
+        return web.Response(text=body, content_type="text/html", headers=headers)
+
+    def app(self):
+        app = web.Application()
+        app.router.add_get("/{tail:.*}", self.handle)
+        return app
+
+
+@asynccontextmanager
+async def serve_docs():
+    """Run a DocsSite on a local port for the duration of the block"""
+    docs = DocsSite()
+    server = TestServer(docs.app())
+    await server.start_server()
+    docs.url = lambda path: str(server.make_url(path))
+    try:
+        yield docs
+    finally:
+        await server.close()
+
+
+class TestHTTPCache:
+    """Test conditional refetches, 304 hits, changed pages and run statistics"""
+
+    @pytest.mark.asyncio
+    async def test_refetch_is_conditional_and_304_is_a_hit(self, tmp_path):
+        """Test stored validators are sent on refetch and a 304 returns the stored body"""
+        async with serve_docs() as site:
+            cache = HTTPCache(tmp_path / "http.sqlite")
+            first, second = empty_stats(), empty_stats()
+            urls = [site.url(path) for path in ("/docs/etag", "/docs/dated", "/docs/plain")]
+
+            async with aiohttp.ClientSession() as session:
+                cold = [await cache.fetch(session, url, stats=first) for url in urls]
+                warm = [await cache.fetch(session, url, stats=second) for url in urls]
+
+            assert [page["text"] for page in warm] == [page["text"] for page in cold]
+            assert [page["from_cache"] for page in warm] == [True, True, False]
+            assert sorted(site.conditional_requests) == ["/docs/dated", "/docs/etag"]
+            assert site.not_modified == 2 and site.full_responses == 4
+
+            assert first["misses"] == 2 and first["uncacheable"] == 1 and first["hits"] == 0
+            assert second["hits"] == 2 and second["uncacheable"] == 1
+            assert second["bytes_saved"] == len(cold[0]["text"]) + len(cold[1]["text"])
+
+    @pytest.mark.asyncio
+    async def test_changed_page_replaces_the_entry(self, tmp_path):
+        """Test a page whose ETag changed is a miss and its new body and validator are stored"""
+        async with serve_docs() as site:
+            cache = HTTPCache(tmp_path / "http.sqlite")
+            url = site.url("/docs/etag")
+
+            async with aiohttp.ClientSession() as session:
+                await cache.fetch(session, url)
+                site.pages["/docs/etag"] = ('<html><main>Version two</main></html>', '"v2"', None)
+                changed = await cache.fetch(session, url)
+                stats = empty_stats()
+                again = await cache.fetch(session, url, stats=stats)
+
+            assert "Version two" in changed["text"] and not changed["from_cache"]
+            assert cache.get(url)["etag"] == '"v2"'
+            assert again["from_cache"] and stats["hits"] == 1
+            assert cache.stats["misses"] == 2 and cache.stats["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, tmp_path):
+        """Test non-200 responses are counted as errors and leave no entry"""
+        async with serve_docs() as site:
+            cache = HTTPCache(tmp_path / "http.sqlite")
+            stats = empty_stats()
+
+            async with aiohttp.ClientSession() as session:
+                missing = await cache.fetch(session, site.url("/docs/missing"), stats=stats)
+
+            assert missing["status"] == 404 and stats["errors"] == 1
+            assert cache.get(site.url("/docs/missing")) is None
+
+
+class TestWebscrapingSpecialistCache:
+    """Test the webscraping specialist scrapes through the cache and records runs"""
+
+    @pytest.mark.asyncio
+    async def test_second_run_is_served_from_cache(self, tmp_path):
+        """Test a repeat scrape parses the cached body and each run's statistics are recorded"""
+        async with serve_docs() as site:
+            scraper = WebscrapingSpecialist()
+            scraper.http_cache = HTTPCache(tmp_path / "http.sqlite")
+            url = site.url("/docs/etag")
+
+            cold = await scraper.scrape_single_page(url, extract_links=False)
+            cold_run = scraper.record_cache_run("docs")
+            warm = await scraper.scrape_single_page(url, extract_links=False)
+            warm_run = scraper.record_cache_run("docs")
+
+            assert cold["content"] == warm["content"] == "Version one"
+            assert not cold["from_cache"] and warm["from_cache"]
+            assert cold_run["misses"] == 1 and cold_run["hit_ratio"] == 0.0
+            assert warm_run["hits"] == 1 and warm_run["hit_ratio"] == 1.0
+            assert [run["hits"] for run in scraper.http_cache.runs("docs")] == [1, 0]
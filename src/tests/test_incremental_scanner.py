@@ -0,0 +1,123 @@
+"""
+Test Incremental Codebase Scanner (ServiceDiscoveryAgent)
+"""
+
+import pytest
+import os
+import re
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from mcp_services.meta.incremental_scanner import IncrementalCodebaseScanner, is_valid_service_name
+
+PATTERNS = {
+    "env_vars": [r'(\w+)_API_KEY'],
+    "imports": [r'from\s+(\w+)\s+import', r'import\s+(\w+)'],
+    "sdks": [r'(\w+)\.Client\(', r'new\s+(\w+)\('],
+    "urls": [r'https?://hooks\.slack\.com']
+}
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Small source tree with a few service references"""
+    root = tmp_path / "repo"
+    (root / "pkg").mkdir(parents=True)
+    (root / "node_modules").mkdir()
+    (root / "pkg" / "billing.py").write_text("import stripe\nSTRIPE_API_KEY = ''\n")
+    (root / "pkg" / "alerts.md").write_text("Post to https://hooks.slack.com\nfrom twilio import Client\n")
+    (root / "node_modules" / "vendored.js").write_text("import paypal\n")
+    return root
+
+
+class TestIncrementalScanner:
+    """Test findings keep the per-pattern scan semantics"""
+
+    @pytest.mark.asyncio
+    async def test_findings_match_per_pattern_findall(self, repo, tmp_path):
+        """Test findings equal the original per-pattern re.findall scan, overlapping matches included"""
+        (repo / "pkg" / "mixed.py").write_text(
+            "from stripe import twilio\r\n"
+            "client = twilio.Client(SENDGRID_API_KEY)\n"
+            "const s3 = new Storage(); import\n  boto\n"
+            "from stripe import twilio\n"
+        )
+        (repo / "pkg" / "empty.json").write_text("")
+
+        findings = await IncrementalCodebaseScanner(PATTERNS, tmp_path / "manifest.sqlite").scan([repo])
+
+        assert {f["service"] for f in findings[str(repo / "pkg" / "mixed.py")]} >= {"stripe", "twilio"}
+        assert len(findings) == 4
+        for path, file_findings in findings.items():
+            assert file_findings == _findall_scan(path)
+
+
+def _findall_scan(file_path):
+    """The scan ServiceDiscoveryAgent ran before the incremental scanner, one file at a time"""
+    content = open(file_path, encoding='utf-8', errors='ignore').read()
+    lines = content.split('\n')
+    findings = []
+    for pattern_type, patterns in PATTERNS.items():
+        for pattern in patterns:
+            for match in re.findall(pattern, content, re.IGNORECASE):
+                if isinstance(match, tuple):
+                    match = match[0]
+                service_name = match.lower().strip()
+                if is_valid_service_name(service_name):
+                    context = next((' | '.join(lines[max(0, i - 1):min(len(lines), i + 2)])
+                                    for i, line in enumerate(lines) if match in line), "")
+                    findings.append({"pattern_type": pattern_type, "service": service_name,
+                                     "pattern": pattern, "context": context})
+    return findings
+
+
+class TestIncrementalScannerManifest:
+    """Test manifest reuse and change detection"""
+
+    @pytest.mark.asyncio
+    async def test_cold_scan_finds_services(self, repo, tmp_path):
+        """Test cold scan reports findings and skips vendored directories"""
+        scanner = IncrementalCodebaseScanner(PATTERNS, tmp_path / "manifest.sqlite")
+        findings = await scanner.scan([repo])
+
+        services = {f["service"] for file_findings in findings.values() for f in file_findings}
+        assert {"stripe", "twilio"} <= services
+        assert "paypal" not in services
+        assert scanner.last_stats["mode"] == "cold"
+        assert scanner.last_stats["files_rescanned"] == 2
+
+    @pytest.mark.asyncio
+    async def test_warm_scan_reuses_manifest(self, repo, tmp_path):
+        """Test a fresh scanner reuses persisted findings and rescans only changed files"""
+        manifest = tmp_path / "manifest.sqlite"
+        first = await IncrementalCodebaseScanner(PATTERNS, manifest).scan([repo])
+
+        scanner = IncrementalCodebaseScanner(PATTERNS, manifest)
+        assert await scanner.scan([repo]) == first
+        assert scanner.last_stats["files_reused"] == 2
+        assert scanner.last_stats["files_rescanned"] == 0
+
+        billing = repo / "pkg" / "billing.py"
+        billing.write_text(billing.read_text() + "import sendgrid\n")
+        (repo / "pkg" / "alerts.md").unlink()
+
+        findings = await scanner.scan([repo])
+        assert scanner.last_stats["files_rescanned"] == 1
+        assert scanner.last_stats["files_removed"] == 1
+        assert "sendgrid" in {f["service"] for f in findings[str(billing)]}
+
+    @pytest.mark.asyncio
+    async def test_touched_file_with_same_content_is_not_rematched(self, repo, tmp_path):
+        """Test an mtime-only change is resolved by the content hash"""
+        scanner = IncrementalCodebaseScanner(PATTERNS, tmp_path / "manifest.sqlite")
+        await scanner.scan([repo])
+
+        billing = repo / "pkg" / "billing.py"
+        stat = billing.stat()
+        os.utime(billing, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        await scanner.scan([repo])
+        assert scanner.last_stats["files_hash_unchanged"] == 1
+        assert scanner.last_stats["files_rescanned"] == 0
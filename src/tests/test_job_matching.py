@@ -0,0 +1,125 @@
+"""
+Test the BM25 candidate-to-job matching index
+"""
+
+import json
+import os
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from agents.app.agents.job_matching import JobMatchIndex, job_record
+
+JOBS = [
+    {"job_id": "ds-1", "title": "Data Scientist", "summary": "Machine learning models in Python",
+     "duties": ["Build statistical models", "SQL reporting"], "qualifications": "Python, statistics"},
+    {"job_id": "dba-1", "title": "Database Administrator", "summary": "Oracle and SQL Server administration",
+     "duties": ["Backup and recovery"], "qualifications": "Oracle RAC experience"},
+    {"job_id": "net-1", "title": "IT Specialist (Network)", "summary": "Cisco routing and firewall support",
+     "duties": ["VPN administration"], "qualifications": "CCNA"},
+]
+
+RAW_USAJOBS = {
+    "MatchedObjectId": "usa-9",
+    "MatchedObjectDescriptor": {
+        "PositionTitle": "Statistician",
+        "OrganizationName": "Census Bureau",
+        "UserArea": {"Details": {"JobSummary": "Survey sampling and weighting", "MajorDuties": ["Design surveys"]}},
+    },
+}
+
+
+def _index(jobs=JOBS):
+    index = JobMatchIndex()
+    index.add_jobs(jobs)
+    return index
+
+
+class TestMatching:
+    """Test ranking and explanations"""
+
+    def test_ranks_best_fit_first_with_explanation(self):
+        """Test a data science resume ranks the data scientist posting first"""
+        profile = {"skills": ["Python", "SQL"], "experience": "Built machine learning models"}
+        matches = _index().match(profile, k=2)
+
+        assert [m["job_id"] for m in matches][0] == "ds-1"
+        terms = [t["term"] for t in matches[0]["explanation"]["matched_terms"]]
+        assert {"python", "machine", "learning"} <= set(terms)
+        assert matches[0]["score"] > matches[1]["score"]
+
+    def test_batch_scores_match_single_scores(self):
+        """Test matrix-matrix batch scoring returns the same rankings as single queries"""
+        index = _index(JOBS + [RAW_USAJOBS])
+        resumes = ["oracle sql backup", "cisco vpn firewall", "survey sampling", "no overlap at all"]
+
+        batch = index.match_many(resumes, k=3)
+        single = [index.match(resume, k=3, explain=False) for resume in resumes]
+        assert [[(m["job_id"], m["score"]) for m in ms] for ms in batch] == \
+               [[(m["job_id"], m["score"]) for m in ms] for ms in single]
+        assert batch[2][0]["job_id"] == "usa-9"
+        assert batch[3] == []
+
+
+class TestIndexMaintenance:
+    """Test incremental updates and persistence"""
+
+    def test_upsert_and_remove(self):
+        """Test re-adding a job_id replaces the posting and removed postings stop matching"""
+        index = _index()
+        index.add_jobs([{"job_id": "dba-1", "title": "Database Administrator", "summary": "PostgreSQL tuning"}])
+        assert index.match("oracle rac", k=5) == []
+        assert index.match("postgresql", k=5)[0]["job_id"] == "dba-1"
+
+        index.remove_jobs(["net-1"])
+        assert index.match("cisco", k=5) == []
+        assert index.stats()["postings"] == 2
+
+        before = [m["job_id"] for m in index.match("sql python", k=5)]
+        index.compact()
+        assert [m["job_id"] for m in index.match("sql python", k=5)] == before
+
+    def test_save_load_and_file_ingest(self, tmp_path):
+        """Test an index round-trips through .npz and re-ingest skips unchanged files"""
+        store = tmp_path / "usajobs_20250101_000000.json"
+        store.write_text(json.dumps({"metadata": {}, "jobs": JOBS}))
+
+        index = JobMatchIndex()
+        assert index.ingest_files([store]) == {"files": 1, "jobs": 3, "skipped": 0}
+        assert index.ingest_files([store])["skipped"] == 1
+
+        path = tmp_path / "index.npz"
+        index.save(path)
+        loaded = JobMatchIndex.load(path)
+        assert loaded.match("oracle", k=1, explain=False) == index.match("oracle", k=1, explain=False)
+        assert loaded.ingest_files([store])["skipped"] == 1
+
+    def test_save_keeps_delta_and_removed_rows(self, tmp_path):
+        """Test saving does not compact and a loaded index scores and updates like the original"""
+        index = _index()
+        index.compact()
+        index.add_jobs([{"job_id": "dba-1", "title": "Database Administrator", "summary": "PostgreSQL tuning"},
+                        RAW_USAJOBS])
+        index.remove_jobs(["net-1"])
+
+        path = tmp_path / "index.npz"
+        index.save(path)
+        assert index.stats()["delta_postings"] == 2
+
+        loaded = JobMatchIndex.load(path)
+        assert loaded.stats() == index.stats()
+        for query in ("postgresql sql", "survey python", "cisco", "oracle"):
+            assert loaded.match(query, k=5) == index.match(query, k=5)
+
+        for i in (index, loaded):
+            i.add_jobs([{"job_id": "net-1", "title": "Network Engineer", "summary": "Cisco routing"}])
+            i.compact()
+        assert loaded.match("cisco postgresql survey", k=5) == index.match("cisco postgresql survey", k=5)
+
+    def test_raw_usajobs_records(self):
+        """Test raw search results normalize to the extract_job_data shape"""
+        record = job_record(RAW_USAJOBS)
+        assert record["job_id"] == "usa-9"
+        assert record["agency"] == "Census Bureau"
+        assert record["duties"] == ["Design surveys"]
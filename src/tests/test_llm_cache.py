@@ -0,0 +1,117 @@
+"""
+Test the LLM response cache used by deterministic agents
+"""
+
+import os
+import sys
+import threading
+import time
+from typing import Any, List, Optional
+
+import pytest
+from langchain_core.language_models.llms import LLM
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from agents.app.agents.llm_cache import LLMResponseCache, attach_llm_cache
+from mcp_services.utils.embeddings import HashingEmbedder
+
+
+class CountingLLM(LLM):
+    """Echo model that counts generations and takes `delay` seconds per call"""
+
+    model: str = "test-model"
+    temperature: float = 0.0
+    delay: float = 0.0
+    fail: bool = False
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "counting"
+
+    @property
+    def _identifying_params(self) -> dict:
+        return {"model": self.model, "temperature": self.temperature}
+
+    def _call(self, prompt: str, stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any) -> str:
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("model unavailable")
+        return f"analysis of {prompt.split()[-1]}"
+
+
+class TestLLMResponseCache:
+    """Test keying, determinism, concurrency and eviction"""
+
+    def test_repeated_prompts_are_served_from_cache(self, tmp_path):
+        """Test whitespace variants hit, other params miss and sampling models are never cached"""
+        cache = LLMResponseCache(tmp_path / "llm.sqlite")
+        llm = attach_llm_cache(CountingLLM(delay=0.05), cache)
+
+        first = llm.invoke("Analyze candidate   skills:\nPython")
+        assert llm.invoke("Analyze candidate skills: Python") == first
+        attach_llm_cache(CountingLLM(model="other-model"), cache).invoke("Analyze candidate skills: Python")
+        sampling = attach_llm_cache(CountingLLM(temperature=0.7), cache)
+        sampling.invoke("Analyze candidate skills: Python")
+        sampling.invoke("Analyze candidate skills: Python")
+
+        stats = cache.stats()
+        assert llm.calls == 1 and sampling.calls == 2
+        assert stats["hits"] == 1 and stats["misses"] == 2 and stats["entries"] == 2
+        assert stats["saved_seconds"] >= 0.05 and stats["hit_rate"] == pytest.approx(1 / 3, abs=0.001)
+
+    def test_concurrent_identical_requests_generate_once(self, tmp_path):
+        """Test lookups for an in-flight prompt wait for its result instead of generating"""
+        cache = LLMResponseCache(tmp_path / "llm.sqlite")
+        llm = attach_llm_cache(CountingLLM(delay=0.2), cache)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(llm.invoke("Analyze Python"))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert llm.calls == 1 and results == ["analysis of Python"] * 4
+        assert cache.stats()["waits"] >= 3
+
+    def test_failed_generation_releases_lease(self, tmp_path):
+        """Test an error drops the lease so the next identical request generates at once"""
+        cache = LLMResponseCache(tmp_path / "llm.sqlite", lease_seconds=30)
+        failing = attach_llm_cache(CountingLLM(fail=True), cache)
+        with pytest.raises(RuntimeError):
+            failing.invoke("Analyze Python")
+
+        started = time.monotonic()
+        assert attach_llm_cache(CountingLLM(), cache).invoke("Analyze Python") == "analysis of Python"
+        assert time.monotonic() - started < 5 and cache.stats()["in_flight"] == 0
+
+    def test_size_bounded_and_persistent(self, tmp_path):
+        """Test least recently used entries are evicted and the rest survive a reopen"""
+        cache = LLMResponseCache(tmp_path / "llm.sqlite", max_bytes=1500)
+        llm = attach_llm_cache(CountingLLM(), cache)
+        for i in range(30):
+            llm.invoke(f"Analyze profile {i}")
+
+        stats = cache.stats()
+        assert stats["evictions"] > 0 and stats["bytes"] <= 1500
+
+        reopened = LLMResponseCache(tmp_path / "llm.sqlite", max_bytes=1500)
+        llm = attach_llm_cache(CountingLLM(), reopened)
+        llm.invoke("Analyze profile 29")
+        llm.invoke("Analyze profile 0")
+        assert llm.calls == 1 and reopened.stats()["hits"] == 1
+
+    def test_near_duplicate_lookup(self, tmp_path):
+        """Test a near-identical prompt reuses the cached answer only above the threshold"""
+        cache = LLMResponseCache(tmp_path / "llm.sqlite", similarity=0.9, embedder=HashingEmbedder())
+        llm = attach_llm_cache(CountingLLM(), cache)
+        profile = "federal data scientist candidate with python sql statistics machine learning and tableau"
+
+        llm.invoke(f"Analyze {profile} experience, target GS-13")
+        llm.invoke(f"Analyze the {profile} experience, target GS-13")
+        llm.invoke("Draft a cover letter for a cybersecurity analyst position")
+
+        assert llm.calls == 2 and cache.stats()["similar_hits"] == 1
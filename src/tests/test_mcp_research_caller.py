@@ -0,0 +1,122 @@
+"""
+Test concurrent research fan-out and batched report writing in MCPResearchCaller
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.mcp_research_caller import AtomicBatchWriter, MCPResearchCaller
+
+
+class SlowResearchCaller(MCPResearchCaller):
+    """Research caller whose agents take a fixed time and report their content in two parts"""
+
+    def __init__(self, delays, **kwargs):
+        super().__init__(**kwargs)
+        self.delays = delays
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def _call_mcp_agent(self, agent, research_request, partial=None):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            partial.update(agent=agent, research_content=f"# Research from {agent}\n\nFirst findings",
+                           sources_count=4, limitations_count=1)
+            await asyncio.sleep(self.delays.get(agent, 0.1))
+            research = dict(partial, research_content=partial["research_content"] + "\n\nFull findings",
+                            quality_score=90)
+            return research
+        finally:
+            self.in_flight -= 1
+
+
+class TestResearchFanOut:
+    """Test agents are called concurrently, timeouts keep partial research and files are written once"""
+
+    def test_agents_run_concurrently_within_the_limit(self, tmp_path):
+        """Test research from all agents takes about as long as the slowest call, not the sum"""
+        caller = SlowResearchCaller({}, research_dir=str(tmp_path), max_concurrency=2)
+        agents = ["security_specialist", "backend_specialist", "compliance_specialist", "devops_specialist"]
+
+        started = time.perf_counter()
+        results = asyncio.run(caller._assign_mcp_research("auth", "Add SSO", agents))
+        elapsed = time.perf_counter() - started
+
+        assert list(results) == agents
+        assert caller.peak_in_flight == 2
+        assert elapsed < 0.35  # two waves of 0.1s, not four
+        assert all(result["research_quality"] == 90 and not result["timed_out"] for result in results.values())
+
+    def test_timed_out_agents_keep_partial_research(self, tmp_path):
+        """Test an agent that exceeds the timeout still has its partial research saved and flagged"""
+        caller = SlowResearchCaller({"compliance_specialist": 5}, research_dir=str(tmp_path), agent_timeout=0.2)
+
+        result = asyncio.run(caller.request_research("authentication_sso", "Add SSO", "authentication"))
+
+        assert result["validation_passed"] is False
+        package = tmp_path / "active"
+        research = {path.name: path.read_text() for path in package.glob("*_RESEARCH.md")}
+        assert len(research) == 3
+        partial = next(text for name, text in research.items() if "COMPLIANCE_SPECIALIST" in name)
+        assert "First findings" in partial and "Full findings" not in partial
+        assert "Timed out - partial research only" in partial
+
+        index = json.loads(next(package.glob("*_INDEX.json")).read_text())
+        assert index["agents"]["compliance_specialist"]["timed_out"] is True
+        assert "compliance_specialist: Timed out, research is partial" in index["validation"]["issues"]
+
+    def test_reports_are_written_in_batches_at_the_end(self, tmp_path):
+        """Test every report of a passing package is flushed together and moved without temp files"""
+        caller = SlowResearchCaller({}, research_dir=str(tmp_path))
+
+        result = asyncio.run(caller.request_research("query_tuning", "Speed up search", "performance"))
+
+        assert result["validation_passed"] is True
+        assert caller.writer.stats == {"files": 7, "batches": 1}  # context, 3 research, analysis, plan, index
+        completed = sorted(path.name for path in (tmp_path / "completed" / "query_tuning_COMPLETE").iterdir())
+        assert len(completed) == 7 and not any(name.startswith(".") for name in completed)
+        assert not list((tmp_path / "active").iterdir())
+
+
+class TestAtomicBatchWriter:
+    """Test batching, last-write-wins and atomic replacement"""
+
+    def test_flushes_when_a_batch_fills(self, tmp_path):
+        """Test writes are held until the batch fills and a later write to the same path wins"""
+        async def scenario():
+            writer = AtomicBatchWriter(batch_size=3)
+            await writer.write(tmp_path / "a.md", "first")
+            await writer.write(tmp_path / "a.md", "second")
+            await writer.write(tmp_path / "b.md", "b")
+            assert not (tmp_path / "a.md").exists()
+            await writer.write(tmp_path / "nested" / "c.md", "c")
+            return writer
+
+        writer = asyncio.run(scenario())
+        assert (tmp_path / "a.md").read_text() == "second"
+        assert (tmp_path / "nested" / "c.md").read_text() == "c"
+        assert writer.stats == {"files": 3, "batches": 1}
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path):
+        """Test a write that fails leaves the previous file intact and no temp file behind"""
+        target = tmp_path / "report.md"
+        target.write_text("previous")
+
+        async def scenario():
+            writer = AtomicBatchWriter()
+            await writer.write(target, "\ud800")  # lone surrogate cannot be encoded
+            await writer.flush()
+
+        with pytest.raises(UnicodeEncodeError):
+            asyncio.run(scenario())
+        assert target.read_text() == "previous"
+        assert [path.name for path in tmp_path.iterdir()] == ["report.md"]
@@ -0,0 +1,114 @@
+"""
+Test in-process metrics: histograms, counters, ring buffer and exposition
+"""
+
+import sys
+import os
+import threading
+import time
+
+import numpy as np
+import pytest
+from prometheus_client import CollectorRegistry, Counter, Gauge, generate_latest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from agents.app.agents.metrics import (
+    Histogram, MetricsRingBuffer, UPPER_BOUNDS, bucket_index, metric_values, quantile_from_counts
+)
+
+
+class TestHistogram:
+    """Test HDR-style buckets and quantile estimates"""
+
+    def test_bucket_bounds_contain_value(self):
+        """Test every value lands in the bucket whose bounds contain it"""
+        for value in (3e-6, 0.0009, 0.0123, 0.5, 1.0, 7.3, 900.0):
+            index = bucket_index(value)
+            assert UPPER_BOUNDS[index - 1] <= value < UPPER_BOUNDS[index]
+
+    def test_quantiles_within_bucket_error(self):
+        """Test p50/p99 estimates stay within the ~6% bucket resolution"""
+        histogram = Histogram("latency_seconds", "test", ("route",))
+        values = np.linspace(0.001, 1.0, 5000)
+        for value in values:
+            histogram.labels(route="/jobs").observe(float(value))
+
+        counts, total, count = histogram.merged()
+        assert count == 5000
+        assert abs(total - values.sum()) < 1e-6
+        assert abs(quantile_from_counts(counts, 0.5) - 0.5) / 0.5 < 0.07
+        assert abs(quantile_from_counts(counts, 0.99) - 0.99) / 0.99 < 0.07
+
+    def test_threads_record_without_losing_counts(self):
+        """Test concurrent observations from several threads add up to the exact total"""
+        registry = CollectorRegistry()
+        histogram = Histogram("work_seconds", "test", ("agent",), registry=registry)
+        counter = Counter("calls_total", "test", ("agent",), registry=registry)
+
+        def worker():
+            for _ in range(2000):
+                histogram.labels(agent="analyst").observe(0.01)
+                counter.labels(agent="analyst").inc()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert histogram.merged()[2] == 16000
+        assert metric_values(counter) == {("analyst",): 16000}
+
+    def test_labels_must_match(self):
+        """Test observations with missing labels are rejected"""
+        histogram = Histogram("latency_seconds", "test", ("route", "method"))
+        with pytest.raises(ValueError):
+            histogram.labels(route="/jobs")
+
+
+class TestPrometheusExposition:
+    """Test text exposition output"""
+
+    def test_render_histogram_and_gauge(self):
+        """Test cumulative buckets, +Inf, sum/count and callback gauges"""
+        registry = CollectorRegistry()
+        histogram = Histogram("http_seconds", "HTTP latency", ("route",), registry=registry)
+        histogram.labels(route='/a"b').observe(0.003)
+        histogram.labels(route='/a"b').observe(2.0)
+        Gauge("queue_depth", "Queue depth", registry=registry).set_function(lambda: 4)
+
+        text = generate_latest(registry).decode()
+        assert "# TYPE http_seconds histogram" in text
+        assert 'http_seconds_bucket{le="+Inf",route="/a\\"b"} 2.0' in text
+        assert 'http_seconds_bucket{le="0.00390625",route="/a\\"b"} 1.0' in text
+        assert 'http_seconds_count{route="/a\\"b"} 2.0' in text
+        assert "queue_depth 4.0" in text
+
+
+class TestMetricsRingBuffer:
+    """Test fixed-size history and vectorized window statistics"""
+
+    def test_wraparound_keeps_latest(self):
+        """Test only the newest `capacity` samples are kept, oldest first"""
+        buffer = MetricsRingBuffer(5, ("timestamp", "value"))
+        now = time.time()
+        for i in range(12):
+            buffer.append({"timestamp": now - 12 + i, "value": i})
+
+        assert len(buffer) == 5
+        assert buffer.column("value").tolist() == [7, 8, 9, 10, 11]
+        assert buffer.latest()["value"] == 11
+
+    def test_window_stats_and_slope(self):
+        """Test time-window filtering and per-minute slope"""
+        buffer = MetricsRingBuffer(100, ("timestamp", "latency"))
+        now = time.time()
+        for i in range(60):
+            buffer.append({"timestamp": now - 600 + i * 10, "latency": 0.1 + 0.01 * i})
+
+        stats = buffer.stats("latency", seconds=305)
+        assert stats["samples"] == 30
+        assert abs(stats["slope_per_minute"] - 0.06) < 1e-6
+        assert stats["max"] == buffer.column("latency").max()
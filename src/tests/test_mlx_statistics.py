@@ -0,0 +1,111 @@
+"""
+Test the MLX/NumPy array backend and batched agent statistics
+"""
+
+import os
+import sys
+import threading
+
+import numpy as np
+import pytest
+
+# The MLX server modules live at the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from mlx_agent_template import mlx_accelerate
+from mlx_statistics import StatisticsBatcher, describe_batch
+
+
+def reference(sample, q, threshold):
+    """Per-sample formulas the MLX agents used before batching"""
+    data = np.asarray(sample, dtype=np.float64)
+    mean, std = data.mean(), data.std()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return {
+            "mean": mean,
+            "variance": data.var(),
+            "skewness": np.mean(((data - mean) / std) ** 3),
+            "kurtosis": np.mean(((data - mean) / std) ** 4) - 3,
+            f"p{q}": np.percentile(data, q),
+            "reliability": np.sum(data < threshold) / len(data) * 100,
+        }
+
+
+class TestDescribeBatch:
+    """Test vectorized statistics over ragged samples"""
+
+    def test_matches_per_sample_formulas(self):
+        """Test batched results equal the per-sample computations"""
+        rng = np.random.default_rng(0)
+        samples = [rng.gamma(2.0, 2.0, n) for n in (1, 2, 7, 50, 333)]
+        results = describe_batch(samples, percentiles=(95,), thresholds=[5.0] * len(samples))
+
+        for sample, result in zip(samples, results):
+            assert result["count"] == len(sample)
+            for key, expected in reference(sample, 95, 5.0).items():
+                if np.isfinite(expected):
+                    assert result[key] == pytest.approx(expected, rel=1e-9, abs=1e-12)
+                else:
+                    assert result[key] is None
+
+    def test_empty_and_constant_samples(self):
+        """Test undefined statistics are reported as None"""
+        empty, constant = describe_batch([[], [3, 3, 3]], percentiles=(50,))
+
+        assert empty["count"] == 0 and empty["mean"] is None and empty["p50"] is None
+        assert constant["mean"] == 3.0 and constant["p50"] == 3.0
+        assert constant["skewness"] is None and constant["kurtosis"] is None
+        assert "reliability" not in constant
+
+
+class TestStatisticsBatcher:
+    """Test coalescing of concurrent describe() calls"""
+
+    def test_concurrent_calls_share_a_batch(self):
+        """Test threads are served by one batch and see only their own percentiles"""
+        batcher = StatisticsBatcher(window_ms=200)
+        results = {}
+
+        def call(i):
+            results[i] = batcher.describe(list(range(i + 2)), percentiles=(50,) if i % 2 else (95,),
+                                          threshold=1.0 if i == 0 else None)
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert batcher.stats()["requests"] == 8
+        assert batcher.stats()["batches"] < 8
+        assert "p50" in results[1] and "p95" not in results[1]
+        assert "p95" in results[2] and "p50" not in results[2]
+        assert results[0]["reliability"] == 50.0 and "reliability" not in results[3]
+        assert results[3]["mean"] == pytest.approx(np.mean(range(5)))
+
+
+class TestMLXAccelerate:
+    """Test the backend conversion decorator"""
+
+    def test_runs_once_and_propagates_errors(self):
+        """Test a failing function is not re-run on the original arguments"""
+        calls = []
+
+        @mlx_accelerate
+        def failing(values):
+            calls.append(values)
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            failing(np.arange(3.0))
+        assert len(calls) == 1
+
+    def test_converts_arguments_and_results(self):
+        """Test numeric lists become backend arrays and scalars come back as Python numbers"""
+
+        @mlx_accelerate
+        def total(values):
+            return values.sum()
+
+        result = total([1.0, 2.0, 3.5])
+        assert isinstance(result, float) and result == 6.5
@@ -0,0 +1,161 @@
+"""
+Test URL canonicalization and SimHash near-duplicate detection in the documentation crawler
+"""
+
+import os
+import random
+import sys
+from contextlib import asynccontextmanager
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from mcp_services.utils.near_duplicates import SimHashIndex, canonicalize_url, hamming_distance, simhash
+from mcp_services.external.webscraping_specialist import WebscrapingSpecialist
+
+STEMS = ("container image volume network compose service build cache layer registry deploy swarm "
+         "secret config healthcheck restart policy port mount context stage").split()
+VOCABULARY = [stem + suffix for stem in STEMS for suffix in ("", "s", "d", "ing", "er")]
+ZIPF = [1 / rank for rank in range(1, len(VOCABULARY) + 1)]
+
+
+def page_text(seed: int, words: int = 600) -> str:
+    """Documentation-like text: word frequencies follow Zipf's law"""
+    rng = random.Random(seed)
+    return " ".join(rng.choices(VOCABULARY, weights=ZIPF, k=words))
+
+
+def edited(text: str, changes: int, seed: int = 0) -> str:
+    """Text with a few words replaced, like a version banner or a print-view footer"""
+    rng = random.Random(seed)
+    words = text.split()
+    for position in rng.sample(range(len(words)), changes):
+        words[position] = "edited"
+    return " ".join(words)
+
+
+class TestCanonicalizeUrl:
+    """Test URL canonicalization rules"""
+
+    def test_variants_collapse_to_one_url(self):
+        """Test fragments, tracking parameters, trailing slashes, case and default ports are normalized"""
+        variants = [
+            "https://docs.docker.com/compose/",
+            "https://docs.docker.com/compose",
+            "HTTPS://Docs.Docker.com:443/compose/#install",
+            "https://docs.docker.com//compose/?utm_source=newsletter&utm_medium=email",
+            "https://docs.docker.com/compose?gclid=abc&ref=nav",
+        ]
+        assert {canonicalize_url(url) for url in variants} == {"https://docs.docker.com/compose"}
+
+    def test_meaningful_query_is_kept_sorted(self):
+        """Test content-bearing query parameters survive in a stable order"""
+        assert (canonicalize_url("https://stripe.com/docs/api?lang=python&version=2&utm_campaign=x")
+                == canonicalize_url("https://stripe.com/docs/api?version=2&lang=python")
+                == "https://stripe.com/docs/api?lang=python&version=2")
+        assert canonicalize_url("http://localhost:8080/") == "http://localhost:8080/"
+
+
+class TestSimHash:
+    """Test fingerprints and the banded index"""
+
+    def test_small_edits_stay_close_and_different_pages_far(self):
+        """Test near-identical text is within the threshold and unrelated text is not"""
+        base = page_text(1)
+        assert simhash(base) == simhash(base)
+        assert hamming_distance(simhash(base), simhash(edited(base, 3))) <= 3
+        assert min(hamming_distance(simhash(base), simhash(page_text(seed))) for seed in range(2, 30)) > 8
+
+    def test_banded_index_matches_brute_force(self):
+        """Test index lookups find exactly the pages a linear scan within the threshold finds"""
+        rng = random.Random(7)
+        fingerprints = {f"page{i}": rng.getrandbits(64) for i in range(2000)}
+        index = SimHashIndex(max_distance=3)
+        for key, fingerprint in fingerprints.items():
+            index.add(key, fingerprint)
+
+        for key in rng.sample(sorted(fingerprints), 100):
+            query = fingerprints[key]
+            for _ in range(rng.randrange(4)):
+                query ^= 1 << rng.randrange(64)
+            expected = min((hamming_distance(query, fp), k) for k, fp in fingerprints.items())
+            found = index.find(query)
+            assert found is not None and found[1] == expected[0]
+        assert index.find(rng.getrandbits(64)) is None
+
+    def test_re_adding_a_key_replaces_its_fingerprint(self):
+        """Test a page re-indexed with new content is no longer found under the old fingerprint"""
+        index = SimHashIndex()
+        index.add("page", 0)
+        index.add("page", (1 << 64) - 1)
+        assert index.find(0) is None and len(index) == 1
+
+
+@asynccontextmanager
+async def serve_site(pages):
+    """Serve {path: text} as HTML pages linking to every other path"""
+    async def handle(request):
+        if request.path not in pages:
+            return web.Response(status=404)
+        links = "".join(f'<a href="{path}">{path}</a>' for path in pages)
+        return web.Response(text=f"<html><title>{request.path}</title><nav>{links}</nav>"
+                                 f"<main>{pages[request.path]}</main></html>", content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handle)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        yield lambda path: str(server.make_url(path))
+    finally:
+        await server.close()
+
+
+class TestCrawlerDeduplication:
+    """Test the webscraping crawler skips URL variants and near-duplicate pages"""
+
+    @pytest.mark.asyncio
+    async def test_near_duplicates_are_linked_to_the_canonical_page(self):
+        """Test versioned and print copies are skipped, reported and linked back"""
+        guide, reference = page_text(11), page_text(12)
+        pages = {
+            "/docs/guide/": guide,
+            "/docs/guide?utm_source=nav": guide,
+            "/docs/v2/guide/": edited(guide, 3),
+            "/docs/guide/print/": guide + " printed",
+            "/docs/reference/": reference,
+        }
+        async with serve_site(pages) as url:
+            scraper = WebscrapingSpecialist()
+            scraper.http_cache = None
+            scraper.delay_between_requests = 0
+            result = await scraper.traverse_documentation(url("/docs/guide/"), max_depth=2, max_pages=10)
+
+            assert sorted(result["content"]) == [url("/docs/guide/"), url("/docs/reference/")]
+            assert result["duplicates"] == {
+                url("/docs/v2/guide/"): canonicalize_url(url("/docs/guide/")),
+                url("/docs/guide/print/"): canonicalize_url(url("/docs/guide/")),
+            }
+            dedup = result["deduplication"]
+            assert dedup["pages_fetched"] == 4 and dedup["near_duplicates"] == 2
+            assert dedup["duplicate_ratio"] == 0.5 and dedup["skipped_bytes"] > 2 * len(guide) - 100
+
+            # A later crawl by the same scraper keeps a page it already indexed under the same URL
+            again = await scraper.traverse_documentation(url("/docs/guide/"), max_pages=1)
+            assert list(again["content"]) == [url("/docs/guide/")]
+
+    @pytest.mark.asyncio
+    async def test_short_pages_are_never_merged(self):
+        """Test pages too short to fingerprint are all kept"""
+        pages = {"/docs/a": "Moved.", "/docs/b": "Moved.", "/docs/c": "Moved."}
+        async with serve_site(pages) as url:
+            scraper = WebscrapingSpecialist()
+            scraper.http_cache = None
+            scraper.delay_between_requests = 0
+            result = await scraper.traverse_documentation(url("/docs/a"), max_depth=1)
+
+            assert len(result["content"]) == 3 and result["deduplication"]["near_duplicates"] == 0
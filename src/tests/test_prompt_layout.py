@@ -0,0 +1,71 @@
+"""
+Test the stable-prefix prompt layout of role agents
+"""
+
+import json
+import os
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from agents.app.agents.base import AgentConfig, stable_prompt_layout
+from agents.app.agents.roles.data_scientist import DataScientistAgent
+from agents.app.agents.roles.database_admin import DatabaseAdminAgent
+
+SECTION_TEMPLATE = """You are a Federal Statistician Career Advisor.
+        Key Responsibilities:
+        1. Analyze methods
+
+        Available tools:
+        {tools}
+
+        Current conversation:
+        {chat_history}
+
+        User Input: {input}
+        Context: {context}
+
+        Remember: NEVER write application content.
+
+        {agent_scratchpad}
+        """
+
+
+class TestStablePromptLayout:
+    """Test role templates are rewritten as static prefix + variable suffix"""
+
+    def test_variable_sections_move_after_instructions(self):
+        """Test trailing instructions join the prefix and variables follow in a fixed order"""
+        layout = stable_prompt_layout(SECTION_TEMPLATE)
+
+        assert layout == (
+            "You are a Federal Statistician Career Advisor.\n"
+            "Key Responsibilities:\n1. Analyze methods\n\n"
+            "Available tools:\n{tools}\n\n"
+            "Remember: NEVER write application content.\n\n"
+            "Current conversation:\n{chat_history}\n\n"
+            "Context: {context}\n\nQuestion: {input}\nThought:{agent_scratchpad}"
+        )
+        assert "{chat_history}" not in stable_prompt_layout(SECTION_TEMPLATE, with_history=False)
+
+    def test_react_templates_keep_format_instructions(self):
+        """Test ReAct-style templates keep their instructions and gain the context section"""
+        layout = stable_prompt_layout(DataScientistAgent._get_prompt_template(None))
+
+        assert "Action: the action to take, should be one of [{tool_names}]" in layout
+        assert layout.index("Begin!") < layout.index("{chat_history}") < layout.index("{context}")
+        assert layout.count("{input}") == 1 and layout.endswith("Thought:{agent_scratchpad}")
+
+    def test_prefix_is_byte_identical_across_calls(self):
+        """Test two different turns of a role render the same prefix and carry keep_alive"""
+        agent = DatabaseAdminAgent(AgentConfig(role="database_admin", user_id="layout", keep_alive="30m"))
+
+        first = agent.prompt.format(input="Which skills matter?", chat_history="",
+                                    context=json.dumps({"grade": "GS-13"}), agent_scratchpad="")
+        second = agent.prompt.format(input="What gaps remain?", chat_history="Human: hi\nAI: hello",
+                                     context=json.dumps({"grade": "GS-12"}), agent_scratchpad="")
+
+        assert first.startswith(agent.prompt_prefix) and second.startswith(agent.prompt_prefix)
+        assert "{tools}" not in agent.prompt_prefix and "platform_analyzer" in agent.prompt_prefix
+        assert agent.llm.keep_alive == "30m"
@@ -0,0 +1,141 @@
+"""
+Test local embeddings, the IVF vector index and semantic retrieval
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from mcp_services.utils.documentation_store import DocumentationStore
+from mcp_services.utils.embeddings import HashingEmbedder
+from mcp_services.utils.semantic_index import SemanticIndex
+from mcp_services.utils.vector_index import VectorIndex
+
+DOCS = {
+    "usajobs/api.md": "# USAJobs API\n\n## Pagination\nResults are paged with ResultsPerPage and Page; "
+                      "at most 500 records per page.\n\n## Authentication\nSend the Authorization-Key header "
+                      "with a User-Agent email on every request.\n",
+    "stripe/webhooks.md": "# Stripe Webhooks\n\n## Signatures\nVerify webhook signatures with the endpoint "
+                          "signing secret before handling invoice events.\n",
+}
+
+JOBS = [
+    {"job_id": "ds-1", "title": "Data Scientist", "summary": "Machine learning models and statistical analysis in Python"},
+    {"MatchedObjectId": "dba-1", "MatchedObjectDescriptor": {
+        "PositionTitle": "Database Administrator", "OrganizationName": "VA",
+        "UserArea": {"Details": {"JobSummary": "Oracle database backup, recovery and tuning"}}}},
+]
+
+
+def clustered(count, dim=32, clusters=20, seed=0):
+    centres = np.random.default_rng(0).standard_normal((clusters, dim))
+    rng = np.random.default_rng(seed)
+    points = centres[rng.integers(0, clusters, count)] + rng.standard_normal((count, dim)) * 0.5
+    return (points / np.linalg.norm(points, axis=1, keepdims=True)).astype(np.float32)
+
+
+class TestHashingEmbedder:
+    """Test the hashing-trick / LSA embedder"""
+
+    def test_stable_and_cached(self):
+        """Test vectors are identical across instances and repeated texts hit the cache"""
+        texts = ["oracle database backup", "kubernetes deployment pipeline"]
+        first, second = HashingEmbedder(), HashingEmbedder()
+
+        assert np.allclose(first.embed(texts), second.embed(texts))
+        first.embed(texts)
+        assert first.stats()["cache_hits"] == 2
+        assert np.allclose(np.linalg.norm(first.embed(texts), axis=1), 1.0)
+
+    def test_fit_groups_related_texts(self):
+        """Test texts about the same topic are closer than unrelated ones after fitting"""
+        corpus = [f"oracle database backup recovery tuning sql {i}" for i in range(20)] + \
+                 [f"kubernetes docker container deployment pipeline {i}" for i in range(20)]
+        embedder = HashingEmbedder(dim=16).fit(corpus)
+        database, related, unrelated = embedder.embed(
+            ["oracle backup recovery", "sql database tuning", "docker container pipeline"])
+
+        assert embedder.fitted
+        assert database @ related > database @ unrelated + 0.3
+
+
+class TestVectorIndex:
+    """Test IVF search, updates and persistence"""
+
+    def test_recall_updates_and_mmap_load(self, tmp_path):
+        """Test IVF results track exact search through upserts, removals and a reload"""
+        vectors = clustered(3000)
+        index = VectorIndex(32, nprobe=8, train_min=1000)
+        index.add(np.arange(3000), vectors)
+        assert index.trained
+
+        queries = clustered(50, seed=1)
+        exact = index.search(queries, k=10, exact=True)
+        approximate = index.search(queries, k=10)
+        recall = np.mean([len(set(a[0]) & set(e[0])) / 10 for a, e in zip(approximate, exact)])
+        assert recall > 0.9
+
+        target = int(exact[0][0][0])
+        index.remove([target])
+        index.add([10 ** 6], queries[:1])
+        ids, scores = index.search(queries[:1], k=3)[0]
+        assert ids[0] == 10 ** 6 and target not in ids.tolist()
+
+        index.save(tmp_path)
+        loaded = VectorIndex.load(tmp_path)
+        assert loaded.stats()["memory_mapped"] and len(loaded) == 3000
+        assert loaded.search(queries[:1], k=3)[0][0].tolist() == ids.tolist()
+
+
+class TestSemanticIndex:
+    """Test retrieval across docs, job postings and research reports"""
+
+    def build(self, tmp_path):
+        for relative, content in DOCS.items():
+            path = tmp_path / "docs" / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+        (tmp_path / "reports").mkdir()
+        (tmp_path / "reports" / "usajobs_research.md").write_text(
+            "# USAJobs Research\n\n## Fields\nAlways request Fields=Full to get job duties and qualifications.\n")
+        (tmp_path / "jobs").mkdir()
+        (tmp_path / "jobs" / "usajobs_1.json").write_text(json.dumps({"jobs": JOBS}))
+
+        return SemanticIndex(directory=tmp_path / "index", embedder=HashingEmbedder(),
+                             docs_roots=[tmp_path / "docs"], reports_dir=tmp_path / "reports",
+                             jobs_dir=tmp_path / "jobs", store=DocumentationStore(tmp_path / "docs.db"))
+
+    def test_search_by_kind_and_incremental_refresh(self, tmp_path):
+        """Test each collection is retrievable and unchanged sources are not re-embedded"""
+        index = self.build(tmp_path)
+        summary = index.refresh()
+        assert summary["embedded"] == index.stats()["items"] > 0
+
+        top = index.search("oracle backup and recovery", k=1)[0]
+        assert top["kind"] == "jobs" and top["job_id"] == "dba-1"
+        assert index.search("records per page", k=1, kinds=["docs"])[0]["heading"].endswith("Pagination")
+        assert index.search("request full fields", k=1, kinds=["reports"])[0]["kind"] == "reports"
+
+        assert index.refresh()["embedded"] == 0
+        (tmp_path / "jobs" / "usajobs_1.json").write_text(json.dumps({"jobs": JOBS[:1]}))
+        index.refresh()
+        assert index.stats()["by_kind"]["jobs"] == 1
+
+    def test_persisted_index_reloads(self, tmp_path):
+        """Test a saved index reopens with its fitted embedder and items"""
+        index = self.build(tmp_path)
+        index.refresh()
+
+        embedder = HashingEmbedder.load(tmp_path / "index" / "embedder.npz")
+        reopened = SemanticIndex(directory=tmp_path / "index", embedder=embedder,
+                                 docs_roots=[tmp_path / "docs"], reports_dir=tmp_path / "reports",
+                                 jobs_dir=tmp_path / "jobs", store=DocumentationStore(tmp_path / "docs.db"))
+
+        assert reopened.stats()["items"] == index.stats()["items"]
+        assert reopened.refresh()["embedded"] == 0
+        assert reopened.search("verify webhook signatures", k=1)[0]["title"] == "Stripe Webhooks"
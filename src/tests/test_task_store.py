@@ -0,0 +1,104 @@
+"""
+Test the SQLite task store behind ClaudeCodeController
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from agents.app.agents.task_store import TaskStore
+
+SRC = os.path.join(os.path.dirname(__file__), '..')
+
+
+class TestTaskStore:
+    """Test status transitions, result capping, listing and crash recovery"""
+
+    def test_transitions_are_recorded_and_validated(self, tmp_path):
+        """Test each transition is logged and illegal moves are rejected"""
+        store = TaskStore(tmp_path / "tasks.sqlite")
+        task_id = store.create("agent", {"agent": "backend_engineer", "task": "Add /health"}, agent="backend_engineer")
+        store.transition(task_id, "running")
+        store.transition(task_id, "completed", result={"output": "Endpoint added"})
+
+        task = store.get(task_id)
+        assert task["status"] == "completed" and task["attempts"] == 1
+        assert task["result"] == {"output": "Endpoint added"}
+        assert [event["status"] for event in task["events"]] == ["pending", "running", "completed"]
+
+        with pytest.raises(ValueError, match="cannot move from completed to running"):
+            store.transition(task_id, "running")
+        with pytest.raises(ValueError, match="Unknown task"):
+            store.transition("missing", "running")
+
+    def test_large_results_are_capped(self, tmp_path):
+        """Test results beyond max_result_bytes are stored truncated with their full size"""
+        store = TaskStore(tmp_path / "tasks.sqlite", max_result_bytes=64)
+        task_id = store.create("team", {"description": "Write docs"})
+        store.transition(task_id, "running")
+        store.transition(task_id, "completed", result={"output": "x" * 1000})
+
+        task = store.get(task_id)
+        assert task["result_truncated"] and task["result_bytes"] > 1000
+        assert len(task["result"].encode()) <= 64
+
+    def test_listing_filters_and_pages(self, tmp_path):
+        """Test listing by status, agent and time range, newest first with a total"""
+        store = TaskStore(tmp_path / "tasks.sqlite")
+        ids = []
+        for i in range(7):
+            agent = "backend_engineer" if i % 2 else "devops_engineer"
+            ids.append(store.create("agent", {"task": f"task {i}"}, agent=agent))
+        for task_id in ids[:3]:
+            store.transition(task_id, "running")
+            store.transition(task_id, "failed", error="model unavailable")
+        midpoint = store.get(ids[4])["created_at"]
+
+        page, total = store.list_tasks(limit=2, offset=2)
+        assert total == 7 and [task["task_id"] for task in page] == [ids[4], ids[3]]
+        assert "result" not in page[0]
+
+        failed, total = store.list_tasks(status="failed", agent="devops_engineer")
+        assert total == 2 and {task["task_id"] for task in failed} == {ids[0], ids[2]}
+        recent, total = store.list_tasks(since=midpoint)
+        assert total == 3 and ids[4] in {task["task_id"] for task in recent}
+        assert store.list_tasks(until=midpoint)[1] == 4
+        assert store.counts() == {"failed": 3, "pending": 4}
+
+    def test_pending_and_interrupted_tasks_survive_a_crash(self, tmp_path):
+        """Test a process killed mid-task leaves its tasks resumable after reopening"""
+        db_path = tmp_path / "tasks.sqlite"
+        script = textwrap.dedent(f"""
+            import os, sys
+            sys.path.insert(0, {SRC!r})
+            from agents.app.agents.task_store import TaskStore
+            store = TaskStore({str(db_path)!r})
+            done = store.create("agent", {{"task": "done"}}, agent="backend_engineer")
+            store.transition(done, "running")
+            store.transition(done, "completed", result="ok")
+            store.create("team", {{"description": "queued"}}, task_id="queued")
+            store.create("github_issue", {{"issue_number": 7}}, task_id="in-flight")
+            store.transition("in-flight", "running")
+            os._exit(9)  # no close, no checkpoint
+        """)
+        crashed = subprocess.run([sys.executable, "-c", script])
+        assert crashed.returncode == 9
+
+        store = TaskStore(db_path)
+        resumed = store.recover()
+        assert [task["task_id"] for task in resumed] == ["queued", "in-flight"]
+        assert resumed[1]["request"] == {"issue_number": 7}
+
+        events = store.get("in-flight")["events"]
+        assert [event["status"] for event in events] == ["pending", "running", "pending"]
+        assert events[-1]["detail"] == "interrupted by restart"
+        assert store.counts() == {"completed": 1, "pending": 2}
+
+        store.transition("in-flight", "running")
+        assert store.get("in-flight")["attempts"] == 2
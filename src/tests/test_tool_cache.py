@@ -0,0 +1,161 @@
+"""
+Test the MCP tool result cache and in-flight deduplication
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core import mcp_server
+from src.core.tool_cache import ToolResultCache, cache_key
+from src.core.mcp_server import FedJobAdvisorMCP
+
+# Server configuration for the tests; the real config/mcp_server.json is not read
+TEST_CONFIG = {"server_info": {"name": "fed-job-advisor-test"}, "agent_base_url": "http://agents.test"}
+
+RESUME_ARGS = {"user_id": "u1", "resume_text": "Led migration of 40 services to AWS GovCloud.", "current_pages": 4}
+
+
+class CountingAgent:
+    """Upstream stand-in that counts calls and takes a fixed time"""
+
+    def __init__(self, delay: float = 0.05, cacheable: bool = True):
+        self.delay = delay
+        self.cacheable = cacheable
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return f"result {self.calls}", self.cacheable
+
+
+class TestToolResultCache:
+    """Test keys, TTLs, opt-outs and collapsing of concurrent calls"""
+
+    def test_key_ignores_argument_order_whitespace_and_nulls(self):
+        """Test equivalent argument sets share a key and different tools or values do not"""
+        reordered = {"current_pages": 4, "target_series": None,
+                     "resume_text": "  Led migration of 40 services to AWS GovCloud.\n", "user_id": "u1"}
+        assert cache_key("analyze_resume_compression", RESUME_ARGS) == cache_key("analyze_resume_compression", reordered)
+        assert cache_key("analyze_resume_compression", RESUME_ARGS) != cache_key("analyze_devops_profile", RESUME_ARGS)
+        assert (cache_key("analyze_resume_compression", RESUME_ARGS)
+                != cache_key("analyze_resume_compression", dict(RESUME_ARGS, current_pages=3)))
+
+    def test_repeat_call_is_served_from_cache_until_ttl(self):
+        """Test a repeated call is a hit with saved latency and goes upstream again once expired"""
+        async def scenario():
+            cache = ToolResultCache(ttls={"short": 0.05})
+            agent = CountingAgent(delay=0.02)
+            results = [await cache.get_or_call("analyze_resume_compression", RESUME_ARGS, agent) for _ in range(3)]
+            await cache.get_or_call("short", {}, agent)
+            await asyncio.sleep(0.06)
+            await cache.get_or_call("short", {}, agent)
+            return cache, agent, results
+
+        cache, agent, results = asyncio.run(scenario())
+        assert results == ["result 1"] * 3 and agent.calls == 3
+        report = cache.report()
+        assert report["hits"] == 2 and report["misses"] == 3 and report["expired"] == 1
+        assert report["saved_seconds"] >= 0.04 and report["hit_rate"] == 0.4
+
+    def test_concurrent_identical_calls_share_one_request(self):
+        """Test simultaneous identical calls make one upstream request and all get its result"""
+        async def scenario():
+            cache = ToolResultCache()
+            agent = CountingAgent(delay=0.05)
+            results = await asyncio.gather(*(cache.get_or_call("analyze_resume_compression", RESUME_ARGS, agent)
+                                             for _ in range(8)))
+            return cache, agent, results
+
+        cache, agent, results = asyncio.run(scenario())
+        assert agent.calls == 1 and results == ["result 1"] * 8
+        assert cache.report()["collapsed"] == 7 and cache.report()["upstream_calls_saved"] == 7
+
+    def test_failures_and_opted_out_tools_are_not_cached(self):
+        """Test uncacheable results and non-idempotent tools always go upstream"""
+        async def scenario():
+            cache = ToolResultCache(uncached=["orchestrate_job_collection"])
+            failing = CountingAgent(delay=0, cacheable=False)
+            live = CountingAgent(delay=0)
+            for _ in range(2):
+                await cache.get_or_call("analyze_devops_profile", RESUME_ARGS, failing)
+                await cache.get_or_call("orchestrate_job_collection", {"user_id": "u1"}, live)
+            return cache, failing, live
+
+        cache, failing, live = asyncio.run(scenario())
+        assert failing.calls == 2 and live.calls == 2
+        assert cache.report()["bypassed"] == 2 and cache.report()["entries"] == 0
+
+    def test_cancelled_leader_does_not_fail_waiters(self):
+        """Test waiters re-issue the call when the caller that made it is cancelled"""
+        async def scenario():
+            cache = ToolResultCache()
+            agent = CountingAgent(delay=0.05)
+            leader = asyncio.create_task(cache.get_or_call("analyze_resume_compression", RESUME_ARGS, agent))
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(cache.get_or_call("analyze_resume_compression", RESUME_ARGS, agent))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await waiter, agent
+
+        result, agent = asyncio.run(scenario())
+        assert result == "result 2" and agent.calls == 2
+
+
+    def test_cancelled_waiter_leaves_the_request_running(self):
+        """Test cancelling a waiter cancels only that waiter, not the request it shares"""
+        async def scenario():
+            cache = ToolResultCache()
+            agent = CountingAgent(delay=0.05)
+            leader = asyncio.create_task(cache.get_or_call("analyze_resume_compression", RESUME_ARGS, agent))
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(cache.get_or_call("analyze_resume_compression", RESUME_ARGS, agent))
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            return await leader, agent
+
+        result, agent = asyncio.run(scenario())
+        assert result == "result 1" and agent.calls == 1
+
+
+class TestMCPServerToolCache:
+    """Test FedJobAdvisorMCP routes agent tools through the cache"""
+
+    def test_retry_reuses_result_and_stats_tool_reports_it(self, monkeypatch):
+        """Test a retried analysis does not reach the agent service and the diagnostics tool shows the hit"""
+        monkeypatch.setattr(mcp_server, "MCP_CONFIG", TEST_CONFIG)
+        server = FedJobAdvisorMCP()
+        calls = []
+
+        async def invoke(tool_name, args):
+            calls.append(tool_name)
+            await asyncio.sleep(0.01)
+            return [f"{tool_name}: {sorted(args)}"], True
+
+        server._invoke_agent = invoke
+
+        async def scenario():
+            first = await server._call_agent("analyze_resume_compression", dict(RESUME_ARGS))
+            retry = await server._call_agent("analyze_resume_compression", dict(RESUME_ARGS))
+            await server._call_agent("scrape_web_page", {"user_id": "u1", "url": "https://www.usajobs.gov"})
+            await server._call_agent("scrape_web_page", {"user_id": "u1", "url": "https://www.usajobs.gov"})
+            return first, retry, await server._call_agent("tool_cache_stats", {})
+
+        first, retry, stats = asyncio.run(scenario())
+        assert first == retry
+        assert calls == ["analyze_resume_compression", "scrape_web_page", "scrape_web_page"]
+        report = json.loads(stats[0].text)
+        assert report["hits"] == 1 and report["bypassed"] == 2
+        assert report["per_tool"]["analyze_resume_compression"]["hits"] == 1
+        assert "tool_cache_stats" in server.local_tools and "tool_cache_stats" not in server.agent_tools